@@ -0,0 +1,368 @@
+"""
+In-process tool dispatch and latency tracking for the Empirica MCP server.
+
+By default every tool call runs `empirica <command>` as a subprocess, paying
+a full interpreter start plus the CLI import graph each time. With
+EMPIRICA_MCP_DISPATCH=inproc the server instead calls the CLI entry point
+(`empirica.cli.cli_core.main`) directly in a bounded worker pool:
+
+- Each worker gets its own stdin/stdout/stderr via thread-routed streams,
+  so output capture matches the subprocess path exactly
+- Imported modules, schema fingerprints and Qdrant/DB client caches stay
+  warm between calls
+- Calls that need a different cwd wait for in-flight calls to drain
+  before the process cwd is switched (cwd is process-global); os.environ
+  is restored and empirica's cwd-derived caches cleared between them
+- While a timed-out call is still running, calls for other projects are
+  sent down the subprocess path instead of waiting on it
+
+Tools marked `"isolate": True` in TOOL_REGISTRY, and every call when the
+`empirica` package cannot be imported, keep using the subprocess path.
+
+Environment:
+    EMPIRICA_MCP_DISPATCH   "subprocess" (default) or "inproc"
+    EMPIRICA_MCP_WORKERS    In-process worker pool size (default 4)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_ENV = "EMPIRICA_MCP_DISPATCH"
+WORKERS_ENV = "EMPIRICA_MCP_WORKERS"
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is +Inf
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+_LATENCY_WINDOW = 512
+
+
+def dispatch_mode() -> str:
+    """Configured dispatch mode: 'inproc' or 'subprocess'."""
+    mode = os.environ.get(DISPATCH_ENV, "subprocess").strip().lower()
+    return "inproc" if mode in {"inproc", "in-process", "inprocess"} else "subprocess"
+
+
+# =============================================================================
+# Latency histogram
+# =============================================================================
+
+class LatencyHistogram:
+    """Thread-safe per-tool latency histogram (fixed buckets + recent window)."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._lock = threading.Lock()
+        self._tools: dict[str, dict] = {}
+
+    def record(self, tool: str, elapsed_ms: float, mode: str, ok: bool = True) -> None:
+        """Record one call's wall time."""
+        with self._lock:
+            stats = self._tools.get(tool)
+            if stats is None:
+                stats = {
+                    "count": 0,
+                    "errors": 0,
+                    "total_ms": 0.0,
+                    "modes": {},
+                    "buckets": [0] * (len(self.buckets_ms) + 1),
+                    "recent": deque(maxlen=_LATENCY_WINDOW),
+                }
+                self._tools[tool] = stats
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            if not ok:
+                stats["errors"] += 1
+            stats["modes"][mode] = stats["modes"].get(mode, 0) + 1
+            stats["buckets"][self._bucket_index(elapsed_ms)] += 1
+            stats["recent"].append(elapsed_ms)
+
+    def _bucket_index(self, elapsed_ms: float) -> int:
+        for i, bound in enumerate(self.buckets_ms):
+            if elapsed_ms <= bound:
+                return i
+        return len(self.buckets_ms)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per-tool counts, bucket counts and p50/p95/max (ms) over the recent window."""
+        labels = [f"le_{b}ms" for b in self.buckets_ms] + ["inf"]
+        out = {}
+        with self._lock:
+            for tool, stats in sorted(self._tools.items()):
+                ordered = sorted(stats["recent"])
+                out[tool] = {
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "modes": dict(stats["modes"]),
+                    "mean_ms": round(stats["total_ms"] / stats["count"], 2),
+                    "p50_ms": round(ordered[len(ordered) // 2], 2),
+                    "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+                    "max_ms": round(ordered[-1], 2),
+                    "buckets": {
+                        label: n for label, n in zip(labels, stats["buckets"], strict=True) if n
+                    },
+                }
+        return out
+
+
+# =============================================================================
+# Thread-routed standard streams
+# =============================================================================
+
+class _ThreadRoutedStream:
+    """Stand-in for sys.stdin/stdout/stderr that routes per worker thread.
+
+    Threads that called route() read/write their own buffer; every other
+    thread (including the MCP stdio transport) sees the original stream.
+    """
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    def _target(self):
+        stream = getattr(self._local, "stream", None)
+        return self._default if stream is None else stream
+
+    def route(self, stream) -> None:
+        self._local.stream = stream
+
+    def unroute(self) -> None:
+        self._local.stream = None
+
+    def write(self, s):
+        return self._target().write(s)
+
+    def read(self, *args):
+        return self._target().read(*args)
+
+    def readline(self, *args):
+        return self._target().readline(*args)
+
+    def __iter__(self):
+        return iter(self._target())
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+
+_routing_lock = threading.Lock()
+
+
+def _install_stream_routing() -> tuple[_ThreadRoutedStream, _ThreadRoutedStream, _ThreadRoutedStream]:
+    """Replace sys.stdin/stdout/stderr with routed wrappers (idempotent)."""
+    with _routing_lock:
+        for name in ("stdin", "stdout", "stderr"):
+            current = getattr(sys, name)
+            if not isinstance(current, _ThreadRoutedStream):
+                setattr(sys, name, _ThreadRoutedStream(current))
+        return sys.stdin, sys.stdout, sys.stderr  # type: ignore[return-value]
+
+
+def _clear_cwd_caches() -> None:
+    """Drop empirica's cwd-derived caches (the resolved git root) after a chdir."""
+    try:
+        from empirica.config.path_resolver import clear_path_caches
+    except ImportError:
+        return
+    clear_path_caches()
+
+
+class _CwdGate:
+    """Share the process cwd and environment between concurrent calls.
+
+    Calls run concurrently while the process is in their cwd (or they need
+    none) and no in-flight call has changed os.environ. Otherwise a call
+    waits for in-flight calls to finish: the environment is restored to the
+    snapshot taken when the first of them entered, the cwd is switched and
+    cwd-derived caches are cleared.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._active = 0
+        self._env: dict[str, str] | None = None
+
+    def _ready(self, target: str | None) -> bool:
+        if not self._active:
+            return True
+        if target and os.path.realpath(os.getcwd()) != target:
+            return False
+        return dict(os.environ) == self._env
+
+    def ready(self, cwd: str | None) -> bool:
+        """True if a call for `cwd` could enter without waiting."""
+        with self._cond:
+            return self._ready(os.path.realpath(cwd) if cwd else None)
+
+    def acquire(self, cwd: str | None, timeout: float | None = None) -> None:
+        """Take the shared cwd/environment for one call; pair with release().
+
+        Raises:
+            TimeoutError: the process could not be switched to `cwd` within
+                `timeout` seconds because other calls are still running
+        """
+        target = os.path.realpath(cwd) if cwd else None
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._ready(target), timeout):
+                raise TimeoutError(f"cwd {cwd} busy for {timeout}s")
+            if not self._active:
+                self._env = dict(os.environ)
+                if target and os.path.realpath(os.getcwd()) != target:
+                    os.chdir(target)
+                    _clear_cwd_caches()
+            self._active += 1
+
+    def release(self) -> None:
+        """End one call; the last one out restores the environment snapshot."""
+        with self._cond:
+            self._active -= 1
+            if not self._active and dict(os.environ) != self._env:
+                os.environ.clear()
+                os.environ.update(self._env)
+            self._cond.notify_all()
+
+
+# =============================================================================
+# In-process dispatcher
+# =============================================================================
+
+class InProcessDispatcher:
+    """Run `empirica` CLI invocations in-process on a bounded worker pool."""
+
+    def __init__(self, max_workers: int | None = None):
+        if max_workers is None:
+            max_workers = int(os.environ.get(WORKERS_ENV, "4"))
+        self.max_workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                        thread_name_prefix="empirica-mcp-inproc")
+        self._cwd_gate = _CwdGate()
+        self._hung = 0
+        self._hung_lock = threading.Lock()
+        self._cli_main = None
+        self._import_error: str | None = None
+
+    def available(self) -> bool:
+        """True if the empirica CLI can be imported into this process."""
+        if self._cli_main is None and self._import_error is None:
+            try:
+                from empirica.cli.cli_core import main as cli_main
+                self._cli_main = cli_main
+            except Exception as e:
+                self._import_error = f"{type(e).__name__}: {e}"
+                logger.warning(f"In-process dispatch unavailable, using subprocess: {self._import_error}")
+        return self._cli_main is not None
+
+    def run(self, argv: list[str], stdin_text: str | None = None,
+            cwd: str | None = None, timeout: float | None = None) -> subprocess.CompletedProcess:
+        """Run one CLI invocation synchronously, capturing its streams.
+
+        Args:
+            argv: CLI arguments without the program name
+            stdin_text: Data for the command's stdin (empty when None)
+            cwd: Working directory for the call
+            timeout: Longest wait (seconds) for other calls to free the cwd
+
+        Returns:
+            CompletedProcess with the same shape the subprocess path yields
+
+        Raises:
+            subprocess.TimeoutExpired: the cwd stayed busy for `timeout`
+        """
+        if not self.available():
+            raise RuntimeError(f"empirica CLI not importable: {self._import_error}")
+
+        stdin, stdout, stderr = _install_stream_routing()
+        out, err = io.StringIO(), io.StringIO()
+        returncode = 0
+        try:
+            self._cwd_gate.acquire(cwd, timeout)
+        except TimeoutError:
+            raise subprocess.TimeoutExpired(argv, timeout) from None
+        stdin.route(io.StringIO(stdin_text or ""))
+        stdout.route(out)
+        stderr.route(err)
+        try:
+            self._cli_main(list(argv))
+        except SystemExit as e:
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                err.write(f"{e.code}\n")
+                returncode = 1
+        except Exception:
+            err.write(traceback.format_exc())
+            returncode = 1
+        finally:
+            stdin.unroute()
+            stdout.unroute()
+            stderr.unroute()
+            self._cwd_gate.release()
+
+        return subprocess.CompletedProcess(argv, returncode, out.getvalue(), err.getvalue())
+
+    def accepts(self, cwd: str | None) -> bool:
+        """False while a timed-out call still holds the process in another cwd.
+
+        Such a call cannot be interrupted, so callers should use the
+        subprocess path for other projects until it returns.
+        """
+        with self._hung_lock:
+            hung = self._hung
+        return not hung or self._cwd_gate.ready(cwd)
+
+    def _hung_done(self, _future) -> None:
+        with self._hung_lock:
+            self._hung -= 1
+
+    async def call(self, argv: list[str], stdin_text: str | None, cwd: str | None,
+                   timeout: float) -> subprocess.CompletedProcess:
+        """Run on the worker pool; raises subprocess.TimeoutExpired on timeout.
+
+        A timed-out call cannot be killed — it keeps its worker and the cwd
+        until it returns, and accepts() turns other projects away meanwhile —
+        so use isolate=True for tools that can hang.
+        """
+        future = self._pool.submit(self.run, argv, stdin_text, cwd, timeout)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except TimeoutError:
+            if not future.done():
+                with self._hung_lock:
+                    self._hung += 1
+                future.add_done_callback(self._hung_done)
+            raise subprocess.TimeoutExpired(argv, timeout) from None
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class ToolTimer:
+    """Context manager recording one tool call into a LatencyHistogram."""
+
+    def __init__(self, histogram: LatencyHistogram, tool: str, mode: str):
+        self.histogram = histogram
+        self.tool = tool
+        self.mode = mode
+        self.ok = True
+
+    def __enter__(self) -> ToolTimer:  # noqa: PYI034 — typing.Self needs Python 3.11
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        self.histogram.record(self.tool, elapsed_ms, self.mode, ok=self.ok and exc_type is None)
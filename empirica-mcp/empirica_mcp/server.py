@@ -11,6 +11,9 @@ Architecture:
 - All commands run with stdin=DEVNULL and timeout (no hanging)
 - Graceful: if CLI not found, returns clear error
 - Stateless: no session state in the server itself
+- Optional in-process dispatch (EMPIRICA_MCP_DISPATCH=inproc, see
+  dispatch.py); `isolate` entries always use the subprocess path
+- Per-tool latency histogram exposed via the get_server_stats tool
 
 Version tracked via the empirica-mcp package metadata (see pyproject.toml).
 Last TOOL_REGISTRY re-verification against `empirica --help`: 2026-04-05
@@ -30,6 +33,13 @@ from mcp import types
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
+from empirica_mcp.dispatch import (
+    InProcessDispatcher,
+    LatencyHistogram,
+    ToolTimer,
+    dispatch_mode,
+)
+
 logger = logging.getLogger(__name__)
 
 # CLI resolution
@@ -52,7 +62,9 @@ MAX_OUTPUT = 30000
 # =============================================================================
 # Tool Registry — single source of truth for tool→CLI mapping
 # =============================================================================
-# Each entry: {cli, params, required, desc, stdin_json?}
+# Each entry: {cli, params, required, desc, stdin_json?, isolate?}
+# isolate=True keeps a tool on the subprocess path under in-process dispatch
+# (long-running, network-bound, or reports on the installed CLI itself)
 # Params verified against CLI --help on 2026-04-05
 
 TOOL_REGISTRY: dict[str, dict] = {
@@ -239,6 +251,7 @@ TOOL_REGISTRY: dict[str, dict] = {
         "cli": "sync-push",
         "params": {"remote": "--remote", "dry_run": "--dry-run", "force": "--force"},
         "required": [],
+        "isolate": True,
         "desc": (
             "Push local .empirica/ state to git remote. Cortex's git_watcher consumes the "
             "push and ingests artifacts into the project's Qdrant collection. Use after a "
@@ -258,6 +271,7 @@ TOOL_REGISTRY: dict[str, dict] = {
         "cli": "doctor",
         "params": {},
         "required": [],
+        "isolate": True,
         "desc": (
             "Frontend-agnostic Empirica health check. Returns structured JSON: "
             "Python version, empirica CLI path/version, empirica-mcp path, .empirica/ "
@@ -350,6 +364,7 @@ TOOL_REGISTRY: dict[str, dict] = {
         "cli": "project-embed",
         "params": {"project_id": "--project-id"},
         "required": [],
+        "isolate": True,
         "desc": "Embed project artifacts to Qdrant for semantic search",
     },
 
@@ -831,6 +846,32 @@ def _build_tool_schema(name: str, entry: dict) -> types.Tool:
 
 app = Server("empirica")
 
+_LATENCY = LatencyHistogram()
+_inproc: InProcessDispatcher | None = None
+
+
+def _get_inproc_dispatcher() -> InProcessDispatcher | None:
+    """The in-process dispatcher, or None in subprocess mode / if unavailable."""
+    global _inproc
+    if dispatch_mode() != "inproc":
+        return None
+    if _inproc is None:
+        _inproc = InProcessDispatcher()
+    return _inproc if _inproc.available() else None
+
+
+def _server_stats() -> dict:
+    """Dispatch configuration + per-tool latency histogram."""
+    dispatcher = _get_inproc_dispatcher()
+    return {
+        "ok": True,
+        "dispatch_mode": "inproc" if dispatcher else "subprocess",
+        "inproc_workers": dispatcher.max_workers if dispatcher else 0,
+        "isolated_tools": sorted(n for n, e in TOOL_REGISTRY.items() if e.get("isolate")),
+        "latency_buckets_ms": list(_LATENCY.buckets_ms),
+        "tools": _LATENCY.snapshot(),
+    }
+
 
 @app.list_tools()
 async def list_tools() -> list[types.Tool]:
@@ -842,6 +883,11 @@ async def list_tools() -> list[types.Tool]:
         description="Get introduction to the Empirica epistemic framework",
         inputSchema={"type": "object", "properties": {}},
     ))
+    tools.append(types.Tool(
+        name="get_server_stats",
+        description="Diagnostics: dispatch mode and per-tool call latency histogram (ms)",
+        inputSchema={"type": "object", "properties": {}},
+    ))
     return tools
 
 
@@ -926,6 +972,9 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
             "commands": sorted(TOOL_REGISTRY.keys()),
         }, indent=2))]
 
+    if name == "get_server_stats":
+        return [types.TextContent(type="text", text=json.dumps(_server_stats(), indent=2))]
+
     entry = TOOL_REGISTRY.get(name)
     if not entry:
         return _err_text({
@@ -934,35 +983,45 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
             "available": sorted(TOOL_REGISTRY.keys()),
         })
 
-    if not EMPIRICA_CLI:
+    cmd, stdin_data = _build_cli_command(entry, arguments)
+    cwd = _resolve_cwd(arguments)
+
+    dispatcher = None if entry.get("isolate") else _get_inproc_dispatcher()
+    if dispatcher is not None and not dispatcher.accepts(cwd):
+        dispatcher = None
+    if dispatcher is None and not EMPIRICA_CLI:
         return _err_text({
             "ok": False,
             "error": "empirica CLI not found. Install: pip install empirica",
         })
 
-    cmd, stdin_data = _build_cli_command(entry, arguments)
-    cwd = _resolve_cwd(arguments)
-
     timeout = CASCADE_TIMEOUT if entry.get("stdin_json") else CLI_TIMEOUT
+    stdin_text = stdin_data.decode("utf-8") if stdin_data else None
     loop = asyncio.get_event_loop()
-    try:
-        result = await loop.run_in_executor(
-            None,
-            lambda: subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                input=stdin_data.decode("utf-8") if stdin_data else None,
-                stdin=None if stdin_data else subprocess.DEVNULL,
-                cwd=cwd,
-                timeout=timeout,
-            ),
-        )
-    except subprocess.TimeoutExpired:
-        return _err_text({
-            "ok": False,
-            "error": f"Command timed out ({timeout}s): {entry['cli']}",
-        })
+    with ToolTimer(_LATENCY, name, "inproc" if dispatcher else "subprocess") as timer:
+        try:
+            if dispatcher is not None:
+                result = await dispatcher.call(cmd[1:], stdin_text, cwd, timeout)
+            else:
+                result = await loop.run_in_executor(
+                    None,
+                    lambda: subprocess.run(
+                        cmd,
+                        capture_output=True,
+                        text=True,
+                        input=stdin_text,
+                        stdin=None if stdin_data else subprocess.DEVNULL,
+                        cwd=cwd,
+                        timeout=timeout,
+                    ),
+                )
+        except subprocess.TimeoutExpired:
+            timer.ok = False
+            return _err_text({
+                "ok": False,
+                "error": f"Command timed out ({timeout}s): {entry['cli']}",
+            })
+        timer.ok = result.returncode == 0
 
     if result.returncode == 0:
         output = result.stdout or result.stderr or '{"ok": true}'
@@ -1010,7 +1069,11 @@ def run():
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
 
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    finally:
+        if _inproc is not None:
+            _inproc.shutdown()
 
 
 if __name__ == "__main__":
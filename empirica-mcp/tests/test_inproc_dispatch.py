@@ -0,0 +1,164 @@
+"""Tests for empirica-mcp's in-process dispatch and latency histogram.
+
+Covers empirica_mcp.dispatch:
+- InProcessDispatcher.run — per-thread stdin/stdout/stderr capture, exit codes
+- Concurrent calls don't see each other's streams
+- _CwdGate — calls run in the requested cwd with fresh cwd-derived caches,
+  and handlers' os.environ changes don't outlive the call
+- InProcessDispatcher.call — timeout surfaces as subprocess.TimeoutExpired,
+  and other projects are turned away while the timed-out call runs
+- LatencyHistogram — bucket counts, percentiles, per-mode counters
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from empirica_mcp.dispatch import InProcessDispatcher, LatencyHistogram, dispatch_mode
+
+
+def _fake_cli(argv):
+    """Stand-in for empirica.cli.cli_core.main: echo argv/stdin/cwd as JSON."""
+    if argv and argv[0] == "boom":
+        raise ValueError("handler exploded")
+    if argv and argv[0] == "sleep":
+        time.sleep(float(argv[1]))
+    if argv and argv[0] == "export":
+        os.environ["EMPIRICA_TEST_EXPORT"] = argv[1]
+    if argv and argv[0] == "root":
+        from empirica.config.path_resolver import get_git_root
+        print(get_git_root())
+        sys.exit(0)
+    payload = sys.stdin.read() if "-" in argv else None
+    print(json.dumps({"argv": argv, "stdin": payload, "cwd": os.getcwd(),
+                      "export": os.environ.get("EMPIRICA_TEST_EXPORT")}))
+    sys.stderr.write("note\n")
+    sys.exit(3 if "--fail" in argv else 0)
+
+
+@pytest.fixture
+def dispatcher():
+    d = InProcessDispatcher(max_workers=4)
+    d._cli_main = _fake_cli
+    yield d
+    d.shutdown(wait=True)
+
+
+def test_run_captures_stdout_stdin_and_exit_code(dispatcher, tmp_path, monkeypatch):
+    monkeypatch.chdir(os.getcwd())  # restore the process cwd afterwards
+    result = dispatcher.run(["preflight-submit", "--output", "json", "-"],
+                            stdin_text='{"session_id": "s1"}', cwd=str(tmp_path))
+
+    assert result.returncode == 0
+    assert result.stderr == "note\n"
+    out = json.loads(result.stdout)
+    assert out["stdin"] == '{"session_id": "s1"}'
+    assert os.path.realpath(out["cwd"]) == os.path.realpath(tmp_path)
+
+
+def test_run_reports_nonzero_exit_and_exceptions(dispatcher):
+    assert dispatcher.run(["goals-list", "--fail"]).returncode == 3
+
+    result = dispatcher.run(["boom"])
+    assert result.returncode == 1
+    assert "handler exploded" in result.stderr
+
+
+def test_concurrent_calls_keep_streams_separate(dispatcher):
+    results = {}
+
+    def worker(i):
+        results[i] = dispatcher.run(["finding-log", f"--n={i}"])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for i, result in results.items():
+        assert json.loads(result.stdout)["argv"] == ["finding-log", f"--n={i}"]
+
+
+def test_caller_streams_untouched_outside_workers(dispatcher, capsys):
+    dispatcher.run(["finding-log"])
+    print("from-test")
+    assert capsys.readouterr().out == "from-test\n"
+
+
+def test_call_timeout_raises_timeout_expired(dispatcher):
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(dispatcher.call(["sleep", "0.5"], None, None, timeout=0.05))
+
+
+def test_environment_changes_do_not_leak(dispatcher, monkeypatch):
+    monkeypatch.delenv("EMPIRICA_TEST_EXPORT", raising=False)
+    assert json.loads(dispatcher.run(["export", "a"]).stdout)["export"] == "a"
+
+    assert json.loads(dispatcher.run(["finding-log"]).stdout)["export"] is None
+    assert "EMPIRICA_TEST_EXPORT" not in os.environ
+
+
+def test_each_cwd_resolves_its_own_git_root(dispatcher, tmp_path, monkeypatch):
+    monkeypatch.chdir(os.getcwd())
+    roots = {}
+    for name in ("project-a", "project-b"):
+        root = tmp_path / name
+        root.mkdir()
+        subprocess.run(["git", "init", "-q", str(root)], check=True)
+        roots[name] = os.path.realpath(root)
+
+    for name in ("project-a", "project-b", "project-a"):
+        result = dispatcher.run(["root"], cwd=roots[name])
+        assert os.path.realpath(result.stdout.strip()) == roots[name]
+
+
+def test_timed_out_call_routes_other_projects_away(dispatcher, tmp_path, monkeypatch):
+    monkeypatch.chdir(os.getcwd())
+    busy, other = tmp_path / "busy", tmp_path / "other"
+    busy.mkdir()
+    other.mkdir()
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(dispatcher.call(["sleep", "0.5"], None, str(busy), timeout=0.05))
+    assert dispatcher.accepts(str(busy))
+    assert not dispatcher.accepts(str(other))
+    # A direct call for the other project waits at most its timeout
+    with pytest.raises(subprocess.TimeoutExpired):
+        dispatcher.run(["finding-log"], cwd=str(other), timeout=0.05)
+
+    deadline = time.monotonic() + 5
+    while not dispatcher.accepts(str(other)) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert dispatcher.accepts(str(other))
+    out = json.loads(dispatcher.run(["finding-log"], cwd=str(other), timeout=1).stdout)
+    assert os.path.realpath(out["cwd"]) == os.path.realpath(other)
+
+
+def test_histogram_buckets_and_percentiles():
+    hist = LatencyHistogram(buckets_ms=(10, 100))
+    for ms in (1, 5, 50, 500):
+        hist.record("finding_log", ms, "inproc")
+    hist.record("finding_log", 20, "subprocess", ok=False)
+
+    snap = hist.snapshot()["finding_log"]
+    assert snap["count"] == 5
+    assert snap["errors"] == 1
+    assert snap["modes"] == {"inproc": 4, "subprocess": 1}
+    assert snap["buckets"] == {"le_10ms": 2, "le_100ms": 2, "inf": 1}
+    assert snap["p50_ms"] == 20
+    assert snap["max_ms"] == 500
+
+
+def test_dispatch_mode_defaults_to_subprocess(monkeypatch):
+    monkeypatch.delenv("EMPIRICA_MCP_DISPATCH", raising=False)
+    assert dispatch_mode() == "subprocess"
+    monkeypatch.setenv("EMPIRICA_MCP_DISPATCH", "inproc")
+    assert dispatch_mode() == "inproc"
@@ -7,7 +7,6 @@ for real-time data without requiring a sync pipeline.
 All queries use ? placeholders (auto-converted for PostgreSQL).
 """
 
-import json
 import logging
 import os
 import subprocess
@@ -15,6 +14,8 @@ import time
 
 from flask import Blueprint, jsonify, request
 
+from empirica.core.canonical.empirica_git.notes_reader import get_notes_reader
+
 bp = Blueprint("deltas", __name__)
 logger = logging.getLogger(__name__)
 
@@ -166,27 +167,13 @@ def _find_repo_for_commit(commit_sha: str) -> str | None:
 
 
 def _read_note_blob(repo_path: str, ref: str) -> dict | None:
-    """Read JSON blob from a git notes ref in a bare repo."""
+    """Read JSON blob from a git notes ref in a bare repo.
+
+    Goes through the repo's shared `git cat-file --batch` reader, so
+    repeated reads don't spawn git processes.
+    """
     try:
-        # ref -> commit -> tree -> blob -> content
-        commit_sha = _git_cmd(repo_path, "rev-parse", ref)
-        if not commit_sha:
-            return None
-        tree_line = _git_cmd(repo_path, "cat-file", "-p", commit_sha)
-        tree_sha = None
-        for line in tree_line.split("\n"):
-            if line.startswith("tree "):
-                tree_sha = line.split()[1]
-                break
-        if not tree_sha:
-            return None
-        ls_tree = _git_cmd(repo_path, "ls-tree", tree_sha)
-        if not ls_tree:
-            return None
-        first_line = ls_tree.split("\n")[0]
-        blob_sha = first_line.split()[2]
-        content = _git_cmd(repo_path, "cat-file", "-p", blob_sha)
-        return json.loads(content)
+        return get_notes_reader(repo_path).read_note_json(ref)
     except Exception:
         return None
 
@@ -209,23 +196,10 @@ def _build_head_commit_index(repo_path: str) -> dict[str, list[str]]:
         return cached[1]
 
     index: dict[str, list[str]] = {}
-    refs_output = _git_cmd(
-        repo_path, "for-each-ref", "--format=%(refname)",
-        "refs/notes/empirica/session/"
-    )
-    if not refs_output:
-        _head_commit_index_cache[repo_path] = (now, index)
-        return index
-
-    for ref in refs_output.split("\n"):
-        if not ref:
-            continue
+    reader = get_notes_reader(repo_path)
+    for ref, data in reader.list_notes_json("refs/notes/empirica/session/"):
         parts = ref.split("/")
-        if len(parts) < 7:
-            continue
-
-        data = _read_note_blob(repo_path, ref)
-        if not data:
+        if len(parts) < 7 or not data:
             continue
 
         # Cache the full data for later retrieval
@@ -276,13 +250,8 @@ def _get_assessment_from_ref(repo_path: str, ref: str) -> dict | None:
 
 def _get_session_refs(repo_path: str, session_id: str) -> list[str]:
     """Get all refs for a specific session."""
-    refs_output = _git_cmd(
-        repo_path, "for-each-ref", "--format=%(refname)",
-        f"refs/notes/empirica/session/{session_id}/"
-    )
-    if not refs_output:
-        return []
-    return [r for r in refs_output.split("\n") if r]
+    reader = get_notes_reader(repo_path)
+    return [ref for ref, _ in reader.list_refs(f"refs/notes/empirica/session/{session_id}/")]
 
 
 def _find_session_for_commit(commit_sha: str, repo_path: str) -> dict | None:
@@ -383,22 +352,14 @@ def _get_session_findings(repo_path: str, session_id: str) -> list[str]:
 
     # Build full index
     session_findings: dict[str, list[str]] = {}
-    refs_output = _git_cmd(
-        repo_path, "for-each-ref", "--format=%(refname)",
-        "refs/notes/empirica/findings/"
-    )
-    if refs_output:
-        for ref in refs_output.split("\n"):
-            if not ref:
-                continue
-            data = _read_note_blob(repo_path, ref)
-            if data:
-                sid = data.get("session_id", "")[:8]
-                finding_text = data.get("finding", "")
-                if sid and finding_text:
-                    if sid not in session_findings:
-                        session_findings[sid] = []
-                    session_findings[sid].append(finding_text[:200])
+    reader = get_notes_reader(repo_path)
+    for _ref, data in reader.list_notes_json("refs/notes/empirica/findings/"):
+        sid = data.get("session_id", "")[:8]
+        finding_text = data.get("finding", "")
+        if sid and finding_text:
+            if sid not in session_findings:
+                session_findings[sid] = []
+            session_findings[sid].append(finding_text[:200])
 
     _findings_cache[repo_path] = (now, session_findings)
     return session_findings.get(session_id[:8], [])
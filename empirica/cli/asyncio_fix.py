@@ -5,6 +5,7 @@ Prevents "Event loop is closed" errors when httpx clients
 try to cleanup after the main event loop has been closed.
 """
 import os
+import sys
 import warnings
 
 # Set environment variable to prevent httpx cleanup issues
@@ -91,8 +92,22 @@ def patch_asyncio_for_mcp():
 
     return _event_loop_ref
 
-# Auto-apply fix on import
-try:
-    patch_asyncio_for_mcp()
-except Exception:
-    pass  # Don't fail if patching doesn't work
+
+_patched = False
+
+
+def patch_if_loaded():
+    """Apply patch_asyncio_for_mcp() once, only if asyncio/httpx are already imported.
+
+    The CLI calls this after importing the command's handler module, so
+    commands that never touch asyncio or httpx don't pay their import cost.
+    """
+    global _patched
+    if _patched:
+        return
+    if 'asyncio' in sys.modules or 'httpx' in sys.modules:
+        _patched = True
+        try:
+            patch_asyncio_for_mcp()
+        except Exception:
+            pass  # Don't fail if patching doesn't work
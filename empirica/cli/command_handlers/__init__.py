@@ -4,277 +4,220 @@ Command Handlers Module - Modular CLI Command Implementations
 Organizes CLI command handlers by semantic function for maintainability.
 """
 
-# Import all command handlers
-from .action_commands import handle_act_log_command, handle_investigate_log_command
+import importlib
 
-# mistake commands consolidated into artifact_log_commands.py
-from .artifact_log_commands import (
-    handle_assumption_log_command,
-    handle_deadend_log_command,
-    handle_decision_log_command,
-    handle_engagement_focus_command,
-    handle_finding_log_command,
-    handle_mistake_log_command,
-    handle_mistake_query_command,
-    handle_source_add_command,
-    handle_source_archive_command,
-    handle_source_list_command,
-    handle_sources_map_command,
-    handle_unknown_list_command,
-    handle_unknown_log_command,
-    handle_unknown_resolve_command,
-)
-from .artifacts_commands import handle_artifacts_generate_command
-from .checkpoint_commands import (
-    handle_checkpoint_create_command,
-    handle_checkpoint_diff_command,
-    handle_checkpoint_list_command,
-    handle_checkpoint_load_command,
-    handle_efficiency_report_command,
-)
-from .checkpoint_signing_commands import (
-    handle_checkpoint_sign_command,
-    handle_checkpoint_signatures_command,
-    handle_checkpoint_verify_command,
-)
-from .cockpit_commands import (
-    handle_loop_group_command,
-    handle_sentinel_group_command,
-)
-from .cockpit_commands import (
-    handle_status_command as handle_cockpit_status_command,
-)
-from .cockpit_launcher_commands import (
-    handle_cockpit_detach_command,
-    handle_cockpit_group_command,
-    handle_cockpit_kill_command,
-    handle_cockpit_launch_command,
-)
-from .cockpit_launcher_commands import (
-    handle_cockpit_status_command as handle_cockpit_launcher_status_command,
-)
-from .code_embed import (
-    handle_code_embed_command,
-)
-from .commit_context_commands import handle_commit_context_command
-from .compact_analysis import handle_compact_analysis
-from .compliance_report_commands import (
-    handle_compliance_report_command,
-)
-from .config_commands import (
-    handle_config_command,
-    handle_config_get_command,
-    handle_config_init_command,
-    handle_config_set_command,
-    handle_config_show_command,
-    handle_config_validate_command,
-)
-from .diagnose import handle_diagnose_command
-from .doc_commands import (
-    handle_doc_check_command,
-    handle_doc_plan_suggest_command,
-)
-from .doctor import handle_doctor_command
-from .ecosystem_commands import (
-    handle_ecosystem_check_command,
-)
-from .enp_commands import handle_enp_setup_command
-from .entity_commands import (
-    handle_entity_create_command,
-    handle_entity_list_command,
-    handle_entity_search_command,
-    handle_entity_show_command,
-    handle_entity_walk_command,
-)
-from .epistemics_commands import (
-    handle_epistemics_list_command,
-    handle_epistemics_search_command,
-    handle_epistemics_stats_command,
-)
-from .epp_commands import (
-    handle_epp_activate_command,
-)
-from .git_commands import handle_history_command, handle_save_command
-from .goal_commands import (
-    handle_goals_activate_command,
-    handle_goals_add_dependency_command,
-    handle_goals_add_task_command,
-    handle_goals_claim_command,
-    handle_goals_complete_command,
-    handle_goals_complete_task_command,
-    handle_goals_create_command,
-    handle_goals_discover_command,
-    handle_goals_get_stale_command,
-    handle_goals_get_tasks_command,
-    handle_goals_list_command,
-    handle_goals_mark_stale_command,
-    handle_goals_progress_command,
-    handle_goals_prune_command,
-    handle_goals_ready_command,
-    handle_goals_refresh_command,
-    handle_goals_resume_command,
-    handle_goals_search_command,
-    handle_sessions_resume_command,
-)
-from .graph_commands import (
-    handle_delete_artifacts_command,
-    handle_log_artifacts_command,
-    handle_resolve_artifacts_command,
-)
-from .handoff_commands import handle_handoff_create_command, handle_handoff_query_command
-from .identity_commands import (
-    handle_identity_create_command,
-    handle_identity_export_command,
-    handle_identity_list_command,
-    handle_identity_verify_command,
-)
-from .investigation_commands import (
-    handle_analyze_command,
-    handle_investigate_checkpoint_branch_command,
-    handle_investigate_command,
-    handle_investigate_create_branch_command,
-    handle_investigate_merge_branches_command,
-    handle_investigate_multi_command,
-)
-from .lesson_commands import (
-    handle_lesson_create_command,
-    handle_lesson_embed_command,
-    handle_lesson_list_command,
-    handle_lesson_load_command,
-    handle_lesson_path_command,
-    handle_lesson_recommend_command,
-    handle_lesson_replay_end_command,
-    handle_lesson_replay_start_command,
-    handle_lesson_search_command,
-    handle_lesson_stats_command,
-)
-from .mcp_commands import handle_mcp_list_tools_command
-from .monitor_commands import (
-    handle_assess_state_command,
-    handle_calibration_dispute_command,
-    handle_calibration_report_command,
-    handle_mco_load_command,
-    handle_monitor_command,
-    handle_monitor_cost_command,
-    handle_monitor_export_command,
-    handle_monitor_reset_command,
-    handle_system_status_command,
-    handle_trajectory_project_command,
-    handle_workflow_patterns_command,
-)
-from .noetic_batch_commands import handle_noetic_batch_command
-from .notify_commands import (
-    handle_notify_backends_command,
-    handle_notify_config_command,
-    handle_notify_emit_command,
-    handle_notify_group_command,
-    handle_notify_test_command,
-)
-from .onboard import handle_onboard_command
-from .performance_commands import handle_benchmark_command, handle_performance_command
-from .profile_commands import (
-    handle_profile_import_command,
-    handle_profile_prune_command,
-    handle_profile_status_command,
-    handle_profile_sync_command,
-)
-from .project_bootstrap import handle_project_bootstrap_command
-from .project_commands import (
-    handle_project_create_command,
-    handle_project_handoff_command,
-    handle_project_list_command,
-    handle_project_switch_command,
-)
-from .project_embed import (
-    handle_project_embed_command,
-)
-from .project_init import handle_project_init_command
-from .project_search import (
-    handle_project_search_command,
-)
-from .project_update import handle_project_update_command
-from .projects_commands import (
-    handle_daemon_deny_command,
-    handle_daemon_grant_command,
-    handle_daemon_grants_list_command,
-    handle_daemon_list_command,
-    handle_project_register_command,
-    handle_projects_bulk_register_command,
-    handle_projects_discover_command,
-    handle_projects_list_command,
-    handle_projects_sync_command,
-    handle_projects_unregister_command,
-)
-from .release_commands import handle_release_command
-from .scan_commands import (
-    handle_scan_command,
-    handle_scan_diff_command,
-    handle_scan_history_command,
-    handle_scan_show_command,
-    handle_services_audit_command,
-)
-from .security_audit_commands import handle_security_audit_command
-from .sentinel_commands import (
-    handle_sentinel_check_command,
-    handle_sentinel_load_profile_command,
-    handle_sentinel_orchestrate_command,
-    handle_sentinel_status_command,
-)
-from .serve_commands import handle_serve_command
-from .session_commands import (
-    handle_memory_compact_command,
-    handle_session_snapshot_command,
-    handle_sessions_export_command,
-    handle_sessions_list_command,
-    handle_sessions_show_command,
-    handle_transaction_adopt_command,
-)
-from .session_create import handle_session_create_command
-from .setup_claude_code import handle_setup_claude_code_command
-from .skill_commands import (
-    handle_skill_extract_command,
-    handle_skill_fetch_command,
-    handle_skill_suggest_command,
-)
-from .sources_reconcile_commands import handle_sources_reconcile_command
-from .sync_commands import (
-    handle_rebuild_command,
-    handle_sync_config_command,
-    handle_sync_pull_command,
-    handle_sync_push_command,
-    handle_sync_status_command,
-)
-from .training_commands import (
-    handle_training_export_command,
-)
-from .visibility_commands import (
-    handle_visibility_group_command,
-    handle_visibility_list_command,
-    handle_visibility_show_command,
-)
+# Exported name → submodule. Submodules are imported on first attribute
+# access (PEP 562) so `empirica <command>` only loads the modules it uses.
+_LAZY_EXPORTS = {
+    'handle_act_log_command': 'action_commands',
+    'handle_investigate_log_command': 'action_commands',
+    'handle_assumption_log_command': 'artifact_log_commands',
+    'handle_deadend_log_command': 'artifact_log_commands',
+    'handle_decision_log_command': 'artifact_log_commands',
+    'handle_engagement_focus_command': 'artifact_log_commands',
+    'handle_finding_log_command': 'artifact_log_commands',
+    'handle_mistake_log_command': 'artifact_log_commands',
+    'handle_mistake_query_command': 'artifact_log_commands',
+    'handle_source_add_command': 'artifact_log_commands',
+    'handle_source_archive_command': 'artifact_log_commands',
+    'handle_source_list_command': 'artifact_log_commands',
+    'handle_sources_map_command': 'artifact_log_commands',
+    'handle_unknown_list_command': 'artifact_log_commands',
+    'handle_unknown_log_command': 'artifact_log_commands',
+    'handle_unknown_resolve_command': 'artifact_log_commands',
+    'handle_artifacts_generate_command': 'artifacts_commands',
+    'handle_checkpoint_create_command': 'checkpoint_commands',
+    'handle_checkpoint_diff_command': 'checkpoint_commands',
+    'handle_checkpoint_list_command': 'checkpoint_commands',
+    'handle_checkpoint_load_command': 'checkpoint_commands',
+    'handle_efficiency_report_command': 'checkpoint_commands',
+    'handle_checkpoint_sign_command': 'checkpoint_signing_commands',
+    'handle_checkpoint_signatures_command': 'checkpoint_signing_commands',
+    'handle_checkpoint_verify_command': 'checkpoint_signing_commands',
+    'handle_cockpit_status_command': 'cockpit_commands',
+    'handle_loop_group_command': 'cockpit_commands',
+    'handle_sentinel_group_command': 'cockpit_commands',
+    'handle_cockpit_detach_command': 'cockpit_launcher_commands',
+    'handle_cockpit_group_command': 'cockpit_launcher_commands',
+    'handle_cockpit_kill_command': 'cockpit_launcher_commands',
+    'handle_cockpit_launch_command': 'cockpit_launcher_commands',
+    'handle_cockpit_launcher_status_command': 'cockpit_launcher_commands',
+    'handle_code_embed_command': 'code_embed',
+    'handle_commit_context_command': 'commit_context_commands',
+    'handle_compact_analysis': 'compact_analysis',
+    'handle_compliance_report_command': 'compliance_report_commands',
+    'handle_config_command': 'config_commands',
+    'handle_config_get_command': 'config_commands',
+    'handle_config_init_command': 'config_commands',
+    'handle_config_set_command': 'config_commands',
+    'handle_config_show_command': 'config_commands',
+    'handle_config_validate_command': 'config_commands',
+    'handle_diagnose_command': 'diagnose',
+    'handle_doc_check_command': 'doc_commands',
+    'handle_doc_plan_suggest_command': 'doc_commands',
+    'handle_doctor_command': 'doctor',
+    'handle_ecosystem_check_command': 'ecosystem_commands',
+    'handle_enp_setup_command': 'enp_commands',
+    'handle_entity_create_command': 'entity_commands',
+    'handle_entity_list_command': 'entity_commands',
+    'handle_entity_search_command': 'entity_commands',
+    'handle_entity_show_command': 'entity_commands',
+    'handle_entity_walk_command': 'entity_commands',
+    'handle_epistemics_list_command': 'epistemics_commands',
+    'handle_epistemics_search_command': 'epistemics_commands',
+    'handle_epistemics_stats_command': 'epistemics_commands',
+    'handle_epp_activate_command': 'epp_commands',
+    'handle_history_command': 'git_commands',
+    'handle_save_command': 'git_commands',
+    'handle_goals_activate_command': 'goal_commands',
+    'handle_goals_add_dependency_command': 'goal_commands',
+    'handle_goals_add_task_command': 'goal_commands',
+    'handle_goals_claim_command': 'goal_commands',
+    'handle_goals_complete_command': 'goal_commands',
+    'handle_goals_complete_task_command': 'goal_commands',
+    'handle_goals_create_command': 'goal_commands',
+    'handle_goals_discover_command': 'goal_commands',
+    'handle_goals_get_stale_command': 'goal_commands',
+    'handle_goals_get_tasks_command': 'goal_commands',
+    'handle_goals_list_command': 'goal_commands',
+    'handle_goals_mark_stale_command': 'goal_commands',
+    'handle_goals_progress_command': 'goal_commands',
+    'handle_goals_prune_command': 'goal_commands',
+    'handle_goals_ready_command': 'goal_commands',
+    'handle_goals_refresh_command': 'goal_commands',
+    'handle_goals_resume_command': 'goal_commands',
+    'handle_goals_search_command': 'goal_commands',
+    'handle_sessions_resume_command': 'goal_commands',
+    'handle_delete_artifacts_command': 'graph_commands',
+    'handle_log_artifacts_command': 'graph_commands',
+    'handle_resolve_artifacts_command': 'graph_commands',
+    'handle_handoff_create_command': 'handoff_commands',
+    'handle_handoff_query_command': 'handoff_commands',
+    'handle_hook_daemon_group_command': 'hook_daemon_commands',
+    'handle_hook_daemon_run_command': 'hook_daemon_commands',
+    'handle_hook_daemon_start_command': 'hook_daemon_commands',
+    'handle_hook_daemon_status_command': 'hook_daemon_commands',
+    'handle_hook_daemon_stop_command': 'hook_daemon_commands',
+    'handle_identity_create_command': 'identity_commands',
+    'handle_identity_export_command': 'identity_commands',
+    'handle_identity_list_command': 'identity_commands',
+    'handle_identity_verify_command': 'identity_commands',
+    'handle_analyze_command': 'investigation_commands',
+    'handle_investigate_checkpoint_branch_command': 'investigation_commands',
+    'handle_investigate_command': 'investigation_commands',
+    'handle_investigate_create_branch_command': 'investigation_commands',
+    'handle_investigate_merge_branches_command': 'investigation_commands',
+    'handle_investigate_multi_command': 'investigation_commands',
+    'handle_lesson_create_command': 'lesson_commands',
+    'handle_lesson_embed_command': 'lesson_commands',
+    'handle_lesson_list_command': 'lesson_commands',
+    'handle_lesson_load_command': 'lesson_commands',
+    'handle_lesson_path_command': 'lesson_commands',
+    'handle_lesson_recommend_command': 'lesson_commands',
+    'handle_lesson_replay_end_command': 'lesson_commands',
+    'handle_lesson_replay_start_command': 'lesson_commands',
+    'handle_lesson_search_command': 'lesson_commands',
+    'handle_lesson_stats_command': 'lesson_commands',
+    'handle_mcp_list_tools_command': 'mcp_commands',
+    'handle_assess_state_command': 'monitor_commands',
+    'handle_calibration_dispute_command': 'monitor_commands',
+    'handle_calibration_report_command': 'monitor_commands',
+    'handle_mco_load_command': 'monitor_commands',
+    'handle_monitor_command': 'monitor_commands',
+    'handle_monitor_cost_command': 'monitor_commands',
+    'handle_monitor_export_command': 'monitor_commands',
+    'handle_monitor_reset_command': 'monitor_commands',
+    'handle_system_status_command': 'monitor_commands',
+    'handle_trajectory_project_command': 'monitor_commands',
+    'handle_workflow_patterns_command': 'monitor_commands',
+    'handle_noetic_batch_command': 'noetic_batch_commands',
+    'handle_notify_backends_command': 'notify_commands',
+    'handle_notify_config_command': 'notify_commands',
+    'handle_notify_emit_command': 'notify_commands',
+    'handle_notify_group_command': 'notify_commands',
+    'handle_notify_test_command': 'notify_commands',
+    'handle_onboard_command': 'onboard',
+    'handle_benchmark_command': 'performance_commands',
+    'handle_performance_command': 'performance_commands',
+    'handle_profile_import_command': 'profile_commands',
+    'handle_profile_prune_command': 'profile_commands',
+    'handle_profile_status_command': 'profile_commands',
+    'handle_profile_sync_command': 'profile_commands',
+    'handle_project_bootstrap_command': 'project_bootstrap',
+    'handle_project_create_command': 'project_commands',
+    'handle_project_handoff_command': 'project_commands',
+    'handle_project_list_command': 'project_commands',
+    'handle_project_switch_command': 'project_commands',
+    'handle_project_embed_command': 'project_embed',
+    'handle_project_init_command': 'project_init',
+    'handle_project_search_command': 'project_search',
+    'handle_project_update_command': 'project_update',
+    'handle_daemon_deny_command': 'projects_commands',
+    'handle_daemon_grant_command': 'projects_commands',
+    'handle_daemon_grants_list_command': 'projects_commands',
+    'handle_daemon_list_command': 'projects_commands',
+    'handle_project_register_command': 'projects_commands',
+    'handle_projects_bulk_register_command': 'projects_commands',
+    'handle_projects_discover_command': 'projects_commands',
+    'handle_projects_list_command': 'projects_commands',
+    'handle_projects_sync_command': 'projects_commands',
+    'handle_projects_unregister_command': 'projects_commands',
+    'handle_release_command': 'release_commands',
+    'handle_scan_command': 'scan_commands',
+    'handle_scan_diff_command': 'scan_commands',
+    'handle_scan_history_command': 'scan_commands',
+    'handle_scan_show_command': 'scan_commands',
+    'handle_services_audit_command': 'scan_commands',
+    'handle_security_audit_command': 'security_audit_commands',
+    'handle_sentinel_check_command': 'sentinel_commands',
+    'handle_sentinel_load_profile_command': 'sentinel_commands',
+    'handle_sentinel_orchestrate_command': 'sentinel_commands',
+    'handle_sentinel_status_command': 'sentinel_commands',
+    'handle_serve_command': 'serve_commands',
+    'handle_memory_compact_command': 'session_commands',
+    'handle_session_snapshot_command': 'session_commands',
+    'handle_sessions_export_command': 'session_commands',
+    'handle_sessions_list_command': 'session_commands',
+    'handle_sessions_show_command': 'session_commands',
+    'handle_transaction_adopt_command': 'session_commands',
+    'handle_session_create_command': 'session_create',
+    'handle_setup_claude_code_command': 'setup_claude_code',
+    'handle_skill_extract_command': 'skill_commands',
+    'handle_skill_fetch_command': 'skill_commands',
+    'handle_skill_suggest_command': 'skill_commands',
+    'handle_sources_reconcile_command': 'sources_reconcile_commands',
+    'handle_rebuild_command': 'sync_commands',
+    'handle_sync_config_command': 'sync_commands',
+    'handle_sync_pull_command': 'sync_commands',
+    'handle_sync_push_command': 'sync_commands',
+    'handle_sync_status_command': 'sync_commands',
+    'handle_training_export_command': 'training_commands',
+    'handle_visibility_group_command': 'visibility_commands',
+    'handle_visibility_list_command': 'visibility_commands',
+    'handle_visibility_show_command': 'visibility_commands',
+    'handle_vision_analyze': 'vision_commands',
+    'handle_vision_log': 'vision_commands',
+    'handle_voice_apply_command': 'voice_commands',
+    'handle_voice_group_command': 'voice_commands',
+    'handle_voice_list_command': 'voice_commands',
+    'handle_voice_show_command': 'voice_commands',
+    'handle_check_command': 'workflow_commands',
+    'handle_check_submit_command': 'workflow_commands',
+    'handle_postflight_submit_command': 'workflow_commands',
+    'handle_preflight_submit_command': 'workflow_commands',
+    'handle_workspace_backfill_entities_command': 'workspace_commands',
+    'handle_workspace_list_command': 'workspace_commands',
+    'handle_workspace_map_command': 'workspace_commands',
+    'handle_workspace_overview_command': 'workspace_commands',
+    'handle_workspace_init_command': 'workspace_init',
+    'handle_workspace_search_command': 'workspace_search',
+}
 
-# handle_goal_analysis_command removed - was in noetic_praxic_commands (deprecated)
-from .vision_commands import handle_vision_analyze, handle_vision_log
-from .voice_commands import (
-    handle_voice_apply_command,
-    handle_voice_group_command,
-    handle_voice_list_command,
-    handle_voice_show_command,
-)
-from .workflow_commands import (
-    handle_check_command,
-    handle_check_submit_command,
-    handle_postflight_submit_command,
-    handle_preflight_submit_command,
-)
-from .workspace_commands import (
-    handle_workspace_backfill_entities_command,
-    handle_workspace_list_command,
-    handle_workspace_map_command,
-    handle_workspace_overview_command,
-)
-from .workspace_init import handle_workspace_init_command
-from .workspace_search import handle_workspace_search_command
+# Exports re-bound under a different name than in their submodule
+_RENAMED_EXPORTS = {
+    'handle_cockpit_status_command': 'handle_status_command',
+    'handle_cockpit_launcher_status_command': 'handle_cockpit_status_command',
+}
 
 # Export all handlers — deliberately grouped by domain (comments separate
 # semantic clusters), so strict alphabetical sort would lose the structure.
@@ -356,6 +299,12 @@ __all__ = [  # noqa: RUF022
     'handle_handoff_create_command',
     'handle_handoff_query_command',
     'handle_history_command',
+    # Hook daemon (warm executor for Claude Code hooks)
+    'handle_hook_daemon_group_command',
+    'handle_hook_daemon_run_command',
+    'handle_hook_daemon_start_command',
+    'handle_hook_daemon_status_command',
+    'handle_hook_daemon_stop_command',
     # NEW: Identity Management Commands (Phase 2 - EEP-1)
     'handle_identity_create_command',
     'handle_identity_export_command',
@@ -515,3 +464,18 @@ __all__ = [  # noqa: RUF022
     # Session-end command
     # 'handle_session_end_command',  # removed - use handoff-create
 ]
+
+
+def __getattr__(name):
+    """Import the submodule that provides ``name`` on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{module_name}', __name__)
+    value = getattr(module, _RENAMED_EXPORTS.get(name, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -442,9 +442,9 @@ def _check_load_dynamic_thresholds(session_id):
 
     # Dynamic thresholds from calibration history
     try:
-        from empirica.core.post_test.dynamic_thresholds import compute_dynamic_thresholds
+        from empirica.core.post_test.dynamic_thresholds import cached_dynamic_thresholds
         dt_db = _get_db_for_session(session_id)
-        dt_result = compute_dynamic_thresholds(
+        dt_result = cached_dynamic_thresholds(
             ai_id="claude-code", db=dt_db,
             base_thresholds=profile_base_thresholds,
         )
@@ -2025,7 +2025,7 @@ def _hard_delete_source_chunks(project_id: str, source_id: str) -> int:
     """
     try:
         from empirica.core.qdrant.collections import _docs_collection
-        from empirica.core.qdrant.connection import _get_qdrant_client
+        from empirica.core.qdrant.connection import _collection_exists, _get_qdrant_client
     except ImportError:
         return 0
     client = _get_qdrant_client()
@@ -2034,7 +2034,7 @@ def _hard_delete_source_chunks(project_id: str, source_id: str) -> int:
     try:
         from qdrant_client.models import FieldCondition, Filter, MatchValue
         coll = _docs_collection(project_id)
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return 0
         # Match either source_id payload key directly, or the source's URL
         # if chunks were keyed by url.
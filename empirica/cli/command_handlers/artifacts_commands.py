@@ -97,183 +97,60 @@ def _get_ts(data):
 # ── Git Notes Reader ──
 
 
-def _read_note_blob(workspace, ref):
-    """Read JSON content from a git notes ref.
-
-    Git notes refs point to commits whose trees contain blobs.
-    Walk: ref → commit → tree → first blob → JSON content.
-    """
-    try:
-        tree_result = subprocess.run(
-            ["git", "cat-file", "-p", ref],
-            cwd=workspace, capture_output=True, text=True, timeout=10
-        )
-        if tree_result.returncode != 0:
-            return None
-
-        tree_sha = None
-        for cline in tree_result.stdout.split("\n"):
-            if cline.startswith("tree "):
-                tree_sha = cline.split()[1]
-                break
-        if not tree_sha:
-            return None
-
-        ls_result = subprocess.run(
-            ["git", "ls-tree", tree_sha],
-            cwd=workspace, capture_output=True, text=True, timeout=10
-        )
-        if ls_result.returncode != 0 or not ls_result.stdout.strip():
-            return None
-
-        first_line = ls_result.stdout.strip().split("\n")[0]
-        blob_sha = first_line.split()[2]
-
-        blob_result = subprocess.run(
-            ["git", "cat-file", "-p", blob_sha],
-            cwd=workspace, capture_output=True, text=True, timeout=10
-        )
-        if blob_result.returncode == 0 and blob_result.stdout.strip():
-            return json.loads(blob_result.stdout.strip())
-    except (json.JSONDecodeError, subprocess.TimeoutExpired, IndexError, ValueError):
-        pass
-    return None
-
-
-def _read_note_raw(workspace, ref):
-    """Read raw text from a git notes ref (for non-JSON formats like cascades)."""
-    try:
-        tree_result = subprocess.run(
-            ["git", "cat-file", "-p", ref],
-            cwd=workspace, capture_output=True, text=True, timeout=10
-        )
-        if tree_result.returncode != 0:
-            return None
-
-        tree_sha = None
-        for cline in tree_result.stdout.split("\n"):
-            if cline.startswith("tree "):
-                tree_sha = cline.split()[1]
-                break
-        if not tree_sha:
-            return None
-
-        ls_result = subprocess.run(
-            ["git", "ls-tree", tree_sha],
-            cwd=workspace, capture_output=True, text=True, timeout=10
-        )
-        if ls_result.returncode != 0 or not ls_result.stdout.strip():
-            return None
-
-        first_line = ls_result.stdout.strip().split("\n")[0]
-        blob_sha = first_line.split()[2]
-
-        blob_result = subprocess.run(
-            ["git", "cat-file", "-p", blob_sha],
-            cwd=workspace, capture_output=True, text=True, timeout=10
-        )
-        if blob_result.returncode == 0:
-            return blob_result.stdout
-    except (subprocess.TimeoutExpired, IndexError):
-        pass
-    return None
+def _notes(workspace):
+    """Shared batched git-notes reader for the workspace (one cat-file process)."""
+    from empirica.core.canonical.empirica_git.notes_reader import get_notes_reader
+    return get_notes_reader(workspace)
 
 
 def _read_all_notes(workspace, namespace):
     """Read all notes under a namespace. Returns list of (id, data_dict)."""
     items = []
-    try:
-        result = subprocess.run(
-            ["git", "for-each-ref", "--format=%(refname)",
-             f"refs/notes/empirica/{namespace}/"],
-            cwd=workspace, capture_output=True, text=True, timeout=30
-        )
-        if result.returncode != 0 or not result.stdout.strip():
-            return items
-
-        for ref in result.stdout.strip().split("\n"):
-            ref = ref.strip()
-            if not ref:
-                continue
-            item_id = ref.split("/")[-1]
-            data = _read_note_blob(workspace, ref)
-            if data:
-                items.append((item_id, data))
-    except subprocess.TimeoutExpired:
-        logger.warning(f"Timeout reading git notes for {namespace}")
+    for ref, data in _notes(workspace).list_notes_json(f"refs/notes/empirica/{namespace}/"):
+        if data:
+            items.append((ref.split("/")[-1], data))
     return items
 
 
 def _read_session_refs(workspace):
     """Read all session epistemic refs. Returns dict: session_id -> list of checkpoint dicts."""
     sessions = {}
-    try:
-        result = subprocess.run(
-            ["git", "for-each-ref", "--format=%(refname)",
-             "refs/notes/empirica/session/"],
-            cwd=workspace, capture_output=True, text=True, timeout=60
-        )
-        if result.returncode != 0 or not result.stdout.strip():
-            return sessions
-
-        for ref in result.stdout.strip().split("\n"):
-            ref = ref.strip()
-            if not ref:
-                continue
-            # ref: refs/notes/empirica/session/{session_id}/{PHASE}/{round}
-            parts = ref.split("/")
-            if len(parts) >= 7:
-                sid = parts[4]
-                data = _read_note_blob(workspace, ref)
-                if data:
-                    sessions.setdefault(sid, []).append(data)
-    except subprocess.TimeoutExpired:
-        logger.warning("Timeout reading session refs")
+    for ref, data in _notes(workspace).list_notes_json("refs/notes/empirica/session/"):
+        # ref: refs/notes/empirica/session/{session_id}/{PHASE}/{round}
+        parts = ref.split("/")
+        if len(parts) >= 7 and data:
+            sessions.setdefault(parts[4], []).append(data)
     return sessions
 
 
 def _read_cascade_refs(workspace):
     """Read cascade (investigation decision) refs. Returns list of (transaction_id, entries)."""
     cascades = []
-    try:
-        result = subprocess.run(
-            ["git", "for-each-ref", "--format=%(refname)",
-             "refs/notes/empirica/cascades/"],
-            cwd=workspace, capture_output=True, text=True, timeout=30
-        )
-        if result.returncode != 0 or not result.stdout.strip():
-            return cascades
-
-        for ref in result.stdout.strip().split("\n"):
-            ref = ref.strip()
-            if not ref:
-                continue
-            parts = ref.split("/")
-            # refs/notes/empirica/cascades/{session_id}/{transaction_id}
-            tid = parts[-1] if len(parts) >= 6 else ref.split("/")[-1]
-            sid = parts[4] if len(parts) >= 6 else "unknown"
-
-            raw = _read_note_raw(workspace, ref)
-            if raw:
-                entries = []
-                for line in raw.strip().split("\n"):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    # Format: LABEL: {json}
-                    colon_pos = line.find(":")
-                    if colon_pos > 0:
-                        label = line[:colon_pos].strip()
-                        try:
-                            payload = json.loads(line[colon_pos + 1:].strip())
-                            entries.append({"decision": label, "data": payload})
-                        except json.JSONDecodeError:
-                            entries.append({"decision": label, "data": {"raw": line[colon_pos + 1:].strip()}})
-                    else:
-                        entries.append({"decision": "UNKNOWN", "data": {"raw": line}})
-                cascades.append((sid, tid, entries))
-    except subprocess.TimeoutExpired:
-        logger.warning("Timeout reading cascade refs")
+    for note in _notes(workspace).list_notes("refs/notes/empirica/cascades/"):
+        parts = note.ref.split("/")
+        # refs/notes/empirica/cascades/{session_id}/{transaction_id}
+        tid = parts[-1]
+        sid = parts[4] if len(parts) >= 6 else "unknown"
+
+        raw = note.text
+        if raw:
+            entries = []
+            for line in raw.strip().split("\n"):
+                line = line.strip()
+                if not line:
+                    continue
+                # Format: LABEL: {json}
+                colon_pos = line.find(":")
+                if colon_pos > 0:
+                    label = line[:colon_pos].strip()
+                    try:
+                        payload = json.loads(line[colon_pos + 1:].strip())
+                        entries.append({"decision": label, "data": payload})
+                    except json.JSONDecodeError:
+                        entries.append({"decision": label, "data": {"raw": line[colon_pos + 1:].strip()}})
+                else:
+                    entries.append({"decision": "UNKNOWN", "data": {"raw": line}})
+            cascades.append((sid, tid, entries))
     return cascades
 
 
@@ -63,6 +63,8 @@ def handle_code_embed_command(args):
         print("Code API embedding complete:")
         print(f"  Files scanned: {result['files_scanned']}")
         print(f"  Modules embedded: {result['modules_embedded']}")
+        print(f"  Unchanged (already current): {result['unchanged']}")
         print(f"  Skipped (no public API): {result['skipped']}")
         if result['errors']:
             print(f"  Errors: {result['errors']}")
+        print(f"  Wall time: {result['duration_ms'] / 1000:.2f}s")
@@ -51,30 +51,28 @@ def _git(workspace: Path, *args: str, timeout: int = 30) -> tuple[int, str, str]
         return 1, "", str(e)
 
 
+def _notes(workspace: Path):
+    """Shared batched git-notes reader (one `git cat-file --batch` per repo)."""
+    from empirica.core.canonical.empirica_git.notes_reader import get_notes_reader
+    return get_notes_reader(workspace)
+
+
 def _list_refs(workspace: Path) -> list[str]:
     """Enumerate all refs under refs/notes/empirica/<type>/ for tracked types."""
+    reader = _notes(workspace)
     refs: list[str] = []
     for ns in ARTIFACT_NAMESPACES:
-        rc, out, _ = _git(workspace, "for-each-ref", "--format=%(refname)",
-                          f"refs/notes/empirica/{ns}/")
-        if rc == 0:
-            refs.extend(r for r in out.strip().split("\n") if r)
+        refs.extend(ref for ref, _ in reader.list_refs(f"refs/notes/empirica/{ns}/"))
     return refs
 
 
 def _ref_annotated_commit(workspace: Path, ref: str) -> str | None:
     """Return the commit SHA this notes ref is attached to, or None.
 
-    Reads .git/refs/notes/.../<ref> tree to extract the single filename
-    (the annotated commit). One subprocess per ref.
+    Reads the notes tree to extract the single filename (the annotated
+    commit) through the shared cat-file pipe — no subprocess per ref.
     """
-    short = ref.replace("refs/notes/", "", 1)
-    rc, out, _ = _git(workspace, "notes", f"--ref={short}", "list", timeout=5)
-    if rc != 0 or not out.strip():
-        return None
-    # Output: "<note-blob-sha> <annotated-commit-sha>" (one line per ref)
-    parts = out.strip().split("\n")[0].split()
-    return parts[1] if len(parts) >= 2 else None
+    return _notes(workspace).annotated_object(ref)
 
 
 def _read_note_json(workspace: Path, ref: str) -> dict | None:
@@ -82,35 +80,7 @@ def _read_note_json(workspace: Path, ref: str) -> dict | None:
 
     Walks ref → notes-commit → tree → first blob. Returns parsed JSON or None.
     """
-    rc, out, _ = _git(workspace, "cat-file", "-p", ref, timeout=10)
-    if rc != 0:
-        return None
-    tree_sha = None
-    for line in out.split("\n"):
-        if line.startswith("tree "):
-            tree_sha = line.split()[1]
-            break
-    if not tree_sha:
-        return None
-    rc, tree_out, _ = _git(workspace, "ls-tree", tree_sha, timeout=5)
-    if rc != 0:
-        return None
-    # Tree line: "<mode> blob <sha>\t<filename>"
-    blob_sha = None
-    for line in tree_out.strip().split("\n"):
-        parts = line.split()
-        if len(parts) >= 3 and parts[1] == "blob":
-            blob_sha = parts[2]
-            break
-    if not blob_sha:
-        return None
-    rc, blob_out, _ = _git(workspace, "cat-file", "-p", blob_sha, timeout=5)
-    if rc != 0:
-        return None
-    try:
-        return json.loads(blob_out)
-    except json.JSONDecodeError:
-        return None
+    return _notes(workspace).read_note_json(ref)
 
 
 def _index_path(workspace: Path) -> Path:
@@ -134,7 +104,7 @@ def _index_is_stale(workspace: Path) -> bool:
 def _build_index(workspace: Path, verbose: bool = False) -> dict[str, list[dict]]:
     """Map commit SHA → list of artifact entries (type/ref/artifact_id/blob).
 
-    Slow path: one subprocess per ref. Cached after first build.
+    Slow path: one batch round trip per ref. Cached after first build.
     """
     refs = _list_refs(workspace)
     if verbose:
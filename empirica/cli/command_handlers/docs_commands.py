@@ -18,17 +18,19 @@ Usage:
     empirica docs-explain --question "How do I start a session?"
 """
 
-import ast
 import fnmatch
 import json
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from ..cli_utils import handle_cli_error
 
+if TYPE_CHECKING:
+    from empirica.core.ast_index import ModuleFacts
+
 # --- ProjectConfig: auto-detected project structure for portability ---
 
 @dataclass
@@ -458,45 +460,55 @@ class EpistemicDocsAgent:
         modules: list[str] = []
         category_map: dict[str, list[str]] = {}
 
-        for pkg_dir_name in self.config.package_dirs:
-            pkg_dir = self.root / pkg_dir_name.rstrip("/")
-            if not pkg_dir.exists():
+        for pkg_dir, py_file, facts in self._indexed_package_files():
+            # Check path ignore patterns
+            rel_str = str(py_file.relative_to(self.root))
+            if self._is_path_ignored(rel_str) or facts is None:
                 continue
 
-            for py_file in pkg_dir.rglob("*.py"):
-                if "__pycache__" in str(py_file):
-                    continue
+            # Get category from parent directory relative to package
+            rel_path = py_file.relative_to(pkg_dir)
+            if len(rel_path.parts) > 1:
+                category = rel_path.parts[0].replace("_", " ").title()
+            else:
+                category = py_file.stem.replace("_", " ").title()
 
-                # Check path ignore patterns
-                rel_str = str(py_file.relative_to(self.root))
-                if self._is_path_ignored(rel_str):
+            # Classes defined at column 0 (module level)
+            for definition in facts.definitions:
+                if definition["kind"] != "class" or definition["col"] != 0:
                     continue
-
-                try:
-                    content = py_file.read_text()
-                    class_pattern = r"^class\s+(\w+)\s*[\(:]"
-                    matches = re.findall(class_pattern, content, re.MULTILINE)
-
-                    # Get category from parent directory relative to package
-                    rel_path = py_file.relative_to(pkg_dir)
-                    if len(rel_path.parts) > 1:
-                        category = rel_path.parts[0].replace("_", " ").title()
-                    else:
-                        category = py_file.stem.replace("_", " ").title()
-
-                    for match in matches:
-                        if not match.startswith("_") and len(match) > 3:
-                            if self._is_class_ignored(match):
-                                continue
-                            modules.append(match)
-                            if category not in category_map:
-                                category_map[category] = []
-                            category_map[category].append(match)
-                except Exception:
-                    pass
+                name = definition["name"]
+                if not name.startswith("_") and len(name) > 3:
+                    if self._is_class_ignored(name):
+                        continue
+                    modules.append(name)
+                    if category not in category_map:
+                        category_map[category] = []
+                    category_map[category].append(name)
 
         return list(set(modules)), category_map
 
+    def _indexed_package_files(self) -> list[tuple[Path, Path, "ModuleFacts | None"]]:
+        """(package dir, .py file, AST facts) for every file under package_dirs.
+
+        Facts come from the project's shared AstIndex, so only files changed
+        since the last docs run are re-parsed.
+        """
+        from empirica.core.ast_index import AstIndex
+
+        files: list[tuple[Path, Path]] = []
+        for pkg_dir_name in self.config.package_dirs:
+            pkg_dir = self.root / pkg_dir_name.rstrip("/")
+            if not pkg_dir.exists():
+                continue
+            files.extend(
+                (pkg_dir, py_file) for py_file in pkg_dir.rglob("*.py")
+                if "__pycache__" not in str(py_file)
+            )
+
+        facts = AstIndex.for_root(self.root).update(py_file for _, py_file in files)
+        return [(pkg_dir, py_file, f) for (pkg_dir, py_file), f in zip(files, facts)]
+
     def _check_if_documented(self, term: str, docs_content: str) -> bool:
         """Check if a term appears in documentation."""
         # Normalize the term for searching
@@ -528,61 +540,42 @@ class EpistemicDocsAgent:
         documented_items = 0
 
         # Scan all package directories
-        pkg_dirs = [self.root / d.rstrip("/") for d in self.config.package_dirs]
-        pkg_dirs = [d for d in pkg_dirs if d.exists()]
-        if not pkg_dirs:
-            return {
-                "modules_missing": modules_missing,
-                "classes_missing": classes_missing,
-                "functions_missing": functions_missing,
-                "total_items": total_items,
-                "documented_items": documented_items,
-                "coverage": 0.0
-            }
+        for _, py_file, facts in self._indexed_package_files():
+            if facts is None or not facts.parsed:
+                # Skip files that can't be parsed
+                continue
+            rel_path = py_file.relative_to(self.root)
 
-        for package_dir in pkg_dirs:
-            for py_file in package_dir.rglob("*.py"):
-                if "__pycache__" in str(py_file):
-                    continue
+            # Check module docstring
+            total_items += 1
+            if facts.module_docstring:
+                documented_items += 1
+            else:
+                modules_missing.append(str(rel_path))
 
-                try:
-                    content = py_file.read_text()
-                    tree = ast.parse(content)
-                    rel_path = py_file.relative_to(self.root)
+            # Check classes and functions
+            for definition in facts.definitions:
+                name = definition["name"]
+                if definition["kind"] == "class":
+                    total_items += 1
+                    if definition["documented"]:
+                        documented_items += 1
+                    else:
+                        classes_missing.append(f"{rel_path}:{name}")
+
+                elif definition["kind"] == "def":
+                    # Skip private/dunder methods
+                    if name.startswith("_") and not name.startswith("__"):
+                        continue
+                    # Skip dunder except __init__
+                    if name.startswith("__") and name != "__init__":
+                        continue
 
-                    # Check module docstring
                     total_items += 1
-                    if ast.get_docstring(tree):
+                    if definition["documented"]:
                         documented_items += 1
                     else:
-                        modules_missing.append(str(rel_path))
-
-                    # Check classes and functions
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.ClassDef):
-                            total_items += 1
-                            if ast.get_docstring(node):
-                                documented_items += 1
-                            else:
-                                classes_missing.append(f"{rel_path}:{node.name}")
-
-                        elif isinstance(node, ast.FunctionDef):
-                            # Skip private/dunder methods
-                            if node.name.startswith("_") and not node.name.startswith("__"):
-                                continue
-                            # Skip dunder except __init__
-                            if node.name.startswith("__") and node.name != "__init__":
-                                continue
-
-                            total_items += 1
-                            if ast.get_docstring(node):
-                                documented_items += 1
-                            else:
-                                functions_missing.append(f"{rel_path}:{node.name}")
-
-                except (SyntaxError, UnicodeDecodeError):
-                    # Skip files that can't be parsed
-                    continue
+                        functions_missing.append(f"{rel_path}:{name}")
 
         # Calculate coverage
         coverage = round(documented_items / total_items * 100, 1) if total_items > 0 else 0.0
@@ -0,0 +1,137 @@
+"""CLI handlers for `empirica hook-daemon` subcommand group.
+
+Verbs:
+  start   Spawn the daemon detached and wait until it answers a ping
+  run     Run the daemon in the foreground (for systemd/launchd units)
+  stop    Ask a running daemon to shut down
+  status  Ping + per-hook latency percentiles
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from empirica.core.hook_daemon import HookDaemon, default_socket_path, ping, request
+
+
+def _socket_arg(args) -> Path:
+    """Resolve --socket or the default socket path."""
+    raw = getattr(args, 'socket', None)
+    return Path(raw).expanduser() if raw else default_socket_path()
+
+
+def _emit(args, payload: dict, human: str, exit_code: int) -> int:
+    """JSON output with --output json, one human line otherwise."""
+    if getattr(args, 'output', 'human') == 'json':
+        sys.stdout.write(json.dumps(payload, indent=2) + '\n')
+    else:
+        print(human)
+    return exit_code
+
+
+def handle_hook_daemon_start_command(args) -> int:
+    """`empirica hook-daemon start` — spawn detached, wait for readiness."""
+    socket_path = _socket_arg(args)
+    existing = ping(socket_path)
+    if existing is not None:
+        return _emit(args, {'ok': True, 'already_running': True, 'pid': existing.get('pid'),
+                            'socket': str(socket_path)},
+                     f"✅ Hook daemon already running (pid {existing.get('pid')})", 0)
+
+    cmd = [sys.executable, '-m', 'empirica.core.hook_daemon', '--socket', str(socket_path)]
+    idle_timeout = getattr(args, 'idle_timeout', None)
+    if idle_timeout:
+        cmd += ['--idle-timeout', str(idle_timeout)]
+    log_path = socket_path.parent / 'logs' / 'hookd.log'
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, 'a') as log_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+    deadline = time.time() + 10.0
+    while time.time() < deadline:
+        reply = ping(socket_path)
+        if reply is not None:
+            return _emit(args, {'ok': True, 'pid': reply.get('pid'), 'socket': str(socket_path)},
+                         f"✅ Hook daemon started (pid {reply.get('pid')}) on {socket_path}", 0)
+        if proc.poll() is not None:
+            break
+        time.sleep(0.05)
+    return _emit(args, {'ok': False, 'detail': f'daemon did not come up; see {log_path}'},
+                 f"❌ Hook daemon did not come up; see {log_path}", 1)
+
+
+def handle_hook_daemon_run_command(args) -> int:
+    """`empirica hook-daemon run` — foreground server loop."""
+    daemon = HookDaemon(socket_path=_socket_arg(args), idle_timeout=getattr(args, 'idle_timeout', None))
+    try:
+        daemon.serve_forever()
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def handle_hook_daemon_stop_command(args) -> int:
+    """`empirica hook-daemon stop` — request shutdown."""
+    socket_path = _socket_arg(args)
+    reply = request({'op': 'shutdown'}, socket_path=socket_path)
+    if reply is None:
+        return _emit(args, {'ok': True, 'running': False}, "Hook daemon is not running", 0)
+    return _emit(args, {'ok': True, 'stopped': True}, "✅ Hook daemon stopped", 0)
+
+
+def handle_hook_daemon_status_command(args) -> int:
+    """`empirica hook-daemon status` — liveness and latency percentiles."""
+    socket_path = _socket_arg(args)
+    reply = request({'op': 'stats'}, socket_path=socket_path)
+    if reply is None:
+        return _emit(args, {'ok': True, 'running': False, 'socket': str(socket_path)},
+                     "Hook daemon is not running (hooks run in-process)", 0)
+    reply['running'] = True
+    lines = [f"✅ Hook daemon running (pid {reply.get('pid')}, up {reply.get('uptime_s')}s, "
+             f"{reply.get('requests')} requests, {reply.get('errors')} errors)"]
+    for name, s in sorted(reply.get('scripts', {}).items()):
+        lines.append(f"   {name:<28} n={s['count']:<6} p50={s['p50_ms']:.1f}ms p95={s['p95_ms']:.1f}ms")
+    return _emit(args, reply, '\n'.join(lines), 0)
+
+
+_HOOK_DAEMON_DISPATCH = {
+    'start': handle_hook_daemon_start_command,
+    'run': handle_hook_daemon_run_command,
+    'stop': handle_hook_daemon_stop_command,
+    'status': handle_hook_daemon_status_command,
+}
+
+
+def handle_hook_daemon_group_command(args) -> int:
+    """Dispatcher for `empirica hook-daemon <action>`."""
+    action = getattr(args, 'hook_daemon_action', None)
+    if not action:
+        sys.stderr.write('usage: empirica hook-daemon <start|stop|status|run> [args...]\n')
+        return 2
+    handler = _HOOK_DAEMON_DISPATCH.get(action)
+    if handler is None:
+        sys.stderr.write(f'error: unknown hook-daemon action: {action}\n')
+        return 2
+    return handler(args) or 0
+
+
+__all__ = [
+    'handle_hook_daemon_group_command',
+    'handle_hook_daemon_run_command',
+    'handle_hook_daemon_start_command',
+    'handle_hook_daemon_status_command',
+    'handle_hook_daemon_stop_command',
+]
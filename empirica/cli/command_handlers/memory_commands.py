@@ -200,13 +200,16 @@ def handle_memory_value_command(args):
         db.close()
 
         # Combine and score by information gain
+        from empirica.data.minhash import NearDuplicateIndex
+
         all_items = []
         existing_texts = []
+        existing_index = NearDuplicateIndex()
 
         for f in findings:
             text = f.get('finding', '')
             tokens = estimate_tokens(text)
-            novelty = novelty_score(text, existing_texts) if existing_texts else 1.0
+            novelty = novelty_score(text, existing_index) if existing_texts else 1.0
             gain = estimate_information_gain(
                 domain=f.get('subject', 'general'),
                 current_vectors={"know": args.know if hasattr(args, 'know') else 0.5, "uncertainty": 0.5},
@@ -223,13 +226,14 @@ def handle_memory_value_command(args):
                 "subject": f.get('subject'),
             })
             existing_texts.append(text)
+            existing_index.add(len(existing_texts), text)
 
         for u in unknowns:
             if u.get('is_resolved'):
                 continue
             text = u.get('unknown', '')
             tokens = estimate_tokens(text)
-            novelty = novelty_score(text, existing_texts) if existing_texts else 1.0
+            novelty = novelty_score(text, existing_index) if existing_texts else 1.0
             # Unknowns have slightly higher base gain (they represent knowledge gaps)
             gain = estimate_information_gain(
                 domain=u.get('subject', 'general'),
@@ -247,6 +251,7 @@ def handle_memory_value_command(args):
                 "subject": u.get('subject'),
             })
             existing_texts.append(text)
+            existing_index.add(len(existing_texts), text)
 
         # Filter by min gain
         all_items = [i for i in all_items if i['gain'] >= args.min_gain]
@@ -469,16 +474,20 @@ def handle_session_rollup_command(args):
             use_semantic_dedup=args.semantic_dedup,
         )
 
+        from empirica.data.minhash import NearDuplicateIndex
+
         scored = []
+        scored_index = NearDuplicateIndex()
         for f in all_findings:
             sf = gate.score_finding(
                 finding=f['finding'], agent_name=f['agent_name'],
                 domain=f.get('subject', 'general'),
                 confidence=f.get('impact', 0.5),
-                existing_findings=[s.finding for s in scored],
+                existing_findings=scored_index,
                 domain_relevance=1.0,
             )
             scored.append(sf)
+            scored_index.add(len(scored), sf.finding)
 
         deduped = gate.deduplicate(scored, project_id)
         result = gate.gate(deduped, args.budget)
@@ -176,7 +176,7 @@ def handle_qdrant_status_command(args):
                 if getattr(args, 'output', 'human') == 'json':
                     print(json.dumps({"ok": False, "error": "Qdrant not available"}))
                 else:
-                    print("Qdrant is not available. Set EMPIRICA_QDRANT_URL or start Qdrant.")
+                    print("Qdrant is not available. Set EMPIRICA_QDRANT_URL (or EMPIRICA_QDRANT_EMBEDDED=on for the embedded store) or start Qdrant.")
                 return
 
         projects, globals_list = _group_collections_by_project(info)
@@ -0,0 +1,616 @@
+"""
+Command Registry - Lazy subcommand → handler / parser manifest
+
+Maps every `empirica` subcommand (and alias) to the dotted
+``module:function`` of its handler and of the parser-group function that
+registers it. cli_core.main() looks the invoked command up here, builds only
+that command's parser group and imports only that handler module, so
+`empirica finding-log` no longer pays the import cost of cockpit, chat,
+docs, compliance, Qdrant or release tooling.
+
+Adding a command:
+  1. Register its parser in the relevant ``add_*_parsers()`` function and
+     list the command name + aliases under that group in PARSER_GROUPS.
+  2. Map the command (and each alias) in COMMAND_HANDLERS.
+tests/integrity/test_command_registry.py fails if either table drifts from
+what the parser modules actually register.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+# Parser-group function → command names (and aliases) it registers.
+# Order matches the historical create_argument_parser() call order.
+PARSER_GROUPS: dict[str, tuple[str, ...]] = {
+    'empirica.cli.parsers.session_parsers:add_session_parsers': (
+        'sessions-list', 'session-list', 'sl', 'sessions-show', 'session-show',
+        'session-snapshot', 'sessions-export', 'session-export', 'memory-compact',
+        'transaction-adopt', 'tx-adopt',
+    ),
+    'empirica.cli.parsers.cascade_parsers:add_cascade_parsers': (
+        'preflight-submit', 'pre', 'preflight', 'check', 'check-submit', 'postflight-submit',
+        'post', 'postflight',
+    ),
+    'empirica.cli.parsers.investigation_parsers:add_investigation_parsers': (
+        'investigate', 'investigate-create-branch', 'investigate-checkpoint-branch',
+        'investigate-merge-branches', 'investigate-multi',
+    ),
+    'empirica.cli.parsers.performance_parsers:add_performance_parsers': (
+        'performance',
+    ),
+    'empirica.cli.parsers.skill_parsers:add_skill_parsers': (
+        'skill-suggest', 'skill-fetch', 'skill-extract',
+    ),
+    'empirica.cli.parsers.utility_parsers:add_utility_parsers': (
+        'goal-analysis', 'log-token-saving', 'efficiency-report', 'qdrant-cleanup',
+        'qdrant-status',
+    ),
+    'empirica.cli.parsers.config_parsers:add_config_parsers': (
+        'config',
+    ),
+    'empirica.cli.parsers.domain_parsers:add_domain_parsers': (
+        'domain-list', 'domain-show', 'domain-resolve', 'domain-validate',
+    ),
+    'empirica.cli.parsers.domain_parsers:add_resolve_parser': (
+        'resolve',
+    ),
+    'empirica.cli.parsers.monitor_parsers:add_monitor_parsers': (
+        'monitor', 'mco-load', 'assess-state', 'trajectory-project', 'workflow-patterns',
+        'system-status', 'commit-context', 'compact-analysis', 'calibration-report',
+        'calibration-dispute', 'compliance-report', 'security-audit', 'noetic-batch',
+    ),
+    'empirica.cli.parsers.action_parsers:add_action_parsers': (
+        'investigate-log', 'act-log',
+    ),
+    'empirica.cli.parsers.checkpoint_parsers:add_checkpoint_parsers': (
+        'checkpoint-create', 'checkpoint-load', 'checkpoint-list', 'checkpoint-diff',
+        'checkpoint-sign', 'checkpoint-verify', 'checkpoint-signatures', 'handoff-create',
+        'handoff-query', 'mistake-log', 'mistake-query', 'project-init', 'project-update',
+        'project-create', 'project-handoff', 'project-list', 'project-switch',
+        'project-bootstrap', 'pb', 'bootstrap', 'project-register', 'workspace-overview',
+        'entity-list', 'entity-create', 'entity-show', 'entity-walk', 'entity-search',
+        'workspace-map', 'workspace-init', 'workspace-list', 'workspace-backfill-entities',
+        'ecosystem-check', 'engagement-focus', 'workspace-search', 'save', 'history',
+        'project-search', 'project-embed', 'code-embed', 'doc-check', 'finding-log', 'fl',
+        'unknown-log', 'ul', 'unknown-resolve', 'unknown-list', 'deadend-log', 'de',
+        'assumption-log', 'decision-log', 'source-add', 'source-list', 'sources-map',
+        'source-archive', 'sources-reconcile', 'log-artifacts', 'resolve-artifacts',
+        'delete-artifacts', 'epp-activate', 'training-export', 'goals-create', 'goal-create',
+        'gc', 'goals-add-task', 'goal-add-task', 'goals-add-dependency', 'goals-complete-task',
+        'goal-complete-task', 'goals-progress', 'goal-progress', 'goals-get-tasks',
+        'goals-list', 'goal-list', 'gl', 'goals-search', 'goals-ready', 'goals-discover',
+        'goals-resume', 'goals-claim', 'goals-complete', 'goal-complete', 'goals-prune',
+        'goals-mark-stale', 'goals-get-stale', 'goals-activate', 'goal-activate',
+        'goals-refresh', 'identity-create', 'identity-list', 'identity-export',
+        'identity-verify', 'sessions-resume', 'session-resume', 'sr', 'session-create', 'sc',
+        'sync-config', 'sync-push', 'sync-pull', 'sync-status', 'rebuild', 'artifacts-generate',
+    ),
+    'empirica.cli.parsers.user_interface_parsers:add_user_interface_parsers': (
+
+    ),
+    'empirica.cli.parsers.vision_parsers:add_vision_parsers': (
+        'vision',
+    ),
+    'empirica.cli.parsers.epistemics_parsers:add_epistemics_parsers': (
+        'epistemics-list', 'epistemics-show',
+    ),
+    'empirica.cli.parsers.edit_verification_parsers:add_edit_verification_parsers': (
+        'edit-with-confidence',
+    ),
+    'empirica.cli.parsers.issue_capture_parsers:add_issue_capture_parsers': (
+        'issue-list', 'issue-show', 'issue-handoff', 'issue-resolve', 'issue-export',
+        'issue-stats',
+    ),
+    'empirica.cli.parsers.architecture_parsers:add_architecture_parsers': (
+        'assess-component', 'assess-compare', 'assess-directory',
+    ),
+    'empirica.cli.parsers.query_parsers:add_query_parsers': (
+        'query',
+    ),
+    'empirica.cli.parsers.agent_parsers:add_agent_parsers': (
+        'agent-spawn', 'agent-report', 'agent-aggregate', 'agent-export', 'agent-import',
+        'agent-discover', 'agent-parallel',
+    ),
+    'empirica.cli.parsers.sentinel_parsers:add_sentinel_parsers': (
+        'sentinel-orchestrate', 'sentinel-load-profile', 'sentinel-status', 'sentinel-check',
+    ),
+    'empirica.cli.parsers.persona_parsers:add_persona_parsers': (
+        'persona-list', 'persona-show', 'persona-promote', 'persona-find',
+    ),
+    'empirica.cli.parsers.release_parsers:add_release_parsers': (
+        'release-ready', 'docs-assess', 'bootstrap-context', 'practice-context',
+        'mesh-agreements', 'docs-link-check', 'docs-explain', 'rust-docs-assess',
+    ),
+    'empirica.cli.parsers.lesson_parsers:add_lesson_parsers': (
+        'lesson-create', 'lesson-load', 'lesson-list', 'lesson-search', 'lesson-recommend',
+        'lesson-path', 'lesson-replay-start', 'lesson-replay-end', 'lesson-stats',
+        'lesson-embed',
+    ),
+    'empirica.cli.parsers.onboarding_parsers:add_onboarding_parsers': (
+        'onboard', 'setup-claude-code', 'enp-setup', 'release', 'diagnose', 'doctor',
+    ),
+    'empirica.cli.parsers.trajectory_parsers:add_trajectory_parsers': (
+        'trajectory-show', 'trajectory-stats', 'trajectory-backfill',
+    ),
+    'empirica.cli.parsers.concept_graph_parsers:add_concept_graph_parsers': (
+        'concept-build', 'concept-stats', 'concept-top', 'concept-related',
+    ),
+    'empirica.cli.parsers.mcp_parsers:add_mcp_parsers': (
+        'mcp-list-tools',
+    ),
+    'empirica.cli.parsers.message_parsers:add_message_parsers': (
+        'message-send', 'msg-send', 'ms', 'message-inbox', 'msg-inbox', 'mi', 'message-read',
+        'msg-read', 'mr', 'message-reply', 'msg-reply', 'message-thread', 'message-channels',
+        'message-cleanup',
+    ),
+    'empirica.cli.parsers.mailbox_parsers:add_mailbox_parsers': (
+        'mailbox',
+    ),
+    'empirica.cli.parsers.bus_parsers:add_bus_parsers': (
+        'bus-register', 'bus-dispatch', 'bus-subscribe', 'bus-instances', 'bus-status',
+    ),
+    'empirica.cli.parsers.mesh_parsers:add_mesh_parsers': (
+        'mesh',
+    ),
+    'empirica.cli.parsers.cockpit_parsers:add_cockpit_parsers': (
+        'sentinel', 'loop', 'listener', 'instance', 'status', 'tui',
+    ),
+    'empirica.cli.parsers.cockpit_launcher_parsers:add_cockpit_launcher_parsers': (
+        'cockpit',
+    ),
+    'empirica.cli.parsers.chat_parsers:add_chat_parsers': (
+        'chat',
+    ),
+    'empirica.cli.parsers.notify_parsers:add_notify_parsers': (
+        'notify',
+    ),
+    'empirica.cli.parsers.voice_parsers:add_voice_parsers': (
+        'voice',
+    ),
+    'empirica.cli.parsers.visibility_parsers:add_visibility_parsers': (
+        'visibility',
+    ),
+    'empirica.cli.parsers.scan_parsers:add_scan_parsers': (
+        'scan', 'scan-history', 'scan-show', 'scan-diff', 'services-audit',
+    ),
+    'empirica.cli.parsers.memory_parsers:add_memory_parsers': (
+        'memory-prime', 'memory-scope', 'memory-value', 'pattern-check', 'session-rollup',
+        'memory-report',
+    ),
+    'empirica.cli.parsers.profile_parsers:add_profile_parsers': (
+        'profile-sync', 'profile-prune', 'profile-status', 'profile-import',
+    ),
+    'empirica.cli.parsers.projects_parsers:add_projects_parsers': (
+        'projects-discover', 'daemon-list', 'daemon-grant', 'daemon-deny', 'daemon-grants-list',
+        'projects-list', 'projects-bulk-register', 'projects-sync', 'projects-unregister',
+    ),
+    'empirica.cli.parsers.serve_parsers:add_serve_parsers': (
+        'serve',
+    ),
+    'empirica.cli.parsers.hook_daemon_parsers:add_hook_daemon_parsers': (
+        'hook-daemon',
+    ),
+}
+
+# Command / alias → handler. Commands with a parser but no entry here
+# (e.g. 'tx-adopt', 'goal-analysis') parse but report "Unknown command".
+COMMAND_HANDLERS: dict[str, str] = {
+    # Session commands
+    'session-create': 'empirica.cli.command_handlers.session_create:handle_session_create_command',
+    'sessions-list': 'empirica.cli.command_handlers.session_commands:handle_sessions_list_command',
+    'sessions-show': 'empirica.cli.command_handlers.session_commands:handle_sessions_show_command',
+    'sessions-export': 'empirica.cli.command_handlers.session_commands:handle_sessions_export_command',
+    'sessions-resume': 'empirica.cli.command_handlers.goal_commands:handle_sessions_resume_command',
+    'session-snapshot': 'empirica.cli.command_handlers.session_commands:handle_session_snapshot_command',
+    'memory-compact': 'empirica.cli.command_handlers.session_commands:handle_memory_compact_command',
+    'transaction-adopt': 'empirica.cli.command_handlers.session_commands:handle_transaction_adopt_command',
+
+    # CASCADE commands (working -submit variants only)
+    'preflight-submit': 'empirica.cli.command_handlers._workflow_preflight:handle_preflight_submit_command',
+    'check': 'empirica.cli.command_handlers._workflow_check:handle_check_command',
+    'check-submit': 'empirica.cli.command_handlers._workflow_check:handle_check_submit_command',
+    'postflight-submit': 'empirica.cli.command_handlers._workflow_postflight:handle_postflight_submit_command',
+
+    # Investigation commands
+    'investigate': 'empirica.cli.command_handlers.investigation_commands:handle_investigate_command',
+    'investigate-log': 'empirica.cli.command_handlers.action_commands:handle_investigate_log_command',
+    'investigate-create-branch': 'empirica.cli.command_handlers.investigation_commands:handle_investigate_create_branch_command',
+    'investigate-checkpoint-branch': 'empirica.cli.command_handlers.investigation_commands:handle_investigate_checkpoint_branch_command',
+    'investigate-merge-branches': 'empirica.cli.command_handlers.investigation_commands:handle_investigate_merge_branches_command',
+    'investigate-multi': 'empirica.cli.command_handlers.investigation_commands:handle_investigate_multi_command',
+
+    # Action commands
+    'act-log': 'empirica.cli.command_handlers.action_commands:handle_act_log_command',
+
+    # Performance commands
+    'performance': 'empirica.cli.command_handlers.performance_commands:handle_performance_command',
+
+    # Skill commands
+    'skill-suggest': 'empirica.cli.command_handlers.skill_commands:handle_skill_suggest_command',
+    'skill-fetch': 'empirica.cli.command_handlers.skill_commands:handle_skill_fetch_command',
+    'skill-extract': 'empirica.cli.command_handlers.skill_commands:handle_skill_extract_command',
+
+    # Utility commands
+    'log-token-saving': 'empirica.cli.command_handlers.utility_commands:handle_log_token_saving',
+    'efficiency-report': 'empirica.cli.command_handlers.utility_commands:handle_efficiency_report',
+
+    # Qdrant maintenance commands
+    'qdrant-cleanup': 'empirica.cli.command_handlers.utility_commands:handle_qdrant_cleanup_command',
+    'qdrant-status': 'empirica.cli.command_handlers.utility_commands:handle_qdrant_status_command',
+
+    # Config commands
+    'config': 'empirica.cli.command_handlers.config_commands:handle_config_command',
+
+    # Domain registry commands (A1 — Sentinel reframe)
+    'domain-list': 'empirica.cli.command_handlers.domain_commands:handle_domain_list_command',
+    'domain-show': 'empirica.cli.command_handlers.domain_commands:handle_domain_show_command',
+    'domain-resolve': 'empirica.cli.command_handlers.domain_commands:handle_domain_resolve_command',
+    'domain-validate': 'empirica.cli.command_handlers.domain_commands:handle_domain_validate_command',
+
+    # Unified resolve command
+    'resolve': 'empirica.cli.command_handlers.resolve_command:handle_resolve_command',
+
+    # Monitor commands
+    'monitor': 'empirica.cli.command_handlers.monitor_commands:handle_monitor_command',
+    'system-status': 'empirica.cli.command_handlers.monitor_commands:handle_system_status_command',
+    'assess-state': 'empirica.cli.command_handlers.monitor_commands:handle_assess_state_command',
+    'mco-load': 'empirica.cli.command_handlers.monitor_commands:handle_mco_load_command',
+    'trajectory-project': 'empirica.cli.command_handlers.monitor_commands:handle_trajectory_project_command',
+    'workflow-patterns': 'empirica.cli.command_handlers.monitor_commands:handle_workflow_patterns_command',
+    'compact-analysis': 'empirica.cli.command_handlers.compact_analysis:handle_compact_analysis',
+    'commit-context': 'empirica.cli.command_handlers.commit_context_commands:handle_commit_context_command',
+    'calibration-report': 'empirica.cli.command_handlers.monitor_commands:handle_calibration_report_command',
+    'calibration-dispute': 'empirica.cli.command_handlers.monitor_commands:handle_calibration_dispute_command',
+    'compliance-report': 'empirica.cli.command_handlers.compliance_report_commands:handle_compliance_report_command',
+    'security-audit': 'empirica.cli.command_handlers.security_audit_commands:handle_security_audit_command',
+    'noetic-batch': 'empirica.cli.command_handlers.noetic_batch_commands:handle_noetic_batch_command',
+
+    # Cockpit (proposal: PROPOSAL_SENTINEL_LOOP_TUI.md)
+    'sentinel': 'empirica.cli.command_handlers.cockpit_commands:handle_sentinel_group_command',
+    'loop': 'empirica.cli.command_handlers.cockpit_commands:handle_loop_group_command',
+    'listener': 'empirica.cli.command_handlers.cockpit_commands:handle_listener_group_command',
+    'mailbox': 'empirica.cli.command_handlers.mailbox_commands:handle_mailbox_group_command',
+    'instance': 'empirica.cli.command_handlers.cockpit_commands:handle_instance_group_command',
+    'status': 'empirica.cli.command_handlers.cockpit_commands:handle_status_command',
+    'tui': 'empirica.cli.command_handlers.cockpit_commands:handle_tui_command',
+
+    # Chat (single-instance collaborative epistemic workspace)
+    # See empirica/docs/architecture/CHAT.md
+    'chat': 'empirica.cli.command_handlers.chat_commands:handle_chat_command',
+
+    # Notify dispatcher (proposal: PROPOSAL_NOTIFY_DISPATCHER.md)
+    'notify': 'empirica.cli.command_handlers.notify_commands:handle_notify_group_command',
+
+    # Voice profiles (prosodic patterns for outreach drafting)
+    'voice': 'empirica.cli.command_handlers.voice_commands:handle_voice_group_command',
+
+    # Visibility tiers (proposal: PROPOSAL_VISIBILITY_TIERS.md, Phase 0)
+    'visibility': 'empirica.cli.command_handlers.visibility_commands:handle_visibility_group_command',
+
+    # Cockpit launcher (proposal: PROPOSAL_COCKPIT_LAUNCHER.md, v1)
+    'cockpit': 'empirica.cli.command_handlers.cockpit_launcher_commands:handle_cockpit_group_command',
+
+    # Unified mesh diagnostic + control surface
+    'mesh': 'empirica.cli.command_handlers.mesh_commands:handle_mesh_group_command',
+
+    # AI service scanner (proposal: PROPOSAL_AI_SERVICE_SCANNER.md)
+    # Phase 1: scan (one-shot). Phase 3: scan-history/show/diff verbs.
+    'scan': 'empirica.cli.command_handlers.scan_commands:handle_scan_command',
+    'scan-history': 'empirica.cli.command_handlers.scan_commands:handle_scan_history_command',
+    'scan-show': 'empirica.cli.command_handlers.scan_commands:handle_scan_show_command',
+    'scan-diff': 'empirica.cli.command_handlers.scan_commands:handle_scan_diff_command',
+    'services-audit': 'empirica.cli.command_handlers.scan_commands:handle_services_audit_command',
+
+    # Checkpoint commands
+    'checkpoint-create': 'empirica.cli.command_handlers.checkpoint_commands:handle_checkpoint_create_command',
+    'checkpoint-load': 'empirica.cli.command_handlers.checkpoint_commands:handle_checkpoint_load_command',
+    'checkpoint-list': 'empirica.cli.command_handlers.checkpoint_commands:handle_checkpoint_list_command',
+    'checkpoint-diff': 'empirica.cli.command_handlers.checkpoint_commands:handle_checkpoint_diff_command',
+    'checkpoint-sign': 'empirica.cli.command_handlers.checkpoint_signing_commands:handle_checkpoint_sign_command',
+    'checkpoint-verify': 'empirica.cli.command_handlers.checkpoint_signing_commands:handle_checkpoint_verify_command',
+    'checkpoint-signatures': 'empirica.cli.command_handlers.checkpoint_signing_commands:handle_checkpoint_signatures_command',
+
+    # Identity commands
+    'identity-create': 'empirica.cli.command_handlers.identity_commands:handle_identity_create_command',
+    'identity-export': 'empirica.cli.command_handlers.identity_commands:handle_identity_export_command',
+    'identity-list': 'empirica.cli.command_handlers.identity_commands:handle_identity_list_command',
+    'identity-verify': 'empirica.cli.command_handlers.identity_commands:handle_identity_verify_command',
+
+    # Handoff commands
+    'handoff-create': 'empirica.cli.command_handlers.handoff_commands:handle_handoff_create_command',
+    'handoff-query': 'empirica.cli.command_handlers.handoff_commands:handle_handoff_query_command',
+
+    # Mistake logging
+    'mistake-log': 'empirica.cli.command_handlers.artifact_log_commands:handle_mistake_log_command',
+    'mistake-query': 'empirica.cli.command_handlers.artifact_log_commands:handle_mistake_query_command',
+
+    # Project commands
+    'project-init': 'empirica.cli.command_handlers.project_init:handle_project_init_command',
+    'project-update': 'empirica.cli.command_handlers.project_update:handle_project_update_command',
+    'project-create': 'empirica.cli.command_handlers.project_commands:handle_project_create_command',
+    'project-handoff': 'empirica.cli.command_handlers.project_commands:handle_project_handoff_command',
+    'project-list': 'empirica.cli.command_handlers.project_commands:handle_project_list_command',
+    'project-switch': 'empirica.cli.command_handlers.project_commands:handle_project_switch_command',
+    'project-bootstrap': 'empirica.cli.command_handlers.project_bootstrap:handle_project_bootstrap_command',
+    'workspace-overview': 'empirica.cli.command_handlers.workspace_commands:handle_workspace_overview_command',
+    'workspace-map': 'empirica.cli.command_handlers.workspace_commands:handle_workspace_map_command',
+    'workspace-list': 'empirica.cli.command_handlers.workspace_commands:handle_workspace_list_command',
+    'workspace-backfill-entities': 'empirica.cli.command_handlers.workspace_commands:handle_workspace_backfill_entities_command',
+    'workspace-init': 'empirica.cli.command_handlers.workspace_init:handle_workspace_init_command',
+    'ecosystem-check': 'empirica.cli.command_handlers.ecosystem_commands:handle_ecosystem_check_command',
+    'workspace-search': 'empirica.cli.command_handlers.workspace_search:handle_workspace_search_command',
+    'entity-create': 'empirica.cli.command_handlers.entity_commands:handle_entity_create_command',
+    'entity-list': 'empirica.cli.command_handlers.entity_commands:handle_entity_list_command',
+    'entity-show': 'empirica.cli.command_handlers.entity_commands:handle_entity_show_command',
+    'entity-walk': 'empirica.cli.command_handlers.entity_commands:handle_entity_walk_command',
+    'entity-search': 'empirica.cli.command_handlers.entity_commands:handle_entity_search_command',
+    'engagement-focus': 'empirica.cli.command_handlers.artifact_log_commands:handle_engagement_focus_command',
+    'save': 'empirica.cli.command_handlers.git_commands:handle_save_command',
+    'history': 'empirica.cli.command_handlers.git_commands:handle_history_command',
+    'project-search': 'empirica.cli.command_handlers.project_search:handle_project_search_command',
+    'project-embed': 'empirica.cli.command_handlers.project_embed:handle_project_embed_command',
+    'code-embed': 'empirica.cli.command_handlers.code_embed:handle_code_embed_command',
+    'doc-check': 'empirica.cli.command_handlers.doc_commands:handle_doc_check_command',
+    'projects-discover': 'empirica.cli.command_handlers.projects_commands:handle_projects_discover_command',
+    'projects-list': 'empirica.cli.command_handlers.projects_commands:handle_projects_list_command',
+    'projects-sync': 'empirica.cli.command_handlers.projects_commands:handle_projects_sync_command',
+    'projects-bulk-register': 'empirica.cli.command_handlers.projects_commands:handle_projects_bulk_register_command',
+    'projects-unregister': 'empirica.cli.command_handlers.projects_commands:handle_projects_unregister_command',
+    'project-register': 'empirica.cli.command_handlers.projects_commands:handle_project_register_command',
+    'daemon-list': 'empirica.cli.command_handlers.projects_commands:handle_daemon_list_command',
+    'daemon-grant': 'empirica.cli.command_handlers.projects_commands:handle_daemon_grant_command',
+    'daemon-deny': 'empirica.cli.command_handlers.projects_commands:handle_daemon_deny_command',
+    'daemon-grants-list': 'empirica.cli.command_handlers.projects_commands:handle_daemon_grants_list_command',
+
+    # Finding/unknown/deadend/assumption/decision logging
+    'finding-log': 'empirica.cli.command_handlers.artifact_log_commands:handle_finding_log_command',
+    'unknown-log': 'empirica.cli.command_handlers.artifact_log_commands:handle_unknown_log_command',
+    'unknown-resolve': 'empirica.cli.command_handlers.artifact_log_commands:handle_unknown_resolve_command',
+    'unknown-list': 'empirica.cli.command_handlers.artifact_log_commands:handle_unknown_list_command',
+    'deadend-log': 'empirica.cli.command_handlers.artifact_log_commands:handle_deadend_log_command',
+    'assumption-log': 'empirica.cli.command_handlers.artifact_log_commands:handle_assumption_log_command',
+    'decision-log': 'empirica.cli.command_handlers.artifact_log_commands:handle_decision_log_command',
+    'log-artifacts': 'empirica.cli.command_handlers.graph_commands:handle_log_artifacts_command',
+    'resolve-artifacts': 'empirica.cli.command_handlers.graph_commands:handle_resolve_artifacts_command',
+    'delete-artifacts': 'empirica.cli.command_handlers.graph_commands:handle_delete_artifacts_command',
+    'source-add': 'empirica.cli.command_handlers.artifact_log_commands:handle_source_add_command',
+    'source-list': 'empirica.cli.command_handlers.artifact_log_commands:handle_source_list_command',
+    'sources-map': 'empirica.cli.command_handlers.artifact_log_commands:handle_sources_map_command',
+    'sources-reconcile': 'empirica.cli.command_handlers.sources_reconcile_commands:handle_sources_reconcile_command',
+    'source-archive': 'empirica.cli.command_handlers.artifact_log_commands:handle_source_archive_command',
+    'epp-activate': 'empirica.cli.command_handlers.epp_commands:handle_epp_activate_command',
+
+    # Training data export
+    'training-export': 'empirica.cli.command_handlers.training_commands:handle_training_export_command',
+
+    # Sync commands (git notes synchronization)
+    'sync-config': 'empirica.cli.command_handlers.sync_commands:handle_sync_config_command',
+    'sync-push': 'empirica.cli.command_handlers.sync_commands:handle_sync_push_command',
+    'sync-pull': 'empirica.cli.command_handlers.sync_commands:handle_sync_pull_command',
+    'sync-status': 'empirica.cli.command_handlers.sync_commands:handle_sync_status_command',
+    'rebuild': 'empirica.cli.command_handlers.sync_commands:handle_rebuild_command',
+    'artifacts-generate': 'empirica.cli.command_handlers.artifacts_commands:handle_artifacts_generate_command',
+
+    # Goals commands
+    'goals-create': 'empirica.cli.command_handlers.goal_commands:handle_goals_create_command',
+    'goals-list': 'empirica.cli.command_handlers.goal_commands:handle_goals_list_command',
+    'goals-search': 'empirica.cli.command_handlers.goal_commands:handle_goals_search_command',
+    'goals-complete': 'empirica.cli.command_handlers.goal_commands:handle_goals_complete_command',
+    'goals-prune': 'empirica.cli.command_handlers.goal_commands:handle_goals_prune_command',
+    'goals-claim': 'empirica.cli.command_handlers.goal_commands:handle_goals_claim_command',
+    'goals-add-task': 'empirica.cli.command_handlers.goal_commands:handle_goals_add_task_command',
+    'goals-add-dependency': 'empirica.cli.command_handlers.goal_commands:handle_goals_add_dependency_command',
+    'goals-complete-task': 'empirica.cli.command_handlers.goal_commands:handle_goals_complete_task_command',
+    'goals-get-tasks': 'empirica.cli.command_handlers.goal_commands:handle_goals_get_tasks_command',
+    'goals-progress': 'empirica.cli.command_handlers.goal_commands:handle_goals_progress_command',
+    'goals-discover': 'empirica.cli.command_handlers.goal_commands:handle_goals_discover_command',
+    'goals-ready': 'empirica.cli.command_handlers.goal_commands:handle_goals_ready_command',
+    'goals-resume': 'empirica.cli.command_handlers.goal_commands:handle_goals_resume_command',
+    'goals-mark-stale': 'empirica.cli.command_handlers.goal_commands:handle_goals_mark_stale_command',
+    'goals-get-stale': 'empirica.cli.command_handlers.goal_commands:handle_goals_get_stale_command',
+    'goals-activate': 'empirica.cli.command_handlers.goal_commands:handle_goals_activate_command',
+    'goal-activate': 'empirica.cli.command_handlers.goal_commands:handle_goals_activate_command',
+    'goals-refresh': 'empirica.cli.command_handlers.goal_commands:handle_goals_refresh_command',
+
+    # Vision commands
+    'vision': 'empirica.cli.command_handlers.vision_commands:handle_vision_analyze',
+
+    # Epistemics commands
+    'epistemics-list': 'empirica.cli.command_handlers.epistemics_commands:handle_epistemics_list_command',
+    'epistemics-show': 'empirica.cli.command_handlers.epistemics_commands:handle_epistemics_stats_command',
+
+    # Edit verification commands
+    'edit-with-confidence': 'empirica.cli.command_handlers.edit_verification_command:handle_edit_with_confidence_command',
+
+    # Issue capture commands
+    'issue-list': 'empirica.cli.command_handlers.issue_capture_commands:handle_issue_list_command',
+    'issue-show': 'empirica.cli.command_handlers.issue_capture_commands:handle_issue_show_command',
+    'issue-handoff': 'empirica.cli.command_handlers.issue_capture_commands:handle_issue_handoff_command',
+    'issue-resolve': 'empirica.cli.command_handlers.issue_capture_commands:handle_issue_resolve_command',
+    'issue-export': 'empirica.cli.command_handlers.issue_capture_commands:handle_issue_export_command',
+    'issue-stats': 'empirica.cli.command_handlers.issue_capture_commands:handle_issue_stats_command',
+
+    # Architecture assessment commands
+    'assess-component': 'empirica.cli.command_handlers.architecture_commands:handle_assess_component_command',
+    'assess-compare': 'empirica.cli.command_handlers.architecture_commands:handle_assess_compare_command',
+    'assess-directory': 'empirica.cli.command_handlers.architecture_commands:handle_assess_directory_command',
+
+    # Unified query command
+    'query': 'empirica.cli.command_handlers.query_commands:handle_query_command',
+
+    # Agent commands
+    'agent-spawn': 'empirica.cli.command_handlers.agent_commands:handle_agent_spawn_command',
+    'agent-report': 'empirica.cli.command_handlers.agent_commands:handle_agent_report_command',
+    'agent-aggregate': 'empirica.cli.command_handlers.agent_commands:handle_agent_aggregate_command',
+    'agent-parallel': 'empirica.cli.command_handlers.agent_commands:handle_agent_parallel_command',
+    'agent-export': 'empirica.cli.command_handlers.agent_commands:handle_agent_export_command',
+    'agent-import': 'empirica.cli.command_handlers.agent_commands:handle_agent_import_command',
+    'agent-discover': 'empirica.cli.command_handlers.agent_commands:handle_agent_discover_command',
+
+    # Sentinel orchestration commands
+    'sentinel-orchestrate': 'empirica.cli.command_handlers.sentinel_commands:handle_sentinel_orchestrate_command',
+    'sentinel-load-profile': 'empirica.cli.command_handlers.sentinel_commands:handle_sentinel_load_profile_command',
+    'sentinel-status': 'empirica.cli.command_handlers.sentinel_commands:handle_sentinel_status_command',
+    'sentinel-check': 'empirica.cli.command_handlers.sentinel_commands:handle_sentinel_check_command',
+
+    # Persona commands
+    'persona-list': 'empirica.cli.command_handlers.persona_commands:handle_persona_list_command',
+    'persona-show': 'empirica.cli.command_handlers.persona_commands:handle_persona_show_command',
+    'persona-promote': 'empirica.cli.command_handlers.persona_commands:handle_persona_promote_command',
+    'persona-find': 'empirica.cli.command_handlers.persona_commands:handle_persona_find_command',
+
+    # Release commands
+    'release-ready': 'empirica.cli.command_handlers.release_commands:handle_release_ready_command',
+    'docs-assess': 'empirica.cli.command_handlers.docs_commands:handle_docs_assess',
+    'docs-explain': 'empirica.cli.command_handlers.docs_commands:handle_docs_explain',
+    'rust-docs-assess': 'empirica.cli.command_handlers.rust_docs_commands:handle_rust_docs_assess',
+    'docs-link-check': 'empirica.cli.command_handlers.docs_link_check_commands:handle_docs_link_check_command',
+    'bootstrap-context': 'empirica.cli.command_handlers.bootstrap_context_commands:handle_bootstrap_context_command',
+    'practice-context': 'empirica.cli.command_handlers.practice_context_commands:handle_practice_context_command',
+    'mesh-agreements': 'empirica.cli.command_handlers.mesh_agreements_commands:handle_mesh_agreements_group_command',
+
+    # Lesson commands (Epistemic Procedural Knowledge)
+    'lesson-create': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_create_command',
+    'lesson-load': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_load_command',
+    'lesson-list': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_list_command',
+    'lesson-search': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_search_command',
+    'lesson-recommend': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_recommend_command',
+    'lesson-path': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_path_command',
+    'lesson-replay-start': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_replay_start_command',
+    'lesson-replay-end': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_replay_end_command',
+    'lesson-stats': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_stats_command',
+    'lesson-embed': 'empirica.cli.command_handlers.lesson_commands:handle_lesson_embed_command',
+
+    # Onboarding commands
+    'onboard': 'empirica.cli.command_handlers.onboard:handle_onboard_command',
+    'setup-claude-code': 'empirica.cli.command_handlers.setup_claude_code:handle_setup_claude_code_command',
+    'enp-setup': 'empirica.cli.command_handlers.enp_commands:handle_enp_setup_command',
+    'diagnose': 'empirica.cli.command_handlers.diagnose:handle_diagnose_command',
+    'doctor': 'empirica.cli.command_handlers.doctor:handle_doctor_command',
+    'release': 'empirica.cli.command_handlers.release_commands:handle_release_command',
+
+    # Trajectory commands (experimental epistemic prediction)
+    'trajectory-show': 'empirica.cli.command_handlers.trajectory_commands:handle_trajectory_show',
+    'trajectory-stats': 'empirica.cli.command_handlers.trajectory_commands:handle_trajectory_stats',
+    'trajectory-backfill': 'empirica.cli.command_handlers.trajectory_commands:handle_trajectory_backfill',
+
+    # Concept graph commands (experimental epistemic prediction)
+    'concept-build': 'empirica.cli.command_handlers.concept_graph_commands:handle_concept_build',
+    'concept-stats': 'empirica.cli.command_handlers.concept_graph_commands:handle_concept_stats',
+    'concept-top': 'empirica.cli.command_handlers.concept_graph_commands:handle_concept_top',
+    'concept-related': 'empirica.cli.command_handlers.concept_graph_commands:handle_concept_related',
+
+    # MCP inspection (lifecycle now owned by harness mcp.json configs)
+    'mcp-list-tools': 'empirica.cli.command_handlers.mcp_commands:handle_mcp_list_tools_command',
+
+    # Inter-agent messaging commands
+    'message-send': 'empirica.cli.command_handlers.message_commands:handle_message_send_command',
+    'message-inbox': 'empirica.cli.command_handlers.message_commands:handle_message_inbox_command',
+    'message-read': 'empirica.cli.command_handlers.message_commands:handle_message_read_command',
+    'message-reply': 'empirica.cli.command_handlers.message_commands:handle_message_reply_command',
+    'message-thread': 'empirica.cli.command_handlers.message_commands:handle_message_thread_command',
+    'message-channels': 'empirica.cli.command_handlers.message_commands:handle_message_channels_command',
+    'message-cleanup': 'empirica.cli.command_handlers.message_commands:handle_message_cleanup_command',
+
+    # Dispatch bus commands (typed cross-instance dispatch)
+    'bus-register': 'empirica.cli.command_handlers.bus_commands:handle_bus_register_command',
+    'bus-dispatch': 'empirica.cli.command_handlers.bus_commands:handle_bus_dispatch_command',
+    'bus-subscribe': 'empirica.cli.command_handlers.bus_commands:handle_bus_subscribe_command',
+    'bus-instances': 'empirica.cli.command_handlers.bus_commands:handle_bus_instances_command',
+    'bus-status': 'empirica.cli.command_handlers.bus_commands:handle_bus_status_command',
+
+    # Profile management commands
+    'profile-sync': 'empirica.cli.command_handlers.profile_commands:handle_profile_sync_command',
+    'profile-prune': 'empirica.cli.command_handlers.profile_commands:handle_profile_prune_command',
+    'profile-status': 'empirica.cli.command_handlers.profile_commands:handle_profile_status_command',
+    'profile-import': 'empirica.cli.command_handlers.profile_commands:handle_profile_import_command',
+
+    # Server commands
+    'serve': 'empirica.cli.command_handlers.serve_commands:handle_serve_command',
+    'hook-daemon': 'empirica.cli.command_handlers.hook_daemon_commands:handle_hook_daemon_group_command',
+
+    # Memory management commands
+    'memory-prime': 'empirica.cli.command_handlers.memory_commands:handle_memory_prime_command',
+    'memory-scope': 'empirica.cli.command_handlers.memory_commands:handle_memory_scope_command',
+    'memory-value': 'empirica.cli.command_handlers.memory_commands:handle_memory_value_command',
+    'pattern-check': 'empirica.cli.command_handlers.memory_commands:handle_pattern_check_command',
+    'session-rollup': 'empirica.cli.command_handlers.memory_commands:handle_session_rollup_command',
+    'memory-report': 'empirica.cli.command_handlers.memory_commands:handle_memory_report_command',
+
+    # === ALIASES ===
+    # Argparse registers aliases for --help, but handler lookup needs them too
+    # CASCADE aliases
+    'pre': 'empirica.cli.command_handlers._workflow_preflight:handle_preflight_submit_command',
+    'preflight': 'empirica.cli.command_handlers._workflow_preflight:handle_preflight_submit_command',
+    'post': 'empirica.cli.command_handlers._workflow_postflight:handle_postflight_submit_command',
+    'postflight': 'empirica.cli.command_handlers._workflow_postflight:handle_postflight_submit_command',
+    # Session aliases
+    'sc': 'empirica.cli.command_handlers.session_create:handle_session_create_command',
+    'sl': 'empirica.cli.command_handlers.session_commands:handle_sessions_list_command',
+    'sr': 'empirica.cli.command_handlers.goal_commands:handle_sessions_resume_command',
+    'session-list': 'empirica.cli.command_handlers.session_commands:handle_sessions_list_command',
+    'session-show': 'empirica.cli.command_handlers.session_commands:handle_sessions_show_command',
+    'session-export': 'empirica.cli.command_handlers.session_commands:handle_sessions_export_command',
+    'session-resume': 'empirica.cli.command_handlers.goal_commands:handle_sessions_resume_command',
+    # Goal aliases
+    'gc': 'empirica.cli.command_handlers.goal_commands:handle_goals_create_command',
+    'gl': 'empirica.cli.command_handlers.goal_commands:handle_goals_list_command',
+    'goal-create': 'empirica.cli.command_handlers.goal_commands:handle_goals_create_command',
+    'goal-list': 'empirica.cli.command_handlers.goal_commands:handle_goals_list_command',
+    'goal-complete': 'empirica.cli.command_handlers.goal_commands:handle_goals_complete_command',
+    'goal-progress': 'empirica.cli.command_handlers.goal_commands:handle_goals_progress_command',
+    'goal-add-task': 'empirica.cli.command_handlers.goal_commands:handle_goals_add_task_command',
+    'goal-complete-task': 'empirica.cli.command_handlers.goal_commands:handle_goals_complete_task_command',
+    # Logging aliases
+    'fl': 'empirica.cli.command_handlers.artifact_log_commands:handle_finding_log_command',
+    'ul': 'empirica.cli.command_handlers.artifact_log_commands:handle_unknown_log_command',
+    'de': 'empirica.cli.command_handlers.artifact_log_commands:handle_deadend_log_command',
+    # Project aliases
+    'pb': 'empirica.cli.command_handlers.project_bootstrap:handle_project_bootstrap_command',
+    'bootstrap': 'empirica.cli.command_handlers.project_bootstrap:handle_project_bootstrap_command',
+    # Message aliases
+    'msg-send': 'empirica.cli.command_handlers.message_commands:handle_message_send_command',
+    'ms': 'empirica.cli.command_handlers.message_commands:handle_message_send_command',
+    'msg-inbox': 'empirica.cli.command_handlers.message_commands:handle_message_inbox_command',
+    'mi': 'empirica.cli.command_handlers.message_commands:handle_message_inbox_command',
+    'msg-read': 'empirica.cli.command_handlers.message_commands:handle_message_read_command',
+    'mr': 'empirica.cli.command_handlers.message_commands:handle_message_read_command',
+    'msg-reply': 'empirica.cli.command_handlers.message_commands:handle_message_reply_command',
+}
+
+_COMMAND_TO_GROUP: dict[str, str] = {
+    command: group for group, commands in PARSER_GROUPS.items() for command in commands
+}
+
+
+def _resolve(spec: str) -> Callable[..., Any]:
+    """Import ``module:function`` and return the function."""
+    module_name, _, attr = spec.partition(':')
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def is_known_command(command: str) -> bool:
+    """True if some parser group registers ``command``."""
+    return command in _COMMAND_TO_GROUP
+
+
+def parser_group_for(command: str) -> str | None:
+    """Return the ``module:function`` parser group that registers ``command``."""
+    return _COMMAND_TO_GROUP.get(command)
+
+
+def add_parser_group(subparsers: argparse._SubParsersAction, group: str) -> None:
+    """Import one parser-group module and register its subcommands."""
+    _resolve(group)(subparsers)
+
+
+def load_handler(command: str) -> Callable[..., Any] | None:
+    """Import and return the handler for ``command`` (None if it has none)."""
+    spec = COMMAND_HANDLERS.get(command)
+    if spec is None:
+        return None
+    return _resolve(spec)
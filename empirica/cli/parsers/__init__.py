@@ -12,6 +12,8 @@ Help Text Guidelines:
 - Example: '--limit LIMIT (optional, default: 10)'
 """
 
+import importlib
+
 
 def format_help_text(text, required=False, default=None):
     """
@@ -41,48 +43,55 @@ def format_help_text(text, required=False, default=None):
     # Escape % for Python 3.14+ argparse, which interprets % as format specifier in help strings
     return result.replace('%', '%%')
 
-from .action_parsers import add_action_parsers
-from .agent_parsers import add_agent_parsers
-from .architecture_parsers import add_architecture_parsers
-from .bus_parsers import add_bus_parsers
-from .cascade_parsers import add_cascade_parsers
-from .chat_parsers import add_chat_parsers
-from .checkpoint_parsers import add_checkpoint_parsers
-from .cockpit_launcher_parsers import add_cockpit_launcher_parsers
-from .cockpit_parsers import add_cockpit_parsers
-from .concept_graph_parsers import add_concept_graph_parsers
-from .config_parsers import add_config_parsers
-from .domain_parsers import add_domain_parsers, add_resolve_parser
-from .edit_verification_parsers import add_edit_verification_parsers
-from .epistemics_parsers import add_epistemics_parsers
-from .investigation_parsers import add_investigation_parsers
-from .issue_capture_parsers import add_issue_capture_parsers
-from .lesson_parsers import add_lesson_parsers
-from .mailbox_parsers import add_mailbox_parsers
-from .mcp_parsers import add_mcp_parsers
-from .memory_parsers import add_memory_parsers
-from .mesh_parsers import add_mesh_parsers
-from .message_parsers import add_message_parsers
-from .monitor_parsers import add_monitor_parsers
-from .notify_parsers import add_notify_parsers
-from .onboarding_parsers import add_onboarding_parsers
-from .performance_parsers import add_performance_parsers
-from .persona_parsers import add_persona_parsers
-from .profile_parsers import add_profile_parsers
-from .projects_parsers import add_projects_parsers
-from .query_parsers import add_query_parsers
-from .release_parsers import add_release_parsers
-from .scan_parsers import add_scan_parsers
-from .sentinel_parsers import add_sentinel_parsers
-from .serve_parsers import add_serve_parsers
-from .session_parsers import add_session_parsers
-from .skill_parsers import add_skill_parsers
-from .trajectory_parsers import add_trajectory_parsers
-from .user_interface_parsers import add_user_interface_parsers
-from .utility_parsers import add_utility_parsers
-from .visibility_parsers import add_visibility_parsers
-from .vision_parsers import add_vision_parsers
-from .voice_parsers import add_voice_parsers
+
+# Exported name → submodule. Submodules are imported on first attribute
+# access (PEP 562) so `empirica <command>` only loads the modules it uses.
+_LAZY_EXPORTS = {
+    'add_action_parsers': 'action_parsers',
+    'add_agent_parsers': 'agent_parsers',
+    'add_architecture_parsers': 'architecture_parsers',
+    'add_bus_parsers': 'bus_parsers',
+    'add_cascade_parsers': 'cascade_parsers',
+    'add_chat_parsers': 'chat_parsers',
+    'add_checkpoint_parsers': 'checkpoint_parsers',
+    'add_cockpit_launcher_parsers': 'cockpit_launcher_parsers',
+    'add_cockpit_parsers': 'cockpit_parsers',
+    'add_concept_graph_parsers': 'concept_graph_parsers',
+    'add_config_parsers': 'config_parsers',
+    'add_domain_parsers': 'domain_parsers',
+    'add_resolve_parser': 'domain_parsers',
+    'add_edit_verification_parsers': 'edit_verification_parsers',
+    'add_epistemics_parsers': 'epistemics_parsers',
+    'add_hook_daemon_parsers': 'hook_daemon_parsers',
+    'add_investigation_parsers': 'investigation_parsers',
+    'add_issue_capture_parsers': 'issue_capture_parsers',
+    'add_lesson_parsers': 'lesson_parsers',
+    'add_mailbox_parsers': 'mailbox_parsers',
+    'add_mcp_parsers': 'mcp_parsers',
+    'add_memory_parsers': 'memory_parsers',
+    'add_mesh_parsers': 'mesh_parsers',
+    'add_message_parsers': 'message_parsers',
+    'add_monitor_parsers': 'monitor_parsers',
+    'add_notify_parsers': 'notify_parsers',
+    'add_onboarding_parsers': 'onboarding_parsers',
+    'add_performance_parsers': 'performance_parsers',
+    'add_persona_parsers': 'persona_parsers',
+    'add_profile_parsers': 'profile_parsers',
+    'add_projects_parsers': 'projects_parsers',
+    'add_query_parsers': 'query_parsers',
+    'add_release_parsers': 'release_parsers',
+    'add_scan_parsers': 'scan_parsers',
+    'add_sentinel_parsers': 'sentinel_parsers',
+    'add_serve_parsers': 'serve_parsers',
+    'add_session_parsers': 'session_parsers',
+    'add_skill_parsers': 'skill_parsers',
+    'add_trajectory_parsers': 'trajectory_parsers',
+    'add_user_interface_parsers': 'user_interface_parsers',
+    'add_utility_parsers': 'utility_parsers',
+    'add_visibility_parsers': 'visibility_parsers',
+    'add_vision_parsers': 'vision_parsers',
+    'add_voice_parsers': 'voice_parsers',
+}
 
 __all__ = [
     'add_action_parsers',
@@ -99,6 +108,7 @@ __all__ = [
     'add_domain_parsers',
     'add_edit_verification_parsers',
     'add_epistemics_parsers',
+    'add_hook_daemon_parsers',
     'add_investigation_parsers',
     'add_issue_capture_parsers',
     'add_lesson_parsers',
@@ -130,3 +140,18 @@ __all__ = [
     'add_voice_parsers',
     'format_help_text',
 ]
+
+
+def __getattr__(name):
+    """Import the submodule that provides ``name`` on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{module_name}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,46 @@
+"""
+Hook Daemon Parsers - Warm executor for Claude Code hook scripts
+
+Commands:
+- hook-daemon start|stop|status|run: Manage the opt-in hook daemon that keeps
+  sentinel-gate / tool-router / statusline warm behind ~/.empirica/hookd.sock
+"""
+
+
+def add_hook_daemon_parsers(subparsers):
+    """Register the `hook-daemon` subcommand group with start/stop/status/run."""
+    daemon_root = subparsers.add_parser(
+        'hook-daemon',
+        help='Manage the warm hook daemon (skips Python cold start per tool call)',
+        description="""
+Opt-in long-lived process that executes sentinel-gate, tool-router,
+entity-extractor, context-shift-tracker and the statusline in a warm
+interpreter. Hook scripts forward to it over ~/.empirica/hookd.sock and
+fall back to running in-process whenever it is not running.
+
+Set EMPIRICA_HOOKD_DISABLE=1 to bypass the daemon without stopping it.
+        """,
+    )
+    daemon_subs = daemon_root.add_subparsers(dest='hook_daemon_action', metavar='action')
+
+    start = daemon_subs.add_parser('start', help='Start the daemon in the background')
+    start.add_argument('--socket', help='Socket path (default: ~/.empirica/hookd.sock)')
+    start.add_argument('--idle-timeout', type=float, default=None,
+                       help='Exit after N seconds without requests (default: never)')
+    start.add_argument('--output', choices=['json', 'human'], default='human',
+                       help='Output format (default: human)')
+
+    run = daemon_subs.add_parser('run', help='Run the daemon in the foreground')
+    run.add_argument('--socket', help='Socket path (default: ~/.empirica/hookd.sock)')
+    run.add_argument('--idle-timeout', type=float, default=None,
+                     help='Exit after N seconds without requests (default: never)')
+
+    stop = daemon_subs.add_parser('stop', help='Stop a running daemon')
+    stop.add_argument('--socket', help='Socket path (default: ~/.empirica/hookd.sock)')
+    stop.add_argument('--output', choices=['json', 'human'], default='human',
+                      help='Output format (default: human)')
+
+    status = daemon_subs.add_parser('status', help='Show daemon status and per-hook latency')
+    status.add_argument('--socket', help='Socket path (default: ~/.empirica/hookd.sock)')
+    status.add_argument('--output', choices=['json', 'human'], default='human',
+                        help='Output format (default: human)')
@@ -0,0 +1,150 @@
+"""
+Startup Profile - `empirica --profile-startup <command> ...`
+
+Re-runs the same invocation as `python -X importtime -m empirica.cli ...`
+and prints a breakdown of where startup time went:
+
+  - wall time and total import time
+  - CLI phases (parser build, handler import, handler run) reported by the
+    child process via mark()
+  - slowest top-level imports (cumulative) and per-package self time
+
+The command's own stdout is passed through untouched; the report goes to
+stderr so `--output json` stays machine-readable.
+
+IMPORTANT: cli_core imports this module on every invocation, so it must stay
+stdlib-only and cheap to import.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+PROFILE_ENV = 'EMPIRICA_PROFILE_STARTUP'
+PHASE_MARKER = 'empirica-startup-phases:'
+
+_IMPORTTIME_PREFIX = 'import time:'
+_TOP_N = 15
+
+_phases: dict[str, float] = {}
+_last_mark = time.perf_counter()
+
+
+def _emit_phases() -> None:
+    print(f"{PHASE_MARKER} {json.dumps(_phases)}", file=sys.stderr)
+
+
+def mark(phase: str) -> None:
+    """Record ms elapsed since the previous mark (only under --profile-startup)."""
+    global _last_mark
+    if not os.environ.get(PROFILE_ENV):
+        return
+    now = time.perf_counter()
+    if not _phases:
+        atexit.register(_emit_phases)
+    _phases[phase] = round((now - _last_mark) * 1000, 2)
+    _last_mark = now
+
+
+def parse_importtime(lines: list[str]) -> list[tuple[str, int, int, int]]:
+    """Parse `-X importtime` stderr lines.
+
+    Returns:
+        (module, self_us, cumulative_us, depth) tuples in emission order;
+        depth 0 is a top-level import.
+    """
+    entries = []
+    for line in lines:
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            continue
+        parts = line[len(_IMPORTTIME_PREFIX):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header row
+        name = parts[2].rstrip('\n')
+        indent = len(name) - len(name.lstrip(' '))
+        entries.append((name.strip(), self_us, cumulative_us, indent))
+
+    if not entries:
+        return []
+    base = min(e[3] for e in entries)
+    return [(name, s, c, (indent - base) // 2) for name, s, c, indent in entries]
+
+
+def _package_key(module: str) -> str:
+    """Group empirica.* by subpackage, everything else by top-level package."""
+    parts = module.split('.')
+    if parts[0] == 'empirica' and len(parts) > 1:
+        return '.'.join(parts[:2])
+    return parts[0]
+
+
+def format_report(argv: list[str], wall_ms: float, entries: list[tuple[str, int, int, int]],
+                  phases: dict[str, float]) -> str:
+    """Render the human-readable startup breakdown."""
+    top_level = [e for e in entries if e[3] == 0]
+    import_ms = sum(e[2] for e in top_level) / 1000
+
+    by_package: dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in entries:
+        by_package[_package_key(name)] += self_us
+
+    lines = [
+        '',
+        f"Startup profile: empirica {' '.join(argv)}",
+        '=' * 60,
+        f"  {'wall time':<28}{wall_ms:>10.1f} ms",
+        f"  {'imports (' + str(len(entries)) + ' modules)':<28}{import_ms:>10.1f} ms",
+    ]
+    for phase, ms in phases.items():
+        lines.append(f"  {phase.replace('_', ' '):<28}{ms:>10.1f} ms")
+
+    lines += ['', f"Slowest top-level imports (cumulative, top {_TOP_N}):"]
+    for name, _, cumulative_us, _ in sorted(top_level, key=lambda e: -e[2])[:_TOP_N]:
+        lines.append(f"  {cumulative_us / 1000:>9.1f} ms  {name}")
+
+    lines += ['', f"Self time by package (top {_TOP_N}):"]
+    for package, self_us in sorted(by_package.items(), key=lambda kv: -kv[1])[:_TOP_N]:
+        lines.append(f"  {self_us / 1000:>9.1f} ms  {package}")
+
+    return '\n'.join(lines) + '\n'
+
+
+def run_profiled(raw_args: list[str]) -> int:
+    """Re-run this invocation under -X importtime and print the breakdown.
+
+    Returns:
+        The profiled command's exit code
+    """
+    argv = [a for a in raw_args if a != '--profile-startup']
+    cmd = [sys.executable, '-X', 'importtime', '-m', 'empirica.cli', *argv]
+    env = {**os.environ, PROFILE_ENV: '1'}
+
+    started = time.perf_counter()
+    proc = subprocess.run(cmd, check=False, env=env, stderr=subprocess.PIPE, text=True)
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    importtime_lines = []
+    phases: dict[str, float] = {}
+    for line in proc.stderr.splitlines(keepends=True):
+        if line.startswith(_IMPORTTIME_PREFIX):
+            importtime_lines.append(line)
+        elif line.startswith(PHASE_MARKER):
+            try:
+                phases = json.loads(line[len(PHASE_MARKER):])
+            except ValueError:
+                pass
+        else:
+            sys.stderr.write(line)
+
+    sys.stderr.write(format_report(argv, wall_ms, parse_importtime(importtime_lines), phases))
+    return proc.returncode
@@ -30,6 +30,7 @@ from __future__ import annotations
 
 import textwrap
 from argparse import Namespace
+from pathlib import Path
 from typing import Any, ClassVar
 
 from textual.app import App, ComposeResult
@@ -67,6 +68,7 @@ from empirica.core.cockpit import (
     stop_instance,
     wake_instance,
 )
+from empirica.core.cockpit.aggregation_cache import AggregationCache
 from empirica.core.cockpit.project_cockpit_config import (
     project_listeners,
     project_loops,
@@ -78,6 +80,19 @@ REFRESH_SECONDS = 2.0
 # Items longer than this wrap onto continuation lines indented under
 # the bullet so the visual association is preserved.
 _WRAP_WIDTH = 36
+
+
+def _project_db_files(project_path: str | None) -> list[Path]:
+    """sessions.db (both layouts) plus WAL files — a committed write changes
+    at least one of them, so they key cached DB reads for the goals strip."""
+    if not project_path:
+        return []
+    empirica_dir = Path(project_path) / '.empirica'
+    return [
+        db.with_name(db.name + suffix)
+        for db in (empirica_dir / 'sessions' / 'sessions.db', empirica_dir / 'sessions.db')
+        for suffix in ('', '-wal')
+    ]
 # Hard cap per item (David: ~200 chars) to bound widget height per row.
 _ITEM_HARD_CAP = 200
 
@@ -135,6 +150,9 @@ class CockpitApp(App):
         self.payload: dict[str, Any] = {'instances': [], 'summary': {}, 'generated_at': ''}
         self.selected_instance_id: str | None = None
         self.include_dead = include_dead
+        # Reused across refresh ticks so only state files that changed
+        # since the last tick are re-read.
+        self.aggregation_cache = AggregationCache()
         # Compliance + services panel expansion state. Failures /
         # collector errors are ALWAYS shown expanded; the toggle keys
         # (`c` / `i`) only flip the clean / passing case so the operator
@@ -198,7 +216,9 @@ class CockpitApp(App):
 
     def refresh_payload(self) -> None:
         try:
-            self.payload = aggregate_all(include_dead=self.include_dead)
+            self.payload = aggregate_all(
+                include_dead=self.include_dead, cache=self.aggregation_cache,
+            )
         except Exception as e:
             self._log_status(f'refresh failed: {e}')
             return
@@ -497,8 +517,11 @@ class CockpitApp(App):
     def _format_goals(self, inst: dict[str, Any]) -> str:
         # Project-scoped: passes session_id through but it's ignored by
         # the reader (kept for signature compat).
-        goals = open_goals_list(
-            inst.get('project_path'), inst.get('session_id'), limit=5,
+        project_path = inst.get('project_path')
+        goals = self.aggregation_cache.get(
+            ('open_goals', project_path),
+            _project_db_files(project_path),
+            lambda: open_goals_list(project_path, inst.get('session_id'), limit=5),
         )
         if not goals:
             return '(none)'
@@ -105,6 +105,17 @@ def get_git_root() -> Path | None:
     return None
 
 
+def clear_path_caches() -> None:
+    """
+    Forget cwd-derived caches (the git root) so the next lookup re-resolves.
+
+    Long-lived processes that serve several projects (the hook daemon,
+    in-process MCP dispatch) call this whenever the working directory changes.
+    """
+    global _git_root_cache
+    _git_root_cache = None
+
+
 def load_empirica_config() -> dict | None:
     """
     Load .empirica/config.yaml from git root.
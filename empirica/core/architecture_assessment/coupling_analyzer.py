@@ -15,9 +15,10 @@ Maps to vectors:
 - impact: Blast radius (high Ca = breaking changes affect many)
 """
 
-import ast
 from pathlib import Path
 
+from empirica.core.ast_index import AstIndex, ModuleFacts
+
 from .schema import CouplingMetrics
 
 
@@ -32,6 +33,7 @@ class CouplingAnalyzer:
             project_root: Root directory of the project
         """
         self.project_root = Path(project_root)
+        self._index = AstIndex.for_root(self.project_root)
         self._import_graph: dict[str, set[str]] = {}
         self._reverse_graph: dict[str, set[str]] = {}
 
@@ -58,14 +60,12 @@ class CouplingAnalyzer:
         """Analyze a single Python file."""
         metrics = CouplingMetrics()
 
-        try:
-            content = module_path.read_text()
-            tree = ast.parse(content)
-        except (SyntaxError, FileNotFoundError):
+        facts = self._index.get(module_path)
+        if facts is None or not facts.parsed:
             return metrics
 
         # Extract imports (efferent coupling)
-        imports = self._extract_imports(tree)
+        imports = self._extract_imports(facts)
         internal_imports = [i for i in imports if self._is_internal(i)]
         metrics.efferent_coupling = len(internal_imports)
 
@@ -81,7 +81,7 @@ class CouplingAnalyzer:
             metrics.instability = 0.5  # Unknown
 
         # Analyze API surface
-        public, private = self._count_definitions(tree)
+        public, private = self._count_definitions(facts)
         metrics.public_functions = public
         metrics.private_functions = private
         total_funcs = public + private
@@ -89,11 +89,11 @@ class CouplingAnalyzer:
             metrics.api_surface_ratio = public / total_funcs
 
         # Check for leaked internals
-        metrics.leaked_internals = self._find_leaked_internals(tree)
+        metrics.leaked_internals = self._find_leaked_internals(facts)
         metrics.clear_interface = len(metrics.leaked_internals) == 0
 
         # Calculate abstractness (interfaces/ABCs vs concrete)
-        metrics.abstractness = self._calculate_abstractness(tree)
+        metrics.abstractness = self._calculate_abstractness(facts)
 
         # Distance from main sequence: |A + I - 1|
         metrics.distance_from_main = abs(
@@ -130,17 +130,9 @@ class CouplingAnalyzer:
 
         return metrics
 
-    def _extract_imports(self, tree: ast.AST) -> list[str]:
-        """Extract all import statements from AST."""
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
-        return imports
+    def _extract_imports(self, facts: ModuleFacts) -> list[str]:
+        """All imported module names (`import x` and `from x import ...`)."""
+        return facts.imports + [module for module, _ in facts.from_imports]
 
     def _is_internal(self, import_name: str) -> bool:
         """Check if import is from within the project."""
@@ -158,22 +150,19 @@ class CouplingAnalyzer:
         """Build full import graph for the project."""
         py_files = list(self.project_root.rglob("*.py"))
 
-        for py_file in py_files:
-            try:
-                content = py_file.read_text()
-                tree = ast.parse(content)
-                module_name = self._path_to_module(py_file)
-                imports = self._extract_imports(tree)
-
-                self._import_graph[module_name] = set(imports)
-
-                # Build reverse graph
-                for imp in imports:
-                    if imp not in self._reverse_graph:
-                        self._reverse_graph[imp] = set()
-                    self._reverse_graph[imp].add(module_name)
-            except (SyntaxError, FileNotFoundError):
+        for py_file, facts in zip(py_files, self._index.update(py_files)):
+            if facts is None or not facts.parsed:
                 continue
+            module_name = self._path_to_module(py_file)
+            imports = self._extract_imports(facts)
+
+            self._import_graph[module_name] = set(imports)
+
+            # Build reverse graph
+            for imp in imports:
+                if imp not in self._reverse_graph:
+                    self._reverse_graph[imp] = set()
+                self._reverse_graph[imp].add(module_name)
 
     def _path_to_module(self, path: Path) -> str:
         """Convert file path to module name."""
@@ -188,53 +177,34 @@ class CouplingAnalyzer:
         except ValueError:
             return path.stem
 
-    def _count_definitions(self, tree: ast.AST) -> tuple[int, int]:
+    def _count_definitions(self, facts: ModuleFacts) -> tuple[int, int]:
         """Count public vs private function/class definitions."""
         public = 0
         private = 0
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                if node.name.startswith('_'):
-                    private += 1
-                else:
-                    public += 1
+        for definition in facts.definitions:
+            if definition['name'].startswith('_'):
+                private += 1
+            else:
+                public += 1
 
         return public, private
 
-    def _find_leaked_internals(self, tree: ast.AST) -> list[str]:
+    def _find_leaked_internals(self, facts: ModuleFacts) -> list[str]:
         """Find private symbols that are exposed in __all__."""
-        leaked = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name) and target.id == '__all__':
-                        if isinstance(node.value, (ast.List, ast.Tuple)):
-                            for elt in node.value.elts:
-                                if isinstance(elt, ast.Constant):
-                                    name = elt.value
-                                    if isinstance(name, str) and name.startswith('_'):
-                                        leaked.append(name)
-
-        return leaked
-
-    def _calculate_abstractness(self, tree: ast.AST) -> float:
+        return [name for name in facts.all_names if name.startswith('_')]
+
+    def _calculate_abstractness(self, facts: ModuleFacts) -> float:
         """Calculate ratio of abstract types to total types."""
         abstract_count = 0
         total_count = 0
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
+        for definition in facts.definitions:
+            if definition['kind'] == 'class':
                 total_count += 1
-                # Check for ABC inheritance or abstractmethod decorators
-                for base in node.bases:
-                    if isinstance(base, ast.Name) and base.id in ('ABC', 'ABCMeta'):
-                        abstract_count += 1
-                        break
-                    if isinstance(base, ast.Attribute) and base.attr in ('ABC', 'ABCMeta'):
-                        abstract_count += 1
-                        break
+                # Check for ABC inheritance (ABC, abc.ABC, ABCMeta)
+                if any(base.rsplit('.', 1)[-1] in ('ABC', 'ABCMeta') for base in definition['bases']):
+                    abstract_count += 1
 
         if total_count == 0:
             return 0.0
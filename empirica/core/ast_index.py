@@ -0,0 +1,366 @@
+"""Incremental per-project AST index shared by the code-analysis surfaces.
+
+Four subsystems used to `ast.parse` the whole tree on every run: the
+bootstrap dependency summary (SessionDatabase._generate_dependency_summary),
+CouplingAnalyzer's import graph, code_embeddings' API extraction and the
+docs agent's docstring/class checks. They now read per-file facts from one
+AstIndex:
+
+- imports (`import x` names and `from m import ...` modules with level)
+- definitions in ast.walk order (kind, name, line, column, docstring
+  presence, class bases)
+- public top-level API signatures (functions, classes and their methods)
+- module docstring, `__all__` names and `if __name__ == '__main__'`
+
+Each entry is keyed by (path, mtime_ns, size, sha1). A stat match reuses
+the entry outright; a changed stat with an unchanged sha1 (touch, checkout)
+only refreshes the stat; anything else is re-parsed — in a process pool
+when enough files changed.
+
+Persistence: `<project>/.empirica/cache/ast_index.json`, written atomically
+and only for real project roots (project.yaml or sessions.db present), so
+analysing an arbitrary directory never creates a stray `.empirica/`. Every
+index is also memoised per root for the life of the process.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar
+
+logger = logging.getLogger(__name__)
+
+# Bump when the extracted facts change shape; older caches are discarded.
+INDEX_VERSION = 1
+INDEX_FILENAME = "ast_index.json"
+# Below this many files to parse, process-pool startup costs more than it saves
+PARALLEL_MIN_FILES = 32
+# Docstrings kept on API signatures and the module (matches code_embeddings)
+DOCSTRING_CHARS = 500
+
+
+@dataclass
+class ModuleFacts:
+    """Everything the index consumers need from one parsed .py file."""
+
+    sha1: str
+    error: str | None = None
+    module_docstring: str = ""
+    imports: list[str] = field(default_factory=list)
+    from_imports: list[tuple[str, int]] = field(default_factory=list)
+    definitions: list[dict[str, Any]] = field(default_factory=list)
+    functions: list[dict[str, Any]] = field(default_factory=list)
+    classes: list[dict[str, Any]] = field(default_factory=list)
+    all_names: list[str] = field(default_factory=list)
+    entry_point: bool = False
+
+    @property
+    def parsed(self) -> bool:
+        return self.error is None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ModuleFacts:
+        data = dict(data)
+        data["from_imports"] = [(m, lvl) for m, lvl in data.get("from_imports", [])]
+        return cls(**data)
+
+
+# --- Extraction (runs in worker processes; must stay top-level) ---
+
+
+def _unparse(node: ast.AST) -> str | None:
+    try:
+        return ast.unparse(node)
+    except Exception:
+        return None
+
+
+def _function_signature(node: ast.FunctionDef | ast.AsyncFunctionDef) -> dict[str, Any]:
+    """Signature dict for a function or method (params, returns, docs, decorators)."""
+    params = []
+    for arg in node.args.args:
+        param = {"name": arg.arg}
+        if arg.annotation and (annotation := _unparse(arg.annotation)) is not None:
+            param["type"] = annotation
+        params.append(param)
+
+    # Defaults (aligned from the right)
+    defaults = node.args.defaults
+    offset = len(params) - len(defaults)
+    for i, default in enumerate(defaults):
+        if (value := _unparse(default)) is not None:
+            params[offset + i]["default"] = value
+
+    decorators = []
+    for dec in node.decorator_list:
+        text = _unparse(dec)
+        if text is None and isinstance(dec, ast.Name):
+            text = dec.id
+        if text is not None:
+            decorators.append(text)
+
+    return {
+        "name": node.name,
+        "params": params,
+        "returns": (_unparse(node.returns) or "") if node.returns else "",
+        "docstring": (ast.get_docstring(node) or "")[:DOCSTRING_CHARS],
+        "decorators": decorators,
+        "line": node.lineno,
+    }
+
+
+def _class_bases(node: ast.ClassDef) -> list[str]:
+    bases = []
+    for base in node.bases:
+        text = _unparse(base)
+        if text is None and isinstance(base, ast.Name):
+            text = base.id
+        if text is not None:
+            bases.append(text)
+    return bases
+
+
+def _class_info(node: ast.ClassDef) -> dict[str, Any]:
+    """Class dict: bases, every method's signature, docstring."""
+    return {
+        "name": node.name,
+        "bases": _class_bases(node),
+        "methods": [
+            _function_signature(item) for item in node.body
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+        ],
+        "docstring": (ast.get_docstring(node) or "")[:DOCSTRING_CHARS],
+        "line": node.lineno,
+    }
+
+
+def _is_main_guard(node: ast.AST) -> bool:
+    if not (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and len(node.test.comparators) == 1):
+        return False
+    left, comp = node.test.left, node.test.comparators[0]
+    return (isinstance(left, ast.Name) and left.id == "__name__"
+            and isinstance(comp, ast.Constant) and comp.value == "__main__")
+
+
+def extract_facts(source: bytes, filename: str = "<unknown>") -> ModuleFacts:
+    """Parse `source` once and collect every fact the consumers use."""
+    facts = ModuleFacts(sha1=hashlib.sha1(source, usedforsecurity=False).hexdigest())
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        facts.error = f"{type(e).__name__}: {e}"
+        return facts
+
+    facts.module_docstring = (ast.get_docstring(tree) or "")[:DOCSTRING_CHARS]
+
+    for node in ast.iter_child_nodes(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if not node.name.startswith("_"):  # Public only
+                facts.functions.append(_function_signature(node))
+        elif isinstance(node, ast.ClassDef) and not node.name.startswith("_"):
+            facts.classes.append(_class_info(node))
+
+    kinds = {ast.ClassDef: "class", ast.FunctionDef: "def", ast.AsyncFunctionDef: "async def"}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            facts.imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                facts.from_imports.append((node.module, node.level))
+        elif type(node) in kinds:
+            definition = {
+                "kind": kinds[type(node)],
+                "name": node.name,
+                "line": node.lineno,
+                "col": node.col_offset,
+                "documented": bool(ast.get_docstring(node)),
+            }
+            if isinstance(node, ast.ClassDef):
+                definition["bases"] = _class_bases(node)
+            facts.definitions.append(definition)
+        elif isinstance(node, ast.Assign):
+            if any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets) \
+                    and isinstance(node.value, (ast.List, ast.Tuple)):
+                facts.all_names.extend(
+                    elt.value for elt in node.value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                )
+        elif not facts.entry_point and _is_main_guard(node):
+            facts.entry_point = True
+
+    return facts
+
+
+def _extract_facts_args(args: tuple[bytes, str]) -> ModuleFacts:
+    """Process-pool entry point for extract_facts (must be top-level to pickle)."""
+    return extract_facts(*args)
+
+
+# --- Index ---
+
+
+def _is_project_root(root: Path) -> bool:
+    return ((root / ".empirica" / "project.yaml").exists()
+            or (root / ".empirica" / "sessions" / "sessions.db").exists())
+
+
+class AstIndex:
+    """Per-file AST facts for one project root, refreshed incrementally."""
+
+    _instances: ClassVar[dict[Path, AstIndex]] = {}
+
+    def __init__(self, root: str | Path, cache_path: str | Path | None = None):
+        self.root = Path(root).resolve()
+        self.cache_path = Path(cache_path) if cache_path else None
+        # key -> {"mtime_ns", "size", "facts": ModuleFacts}
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_root(cls, root: str | Path) -> AstIndex:
+        """The process-wide index for `root`, persisted under its
+        .empirica/cache/ when `root` is a project root."""
+        resolved = Path(root).resolve()
+        index = cls._instances.get(resolved)
+        if index is None:
+            cache_path = None
+            if _is_project_root(resolved):
+                cache_path = resolved / ".empirica" / "cache" / INDEX_FILENAME
+            index = cls._instances[resolved] = cls(resolved, cache_path)
+        return index
+
+    def _key(self, path: Path) -> str:
+        path = path if path.is_absolute() else self.root / path
+        try:
+            return path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path.resolve())
+
+    # --- Persistence ---
+
+    def _load(self) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        try:
+            self._entries = {
+                key: {**entry, "facts": ModuleFacts.from_dict(entry["facts"])}
+                for key, entry in data.get("files", {}).items()
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Discarding unreadable AST index {self.cache_path}: {e}")
+            self._entries = {}
+
+    def save(self) -> None:
+        """Persist changed entries, dropping files that no longer exist."""
+        if self.cache_path is None or not self._dirty:
+            return
+        for key in [k for k in self._entries if not (self.root / k).exists()]:
+            del self._entries[key]
+        data = {
+            "version": INDEX_VERSION,
+            "files": {
+                key: {**entry, "facts": asdict(entry["facts"])}
+                for key, entry in self._entries.items()
+            },
+        }
+        tmp = self.cache_path.with_name(self.cache_path.name + f".{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"AST index not persisted for {self.root}: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    # --- Lookup ---
+
+    def update(
+        self,
+        paths: Iterable[str | Path],
+        workers: int | None = None,
+        parallel_min: int = PARALLEL_MIN_FILES,
+    ) -> list[ModuleFacts | None]:
+        """Facts for each of `paths` (None where the file can't be read),
+        re-parsing only files whose content changed since they were indexed.
+
+        Workers default to EMPIRICA_AST_INDEX_WORKERS, else os.cpu_count();
+        1 forces in-process parsing.
+        """
+        paths = [Path(p) for p in paths]
+        keys = [self._key(p) for p in paths]
+        results: list[ModuleFacts | None] = [None] * len(paths)
+        to_parse: list[tuple[int, bytes, os.stat_result]] = []
+
+        for i, (path, key) in enumerate(zip(paths, keys)):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entry = self._entries.get(key)
+            if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                results[i] = entry["facts"]
+                continue
+            try:
+                source = path.read_bytes()
+            except OSError:
+                continue
+            if entry and entry["facts"].sha1 == hashlib.sha1(source, usedforsecurity=False).hexdigest():
+                entry["mtime_ns"], entry["size"] = st.st_mtime_ns, st.st_size
+                self._dirty = True
+                results[i] = entry["facts"]
+                continue
+            to_parse.append((i, source, st))
+
+        for (i, _, st), facts in zip(to_parse, self._parse([(src, str(paths[i])) for i, src, _ in to_parse],
+                                                           workers, parallel_min)):
+            self._entries[keys[i]] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "facts": facts}
+            results[i] = facts
+        if to_parse:
+            self._dirty = True
+        self.save()
+        return results
+
+    def get(self, path: str | Path) -> ModuleFacts | None:
+        """Facts for a single file."""
+        return self.update([path])[0]
+
+    @staticmethod
+    def _parse(args: list[tuple[bytes, str]], workers: int | None, parallel_min: int) -> list[ModuleFacts]:
+        if workers is None:
+            workers = int(os.environ.get("EMPIRICA_AST_INDEX_WORKERS", "0")) or (os.cpu_count() or 1)
+        if workers > 1 and len(args) >= parallel_min:
+            from concurrent.futures import ProcessPoolExecutor
+
+            try:
+                with ProcessPoolExecutor(max_workers=min(workers, len(args))) as pool:
+                    chunksize = max(1, len(args) // (workers * 4))
+                    return list(pool.map(_extract_facts_args, args, chunksize=chunksize))
+            except Exception as e:
+                logger.debug(f"Parallel AST parsing unavailable, running in-process: {e}")
+        return [extract_facts(*a) for a in args]
+
+
+__all__ = [
+    'AstIndex',
+    'ModuleFacts',
+    'extract_facts',
+]
@@ -78,33 +78,27 @@ class BayesianBeliefManager:
         """
         cursor = self.conn.cursor()
 
-        # Get most recent belief for each vector
+        # Most recent belief per vector, kept current by a trigger on
+        # bayesian_beliefs (migration 055) - history stays append-only
         cursor.execute("""
-            SELECT bb.vector_name, bb.mean, bb.variance, bb.evidence_count,
-                   bb.prior_mean, bb.prior_variance, bb.last_updated
-            FROM bayesian_beliefs bb
-            JOIN cascades c ON bb.cascade_id = c.cascade_id
-            JOIN sessions s ON c.session_id = s.session_id
-            WHERE s.ai_id = ?
-            ORDER BY bb.last_updated DESC
+            SELECT vector_name, mean, variance, evidence_count,
+                   prior_mean, prior_variance, last_updated
+            FROM bayesian_beliefs_current
+            WHERE ai_id = ?
         """, (ai_id,))
 
         beliefs = {}
-        seen_vectors = set()
 
         for row in cursor.fetchall():
-            vector_name = row[0]
-            if vector_name not in seen_vectors:
-                beliefs[vector_name] = Belief(
-                    vector_name=vector_name,
-                    mean=row[1],
-                    variance=row[2],
-                    evidence_count=row[3],
-                    prior_mean=row[4],
-                    prior_variance=row[5],
-                    last_updated=row[6]
-                )
-                seen_vectors.add(vector_name)
+            beliefs[row[0]] = Belief(
+                vector_name=row[0],
+                mean=row[1],
+                variance=row[2],
+                evidence_count=row[3],
+                prior_mean=row[4],
+                prior_variance=row[5],
+                last_updated=row[6]
+            )
 
         # Fill in defaults for missing vectors
         for vector in self.TRACKED_VECTORS:
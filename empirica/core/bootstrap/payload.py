@@ -188,14 +188,20 @@ def _build_project_block(db_path: Path, project_id: str) -> dict | None:
             except (ValueError, TypeError):
                 repos = []
         # Live counts (the stored denormalized counters drift — see
-        # session_database._count_project_artifacts).
-        try:
-            ts = conn.execute(
-                "SELECT COUNT(*) FROM sessions WHERE project_id = ?",
-                (project_id,),
-            ).fetchone()[0]
-        except Exception:
-            ts = row["total_sessions"] or 0
+        # session_database._count_project_artifacts). project_counters is
+        # trigger-maintained (migration 057); count directly without it.
+        from empirica.data.project_counters import read_project_counters
+        counters = read_project_counters(conn, project_id)
+        if counters is not None:
+            ts = counters["sessions"]
+        else:
+            try:
+                ts = conn.execute(
+                    "SELECT COUNT(*) FROM sessions WHERE project_id = ?",
+                    (project_id,),
+                ).fetchone()[0]
+            except Exception:
+                ts = row["total_sessions"] or 0
         # Transactions live as transaction_id columns scattered across the
         # artifact tables — there is no standalone `transactions` table.
         # Count distinct transaction_ids across all artifact tables scoped
@@ -246,14 +252,17 @@ def _build_project_block(db_path: Path, project_id: str) -> dict | None:
             # if the schema drifts again, surfaces other DB errors instead
             # of silently swallowing them.
             tt = 0
-        try:
-            tg = conn.execute(
-                "SELECT COUNT(*) FROM goals WHERE project_id = ? OR "
-                "session_id IN (SELECT session_id FROM sessions WHERE project_id = ?)",
-                (project_id, project_id),
-            ).fetchone()[0]
-        except Exception:
-            tg = row["total_goals"] or 0
+        if counters is not None:
+            tg = counters["goals"]
+        else:
+            try:
+                tg = conn.execute(
+                    "SELECT COUNT(*) FROM goals WHERE project_id = ? OR "
+                    "session_id IN (SELECT session_id FROM sessions WHERE project_id = ?)",
+                    (project_id, project_id),
+                ).fetchone()[0]
+            except Exception:
+                tg = row["total_goals"] or 0
         return {
             "id": row["id"],
             "name": row["name"],
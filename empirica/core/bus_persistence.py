@@ -23,10 +23,15 @@ Usage:
     bus.publish(event)  # Goes to in-process + SQLite + Qdrant
 """
 
+import atexit
 import json
 import logging
 import os
+import sqlite3
+import threading
 import uuid
+import weakref
+from collections import deque
 from typing import Any
 
 from empirica.core.epistemic_bus import (
@@ -38,6 +43,27 @@ from empirica.core.epistemic_bus import (
 logger = logging.getLogger(__name__)
 
 
+_EVENTS_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS epistemic_events (
+        id TEXT PRIMARY KEY,
+        session_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        agent_id TEXT,
+        data_json TEXT,
+        timestamp REAL NOT NULL,
+        node_id TEXT,
+        created_at TEXT DEFAULT (datetime('now'))
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_events_session ON epistemic_events(session_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_events_type ON epistemic_events(event_type, timestamp)",
+)
+
+# Live SQLite observers, flushed at interpreter exit and before queries
+_sqlite_observers: "weakref.WeakSet[SqliteBusObserver]" = weakref.WeakSet()
+
+
 class SqliteBusObserver(EpistemicObserver):
     """
     Persist bus events to SQLite for durable cross-session event log.
@@ -45,75 +71,150 @@ class SqliteBusObserver(EpistemicObserver):
     Always available - the guaranteed fallback when Qdrant is down.
     Writes to `epistemic_events` table in sessions.db.
 
-    Like journaling to disk: slow but reliable.
+    Write-behind: handle_event only serializes the event and appends it to
+    an in-memory queue, so publishers never wait on SQLite. A background
+    writer drains the queue over one long-lived connection in batched
+    transactions, when `batch_size` events are pending or every
+    `flush_interval` seconds. Pending events are flushed at interpreter exit
+    (and before query_events). When `max_queue` events are already pending,
+    new events are dropped and counted rather than blocking the publisher.
     """
 
-    def __init__(self, session_id: str):
+    def __init__(self, session_id: str, db_path: str | None = None,
+                 batch_size: int = 64, flush_interval: float = 0.5,
+                 max_queue: int = 10_000):
         self.session_id = session_id
-        self._ensure_table()
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._pending: deque[tuple] = deque()
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._closed = False
+        self._counters = {"queued": 0, "flushed": 0, "dropped": 0, "batches": 0}
         self._event_count = 0
+        self._ensure_table()
+        _sqlite_observers.add(self)
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """The observer's single connection (opened lazily, shared under _write_lock)."""
+        if self._conn is None:
+            if self._db_path is None:
+                from empirica.config.path_resolver import get_session_db_path
+                self._db_path = str(get_session_db_path())
+            conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._conn = conn
+        return self._conn
 
     def _ensure_table(self):
         """Create events table if it doesn't exist."""
         try:
-            from empirica.data.session_database import SessionDatabase
-            db = SessionDatabase()
-            if db.conn is None:
-                return
-            db.conn.execute("""
-                CREATE TABLE IF NOT EXISTS epistemic_events (
-                    id TEXT PRIMARY KEY,
-                    session_id TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    agent_id TEXT,
-                    data_json TEXT,
-                    timestamp REAL NOT NULL,
-                    node_id TEXT,
-                    created_at TEXT DEFAULT (datetime('now'))
-                )
-            """)
-            db.conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_events_session
-                ON epistemic_events(session_id, timestamp)
-            """)
-            db.conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_events_type
-                ON epistemic_events(event_type, timestamp)
-            """)
-            db.conn.commit()
-            db.close()
+            with self._write_lock:
+                conn = self._connect()
+                for statement in _EVENTS_DDL:
+                    conn.execute(statement)
+                conn.commit()
         except Exception as e:
             logger.warning(f"Could not ensure events table: {e}")
 
     def handle_event(self, event: EpistemicEvent) -> None:
-        """Persist event to SQLite."""
+        """Queue event for persistence (never blocks on SQLite)."""
         try:
-            from empirica.data.session_database import SessionDatabase
-            db = SessionDatabase()
-            if db.conn is None:
-                return
-
-            event_id = str(uuid.uuid4())
-            node_id = os.getenv("EMPIRICA_AI_ID", "unknown")
-
-            db.conn.execute("""
-                INSERT INTO epistemic_events
-                (id, session_id, event_type, agent_id, data_json, timestamp, node_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event_id,
+            row = (
+                str(uuid.uuid4()),
                 event.session_id,
                 event.event_type,
                 event.agent_id,
                 json.dumps(event.data),
                 event.timestamp,
-                node_id,
-            ))
-            db.conn.commit()
-            db.close()
-            self._event_count += 1
-        except Exception as e:
-            logger.debug(f"SQLite event persist failed: {e}")
+                os.getenv("EMPIRICA_AI_ID", "unknown"),
+            )
+        except (TypeError, ValueError) as e:
+            logger.debug(f"SQLite event not serializable: {e}")
+            self._counters["dropped"] += 1
+            return
+
+        with self._cond:
+            if self._closed or len(self._pending) >= self.max_queue:
+                self._counters["dropped"] += 1
+                return
+            self._pending.append(row)
+            self._counters["queued"] += 1
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="empirica-bus-sqlite", daemon=True,
+                )
+                self._writer.start()
+            if len(self._pending) in (1, self.batch_size):
+                self._cond.notify()
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed:
+                    if not self._pending:
+                        self._cond.wait()  # woken by the first queued event
+                    if len(self._pending) < self.batch_size and not self._closed:
+                        self._cond.wait(self.flush_interval)
+                if self._closed and not self._pending:
+                    return
+            self.flush()
+
+    def flush(self) -> int:
+        """Write every pending event in one transaction. Returns events written."""
+        with self._write_lock:
+            with self._cond:
+                rows = list(self._pending)
+                self._pending.clear()
+            if not rows:
+                return 0
+            try:
+                conn = self._connect()
+                conn.executemany("""
+                    INSERT INTO epistemic_events
+                    (id, session_id, event_type, agent_id, data_json, timestamp, node_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"SQLite event persist failed ({len(rows)} events): {e}")
+                if self._conn is not None:
+                    self._conn.rollback()
+                with self._cond:
+                    # Requeue ahead of newer events for the next flush, within the bound
+                    room = max(0, self.max_queue - len(self._pending))
+                    self._pending.extendleft(reversed(rows[:room]))
+                    self._counters["dropped"] += len(rows) - min(room, len(rows))
+                return 0
+            self._counters["flushed"] += len(rows)
+            self._counters["batches"] += 1
+            self._event_count += len(rows)
+            return len(rows)
+
+    def close(self) -> None:
+        """Flush pending events, stop the writer and close the connection."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout=5)
+        self.flush()
+        with self._write_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        _sqlite_observers.discard(self)
+
+    def stats(self) -> dict[str, int]:
+        """Counters: queued/flushed/dropped totals, batches written, pending now."""
+        with self._cond:
+            return {**self._counters, "pending": len(self._pending)}
 
     @staticmethod
     def query_events(
@@ -124,8 +225,10 @@ class SqliteBusObserver(EpistemicObserver):
     ) -> list[dict[str, Any]]:
         """Query persisted events from SQLite.
 
-        Enables cross-session event discovery.
+        Enables cross-session event discovery. Events still queued in this
+        process are flushed first.
         """
+        flush_sqlite_observers()
         try:
             from empirica.data.session_database import SessionDatabase
             db = SessionDatabase()
@@ -158,6 +261,12 @@ class SqliteBusObserver(EpistemicObserver):
             return []
 
 
+@atexit.register
+def flush_sqlite_observers() -> int:
+    """Flush every live SqliteBusObserver's queue. Returns events written."""
+    return sum(observer.flush() for observer in list(_sqlite_observers))
+
+
 class QdrantBusObserver(EpistemicObserver):
     """
     Persist bus events to Qdrant for semantic cross-node discovery.
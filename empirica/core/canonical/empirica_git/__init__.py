@@ -6,6 +6,7 @@ Modular git-based coordination layer for multi-AI collaboration.
 Modules:
 - checkpoint_manager: Automatic checkpoint creation and loading
 - goal_store: Goal/task storage in git notes for cross-AI discovery
+- notes_reader: Batched note reads over one `git cat-file --batch` per repo
 - session_sync: Session state synchronization via git
 - sentinel_hooks: Integration points for cognitive_vault Sentinel
 
@@ -19,6 +20,7 @@ Design Principles:
 from .checkpoint_manager import CheckpointManager, auto_checkpoint
 from .goal_store import GitGoalStore
 from .message_store import GitMessageStore
+from .notes_reader import GitNotesReader, get_notes_reader
 from .sentinel_hooks import SentinelDecision, SentinelHooks, SentinelState, TurtleStatus
 from .session_sync import SessionSync
 
@@ -26,10 +28,12 @@ __all__ = [
     'CheckpointManager',
     'GitGoalStore',
     'GitMessageStore',
+    'GitNotesReader',
     'SentinelDecision',
     'SentinelHooks',
     'SentinelState',
     'SessionSync',
     'TurtleStatus',
-    'auto_checkpoint'
+    'auto_checkpoint',
+    'get_notes_reader',
 ]
@@ -14,6 +14,8 @@ import subprocess
 from datetime import datetime, timezone
 from typing import Any
 
+from .notes_reader import get_notes_reader
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +25,7 @@ class GitAssumptionStore:
     def __init__(self, workspace_root: str | None = None):
         self.workspace_root = workspace_root or os.getcwd()
         self._git_available = self._check_git_repo()
+        self._notes = get_notes_reader(self.workspace_root)
 
     def _check_git_repo(self) -> bool:
         try:
@@ -99,35 +102,12 @@ class GitAssumptionStore:
             return False
 
     def load_assumption(self, assumption_id: str) -> dict[str, Any] | None:
-        if not self._git_available or not self._has_commits():
+        if not self._git_available:
             return None
 
         try:
             note_ref = f'empirica/assumptions/{assumption_id}'
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'list'],
-                cwd=self.workspace_root,
-                capture_output=True, text=True
-            )
-
-            if result.returncode != 0 or not result.stdout.strip():
-                return None
-
-            parts = result.stdout.strip().split()
-            if len(parts) < 2:
-                return None
-            commit_hash = parts[1]
-
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'show', commit_hash],
-                cwd=self.workspace_root,
-                capture_output=True, text=True
-            )
-
-            if result.returncode != 0:
-                return None
-
-            return json.loads(result.stdout)
+            return self._notes.read_note_json(note_ref)
 
         except Exception as e:
             logger.warning(f"Failed to load assumption from git: {e}")
@@ -142,28 +122,8 @@ class GitAssumptionStore:
             return []
 
         try:
-            result = subprocess.run(
-                ['git', 'for-each-ref', 'refs/notes/empirica/assumptions/'],
-                cwd=self.workspace_root,
-                capture_output=True, text=True
-            )
-
-            if result.returncode != 0:
-                return []
-
             assumptions = []
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                parts = line.split('\t')
-                if len(parts) < 2:
-                    continue
-                ref = parts[1]
-                if not ref.startswith('refs/notes/empirica/assumptions/'):
-                    continue
-
-                assumption_id = ref.split('/')[-1]
-                data = self.load_assumption(assumption_id)
+            for _ref, data in self._notes.list_notes_json('refs/notes/empirica/assumptions/'):
                 if not data:
                     continue
 
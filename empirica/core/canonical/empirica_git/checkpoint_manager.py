@@ -15,9 +15,12 @@ import json
 import logging
 import os
 import subprocess
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import Any
 
+from .notes_reader import get_notes_reader
+
 UTC = timezone.utc
 
 logger = logging.getLogger(__name__)
@@ -43,6 +46,7 @@ class CheckpointManager:
         """
         self.workspace_root = workspace_root or os.getcwd()
         self._git_available = self._check_git_repo()
+        self._notes = get_notes_reader(self.workspace_root)
 
     def _check_git_repo(self) -> bool:
         """Check if we're in a git repository"""
@@ -259,6 +263,22 @@ class CheckpointManager:
 
         return json.loads(result.stdout)
 
+    def _iter_checkpoints(self, commit_hashes: list[str]) -> Iterator[dict[str, Any]]:
+        """Yield checkpoints attached to the given commits, in order.
+
+        Reads the checkpoints notes tree once instead of running
+        `git notes show` per commit.
+        """
+        notes = self._notes.note_map('empirica/checkpoints')
+        for commit_hash in commit_hashes:
+            blob = notes.get(commit_hash)
+            if blob is None:
+                continue
+            text = self._notes.read_blob(blob)
+            checkpoint = json.loads(text) if text else None
+            if checkpoint:
+                yield checkpoint
+
     def load_recent_checkpoints(
         self,
         session_id: str | None = None,
@@ -296,14 +316,10 @@ class CheckpointManager:
             checkpoints = []
 
             # Search for matching checkpoints
-            for commit_hash in commit_hashes:
+            for checkpoint in self._iter_checkpoints(commit_hashes):
                 if len(checkpoints) >= count:
                     break
 
-                checkpoint = self._load_checkpoint_by_hash(commit_hash)
-                if not checkpoint:
-                    continue
-
                 # Apply filters
                 if session_id and checkpoint.get('session_id') != session_id:
                     continue
@@ -337,10 +353,7 @@ class CheckpointManager:
         commit_hashes = result.stdout.strip().split('\n')
 
         # Search for matching checkpoint
-        for commit_hash in commit_hashes:
-            checkpoint = self._load_checkpoint_by_hash(commit_hash)
-            if not checkpoint:
-                continue
+        for checkpoint in self._iter_checkpoints(commit_hashes):
 
             # Apply filters
             if session_id and checkpoint.get('session_id') != session_id:
@@ -17,6 +17,8 @@ import subprocess
 from datetime import datetime, timezone
 from typing import Any
 
+from .notes_reader import get_notes_reader
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +47,7 @@ class GitDeadEndStore:
         """Initialize git dead end store"""
         self.workspace_root = workspace_root or os.getcwd()
         self._git_available = self._check_git_repo()
+        self._notes = get_notes_reader(self.workspace_root)
 
     def _check_git_repo(self) -> bool:
         """Check if we're in a git repository"""
@@ -153,41 +156,12 @@ class GitDeadEndStore:
 
     def load_dead_end(self, dead_end_id: str) -> dict[str, Any] | None:
         """Load dead end from git notes"""
-        if not self._git_available or not self._has_commits():
+        if not self._git_available:
             return None
 
         try:
             note_ref = f'empirica/dead_ends/{dead_end_id}'
-
-            # List which commit has the note (notes can be on any commit, not just HEAD)
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'list'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0 or not result.stdout.strip():
-                return None
-
-            # Format is: <blob> <commit>
-            parts = result.stdout.strip().split()
-            if len(parts) < 2:
-                return None
-            commit_hash = parts[1]
-
-            # Load note from the commit it's actually attached to
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'show', commit_hash],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return None
-
-            return json.loads(result.stdout)
+            return self._notes.read_note_json(note_ref)
 
         except Exception as e:
             logger.warning(f"Failed to load dead end from git: {e}")
@@ -214,33 +188,8 @@ class GitDeadEndStore:
             return []
 
         try:
-            result = subprocess.run(
-                ['git', 'for-each-ref', 'refs/notes/empirica/dead_ends/'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return []
-
             dead_ends = []
-
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                parts = line.split('\t')
-                if len(parts) < 2:
-                    continue
-
-                ref = parts[1]
-                if not ref.startswith('refs/notes/empirica/dead_ends/'):
-                    continue
-
-                dead_end_id = ref.split('/')[-1]
-                dead_end_data = self.load_dead_end(dead_end_id)
-
+            for _ref, dead_end_data in self._notes.list_notes_json('refs/notes/empirica/dead_ends/'):
                 if not dead_end_data:
                     continue
 
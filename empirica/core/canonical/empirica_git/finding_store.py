@@ -18,6 +18,8 @@ import subprocess
 from datetime import datetime, timezone
 from typing import Any
 
+from .notes_reader import get_notes_reader
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +50,7 @@ class GitFindingStore:
         """Initialize git finding store"""
         self.workspace_root = workspace_root or os.getcwd()
         self._git_available = self._check_git_repo()
+        self._notes = get_notes_reader(self.workspace_root)
 
     def _check_git_repo(self) -> bool:
         """Check if we're in a git repository"""
@@ -177,41 +180,9 @@ class GitFindingStore:
         if not self._git_available:
             return None
 
-        if not self._has_commits():
-            return None
-
         try:
             note_ref = f'empirica/findings/{finding_id}'
-
-            # List which commit has the note (notes can be on any commit, not just HEAD)
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'list'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0 or not result.stdout.strip():
-                return None
-
-            # Format is: <blob> <commit>
-            parts = result.stdout.strip().split()
-            if len(parts) < 2:
-                return None
-            commit_hash = parts[1]
-
-            # Load note from the commit it's actually attached to
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'show', commit_hash],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return None
-
-            return json.loads(result.stdout)
+            return self._notes.read_note_json(note_ref)
 
         except Exception as e:
             logger.warning(f"Failed to load finding from git: {e}")
@@ -240,34 +211,8 @@ class GitFindingStore:
             return []
 
         try:
-            # List all finding note refs
-            result = subprocess.run(
-                ['git', 'for-each-ref', 'refs/notes/empirica/findings/'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return []
-
             findings = []
-
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                parts = line.split('\t')
-                if len(parts) < 2:
-                    continue
-
-                ref = parts[1]
-                if not ref.startswith('refs/notes/empirica/findings/'):
-                    continue
-
-                finding_id = ref.split('/')[-1]
-                finding_data = self.load_finding(finding_id)
-
+            for _ref, finding_data in self._notes.list_notes_json('refs/notes/empirica/findings/'):
                 if not finding_data:
                     continue
 
@@ -18,6 +18,8 @@ import subprocess
 from datetime import datetime, timezone
 from typing import Any
 
+from .notes_reader import get_notes_reader
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,6 +57,7 @@ class GitGoalStore:
         """Initialize git goal store"""
         self.workspace_root = workspace_root or os.getcwd()
         self._git_available = self._check_git_repo()
+        self._notes = get_notes_reader(self.workspace_root)
 
     def _check_git_repo(self) -> bool:
         """Check if we're in a git repository"""
@@ -178,42 +181,10 @@ class GitGoalStore:
         if not self._git_available:
             return None
 
-        if not self._has_commits():
-            return None
-
         try:
             # Try to find goal in git notes
             note_ref = f'empirica/goals/{goal_id}'
-
-            # List which commit has the note (notes can be on any commit, not just HEAD)
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'list'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0 or not result.stdout.strip():
-                return None
-
-            # Format is: <blob> <commit>
-            parts = result.stdout.strip().split()
-            if len(parts) < 2:
-                return None
-            commit_hash = parts[1]
-
-            # Load note from the commit it's actually attached to
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'show', commit_hash],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return None
-
-            return json.loads(result.stdout)
+            return self._notes.read_note_json(note_ref)
 
         except Exception as e:
             logger.warning(f"Failed to load goal from git: {e}")
@@ -238,38 +209,8 @@ class GitGoalStore:
             return []
 
         try:
-            # List all goal note refs using for-each-ref
-            # This properly handles custom refs like refs/notes/empirica/goals/*
-            result = subprocess.run(
-                ['git', 'for-each-ref', 'refs/notes/empirica/goals/'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return []
-
             goals = []
-
-            # Parse for-each-ref output
-            # Format: <commit-hash> commit\trefs/notes/empirica/goals/<goal-id>
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                parts = line.split('\t')
-                if len(parts) < 2:
-                    continue
-
-                ref = parts[1]  # refs/notes/empirica/goals/<goal-id>
-                if not ref.startswith('refs/notes/empirica/goals/'):
-                    continue
-
-                # Extract goal ID from ref path
-                goal_id = ref.split('/')[-1]
-                goal_data = self.load_goal(goal_id)
-
+            for _ref, goal_data in self._notes.list_notes_json('refs/notes/empirica/goals/'):
                 if not goal_data:
                     continue
 
@@ -25,6 +25,8 @@ from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from .notes_reader import get_notes_reader
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +45,7 @@ class GitMessageStore:
         """Initialize git message store"""
         self.workspace_root = workspace_root or os.getcwd()
         self._git_available = self._check_git_repo()
+        self._notes = get_notes_reader(self.workspace_root)
         self._machine_id = socket.gethostname()
 
     def _check_git_repo(self) -> bool:
@@ -182,34 +185,7 @@ class GitMessageStore:
 
         try:
             note_ref = f'empirica/messages/{channel}/{message_id}'
-
-            # List which commit has the note
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'list'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0 or not result.stdout.strip():
-                return None
-
-            parts = result.stdout.strip().split()
-            if len(parts) < 2:
-                return None
-            commit_hash = parts[1]
-
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'show', commit_hash],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return None
-
-            return json.loads(result.stdout)
+            return self._notes.read_note_json(note_ref)
 
         except Exception as e:
             logger.warning(f"Failed to load message: {e}")
@@ -237,31 +213,10 @@ class GitMessageStore:
             # Scope the search by channel if specified
             search_prefix = f'refs/notes/empirica/messages/{channel}/' if channel else 'refs/notes/empirica/messages/'
 
-            result = subprocess.run(
-                ['git', 'for-each-ref', search_prefix, '--format=%(refname)'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return []
-
             messages = []
 
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                ref_parts = line.strip().split('/')
-                if len(ref_parts) < 6:
-                    continue
-
-                msg_channel = ref_parts[4]
-                msg_id = ref_parts[5]
-
-                msg = self.load_message(msg_channel, msg_id)
-                if not msg:
+            for ref, msg in self._notes.list_notes_json(search_prefix):
+                if len(ref.split('/')) < 6 or not msg:
                     continue
 
                 if not self._matches_inbox_filters(msg, ai_id, machine, status, include_expired):
@@ -336,14 +291,8 @@ class GitMessageStore:
             note_ref = f'empirica/messages/{channel}/{message_id}'
 
             # Find the commit it's attached to
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'list'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-            parts = result.stdout.strip().split()
-            commit_hash = parts[1] if len(parts) >= 2 else (self._get_head_commit() or 'HEAD')
+            entry = self._notes.read_note(note_ref)
+            commit_hash = entry.annotated if entry else (self._get_head_commit() or 'HEAD')
 
             subprocess.run(
                 ['git', 'notes', f'--ref={note_ref}', 'add', '-f', '-m', payload_json, commit_hash],
@@ -404,30 +353,12 @@ class GitMessageStore:
         try:
             search_prefix = f'refs/notes/empirica/messages/{channel}/' if channel else 'refs/notes/empirica/messages/'
 
-            result = subprocess.run(
-                ['git', 'for-each-ref', search_prefix, '--format=%(refname)'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return []
-
             messages = []
 
-            for line in result.stdout.strip().split('\n'):
-                if not line:
+            for ref, msg in self._notes.list_notes_json(search_prefix):
+                if len(ref.split('/')) < 6:
                     continue
 
-                ref_parts = line.strip().split('/')
-                if len(ref_parts) < 6:
-                    continue
-
-                msg_channel = ref_parts[4]
-                msg_id = ref_parts[5]
-                msg = self.load_message(msg_channel, msg_id)
-
                 if msg and msg.get('thread_id') == thread_id:
                     messages.append(msg)
 
@@ -487,29 +418,15 @@ class GitMessageStore:
             return []
 
         try:
-            result = subprocess.run(
-                ['git', 'for-each-ref', 'refs/notes/empirica/messages/', '--format=%(refname)'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return []
-
             removed = []
 
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                ref_parts = line.strip().split('/')
+            for ref, msg in self._notes.list_notes_json('refs/notes/empirica/messages/'):
+                ref_parts = ref.split('/')
                 if len(ref_parts) < 6:
                     continue
 
                 msg_channel = ref_parts[4]
                 msg_id = ref_parts[5]
-                msg = self.load_message(msg_channel, msg_id)
 
                 if msg and self._is_expired(msg):
                     removed.append(msg)
@@ -17,6 +17,8 @@ import subprocess
 from datetime import datetime, timezone
 from typing import Any
 
+from .notes_reader import get_notes_reader
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +50,7 @@ class GitMistakeStore:
         """Initialize git mistake store"""
         self.workspace_root = workspace_root or os.getcwd()
         self._git_available = self._check_git_repo()
+        self._notes = get_notes_reader(self.workspace_root)
 
     def _check_git_repo(self) -> bool:
         """Check if we're in a git repository"""
@@ -165,41 +168,12 @@ class GitMistakeStore:
 
     def load_mistake(self, mistake_id: str) -> dict[str, Any] | None:
         """Load mistake from git notes"""
-        if not self._git_available or not self._has_commits():
+        if not self._git_available:
             return None
 
         try:
             note_ref = f'empirica/mistakes/{mistake_id}'
-
-            # List which commit has the note (notes can be on any commit, not just HEAD)
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'list'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0 or not result.stdout.strip():
-                return None
-
-            # Format is: <blob> <commit>
-            parts = result.stdout.strip().split()
-            if len(parts) < 2:
-                return None
-            commit_hash = parts[1]
-
-            # Load note from the commit it's actually attached to
-            result = subprocess.run(
-                ['git', 'notes', f'--ref={note_ref}', 'show', commit_hash],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return None
-
-            return json.loads(result.stdout)
+            return self._notes.read_note_json(note_ref)
 
         except Exception as e:
             logger.warning(f"Failed to load mistake from git: {e}")
@@ -228,33 +202,8 @@ class GitMistakeStore:
             return []
 
         try:
-            result = subprocess.run(
-                ['git', 'for-each-ref', 'refs/notes/empirica/mistakes/'],
-                cwd=self.workspace_root,
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode != 0:
-                return []
-
             mistakes = []
-
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                parts = line.split('\t')
-                if len(parts) < 2:
-                    continue
-
-                ref = parts[1]
-                if not ref.startswith('refs/notes/empirica/mistakes/'):
-                    continue
-
-                mistake_id = ref.split('/')[-1]
-                mistake_data = self.load_mistake(mistake_id)
-
+            for _ref, mistake_data in self._notes.list_notes_json('refs/notes/empirica/mistakes/'):
                 if not mistake_data:
                     continue
 
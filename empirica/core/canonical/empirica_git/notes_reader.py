@@ -0,0 +1,322 @@
+"""
+Git Notes Reader - Batched reads of empirica git notes
+
+Every empirica artifact lives in its own notes ref
+(refs/notes/empirica/<type>/<id>). Reading one the obvious way costs 2-4
+git processes (`notes list` + `notes show`, or rev-parse → cat-file →
+ls-tree → cat-file), so enumerating N notes spawns O(N) processes.
+
+GitNotesReader keeps one long-lived `git cat-file --batch` process per
+repository and resolves ref → notes tree → note blob through it:
+
+- list_notes(prefix): one `for-each-ref` + one batch round trip per tree
+  and blob, regardless of N
+- read_note(ref): no new process once the batch pipe is up
+- show_note(ref, commit): `git notes show` equivalent (handles fanout)
+- note_map(ref): `git notes list` equivalent for shared notes refs
+
+Use get_notes_reader(repo_path) to share one reader per repository across
+all the *_store.py classes; readers are closed on LRU eviction and at
+interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_TREE_MODE = b'40000'
+
+
+@dataclass(frozen=True)
+class NoteEntry:
+    """A single note read from a notes ref."""
+    ref: str                # Full ref name, e.g. refs/notes/empirica/findings/<id>
+    annotated: str          # Object the note is attached to (git notes list, column 2)
+    blob: str               # Note blob SHA (git notes list, column 1)
+    text: str               # Note content (git notes show)
+
+    def json(self) -> dict[str, Any] | None:
+        """Parse the note as JSON (None if it isn't valid JSON)."""
+        try:
+            return json.loads(self.text)
+        except (json.JSONDecodeError, ValueError):
+            return None
+
+
+def _full_ref(ref: str) -> str:
+    """Accept `empirica/findings/x` (git notes --ref style) or a full ref."""
+    return ref if ref.startswith('refs/') else f'refs/notes/{ref}'
+
+
+class GitNotesReader:
+    """
+    Read git notes through one persistent `git cat-file --batch` pipe.
+
+    Thread-safe; the batch process is started lazily and restarted if it
+    dies. Works in bare repositories too (repo_path is used as cwd).
+    """
+
+    def __init__(self, repo_path: str | os.PathLike, timeout: int = 30):
+        self.repo_path = str(repo_path)
+        self.timeout = timeout
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    # ── batch pipe ──
+
+    def _ensure_proc(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def _reset(self) -> None:
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+                self._proc.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        self._proc = None
+
+    def read_object(self, rev: str) -> tuple[str, str, bytes] | None:
+        """
+        Read one object through the batch pipe.
+
+        Args:
+            rev: Any object name cat-file accepts (sha, ref, `ref^{tree}`)
+
+        Returns:
+            (sha, type, content) or None if missing / git unavailable
+        """
+        if '\n' in rev:
+            return None
+        with self._lock:
+            try:
+                proc = self._ensure_proc()
+                proc.stdin.write(rev.encode('utf-8') + b'\n')
+                proc.stdin.flush()
+                header = proc.stdout.readline()
+                if not header:
+                    self._reset()
+                    return None
+                parts = header.split()
+                if len(parts) != 3:
+                    return None  # "<rev> missing" / "<rev> ambiguous"
+                sha, obj_type, size = parts
+                content = proc.stdout.read(int(size))
+                proc.stdout.read(1)  # trailing LF
+                return sha.decode(), obj_type.decode(), content
+            except (OSError, ValueError) as e:
+                logger.debug(f"git cat-file --batch failed in {self.repo_path}: {e}")
+                self._reset()
+                return None
+
+    def close(self) -> None:
+        """Terminate the batch process."""
+        with self._lock:
+            if self._proc is not None:
+                try:
+                    self._proc.stdin.close()
+                    self._proc.wait(timeout=2)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+                self._reset()
+
+    def __enter__(self) -> GitNotesReader:  # noqa: PYI034 — typing.Self needs Python 3.11
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ── trees ──
+
+    def _tree_entries(self, tree_rev: str) -> list[tuple[bytes, str, str]]:
+        """Parse a raw tree object into (mode, name, sha) entries."""
+        obj = self.read_object(tree_rev)
+        if obj is None or obj[1] != 'tree':
+            return []
+        sha_len = len(obj[0]) // 2  # 20 bytes for SHA-1, 32 for SHA-256
+        data = obj[2]
+        entries = []
+        pos = 0
+        while pos < len(data):
+            space = data.index(b' ', pos)
+            nul = data.index(b'\0', space)
+            mode = data[pos:space]
+            name = data[space + 1:nul].decode('utf-8', errors='replace')
+            sha = data[nul + 1:nul + 1 + sha_len].hex()
+            entries.append((mode, name, sha))
+            pos = nul + 1 + sha_len
+        return entries
+
+    def _note_blobs(self, tree_rev: str, prefix: str = '') -> Iterator[tuple[str, str]]:
+        """Yield (annotated_object, blob_sha) for every note in a notes tree."""
+        for mode, name, sha in self._tree_entries(tree_rev):
+            if mode == _TREE_MODE:
+                yield from self._note_blobs(sha, prefix + name)  # fanout dir
+            else:
+                yield prefix + name, sha
+
+    def read_blob(self, blob_sha: str) -> str | None:
+        """Text content of a blob, or None."""
+        obj = self.read_object(blob_sha)
+        if obj is None or obj[1] != 'blob':
+            return None
+        return obj[2].decode('utf-8', errors='replace')
+
+    def _first_note(self, ref: str, tree_rev: str) -> NoteEntry | None:
+        for annotated, blob in self._note_blobs(tree_rev):
+            text = self.read_blob(blob)
+            if text is None:
+                return None
+            return NoteEntry(ref=ref, annotated=annotated, blob=blob, text=text)
+        return None
+
+    # ── public API ──
+
+    def list_refs(self, prefix: str) -> list[tuple[str, str]]:
+        """
+        List notes refs under a prefix with one `git for-each-ref`.
+
+        Returns:
+            [(refname, tree_sha)] in ref order
+        """
+        try:
+            result = subprocess.run(
+                ['git', 'for-each-ref', '--format=%(refname)%09%(tree)', _full_ref(prefix)],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                check=False,
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+            return []
+        if result.returncode != 0:
+            return []
+        refs = []
+        for line in result.stdout.splitlines():
+            refname, _, tree = line.partition('\t')
+            if refname:
+                refs.append((refname, tree))
+        return refs
+
+    def read_note(self, ref: str) -> NoteEntry | None:
+        """First note in a per-artifact notes ref (`notes list` + `notes show`)."""
+        ref = _full_ref(ref)
+        return self._first_note(ref, f'{ref}^{{tree}}')
+
+    def read_note_json(self, ref: str) -> dict[str, Any] | None:
+        """JSON payload of a per-artifact notes ref, or None."""
+        entry = self.read_note(ref)
+        return entry.json() if entry else None
+
+    def show_note(self, ref: str, annotated: str) -> str | None:
+        """Note attached to `annotated` in a notes ref (`git notes show`)."""
+        ref = _full_ref(ref)
+        target = annotated.lower()
+        tree_rev = f'{ref}^{{tree}}'
+        while True:
+            next_rev = None
+            for mode, name, sha in self._tree_entries(tree_rev):
+                if mode == _TREE_MODE and target.startswith(name):
+                    next_rev, target = sha, target[len(name):]
+                    break
+                if mode != _TREE_MODE and name == target:
+                    return self.read_blob(sha)
+            if next_rev is None:
+                return None
+            tree_rev = next_rev
+
+    def annotated_object(self, ref: str) -> str | None:
+        """Object the first note in a notes ref is attached to (no blob read)."""
+        for annotated, _blob in self._note_blobs(f'{_full_ref(ref)}^{{tree}}'):
+            return annotated
+        return None
+
+    def note_map(self, ref: str) -> dict[str, str]:
+        """Map annotated object → note blob for every note in one notes ref.
+
+        Equivalent to `git notes --ref=<ref> list`; use it to test many
+        commits against a shared notes ref (e.g. empirica/checkpoints).
+        """
+        return dict(self._note_blobs(f'{_full_ref(ref)}^{{tree}}'))
+
+    def list_notes(self, prefix: str) -> Iterator[NoteEntry]:
+        """Yield the first note of every notes ref under a prefix."""
+        for refname, tree in self.list_refs(prefix):
+            entry = self._first_note(refname, tree or f'{refname}^{{tree}}')
+            if entry is not None:
+                yield entry
+
+    def list_notes_json(self, prefix: str) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (refname, payload) for every JSON note under a prefix."""
+        for entry in self.list_notes(prefix):
+            payload = entry.json()
+            if payload is None:
+                logger.debug(f"Invalid JSON in note ref {entry.ref}")
+                continue
+            yield entry.ref, payload
+
+
+_MAX_READERS = 16
+_readers: OrderedDict[str, tuple[tuple[int, int] | None, GitNotesReader]] = OrderedDict()
+_readers_lock = threading.Lock()
+
+
+def _dir_identity(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def get_notes_reader(repo_path: str | os.PathLike | None = None) -> GitNotesReader:
+    """Shared GitNotesReader for a repository path (default: cwd).
+
+    Keeps the most recently used readers (LRU); a reader whose directory
+    was removed and recreated at the same path is replaced.
+    """
+    key = os.path.realpath(str(repo_path) if repo_path else os.getcwd())
+    identity = _dir_identity(key)
+    evicted = []
+    with _readers_lock:
+        cached = _readers.pop(key, None)
+        if cached is not None and cached[0] != identity:
+            evicted.append(cached[1])
+            cached = None
+        reader = cached[1] if cached else GitNotesReader(key)
+        _readers[key] = (identity, reader)
+        while len(_readers) > _MAX_READERS:
+            evicted.append(_readers.popitem(last=False)[1][1])
+    for old in evicted:
+        old.close()
+    return reader
+
+
+@atexit.register
+def close_all_readers() -> None:
+    """Close every shared reader's batch process."""
+    with _readers_lock:
+        readers = [reader for _, reader in _readers.values()]
+        _readers.clear()
+    for reader in readers:
+        reader.close()
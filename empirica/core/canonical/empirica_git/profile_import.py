@@ -19,11 +19,12 @@ Design:
 
 import json
 import logging
-import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .notes_reader import get_notes_reader
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,16 +34,7 @@ class ProfileImporter:
     def __init__(self, workspace_root: str | None = None):
         self.workspace_root = workspace_root or str(Path.cwd())
         self._stats: dict[str, dict[str, int]] = {}
-
-    def _git_cmd(self, args: list[str]) -> subprocess.CompletedProcess:
-        """Run a git command in the workspace."""
-        return subprocess.run(
-            ['git'] + args,
-            cwd=self.workspace_root,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        self._notes = get_notes_reader(self.workspace_root)
 
     def _discover_refs(self, prefix: str) -> list[str]:
         """List all git notes refs under a prefix.
@@ -53,18 +45,8 @@ class ProfileImporter:
         Returns:
             List of artifact IDs extracted from ref paths.
         """
-        result = self._git_cmd(['for-each-ref', prefix])
-        if result.returncode != 0:
-            return []
-
         ids = []
-        for line in result.stdout.strip().split('\n'):
-            if not line:
-                continue
-            parts = line.split('\t')
-            if len(parts) < 2:
-                continue
-            ref = parts[1]
+        for ref, _tree in self._notes.list_refs(prefix):
             artifact_id = ref.split('/')[-1]
             if artifact_id:
                 ids.append(artifact_id)
@@ -72,26 +54,14 @@ class ProfileImporter:
 
     def _load_note(self, ref: str) -> dict[str, Any] | None:
         """Load JSON payload from a git note ref."""
-        # List which commit has the note
-        result = self._git_cmd(['notes', f'--ref={ref}', 'list'])
-        if result.returncode != 0 or not result.stdout.strip():
+        entry = self._notes.read_note(ref)
+        if entry is None:
             return None
 
-        parts = result.stdout.strip().split()
-        if len(parts) < 2:
-            return None
-        commit_hash = parts[1]
-
-        # Load the note content
-        result = self._git_cmd(['notes', f'--ref={ref}', 'show', commit_hash])
-        if result.returncode != 0:
-            return None
-
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError:
+        payload = entry.json()
+        if payload is None:
             logger.warning(f"Invalid JSON in note ref {ref}")
-            return None
+        return payload
 
     def _parse_timestamp(self, iso_str: str | None) -> float | None:
         """Convert ISO timestamp string to epoch float."""
@@ -543,7 +543,7 @@ def default_epistemic_evaluator(checkpoint_data: dict[str, Any]) -> SentinelDeci
 
     Threshold priority:
     1. Environment variables (EMPIRICA_KNOW_THRESHOLD, etc.) — always win
-    2. Brier-inflated dynamic thresholds from compute_dynamic_thresholds() —
+    2. Brier-inflated dynamic thresholds from cached_dynamic_thresholds() —
        uses the SAME thresholds as CHECK, ensuring the Sentinel is never
        weaker than the gate it enforces
     3. MCO cascade_styles.yaml via ThresholdLoader — user-configured baseline
@@ -611,12 +611,12 @@ def _load_evaluator_thresholds() -> tuple:
 
     # Try Brier-inflated dynamic thresholds (same as CHECK uses)
     try:
-        from empirica.core.post_test.dynamic_thresholds import compute_dynamic_thresholds
+        from empirica.core.post_test.dynamic_thresholds import cached_dynamic_thresholds
         from empirica.data.session_database import SessionDatabase
 
         db = SessionDatabase()
         try:
-            dt_result = compute_dynamic_thresholds(ai_id="claude-code", db=db)
+            dt_result = cached_dynamic_thresholds(ai_id="claude-code", db=db)
             if dt_result.get("source") == "dynamic":
                 # Use noetic thresholds — the evaluator gates the
                 # investigation→action boundary, same as CHECK.
@@ -13,6 +13,7 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from empirica.core.canonical.empirica_git.notes_reader import get_notes_reader
 from empirica.core.git_ops.signed_operations import SignedGitOperations
 from empirica.core.persona.signing_persona import SigningPersona
 
@@ -255,21 +256,26 @@ class GitNotesStorage:
             if phase:
                 phases_to_check = [phase]
 
+            # One for-each-ref + the shared cat-file pipe instead of a
+            # `git notes show HEAD` per (round, phase) candidate
+            reader = get_notes_reader(self.git_repo_path)
+            existing = {ref for ref, _ in reader.list_refs(f"refs/notes/empirica/session/{self.session_id}/")}
+            head = reader.read_object("HEAD") if existing else None
+            if head is None:
+                logger.debug(f"No git note found for session {self.session_id}")
+                return None
+
             # Start checking from the highest round numbers downwards
             for round_num in range(10, 0, -1):
                 for ph in phases_to_check:
                     note_ref = f"empirica/session/{self.session_id}/{ph}/{round_num}"
+                    if f"refs/notes/{note_ref}" not in existing:
+                        continue
 
-                    result = subprocess.run(
-                        ["git", "notes", "--ref", note_ref, "show", "HEAD"],
-                        capture_output=True,
-                        timeout=2,
-                        cwd=self.git_repo_path,
-                        text=True
-                    )
+                    note_text = reader.show_note(note_ref, head[0])
 
-                    if result.returncode == 0:
-                        checkpoint = json.loads(result.stdout)
+                    if note_text is not None:
+                        checkpoint = json.loads(note_text)
 
                         if checkpoint.get("session_id") != self.session_id:
                             logger.warning(f"Session ID mismatch: {checkpoint.get('session_id')} vs {self.session_id}")
@@ -314,22 +320,16 @@ class GitNotesStorage:
         checkpoints = []
         filter_session_id = session_id or self.session_id
 
-        # Use git for-each-ref to discover all refs in session's namespace
-        refs_result = subprocess.run(
-            ["git", "for-each-ref", f"refs/notes/empirica/session/{filter_session_id}", "--format=%(refname)"],
-            capture_output=True,
-            text=True,
-            cwd=self.git_repo_path
-        )
+        # Discover all refs in session's namespace with one for-each-ref;
+        # note contents stream through the shared cat-file pipe
+        reader = get_notes_reader(self.git_repo_path)
+        refs = reader.list_refs(f"refs/notes/empirica/session/{filter_session_id}")
 
-        if refs_result.returncode != 0 or not refs_result.stdout.strip():
+        if not refs:
             logger.debug(f"No checkpoints found for session: {filter_session_id}")
             return []
 
-        # Parse all refs (one per line)
-        refs = [line.strip() for line in refs_result.stdout.strip().split('\n') if line.strip()]
-
-        for ref in refs:
+        for ref, _tree in refs:
             # Extract phase from ref path
             # Example: refs/notes/empirica/session/abc-123/PREFLIGHT/1
             ref_parts = ref.split('/')
@@ -343,51 +343,24 @@ class GitNotesStorage:
             if phase and ref_phase != phase:
                 continue
 
-            # Strip "refs/notes/" prefix for git notes command
-            note_ref = ref[11:]
-
-            # Find what commit this note is attached to
-            list_result = subprocess.run(
-                ["git", "notes", "--ref", note_ref, "list"],
-                capture_output=True,
-                text=True,
-                cwd=self.git_repo_path
-            )
-
-            if list_result.returncode != 0 or not list_result.stdout.strip():
-                logger.debug(f"No notes found for ref {note_ref}")
-                continue
-
-            # Parse the annotated commit (second column)
-            note_line = list_result.stdout.strip().split('\n')[0]
-            parts = note_line.split()
-            if len(parts) < 2:
-                logger.warning(f"Unexpected note list format for {note_ref}: {note_line}")
+            note = reader.read_note(ref)
+            if note is None:
+                logger.debug(f"No notes found for ref {ref}")
                 continue
-            annotated_commit = parts[1]
-
-            # Get the note content for the specific commit
-            show_result = subprocess.run(
-                ["git", "notes", "--ref", note_ref, "show", annotated_commit],
-                capture_output=True,
-                text=True,
-                cwd=self.git_repo_path
-            )
 
-            if show_result.returncode == 0:
-                try:
-                    checkpoint = json.loads(show_result.stdout)
-
-                    # Double-check session filter
-                    if session_id and checkpoint.get("session_id") != session_id:
-                        logger.warning(f"Session mismatch in checkpoint: {checkpoint.get('session_id')} != {session_id}")
-                        continue
+            try:
+                checkpoint = json.loads(note.text)
 
-                    checkpoints.append(checkpoint)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse checkpoint from ref {ref}: {e}")
+                # Double-check session filter
+                if session_id and checkpoint.get("session_id") != session_id:
+                    logger.warning(f"Session mismatch in checkpoint: {checkpoint.get('session_id')} != {session_id}")
                     continue
 
+                checkpoints.append(checkpoint)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse checkpoint from ref {ref}: {e}")
+                continue
+
         # Sort by timestamp descending (newest first)
         checkpoints.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
 
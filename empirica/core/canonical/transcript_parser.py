@@ -14,7 +14,7 @@ Record types handled:
 - summary: Conversation summaries (post-compaction)
 
 Architecture:
-    .jsonl file ──> TranscriptParser.parse_session()
+    .jsonl file ──> TranscriptReader ──> TranscriptParser.iter_session() / parse_session()
                          ├── iter_conversation_turns() ──> ConversationTurn[]
                          ├── extract_tool_chains() ──> ToolChain[]
                          └── session_metadata() ──> SessionMetadata
@@ -28,9 +28,12 @@ from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import pairwise
 from pathlib import Path
 from typing import Any, ClassVar
 
+from empirica.utils.transcript_reader import TranscriptReader
+
 logger = logging.getLogger(__name__)
 
 
@@ -236,38 +239,45 @@ class TranscriptParser:
     # Record types that carry epistemic signal (vs operational noise)
     SIGNAL_TYPES: ClassVar[set[RecordType]] = {RecordType.USER, RecordType.ASSISTANT, RecordType.SYSTEM, RecordType.SUMMARY}
 
-    def parse_session(self, jsonl_path: str) -> list[TranscriptRecord]:
-        """Parse all records from a .jsonl transcript file.
+    def iter_session(self, jsonl_path: str, start_offset: int = 0) -> Iterator[TranscriptRecord]:
+        """Lazily parse records from a .jsonl transcript in file order.
 
         Args:
             jsonl_path: Path to the .jsonl transcript file.
+            start_offset: Byte offset of a line to resume from (e.g. the
+                TranscriptReader index size from a previous pass).
 
-        Returns:
-            List of parsed TranscriptRecord objects, ordered by timestamp.
+        Yields:
+            Parsed TranscriptRecord objects (progress records skipped).
         """
-        path = Path(jsonl_path)
-        if not path.exists():
+        reader = TranscriptReader(jsonl_path)
+        if not reader.exists():
             logger.warning(f"Transcript file not found: {jsonl_path}")
-            return []
+            return
 
-        records = []
-        line_num = 0
-        for line in path.open('r', encoding='utf-8'):
-            line_num += 1
-            line = line.strip()
-            if not line:
-                continue
+        for offset, raw in reader.records_with_offsets(start_offset):
             try:
-                raw = json.loads(line)
                 record = self._parse_record(raw)
-                if record:
-                    records.append(record)
-            except json.JSONDecodeError:
-                logger.debug(f"Skipping invalid JSON at line {line_num} in {path.name}")
             except Exception as e:
-                logger.debug(f"Error parsing line {line_num} in {path.name}: {e}")
+                logger.debug(f"Error parsing record at byte {offset} in {reader.path.name}: {e}")
+                continue
+            if record:
+                yield record
 
-        return sorted(records, key=lambda r: r.timestamp)
+    def parse_session(self, jsonl_path: str) -> list[TranscriptRecord]:
+        """Parse all records from a .jsonl transcript file.
+
+        Args:
+            jsonl_path: Path to the .jsonl transcript file.
+
+        Returns:
+            List of parsed TranscriptRecord objects, ordered by timestamp.
+        """
+        records = list(self.iter_session(jsonl_path))
+        # Transcripts are appended in time order; only sort when they aren't.
+        if any(a.timestamp > b.timestamp for a, b in pairwise(records)):
+            records.sort(key=lambda r: r.timestamp)
+        return records
 
     def _parse_record(self, raw: dict[str, Any]) -> TranscriptRecord | None:
         """Parse a single JSON record into a TranscriptRecord."""
@@ -413,6 +423,8 @@ class TranscriptParser:
             and (include_sidechains or not r.is_sidechain)
         ]
 
+        result_lookup = self._tool_result_lookup(filtered)
+
         turn_index = 0
         current_user_msg = ""
         current_user_ts = ""
@@ -428,7 +440,7 @@ class TranscriptParser:
             if record.record_type == RecordType.USER:
                 # Yield previous turn if we have one
                 if current_user_msg:
-                    tool_chains = self._resolve_tool_chains(current_tool_uses, filtered)
+                    tool_chains = self._resolve_tool_chains(current_tool_uses, result_lookup)
                     yield ConversationTurn(
                         turn_index=turn_index,
                         user_message=current_user_msg,
@@ -473,7 +485,7 @@ class TranscriptParser:
 
         # Yield final turn
         if current_user_msg:
-            tool_chains = self._resolve_tool_chains(current_tool_uses, filtered)
+            tool_chains = self._resolve_tool_chains(current_tool_uses, result_lookup)
             yield ConversationTurn(
                 turn_index=turn_index,
                 user_message=current_user_msg,
@@ -487,21 +499,28 @@ class TranscriptParser:
                 summary_text=summary_in_turn,
             )
 
-    def _resolve_tool_chains(
-        self,
-        tool_uses: dict[str, ContentBlock],
-        all_records: list[TranscriptRecord],
-    ) -> list[ToolChain]:
-        """Match tool_use blocks with their tool_result responses."""
-        chains = []
-        # Build a lookup of tool results from user records
+    @staticmethod
+    def _tool_result_lookup(records: list[TranscriptRecord]) -> dict[str, str]:
+        """tool_use_id → tool_result text across a session's user records.
+
+        Built once per session; rebuilding it for every turn made threading
+        quadratic in transcript length.
+        """
         result_lookup: dict[str, str] = {}
-        for record in all_records:
+        for record in records:
             if record.record_type == RecordType.USER:
                 for block in record.content_blocks:
                     if block.block_type == ContentBlockType.TOOL_RESULT:
                         result_lookup[block.tool_use_id] = block.text
+        return result_lookup
 
+    def _resolve_tool_chains(
+        self,
+        tool_uses: dict[str, ContentBlock],
+        result_lookup: dict[str, str],
+    ) -> list[ToolChain]:
+        """Match tool_use blocks with their tool_result responses."""
+        chains = []
         for tool_use_id, block in tool_uses.items():
             result_text = result_lookup.get(tool_use_id, "")
             # Infer success from result content
@@ -0,0 +1,174 @@
+"""Change-driven cache for cockpit aggregation.
+
+`aggregate_all()` is called on every TUI refresh tick, yet almost every
+field of an instance row is derived from small state files that rarely
+change between ticks. A long-running caller (the TUI) holds one
+AggregationCache and passes it in; each file-derived section of an
+instance row is then reused until the (mtime, size, inode) of one of the
+files it reads changes. Time-relative fields (ages, liveness, the state
+symbol) are still recomputed every tick from the cached raw values.
+
+loop_fires.log is tailed incrementally: only bytes appended since the
+previous tick are parsed, and the most recent events per instance are
+kept in memory. Truncation or rotation (size shrinks / inode changes)
+restarts the tail from the top.
+
+Change detection is stat polling — one stat() per source file per tick,
+which is far cheaper than re-reading and re-parsing the JSON behind it
+and needs no platform-specific watcher.
+
+One-shot callers (`empirica status`) pass no cache and read everything
+fresh, exactly as before.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterable
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+# Per-instance events kept from loop_fires.log (the pane shows the last 5).
+RECENT_EVENTS_KEPT = 20
+
+FileSignature = tuple[int, int, int] | None
+
+
+def file_signature(path: Path) -> FileSignature:
+    """(mtime_ns, size, inode) of `path`, or None when it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class _EventLogTail:
+    """Incremental reader for one JSONL event log, bucketed by instance_id."""
+
+    def __init__(self, path: Path, keep: int = RECENT_EVENTS_KEPT):
+        self.path = path
+        self.keep = keep
+        self._inode: int | None = None
+        self._offset = 0
+        self._by_instance: dict[str, deque[dict[str, Any]]] = {}
+
+    def _reset(self, inode: int | None) -> None:
+        self._inode = inode
+        self._offset = 0
+        self._by_instance.clear()
+
+    def refresh(self) -> None:
+        """Parse whatever was appended since the last refresh."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._reset(None)
+            return
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._reset(st.st_ino)
+        if st.st_size == self._offset:
+            return
+
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self._offset)
+                chunk = f.read(st.st_size - self._offset)
+        except OSError:
+            return
+
+        # Leave a partially written trailing line for the next tick.
+        end = chunk.rfind(b'\n') + 1
+        if not end:
+            return
+        self._offset += end
+
+        for raw in chunk[:end].splitlines():
+            if not raw.strip():
+                continue
+            try:
+                event = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if not isinstance(event, dict):
+                continue
+            instance_id = event.get('instance_id')
+            if not isinstance(instance_id, str):
+                continue
+            bucket = self._by_instance.get(instance_id)
+            if bucket is None:
+                bucket = self._by_instance[instance_id] = deque(maxlen=self.keep)
+            bucket.append(event)
+
+    def latest(self, instance_id: str, limit: int) -> list[dict[str, Any]]:
+        """Most-recent-first events for `instance_id` (copies)."""
+        bucket = self._by_instance.get(instance_id)
+        if not bucket:
+            return []
+        return [dict(event) for event in islice(reversed(bucket), limit)]
+
+
+class AggregationCache:
+    """Per-process memo of cockpit sections keyed by source-file signatures.
+
+    Entries not used during an `aggregate_all()` pass are dropped by
+    `sweep()`, so instances that disappear don't accumulate.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Any, tuple[tuple, Any]] = {}
+        self._used: set[Any] = set()
+        self._tails: dict[Path, _EventLogTail] = {}
+
+    def get(self, key: Any, paths: Iterable[Path | None], compute: Callable[[], Any]) -> Any:
+        """Return the cached value for `key`, recomputing when any of
+        `paths` changed (or appeared/disappeared) since it was stored.
+
+        Cached values are shared — callers that mutate must copy.
+        """
+        signature = tuple(
+            (str(p), file_signature(p)) for p in paths if p is not None
+        )
+        self._used.add(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        value = compute()
+        self._entries[key] = (signature, value)
+        return value
+
+    def recent_events(self, log_path: Path, instance_id: str, limit: int) -> list[dict[str, Any]]:
+        """Last `limit` events for `instance_id` from an incrementally tailed log."""
+        tail = self._tails.get(log_path)
+        if tail is None:
+            tail = self._tails[log_path] = _EventLogTail(log_path, keep=max(limit, RECENT_EVENTS_KEPT))
+        tail.refresh()
+        return tail.latest(instance_id, limit)
+
+    def sweep(self) -> None:
+        """Drop entries that weren't read since the previous sweep."""
+        for key in self._entries.keys() - self._used:
+            del self._entries[key]
+        self._used.clear()
+
+
+def cached(
+    cache: AggregationCache | None,
+    key: Any,
+    paths: Iterable[Path | None],
+    compute: Callable[[], Any],
+) -> Any:
+    """`cache.get(...)`, or just `compute()` when there is no cache."""
+    if cache is None:
+        return compute()
+    return cache.get(key, paths, compute)
+
+
+__all__ = [
+    'AggregationCache',
+    'cached',
+    'file_signature',
+]
@@ -420,7 +420,13 @@ def _count_open_goals(cur: sqlite3.Cursor, project_id: str | None) -> int | None
     """Count goals with is_completed = 0 (canonical source of truth).
 
     Project-scoped when project_id is available; otherwise project-wide.
+    Reads the trigger-maintained project_counters row when present.
     """
+    from empirica.data.project_counters import read_project_counters
+
+    counters = read_project_counters(cur, project_id or None)
+    if counters is not None:
+        return counters['open_goals']
     try:
         if project_id:
             cur.execute(
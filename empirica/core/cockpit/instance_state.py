@@ -24,10 +24,13 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Callable, Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from empirica.core.cockpit import compliance_view, enrichment, services_view
+from empirica.core.cockpit.aggregation_cache import AggregationCache, cached
 from empirica.core.cockpit.compliance_view import read_compliance_summary
 from empirica.core.cockpit.enrichment import (
     is_asking,
@@ -46,6 +49,7 @@ from empirica.core.cockpit.notify_dispatcher_view import (
 )
 from empirica.core.cockpit.sentinel_pause import sentinel_status
 from empirica.core.cockpit.services_view import read_services_summary
+from empirica.core.notify import audit as notify_audit
 
 EMPIRICA_DIR = Path.home() / '.empirica'
 
@@ -180,68 +184,62 @@ def _newest_mtime(paths: list[Path]) -> float | None:
     return best
 
 
-def _read_transaction_state(project_path: str, instance_id: str) -> dict[str, Any]:
-    """Read transaction info for an instance. Returns dict with phase + age fields.
-
-    Returns:
-        {
-            'phase': 'noetic' | 'praxic' | 'closed' | 'no-transaction',
-            'transaction_id': str | None,
-            'transaction_age_seconds': float | None,
-            'last_activity_iso': str | None,
-            'last_activity_seconds': float | None,
-            'work_type': str | None,
-            'domain': str | None,
-            'criticality': str | None,
-        }
-    """
+def _transaction_paths(project_path: str, instance_id: str) -> tuple[Path, Path]:
+    """(active_transaction, hook_counters) files for an instance's project."""
     suffix = f'_{instance_id}'
     empirica_dir = Path(project_path) / '.empirica'
-    tx_file = empirica_dir / f'active_transaction{suffix}.json'
-    counters_file = empirica_dir / f'hook_counters{suffix}.json'
+    return (
+        empirica_dir / f'active_transaction{suffix}.json',
+        empirica_dir / f'hook_counters{suffix}.json',
+    )
+
+
+def _load_transaction_snapshot(project_path: str, instance_id: str) -> dict[str, Any]:
+    """File-derived half of _read_transaction_state — no clock reads, so the
+    result stays valid until the transaction or counters file changes.
 
-    result: dict[str, Any] = {
+    Carries the raw `preflight_timestamp` and `last_mtime` that
+    _transaction_state_at turns into ages.
+    """
+    tx_file, counters_file = _transaction_paths(project_path, instance_id)
+
+    snapshot: dict[str, Any] = {
         'phase': 'no-transaction',
         'transaction_id': None,
         'session_id': None,
-        'transaction_age_seconds': None,
-        'last_activity_iso': None,
-        'last_activity_seconds': None,
         'work_type': None,
         'domain': None,
         'criticality': None,
+        'preflight_timestamp': None,
+        'last_mtime': None,
     }
 
     if not tx_file.exists():
-        return result
+        return snapshot
 
     try:
         with open(tx_file, encoding='utf-8') as f:
             tx = json.load(f)
     except (OSError, json.JSONDecodeError):
-        return result
+        return snapshot
 
-    result['transaction_id'] = tx.get('transaction_id')
-    result['session_id'] = tx.get('session_id')
-    result['work_type'] = tx.get('work_type')
-    result['domain'] = tx.get('domain')
-    result['criticality'] = tx.get('criticality')
+    snapshot['transaction_id'] = tx.get('transaction_id')
+    snapshot['session_id'] = tx.get('session_id')
+    snapshot['work_type'] = tx.get('work_type')
+    snapshot['domain'] = tx.get('domain')
+    snapshot['criticality'] = tx.get('criticality')
 
     preflight_ts = tx.get('preflight_timestamp')
-    now = datetime.now(tz=timezone.utc).timestamp()
     if isinstance(preflight_ts, (int, float)):
-        result['transaction_age_seconds'] = max(0.0, now - preflight_ts)
+        snapshot['preflight_timestamp'] = preflight_ts
 
     # Last activity = newest mtime across tx + counters file
-    last_mtime = _newest_mtime([tx_file, counters_file])
-    if last_mtime is not None:
-        result['last_activity_iso'] = datetime.fromtimestamp(last_mtime, tz=timezone.utc).isoformat()
-        result['last_activity_seconds'] = max(0.0, now - last_mtime)
+    snapshot['last_mtime'] = _newest_mtime([tx_file, counters_file])
 
     status = tx.get('status', 'open')
     if status == 'closed':
-        result['phase'] = 'closed'
-        return result
+        snapshot['phase'] = 'closed'
+        return snapshot
 
     # Status open — distinguish noetic vs praxic from hook counters.
     praxic = 0
@@ -252,10 +250,56 @@ def _read_transaction_state(project_path: str, instance_id: str) -> dict[str, An
             praxic = int(counters.get('praxic_tool_calls', 0) or 0)
         except (OSError, json.JSONDecodeError, TypeError, ValueError):
             praxic = 0
-    result['phase'] = 'praxic' if praxic > 0 else 'noetic'
+    snapshot['phase'] = 'praxic' if praxic > 0 else 'noetic'
+    return snapshot
+
+
+def _transaction_state_at(snapshot: dict[str, Any], now: float) -> dict[str, Any]:
+    """Resolve a transaction snapshot's ages against `now`."""
+    preflight_ts = snapshot['preflight_timestamp']
+    last_mtime = snapshot['last_mtime']
+    result = {
+        k: v for k, v in snapshot.items()
+        if k not in ('preflight_timestamp', 'last_mtime')
+    }
+    result['transaction_age_seconds'] = (
+        max(0.0, now - preflight_ts) if preflight_ts is not None else None
+    )
+    result['last_activity_iso'] = None
+    result['last_activity_seconds'] = None
+    if last_mtime is not None:
+        result['last_activity_iso'] = datetime.fromtimestamp(last_mtime, tz=timezone.utc).isoformat()
+        result['last_activity_seconds'] = max(0.0, now - last_mtime)
     return result
 
 
+def _read_transaction_state(
+    project_path: str,
+    instance_id: str,
+    cache: AggregationCache | None = None,
+) -> dict[str, Any]:
+    """Read transaction info for an instance. Returns dict with phase + age fields.
+
+    Returns:
+        {
+            'phase': 'noetic' | 'praxic' | 'closed' | 'no-transaction',
+            'transaction_id': str | None,
+            'transaction_age_seconds': float | None,
+            'last_activity_iso': str | None,
+            'last_activity_seconds': float | None,
+            'work_type': str | None,
+            'domain': str | None,
+            'criticality': str | None,
+        }
+    """
+    snapshot = cached(
+        cache, ('transaction', project_path, instance_id),
+        _transaction_paths(project_path, instance_id),
+        lambda: _load_transaction_snapshot(project_path, instance_id),
+    )
+    return _transaction_state_at(snapshot, datetime.now(tz=timezone.utc).timestamp())
+
+
 def _derive_state_symbol(
     tx_state: dict[str, Any],
     instance_files_mtime: float | None,
@@ -294,6 +338,38 @@ def _derive_state_symbol(
     return 'idle'
 
 
+def _scan_instance_files() -> set[str]:
+    """instance_ids derived from the state-file globs under ~/.empirica/."""
+    seen: set[str] = set()
+    for glob in INSTANCE_GLOBS:
+        for path in EMPIRICA_DIR.glob(glob):
+            instance_id = _instance_id_from_filename(path.name)
+            if instance_id and not LOOP_PAUSE_PATTERN.match(path.name):
+                seen.add(instance_id)
+    return seen
+
+
+def _discover_instances(
+    live_panes: set[str] | None,
+    cache: AggregationCache | None = None,
+) -> list[str]:
+    """discover_instances() with a pre-computed pane set. With a cache the
+    glob scan is only redone when a file is created, renamed or removed in
+    ~/.empirica/ or instance_projects/ (both bump the directory mtime)."""
+    EMPIRICA_DIR.mkdir(parents=True, exist_ok=True)
+    seen = set(cached(
+        cache, ('discovery', str(EMPIRICA_DIR)),
+        (EMPIRICA_DIR, EMPIRICA_DIR / 'instance_projects'),
+        _scan_instance_files,
+    ))
+
+    if live_panes:
+        for pane in live_panes:
+            seen.add(f'tmux_{pane}')
+
+    return sorted(seen)
+
+
 def discover_instances() -> list[str]:
     """Return the sorted list of known instance_ids.
 
@@ -307,21 +383,7 @@ def discover_instances() -> list[str]:
     Synthetic ``tmux_{pane}`` IDs are stable across cockpit refreshes
     because tmux pane numbers are stable for the lifetime of the pane.
     """
-    EMPIRICA_DIR.mkdir(parents=True, exist_ok=True)
-    seen: set[str] = set()
-
-    for glob in INSTANCE_GLOBS:
-        for path in EMPIRICA_DIR.glob(glob):
-            instance_id = _instance_id_from_filename(path.name)
-            if instance_id and not LOOP_PAUSE_PATTERN.match(path.name):
-                seen.add(instance_id)
-
-    live_panes = _live_tmux_panes()
-    if live_panes:
-        for pane in live_panes:
-            seen.add(f'tmux_{pane}')
-
-    return sorted(seen)
+    return _discover_instances(_live_tmux_panes())
 
 
 def _newest_instance_file_mtime(instance_id: str) -> float | None:
@@ -338,7 +400,11 @@ def _newest_instance_file_mtime(instance_id: str) -> float | None:
     return _newest_mtime(candidates)
 
 
-def _read_recent_events_for_instance(instance_id: str, limit: int = 5) -> list[dict]:
+def _read_recent_events_for_instance(
+    instance_id: str,
+    limit: int = 5,
+    cache: AggregationCache | None = None,
+) -> list[dict]:
     """Tail ~/.empirica/loop_fires.log filtered to `instance_id`, return the
     last `limit` events parsed as dicts.
 
@@ -347,14 +413,16 @@ def _read_recent_events_for_instance(instance_id: str, limit: int = 5) -> list[d
     arriving via the listener push or content-poll catch-up. Lines that
     don't parse are skipped silently.
 
+    With a cache the log is tailed incrementally (only appended bytes are
+    parsed per tick); without one it is read whole.
+
     Returns most-recent-first ordering."""
     log = Path.home() / ".empirica" / "loop_fires.log"
+    if cache is not None:
+        return cache.recent_events(log, instance_id, limit)
     if not log.exists():
         return []
     try:
-        # Read tail — modest log size expected (one line per emission); for
-        # very large files this could be optimized to seek-from-end, but
-        # T6/T7 emission is content-only so the log stays small in practice.
         with open(log, encoding="utf-8") as f:
             lines = f.readlines()
     except OSError:
@@ -424,10 +492,68 @@ def _annotate_loops_with_systemd_state(
         pass
 
 
+def _project_yaml(project_path: str | None) -> Path | None:
+    if not project_path:
+        return None
+    return Path(project_path) / '.empirica' / 'project.yaml'
+
+
+def _registry_entries(
+    cache: AggregationCache | None,
+    kind: str,
+    registry: LoopRegistry | ListenerRegistry,
+    list_entries: Callable[[], Iterable[Any]],
+) -> list[tuple[str, dict[str, Any]]]:
+    """(name, to_dict()) per registry entry, re-read only when the registry
+    file changes. The dicts are shared with the cache — copy before mutating."""
+    return cached(
+        cache, (kind, registry.instance_id), (registry.path,),
+        lambda: [(entry.name, entry.to_dict()) for entry in list_entries()],
+    )
+
+
+def _last_notify_by_loop(loops_dict: dict[str, Any]) -> dict[str, Any]:
+    """loop name → last_notify, via annotate_loops_with_last_notify on a scratch dict."""
+    scratch: dict[str, dict[str, Any]] = {name: {} for name in loops_dict}
+    annotate_loops_with_last_notify(scratch)
+    return {name: loop.get('last_notify') for name, loop in scratch.items()}
+
+
+def _persisted_project_summary(
+    cache: AggregationCache | None,
+    kind: str,
+    project_path: str | None,
+    read: Callable[[str | None], dict[str, Any] | None],
+    summary_path: Callable[[str | None], Path | None],
+    fresh_window: float,
+) -> dict[str, Any] | None:
+    """Compliance / services summary for a project, cached by project.yaml
+    and the persisted JSON it points at. The summary's age fields are
+    advanced to now on every call so `fresh` still flips on time."""
+    if cache is None or not project_path:
+        return read(project_path)
+    yaml_path = _project_yaml(project_path)
+    project_id = cache.get(
+        ('project_id', project_path), (yaml_path,),
+        lambda: compliance_view._project_id_from_path(project_path),
+    )
+    read_at, summary = cache.get(
+        (kind, project_path), (yaml_path, summary_path(project_id)),
+        lambda: (datetime.now(tz=timezone.utc).timestamp(), read(project_path)),
+    )
+    if summary is None or summary.get('age_seconds') is None:
+        return summary
+    summary = dict(summary)
+    summary['age_seconds'] += max(0.0, datetime.now(tz=timezone.utc).timestamp() - read_at)
+    summary['fresh'] = summary['age_seconds'] < fresh_window
+    return summary
+
+
 def aggregate_instance_state(
     instance_id: str,
     live_panes: set[str] | None = None,
     current_instance_id: str | None = None,
+    cache: AggregationCache | None = None,
 ) -> dict[str, Any]:
     """Read all state for one instance and return a serializable dict.
 
@@ -436,13 +562,26 @@ def aggregate_instance_state(
 
     `live_panes` is an optional pre-computed set of live tmux pane numbers
     (sweep optimization). `current_instance_id` exempts the running cockpit
-    from liveness checks (it's alive by definition).
+    from liveness checks (it's alive by definition). `cache` lets a
+    long-running caller reuse file-derived sections whose source files
+    haven't changed since the previous call.
     """
-    project_path = _instance_project_path(instance_id)
-    label = _instance_label(instance_id, project_path)
+    project_path = cached(
+        cache, ('project_path', instance_id),
+        (
+            EMPIRICA_DIR / 'instance_projects' / f'{instance_id}.json',
+            EMPIRICA_DIR / f'active_session_{instance_id}',
+        ),
+        lambda: _instance_project_path(instance_id),
+    )
+    label = cached(
+        cache, ('label', instance_id, project_path),
+        (EMPIRICA_DIR / f'instance_label_{instance_id}',),
+        lambda: _instance_label(instance_id, project_path),
+    )
 
     if project_path:
-        tx_state = _read_transaction_state(project_path, instance_id)
+        tx_state = _read_transaction_state(project_path, instance_id, cache=cache)
     else:
         tx_state = {
             'phase': 'no-transaction',
@@ -471,10 +610,10 @@ def aggregate_instance_state(
     # Loop registry — graceful when registry doesn't exist.
     registry = LoopRegistry(instance_id, label=label)
     loops_dict: dict[str, Any] = {}
-    for entry in registry.list_loops():
-        d = entry.to_dict()
-        d['paused'] = is_loop_paused(instance_id, entry.name)
-        loops_dict[entry.name] = d
+    for name, entry in _registry_entries(cache, 'loops', registry, registry.list_loops):
+        d = dict(entry)
+        d['paused'] = is_loop_paused(instance_id, name)
+        loops_dict[name] = d
 
     # systemd state annotation (Phase 1c-tail, goal f718156c): for loops
     # registered with scheduler_kind='systemd', the file-flag pause is
@@ -485,15 +624,23 @@ def aggregate_instance_state(
     _annotate_loops_with_systemd_state(instance_id, loops_dict)
 
     # Per-loop last-notify annotation (audit log → loops by `loop:{name}` source).
-    annotate_loops_with_last_notify(loops_dict)
+    if loops_dict:
+        last_notify = cached(
+            cache, ('last_notify', tuple(loops_dict)), (notify_audit.AUDIT_PATH,),
+            lambda: _last_notify_by_loop(loops_dict),
+        )
+        for name, loop in loops_dict.items():
+            loop['last_notify'] = last_notify.get(name)
 
     # Listener registry — sister to loops but event-driven.
     listener_registry = ListenerRegistry(instance_id, label=label)
     listeners_dict: dict[str, Any] = {}
-    for entry in listener_registry.list_listeners():
-        d = entry.to_dict()
-        d['paused'] = is_listener_paused(instance_id, entry.name)
-        listeners_dict[entry.name] = d
+    for name, entry in _registry_entries(
+        cache, 'listeners', listener_registry, listener_registry.list_listeners,
+    ):
+        d = dict(entry)
+        d['paused'] = is_listener_paused(instance_id, name)
+        listeners_dict[name] = d
 
     transaction: dict[str, Any] | None
     if tx_state['transaction_id']:
@@ -511,25 +658,41 @@ def aggregate_instance_state(
     asking = is_asking(instance_id)
     phase = 'ask' if asking and tx_state['phase'] in ('noetic', 'praxic') else tx_state['phase']
 
-    notif = notification_summary(instance_id, project_path=project_path)
+    notif = cached(
+        cache, ('notifications', instance_id, project_path), (enrichment.ENP_PENDING_PATH,),
+        lambda: notification_summary(instance_id, project_path=project_path),
+    )
 
     # Compliance is project-scoped (audits the source tree, not the
     # instance's transaction state), so multiple instances of the same
     # project share the same compliance result. Embedding it per-instance
     # keeps the cockpit row self-contained — the TUI doesn't have to
     # cross-reference a separate project map.
-    compliance = read_compliance_summary(project_path)
+    compliance = _persisted_project_summary(
+        cache, 'compliance', project_path, read_compliance_summary,
+        compliance_view.last_compliance_path, compliance_view.FRESH_WINDOW_S,
+    )
 
     # Services is also project-scoped — same shape, different source
     # (last `empirica scan` snapshot). Phase 2 T2 surfaces deterministic
     # Phase 1 metrics (process count, listening ports, integrity ratio);
     # auditor judgment counts will land here once Phase 2 T3 wires the
     # POSTFLIGHT coverage block.
-    services = read_services_summary(project_path)
+    services = _persisted_project_summary(
+        cache, 'services', project_path, read_services_summary,
+        services_view.last_scan_path, services_view.FRESH_WINDOW_S,
+    )
+
+    # Without a project_path the resolver falls back to the active project,
+    # which is not file-keyed — never cache that case.
+    ai_id = cached(
+        cache if project_path else None, ('ai_id', project_path), (_project_yaml(project_path),),
+        lambda: _project_ai_id(project_path),
+    )
 
     return {
         'instance_id': instance_id,
-        'ai_id': _project_ai_id(project_path),
+        'ai_id': ai_id,
         'label': label,
         'project_path': project_path,
         'session_id': tx_state['session_id'],
@@ -559,19 +722,26 @@ def aggregate_instance_state(
         # ECO-decided proposal events surface here (one row per inbox-act
         # or outbox-ack), making "notifications" the unified surface that
         # subsumes the older separate loops/listeners columns.
-        'recent_events': _read_recent_events_for_instance(instance_id, limit=5),
+        'recent_events': _read_recent_events_for_instance(instance_id, limit=5, cache=cache),
     }
 
 
 
 
-def aggregate_all(include_dead: bool = False) -> dict[str, Any]:
+def aggregate_all(
+    include_dead: bool = False,
+    cache: AggregationCache | None = None,
+) -> dict[str, Any]:
     """Scan and aggregate every discoverable instance.
 
     By default returns only LIVE instances (tmux pane exists, PPID alive,
     or recent activity). Set `include_dead=True` for diagnostic mode that
     surfaces every state-file footprint regardless of whether the
     underlying Claude process still exists.
+
+    Long-running callers (the TUI refresh loop) pass the same `cache` on
+    every call so unchanged per-instance state files aren't re-read; see
+    aggregation_cache.
     """
     # Pre-compute the live tmux pane set once, share across instances.
     live_panes = _live_tmux_panes()
@@ -587,9 +757,9 @@ def aggregate_all(include_dead: bool = False) -> dict[str, Any]:
 
     instances = [
         aggregate_instance_state(
-            i, live_panes=live_panes, current_instance_id=current_id,
+            i, live_panes=live_panes, current_instance_id=current_id, cache=cache,
         )
-        for i in discover_instances()
+        for i in _discover_instances(live_panes, cache=cache)
     ]
 
     if not include_dead:
@@ -618,6 +788,9 @@ def aggregate_all(include_dead: bool = False) -> dict[str, Any]:
     except Exception:
         auto_accept = None
 
+    if cache is not None:
+        cache.sweep()
+
     return {
         'generated_at': datetime.now(tz=timezone.utc).isoformat(),
         'instances': instances,
@@ -628,7 +801,10 @@ def aggregate_all(include_dead: bool = False) -> dict[str, Any]:
             'listeners_registered': listeners_registered,
             'listeners_paused': listeners_paused,
             'active_tx': active_tx,
-            'open_notifications': notifications_total(),
+            'open_notifications': cached(
+                cache, ('notifications_total',), (enrichment.ENP_PENDING_PATH,),
+                notifications_total,
+            ),
             'notify_dispatcher': build_notify_dispatcher_block(),
             'auto_accept': auto_accept,
         },
@@ -12,15 +12,20 @@ gate before being logged to the parent session. The gate:
 This is the quality control mechanism for multi-agent epistemic rollup.
 """
 
+from __future__ import annotations
+
 import hashlib
 import logging
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from empirica.core.information_gain import novelty_score
 
+if TYPE_CHECKING:
+    from empirica.data.minhash import NearDuplicateIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -117,7 +122,7 @@ class EpistemicRollupGate:
         agent_name: str,
         domain: str,
         confidence: float,
-        existing_findings: list[str],
+        existing_findings: list[str] | NearDuplicateIndex,
         domain_relevance: float = 1.0,
     ) -> ScoredFinding:
         """
@@ -128,7 +133,8 @@ class EpistemicRollupGate:
             agent_name: Which agent produced this
             domain: Investigation domain
             confidence: Agent's confidence (0.0-1.0)
-            existing_findings: Already-accepted findings for dedup
+            existing_findings: Already-accepted findings for dedup (texts, or a
+                NearDuplicateIndex when scoring many findings in turn)
             domain_relevance: How relevant to investigation (0.0-1.0)
 
         Returns:
@@ -194,23 +200,23 @@ class EpistemicRollupGate:
         return deduped
 
     def _jaccard_dedup(self, findings: list[ScoredFinding]) -> list[ScoredFinding]:
-        """Remove findings that are Jaccard-similar to higher-scored findings."""
+        """Remove findings that are Jaccard-similar to higher-scored findings.
+
+        Kept findings go into a MinHash/LSH index, so each candidate is only
+        compared (exactly) with the kept findings sharing a band bucket.
+        """
+        from empirica.data.minhash import NearDuplicateIndex
+
         # Sort by score descending (keep higher-scored ones)
         sorted_findings = sorted(findings, key=lambda f: f.score, reverse=True)
         kept = []
+        index = NearDuplicateIndex()
 
         for candidate in sorted_findings:
-            is_dup = False
-            for existing in kept:
-                similarity = 1.0 - novelty_score(
-                    candidate.finding, [existing.finding], self.jaccard_threshold
-                )
-                if similarity >= self.jaccard_threshold:
-                    is_dup = True
-                    break
-
-            if not is_dup:
+            similarity = 1.0 - novelty_score(candidate.finding, index, self.jaccard_threshold)
+            if similarity < self.jaccard_threshold:
                 kept.append(candidate)
+                index.add(len(kept), candidate.finding)
 
         return kept
 
@@ -316,7 +322,10 @@ class EpistemicRollupGate:
         Returns:
             RollupResult
         """
-        # Score all findings
+        from empirica.data.minhash import NearDuplicateIndex
+
+        # Score all findings, each against the existing ones and those scored before it
+        seen = NearDuplicateIndex(existing_findings)
         scored = []
         for item in raw_findings:
             text = item.get("finding", "") if isinstance(item, dict) else str(item)
@@ -325,10 +334,11 @@ class EpistemicRollupGate:
                 agent_name=agent_name,
                 domain=domain,
                 confidence=confidence,
-                existing_findings=existing_findings + [f.finding for f in scored],
+                existing_findings=seen,
                 domain_relevance=domain_relevance,
             )
             scored.append(sf)
+            seen.add(len(seen), text)
 
         # Deduplicate
         deduped = self.deduplicate(scored, project_id)
@@ -6,20 +6,25 @@ AI sees what's already known about the file before modifying it.
 This closes the gap where the AI edits a file without first checking
 whether prior findings, decisions, dead-ends, or mistakes referenced it.
 
-Lookup is a SQLite LIKE search on the artifact text columns of all six
-artifact tables, scoped to the active project. Both the basename and
-the project-relative path are matched so 'auth.py' and
-'src/auth/auth.py' both hit the same artifacts.
-
-Hot-path constraint: the hook runs on every PreToolUse, so this stays
-under ~50ms by capping per-table queries at small limits and using a
-single sqlite connection.
+Lookup goes through the artifact_mentions FTS5 index (migration 052),
+which triggers keep in sync with all six artifact tables, scoped to the
+active project. Both the basename and the project-relative path are
+matched so 'auth.py' and 'src/auth/auth.py' both hit the same artifacts.
+FTS hits are confirmed with LIKE on the indexed text, so results match
+what a substring search would return for the same tokens. DBs without
+the index (pre-migration, or SQLite without FTS5) fall back to a LIKE
+search per table.
+
+Hot-path constraint: the hook runs on every PreToolUse. The indexed
+lookup stays sub-millisecond at 100k artifacts; the LIKE fallback scans
+and is capped per table.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import re
 import sqlite3
 from pathlib import Path
 from typing import Any
@@ -83,6 +88,9 @@ def get_file_relevant_artifacts(
     out: list[dict] = []
 
     try:
+        indexed = _query_mention_index(cur, project_id, needles, limit, per_table_cap)
+        if indexed is not None:
+            return indexed
         for table, id_col, primary, type_label, secondary, ts_col in _ARTIFACT_TABLES:
             rows = _query_table(cur, table, id_col, primary, secondary,
                                 ts_col, project_id, needles, per_table_cap)
@@ -162,6 +170,83 @@ def _build_needles(project_root: Path, file_path: str) -> list[str]:
     return needles
 
 
+def _fts_phrase(needle: str) -> str | None:
+    """FTS5 prefix-phrase query for a needle (None if it has no tokens).
+
+    Tokens mirror the index tokenizer (unicode61 + tokenchars '._-'), so
+    'src/auth/auth.py' becomes "src auth auth.py"* — the prefix on the
+    last token also matches 'auth.py.' at the end of a sentence.
+    """
+    tokens = re.findall(r"[\w.\-]+", needle)
+    if not tokens:
+        return None
+    return '"' + " ".join(tokens) + '"*'
+
+
+def _query_mention_index(
+    cur: sqlite3.Cursor,
+    project_id: str | None,
+    needles: list[str],
+    limit: int,
+    cap: int,
+) -> list[dict[str, Any]] | None:
+    """Look up artifacts mentioning any needle via artifact_mentions_fts.
+
+    Returns None when the index is unavailable so the caller can fall
+    back to the LIKE scan.
+    """
+    phrases = [p for p in (_fts_phrase(n) for n in needles) if p]
+    if not phrases:
+        return None
+
+    sql = (
+        "SELECT m.kind, m.artifact_id, m.created_timestamp "
+        "FROM artifact_mentions_fts f JOIN artifact_mentions m ON m.id = f.rowid "
+        "WHERE artifact_mentions_fts MATCH ? "
+        "AND (" + " OR ".join("m.body LIKE ?" for _ in needles) + ")"
+    )
+    params: list[Any] = [" OR ".join(phrases), *(f"%{n}%" for n in needles)]
+    if project_id:
+        sql += " AND m.project_id = ?"
+        params.append(project_id)
+    sql += " ORDER BY m.created_timestamp DESC"
+
+    try:
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+    except sqlite3.OperationalError as e:
+        logger.debug(f"file_relevance: mention index unavailable: {e}")
+        return None
+
+    tables = {t[0]: t for t in _ARTIFACT_TABLES}
+    per_kind: dict[str, int] = {}
+    hits: list[tuple] = []
+    for kind, artifact_id, ts in rows:
+        if kind not in tables or per_kind.get(kind, 0) >= cap:
+            continue
+        per_kind[kind] = per_kind.get(kind, 0) + 1
+        hits.append((kind, artifact_id, ts))
+        if len(hits) >= limit:
+            break
+
+    out: list[dict[str, Any]] = []
+    for kind, artifact_id, ts in hits:
+        _, id_col, primary, type_label, secondary, _ = tables[kind]
+        cur.execute(
+            f"SELECT {', '.join([primary] + secondary)} FROM {kind} WHERE {id_col} = ?",
+            (artifact_id,),
+        )
+        row = cur.fetchone() or ()
+        summary = next((str(v)[:120] for v in row if v), "")
+        out.append({
+            "id": artifact_id,
+            "type": type_label,
+            "summary": summary,
+            "created_at": _to_iso(ts),
+        })
+    return out
+
+
 def _query_table(
     cur: sqlite3.Cursor,
     table: str,
@@ -0,0 +1,434 @@
+"""Hook daemon — warm, long-lived executor for Claude Code hook scripts.
+
+Every PreToolUse/PostToolUse hook (sentinel-gate, tool-router,
+entity-extractor, context-shift-tracker) and the statusline start a fresh
+interpreter, re-import ``empirica.data.session_database``, re-resolve the
+project and reopen SQLite. That cold start dominates the sentinel decision.
+
+The daemon keeps one interpreter alive with those imports and the
+``ThresholdLoader`` / ``MCOLoader`` singletons already loaded, listening on a
+user-only unix socket under ``~/.empirica/``. Hook scripts become thin
+clients (``lib/hook_daemon_client.py``): they forward argv, stdin, env and
+cwd, and the daemon re-runs the *same* script file in-process with those
+redirected, returning stdout/stderr/exit code verbatim. Hook behaviour is
+therefore identical on both paths — the daemon only removes start-up cost.
+
+Opt-in: nothing changes until ``empirica hook-daemon start`` is run. If the
+socket is missing or the daemon does not answer, clients fall back to the
+in-process path.
+
+Protocol: one JSON document per connection, client half-closes after
+writing, daemon replies with one JSON document and closes.
+
+    {"op": "run", "script": "/abs/sentinel-gate.py", "stdin": "...",
+     "env": {...}, "cwd": "...", "argv": [...]}
+    → {"ok": true, "stdout": "...", "stderr": "...", "exit_code": 0}
+
+    {"op": "ping"} | {"op": "stats"} | {"op": "shutdown"}
+"""
+
+from __future__ import annotations
+
+import builtins
+import contextlib
+import io
+import json
+import logging
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Scripts the daemon is willing to execute. Matched by basename so the
+# plugin can live anywhere (repo checkout, ~/.claude/plugins, pip install).
+DEFAULT_HOOK_SCRIPTS = frozenset({
+    'sentinel-gate.py',
+    'tool-router.py',
+    'entity-extractor.py',
+    'context-shift-tracker.py',
+    'statusline_empirica.py',
+})
+
+# Set in the environment of scripts executed by the daemon so the client
+# shim inside them does not try to forward a second time.
+INPROC_ENV = 'EMPIRICA_HOOKD_INPROC'
+SOCKET_ENV = 'EMPIRICA_HOOKD_SOCKET'
+
+_MAX_REQUEST_BYTES = 16 * 1024 * 1024
+_LATENCY_WINDOW = 1000
+
+
+def default_socket_path() -> Path:
+    """Socket path: $EMPIRICA_HOOKD_SOCKET or ~/.empirica/hookd.sock."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / '.empirica' / 'hookd.sock'
+
+
+def _recv_all(conn: socket.socket, limit: int = _MAX_REQUEST_BYTES) -> bytes:
+    """Read until EOF (peer half-close) or the size limit."""
+    chunks = []
+    total = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        total += len(chunk)
+        if total > limit:
+            raise ValueError(f'request exceeds {limit} bytes')
+    return b''.join(chunks)
+
+
+def _exit_code(code: Any) -> int:
+    """Map a SystemExit.code to a process exit status (mirrors the interpreter)."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
+
+
+def _snapshot_log_handlers() -> dict[str, list[logging.Handler]]:
+    """Record handlers on every logger so per-run additions can be undone."""
+    snapshot = {'': list(logging.getLogger().handlers)}
+    for name, obj in list(logging.Logger.manager.loggerDict.items()):
+        if isinstance(obj, logging.Logger):
+            snapshot[name] = list(obj.handlers)
+    return snapshot
+
+
+def _restore_log_handlers(snapshot: dict[str, list[logging.Handler]]) -> None:
+    """Remove (and close) handlers a hook script attached during its run.
+
+    Hooks like entity-extractor add a FileHandler at import time; re-running
+    them in one process would otherwise stack a new handler per call.
+    """
+    loggers = {'': logging.getLogger()}
+    for name, obj in list(logging.Logger.manager.loggerDict.items()):
+        if isinstance(obj, logging.Logger):
+            loggers[name] = obj
+    for name, lg in loggers.items():
+        before = snapshot.get(name, [])
+        for handler in list(lg.handlers):
+            if handler not in before:
+                lg.removeHandler(handler)
+                with contextlib.suppress(Exception):
+                    handler.close()
+
+
+def _clear_cwd_caches() -> None:
+    """Drop module-level state derived from the cwd (e.g. the cached git root).
+
+    One daemon serves every project, so a cached root from the previous
+    hook would resolve this hook to the wrong project's sessions.db.
+    """
+    try:
+        from empirica.config.path_resolver import clear_path_caches
+    except ImportError:
+        return
+    clear_path_caches()
+
+
+def ping(socket_path: Path | None = None, timeout: float = 0.5) -> dict | None:
+    """Return the daemon's ping reply, or None if it is not reachable."""
+    return request({'op': 'ping'}, socket_path=socket_path, timeout=timeout)
+
+
+def request(payload: dict, socket_path: Path | None = None, timeout: float = 5.0) -> dict | None:
+    """Send one request to the daemon. Returns None on any transport error."""
+    path = socket_path or default_socket_path()
+    if not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(payload).encode('utf-8'))
+            sock.shutdown(socket.SHUT_WR)
+            raw = _recv_all(sock)
+        return json.loads(raw.decode('utf-8')) if raw else None
+    except (OSError, ValueError):
+        return None
+
+
+class HookDaemon:
+    """Unix-socket server that executes hook scripts in a warm interpreter.
+
+    Requests are executed one at a time: a hook run swaps process-global
+    state (sys.stdin/stdout, os.environ, cwd, cwd-derived caches such as the
+    resolved git root), so concurrency would leak
+    state between hooks. Hook runs are milliseconds once warm, so callers
+    simply queue on the listen backlog.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        allowed_scripts: frozenset[str] | set[str] | None = None,
+        idle_timeout: float | None = None,
+    ) -> None:
+        """Configure the daemon.
+
+        Args:
+            socket_path: Unix socket to listen on (default: ~/.empirica/hookd.sock)
+            allowed_scripts: Basenames the daemon may execute (default: DEFAULT_HOOK_SCRIPTS)
+            idle_timeout: Exit after this many seconds without a request (None = never)
+        """
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self.allowed_scripts = frozenset(allowed_scripts or DEFAULT_HOOK_SCRIPTS)
+        self.idle_timeout = idle_timeout
+        self.started_at = time.time()
+        self.requests = 0
+        self.errors = 0
+        self._latencies: dict[str, deque] = {}
+        self._stop = threading.Event()
+        self._sock: socket.socket | None = None
+        # path -> ((mtime_ns, size), code) — sentinel-gate is ~3k lines and
+        # recompiling it per call would cost more than the hook itself
+        self._code_cache: dict[str, tuple[tuple[int, int], Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Warm state
+    # ------------------------------------------------------------------
+
+    def warm(self) -> None:
+        """Import the heavy modules and load config singletons up front."""
+        try:
+            from empirica.config.mco_loader import MCOLoader
+            from empirica.config.threshold_loader import ThresholdLoader
+            from empirica.data.session_database import SessionDatabase, schema_fingerprint  # noqa: F401
+            from empirica.utils import session_resolver  # noqa: F401
+
+            ThresholdLoader.get_instance()
+            MCOLoader.get_instance()
+            schema_fingerprint()
+        except Exception as e:
+            # A partially warm daemon is still faster than a cold start
+            logger.warning(f'hook daemon warm-up incomplete: {e}')
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _compiled(self, script: Path):
+        """Return the script's code object, recompiling only when it changes."""
+        st = script.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._code_cache.get(str(script))
+        if cached and cached[0] == key:
+            return cached[1]
+        code = compile(script.read_bytes(), str(script), 'exec')
+        self._code_cache[str(script)] = (key, code)
+        return code
+
+    def run_hook(self, req: dict) -> dict:
+        """Execute one hook script with the caller's stdin/env/cwd/argv."""
+        script = Path(req.get('script') or '')
+        if script.name not in self.allowed_scripts:
+            return {'ok': False, 'error': f'script not allowed: {script.name!r}'}
+        if not script.is_absolute() or not script.is_file():
+            return {'ok': False, 'error': f'script not found: {script}'}
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        env = {str(k): str(v) for k, v in (req.get('env') or {}).items()}
+        env[INPROC_ENV] = '1'
+        cwd = req.get('cwd')
+
+        saved_stdio = (sys.stdin, sys.stdout, sys.stderr)
+        saved_argv = sys.argv
+        saved_path = list(sys.path)
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        handlers = _snapshot_log_handlers()
+        exit_code = 0
+        start = time.perf_counter()
+
+        # A real file (not StringIO) so hooks that select() on stdin work
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as stdin_file:
+            stdin_file.write(req.get('stdin') or '')
+            stdin_file.seek(0)
+            try:
+                os.environ.clear()
+                os.environ.update(env)
+                if cwd and os.path.isdir(cwd):
+                    os.chdir(cwd)
+                _clear_cwd_caches()
+                sys.stdin, sys.stdout, sys.stderr = stdin_file, stdout, stderr
+                sys.argv = [str(script), *[str(a) for a in req.get('argv') or []]]
+                # Fresh globals per run, like a new interpreter's __main__
+                exec(self._compiled(script), {  # noqa: S102 — runs an allowlisted hook script, as its own interpreter would
+                    '__name__': '__main__',
+                    '__file__': str(script),
+                    '__builtins__': builtins,
+                })
+            except SystemExit as e:
+                exit_code = _exit_code(e.code)
+                if not isinstance(e.code, int | None):
+                    stderr.write(f'{e.code}\n')
+            except BaseException:
+                traceback.print_exc(file=stderr)
+                exit_code = 1
+                self.errors += 1
+            finally:
+                sys.stdin, sys.stdout, sys.stderr = saved_stdio
+                sys.argv = saved_argv
+                sys.path[:] = saved_path
+                os.environ.clear()
+                os.environ.update(saved_env)
+                with contextlib.suppress(OSError):
+                    os.chdir(saved_cwd)
+                _clear_cwd_caches()
+                _restore_log_handlers(handlers)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._latencies.setdefault(script.name, deque(maxlen=_LATENCY_WINDOW)).append(elapsed_ms)
+        return {
+            'ok': True,
+            'stdout': stdout.getvalue(),
+            'stderr': stderr.getvalue(),
+            'exit_code': exit_code,
+            'elapsed_ms': round(elapsed_ms, 2),
+        }
+
+    def stats(self) -> dict:
+        """Request counters and per-script latency percentiles (ms)."""
+        per_script = {}
+        for name, samples in self._latencies.items():
+            ordered = sorted(samples)
+            if not ordered:
+                continue
+            per_script[name] = {
+                'count': len(ordered),
+                'p50_ms': round(ordered[len(ordered) // 2], 2),
+                'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+                'max_ms': round(ordered[-1], 2),
+            }
+        return {
+            'pid': os.getpid(),
+            'socket': str(self.socket_path),
+            'uptime_s': round(time.time() - self.started_at, 1),
+            'requests': self.requests,
+            'errors': self.errors,
+            'scripts': per_script,
+        }
+
+    def handle_request(self, req: dict) -> dict:
+        """Dispatch one decoded request."""
+        op = req.get('op', 'run')
+        if op == 'ping':
+            return {'ok': True, 'pid': os.getpid()}
+        if op == 'stats':
+            return {'ok': True, **self.stats()}
+        if op == 'shutdown':
+            self._stop.set()
+            return {'ok': True}
+        if op == 'run':
+            self.requests += 1
+            return self.run_hook(req)
+        return {'ok': False, 'error': f'unknown op: {op!r}'}
+
+    # ------------------------------------------------------------------
+    # Server loop
+    # ------------------------------------------------------------------
+
+    def _bind(self) -> socket.socket:
+        """Bind the listening socket, clearing a stale one left by a crash."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if ping(self.socket_path) is not None:
+                raise RuntimeError(f'hook daemon already running on {self.socket_path}')
+            self.socket_path.unlink()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)  # socket file is user-only (0600)
+        try:
+            sock.bind(str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+        sock.listen(64)
+        sock.settimeout(1.0)
+        return sock
+
+    def serve_forever(self) -> None:
+        """Accept and serve requests until shutdown or idle timeout."""
+        self._sock = self._bind()
+        self.warm()
+        last_activity = time.time()
+        logger.info(f'hook daemon listening on {self.socket_path} (pid {os.getpid()})')
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn, _ = self._sock.accept()
+                except TimeoutError:
+                    if self.idle_timeout and time.time() - last_activity > self.idle_timeout:
+                        logger.info('hook daemon idle timeout reached')
+                        break
+                    continue
+                last_activity = time.time()
+                with conn:
+                    self._serve_connection(conn)
+        finally:
+            self.close()
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        """Read one request, execute it, write the reply."""
+        conn.settimeout(30.0)
+        try:
+            raw = _recv_all(conn)
+            req = json.loads(raw.decode('utf-8')) if raw else {}
+            reply = self.handle_request(req) if isinstance(req, dict) else {'ok': False, 'error': 'bad request'}
+        except Exception as e:
+            reply = {'ok': False, 'error': f'{type(e).__name__}: {e}'}
+        with contextlib.suppress(OSError):
+            conn.sendall(json.dumps(reply).encode('utf-8'))
+
+    def shutdown(self) -> None:
+        """Ask the serve loop to exit after the current request."""
+        self._stop.set()
+
+    def close(self) -> None:
+        """Close and unlink the listening socket."""
+        if self._sock is not None:
+            with contextlib.suppress(OSError):
+                self._sock.close()
+            self._sock = None
+        with contextlib.suppress(OSError):
+            self.socket_path.unlink()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Foreground entry point: ``python -m empirica.core.hook_daemon``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='empirica-hookd', description='Empirica hook daemon')
+    parser.add_argument('--socket', help='Socket path (default: ~/.empirica/hookd.sock)')
+    parser.add_argument('--idle-timeout', type=float, default=None,
+                        help='Exit after N seconds without requests')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s hookd %(message)s')
+    daemon = HookDaemon(
+        socket_path=Path(args.socket) if args.socket else None,
+        idle_timeout=args.idle_timeout,
+    )
+    try:
+        daemon.serve_forever()
+    except RuntimeError as e:
+        sys.stderr.write(f'{e}\n')
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,8 +10,14 @@ investigating a domain yields high gain; subsequent agents yield less.
 When expected gain falls below a threshold, it's better to stop.
 """
 
+from __future__ import annotations
+
 import logging
 import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from empirica.data.minhash import NearDuplicateIndex
 
 logger = logging.getLogger(__name__)
 
@@ -149,7 +155,7 @@ def should_spawn_more(
 
 def novelty_score(
     finding: str,
-    existing_findings: list[str],
+    existing_findings: list[str] | NearDuplicateIndex,
     jaccard_threshold: float = 0.7,
 ) -> float:
     """
@@ -158,14 +164,25 @@ def novelty_score(
     Uses Jaccard similarity on word sets. A finding is novel if it has
     low similarity to all existing findings.
 
+    Callers scoring a growing set of findings should pass a
+    NearDuplicateIndex and add() each finding to it: only LSH candidates
+    are compared (exactly), instead of every existing finding. Pairs below
+    the LSH detection range (roughly Jaccard < 0.3) may go unseen, which
+    only affects findings that are highly novel either way.
+
     Args:
         finding: New finding text
-        existing_findings: List of existing finding texts
+        existing_findings: Existing finding texts, or an index over them
         jaccard_threshold: Similarity above this = not novel
 
     Returns:
         Novelty score (0.0 = duplicate, 1.0 = completely novel)
     """
+    from empirica.data.minhash import NearDuplicateIndex, jaccard
+
+    if isinstance(existing_findings, NearDuplicateIndex):
+        return 1.0 - existing_findings.max_similarity(finding)
+
     if not existing_findings:
         return 1.0
 
@@ -175,14 +192,7 @@ def novelty_score(
 
     max_similarity = 0.0
     for existing in existing_findings:
-        existing_words = _tokenize(existing)
-        if not existing_words:
-            continue
-
-        intersection = finding_words & existing_words
-        union = finding_words | existing_words
-        similarity = len(intersection) / len(union) if union else 0.0
-        max_similarity = max(max_similarity, similarity)
+        max_similarity = max(max_similarity, jaccard(finding_words, _tokenize(existing)))
 
     # Novelty is inverse of max similarity
     novelty = 1.0 - max_similarity
@@ -190,14 +200,7 @@ def novelty_score(
     return novelty
 
 
-def _tokenize(text: str) -> set:
-    """Tokenize text into word set for Jaccard comparison."""
-    import re
-    words = set(re.findall(r'\b\w{3,}\b', text.lower()))
-    # Remove very common words
-    stop_words = {
-        'the', 'and', 'for', 'that', 'this', 'with', 'from', 'are', 'was',
-        'were', 'been', 'have', 'has', 'had', 'not', 'but', 'can', 'will',
-        'should', 'would', 'could', 'which', 'there', 'their', 'about',
-    }
-    return words - stop_words
+def _tokenize(text: str) -> frozenset[str]:
+    """Tokenize text into word set for Jaccard comparison (memoized)."""
+    from empirica.data.minhash import text_tokens
+    return text_tokens(text)
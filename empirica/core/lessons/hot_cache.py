@@ -13,6 +13,9 @@ import time
 from collections import defaultdict
 from dataclasses import dataclass
 
+# Bump when the to_snapshot() layout changes; older snapshots are ignored.
+SNAPSHOT_FORMAT = 1
+
 
 @dataclass
 class HotLessonEntry:
@@ -120,6 +123,62 @@ class LessonHotCache:
             self._load_timestamp = time.time()
             return count
 
+    def to_snapshot(self) -> dict:
+        """
+        Serialize the cache to a JSON-compatible dict.
+
+        Lesson entries carry every edge, so only they and the sorted
+        epistemic indexes are stored; load_snapshot() derives the rest.
+        """
+        with self._lock:
+            return {
+                'format': SNAPSHOT_FORMAT,
+                'lessons': [
+                    [e.id, e.name, e.domain, e.expected_delta,
+                     list(e.prereq_ids), list(e.requires_ids), list(e.enables_ids)]
+                    for e in self._lessons.values()
+                ],
+                'improves_know': self._improves_know,
+                'improves_do': self._improves_do,
+                'improves_context': self._improves_context,
+                'reduces_uncertainty': self._reduces_uncertainty,
+            }
+
+    def load_snapshot(self, snapshot: dict) -> int:
+        """
+        Replace all indexes with a snapshot from to_snapshot().
+        Returns count of lessons loaded.
+        """
+        if snapshot.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported hot cache snapshot format: {snapshot.get('format')!r}")
+
+        with self._lock:
+            self._clear_indexes()
+            for lesson_id, name, domain, delta, prereqs, requires, enables in snapshot['lessons']:
+                entry = HotLessonEntry(
+                    id=lesson_id, name=name, expected_delta=delta,
+                    prereq_ids=set(prereqs), requires_ids=set(requires),
+                    enables_ids=set(enables), domain=domain,
+                )
+                self._lessons[lesson_id] = entry
+                if requires:
+                    self._requires[lesson_id] = set(requires)
+                    for req_id in requires:
+                        self._required_by[req_id].add(lesson_id)
+                if enables:
+                    self._enables[lesson_id] = set(enables)
+                    for enables_id in enables:
+                        self._enabled_by[enables_id].add(lesson_id)
+                if domain:
+                    self._by_domain[domain].add(lesson_id)
+
+            self._improves_know = [tuple(x) for x in snapshot['improves_know']]
+            self._improves_do = [tuple(x) for x in snapshot['improves_do']]
+            self._improves_context = [tuple(x) for x in snapshot['improves_context']]
+            self._reduces_uncertainty = [tuple(x) for x in snapshot['reduces_uncertainty']]
+            self._load_timestamp = time.time()
+            return len(self._lessons)
+
     def _clear_indexes(self) -> None:
         """Clear all indexes"""
         self._lessons.clear()
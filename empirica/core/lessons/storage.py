@@ -13,6 +13,8 @@ This module is the single entry point for all lesson storage operations.
 import hashlib
 import json
 import logging
+import os
+import sqlite3
 import time
 import uuid
 from pathlib import Path
@@ -154,63 +156,110 @@ class LessonStorageManager:
             logger.warning(f"Could not ensure Qdrant collection: {e}")
 
     def _load_hot_cache(self) -> int:
-        """Load all lessons into hot cache from warm storage for fast access."""
+        """
+        Load all lessons into hot cache for fast access.
+
+        Uses the on-disk snapshot when its key matches the database's
+        lesson_cache_generation (migration 053); otherwise rebuilds from
+        warm storage and rewrites the snapshot.
+        """
+        key = self._lesson_cache_key()
+        snapshot_path = self._hot_snapshot_path() if key else None
+
+        if snapshot_path and snapshot_path.exists():
+            try:
+                with open(snapshot_path) as f:
+                    snapshot = json.load(f)
+                if snapshot.get('key') == key:
+                    count = self._hot.load_snapshot(snapshot['cache'])
+                    logger.info(f"Loaded {count} lessons into hot cache from snapshot")
+                    return count
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.debug(f"Ignoring lesson hot cache snapshot {snapshot_path}: {e}")
+
+        count = self._hot.load_from_warm(self)
+        logger.info(f"Loaded {count} lessons into hot cache")
+
+        # Uncommitted lesson writes may still roll back; don't key a snapshot on them
+        if snapshot_path and not self._conn.in_transaction:
+            self._write_hot_snapshot(snapshot_path, key)
+        return count
+
+    def get_all_hot_data(self):
+        """
+        Yield hot-cache dicts for all lessons (warm_loader for LessonHotCache).
+
+        Four set-based queries regardless of lesson count: lessons, deltas,
+        lesson prerequisites and lesson→lesson graph edges, joined in Python.
+        """
         cursor = self._conn.cursor()
-        cursor.execute("""
-            SELECT l.id, l.name, l.domain,
-                   GROUP_CONCAT(DISTINCT led.vector_name || ':' || led.delta_value) as deltas,
-                   GROUP_CONCAT(DISTINCT lp.prereq_id) as prereqs
-            FROM lessons l
-            LEFT JOIN lesson_epistemic_deltas led ON l.id = led.lesson_id
-            LEFT JOIN lesson_prerequisites lp ON l.id = lp.lesson_id AND lp.prereq_type = 'lesson'
-            GROUP BY l.id
-        """)
+        cursor.row_factory = None  # plain tuples; tens of thousands of edge rows
 
-        count = 0
-        for row in cursor.fetchall():
-            lesson_id, name, domain, deltas_str, prereqs_str = row
+        cursor.execute("SELECT lesson_id, vector_name, delta_value FROM lesson_epistemic_deltas")
+        deltas: dict[str, dict[str, float]] = {}
+        for lesson_id, vector, value in cursor.fetchall():
+            deltas.setdefault(lesson_id, {})[vector] = float(value)
 
-            # Parse deltas
-            expected_delta = {}
-            if deltas_str:
-                for d in deltas_str.split(','):
-                    if ':' in d:
-                        k, v = d.split(':')
-                        expected_delta[k] = float(v)
+        # Grouped in SQL (ids joined with the ASCII unit separator) so Python
+        # handles one row per lesson/relation rather than one per edge
+        cursor.execute("""
+            SELECT lesson_id, GROUP_CONCAT(prereq_id, char(31)) FROM lesson_prerequisites
+            WHERE prereq_type = 'lesson'
+            GROUP BY lesson_id
+        """)
+        prereqs = {lesson_id: ids.split('\x1f') for lesson_id, ids in cursor.fetchall()}
 
-            # Parse prereqs
-            prereq_ids = prereqs_str.split(',') if prereqs_str else []
+        cursor.execute("""
+            SELECT source_id, relation_type, GROUP_CONCAT(target_id, char(31)) FROM knowledge_graph
+            WHERE source_type = 'lesson' AND target_type = 'lesson'
+            AND relation_type IN ('enables', 'requires')
+            GROUP BY source_id, relation_type
+        """)
+        relations = {(source_id, rel_type): ids.split('\x1f') for source_id, rel_type, ids in cursor.fetchall()}
 
-            # Get relations from knowledge_graph
-            cursor.execute("""
-                SELECT target_id, relation_type FROM knowledge_graph
-                WHERE source_type = 'lesson' AND source_id = ?
-                AND target_type = 'lesson'
-            """, (lesson_id,))
-
-            enables = []
-            requires = []
-            for target_id, rel_type in cursor.fetchall():
-                if rel_type == 'enables':
-                    enables.append(target_id)
-                elif rel_type == 'requires':
-                    requires.append(target_id)
-
-            hot_dict = {
+        cursor.execute("SELECT id, name, domain FROM lessons")
+        for lesson_id, name, domain in cursor.fetchall():
+            yield {
                 'id': lesson_id,
                 'name': name,
                 'domain': domain,
-                'expected_delta': expected_delta,
-                'prereq_ids': prereq_ids,
-                'enables': enables,
-                'requires': requires
+                'expected_delta': deltas.get(lesson_id, {}),
+                'prereq_ids': prereqs.get(lesson_id, []),
+                'enables': relations.get((lesson_id, 'enables'), []),
+                'requires': relations.get((lesson_id, 'requires'), []),
             }
 
-            self._hot.load_lesson(hot_dict)
-            count += 1
+    def _lesson_cache_key(self) -> list | None:
+        """[epoch, generation] of the lesson tables, or None before migration 053."""
+        try:
+            row = self._conn.execute(
+                "SELECT epoch, generation FROM lesson_cache_generation WHERE id = 1"
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return list(row) if row else None
 
-        logger.info(f"Loaded {count} lessons into hot cache")
-        return count
+    def _hot_snapshot_path(self) -> Path | None:
+        """Snapshot file next to the database file (None for in-memory databases)."""
+        try:
+            for _, name, filename in self._conn.execute("PRAGMA database_list").fetchall():
+                if name == 'main' and filename:
+                    db_file = Path(filename)
+                    return db_file.with_name(f"{db_file.name}.lesson-cache.json")
+        except sqlite3.Error as e:
+            logger.debug(f"Could not resolve database path for lesson snapshot: {e}")
+        return None
+
+    def _write_hot_snapshot(self, path: Path, key: list) -> None:
+        """Atomically write the hot cache snapshot (best-effort)."""
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            with open(tmp, 'w') as f:
+                json.dump({'key': key, 'cache': self._hot.to_snapshot()}, f, separators=(',', ':'))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Could not write lesson hot cache snapshot {path}: {e}")
+            tmp.unlink(missing_ok=True)
 
     # ==================== CREATE ====================
 
@@ -1066,32 +1115,17 @@ _storage: LessonStorageManager | None = None
 def _try_get_qdrant_client():
     """Try to get a Qdrant client, return None if unavailable.
 
-    Requires a running Qdrant server. File-based storage was removed (#45)
-    because it creates incompatible storage formats and CWD-relative paths.
+    Shares the pooled client from empirica.core.qdrant.connection (server
+    URL, embedded EMPIRICA_QDRANT_EMBEDDED store, or localhost server), so the
+    lessons SEARCH layer never opens a second handle on the same store.
     """
     try:
-        import os
-
-        from qdrant_client import QdrantClient
+        from empirica.core.qdrant.connection import _get_qdrant_client
 
-        # Priority 1: Explicit URL
-        url = os.getenv("EMPIRICA_QDRANT_URL")
-        if url:
-            return QdrantClient(url=url)
-
-        # Priority 2: Check if Qdrant server is running on localhost
-        default_url = "http://localhost:6333"
-        try:
-            import urllib.request
-            req = urllib.request.Request(f"{default_url}/collections", method='GET')
-            with urllib.request.urlopen(req, timeout=1) as resp:
-                if resp.status == 200:
-                    return QdrantClient(url=default_url)
-        except Exception:  # noqa: S110 — Qdrant server may not be running; graceful fallback
-            pass
-
-        logger.debug("Qdrant server not available for lessons storage")
-        return None
+        client = _get_qdrant_client()
+        if client is None:
+            logger.debug("Qdrant server not available for lessons storage")
+        return client
     except ImportError:
         logger.debug("qdrant-client not installed, SEARCH layer disabled")
         return None
@@ -20,6 +20,12 @@ Praxic phase (after CHECK):
 Each evidence source is independent and failure-tolerant. The collector
 returns whatever evidence it can gather.
 
+Sources in PostTestCollector.PARALLEL_SOURCES run concurrently on a thread
+pool, each with its own read-only SQLite connection and a wall-clock budget
+(SOURCE_TIME_BUDGETS). Results merge into the bundle in declaration order,
+so output is deterministic regardless of completion order. Set
+EMPIRICA_EVIDENCE_PARALLEL=0 to collect sequentially.
+
 All evidence gathered here consists of deterministic proxies — observable signals
 that correlate with epistemic state but cannot fully measure it. These are useful
 for detecting systematic calibration drift over many transactions, not for judging
@@ -29,8 +35,12 @@ docstring for the full dual-track calibration philosophy.
 
 import json
 import logging
+import os
+import sqlite3
 import subprocess
+import threading
 import time
+from concurrent.futures import Future, wait
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -81,6 +91,9 @@ class EvidenceBundle:
     in POSTFLIGHT response when sources_failed is non-empty so failures
     can be debugged from the output alone.
 
+    source_durations_ms maps source name → wall time spent in its collector,
+    so slow sources are visible in POSTFLIGHT output.
+
     Helpers `has`, `get`, `direction` provide named-metric lookup for consumers
     like the goal-criterion EvidenceMetricEvaluator. They search items by
     metric_name and return the first match.
@@ -92,6 +105,7 @@ class EvidenceBundle:
     sources_failed: list[str] = field(default_factory=list)
     sources_empty: list[str] = field(default_factory=list)
     source_errors: dict[str, str] = field(default_factory=dict)
+    source_durations_ms: dict[str, int] = field(default_factory=dict)
     coverage: float = 0.0
 
     def _find(self, metric_name: str) -> EvidenceItem | None:
@@ -192,9 +206,44 @@ class EvidenceProfile:
         return EvidenceProfile.AUTO
 
 
+class _ReadOnlySessionDB:
+    """Read-only view of the session DB for one collector thread.
+
+    Exposes the subset of SessionDatabase the collectors use (`conn`,
+    `codebase_model`) over a private `mode=ro` SQLite connection, since the
+    shared connection can't cross threads.
+    """
+
+    def __init__(self, db_path: str):
+        from empirica.data.repositories.codebase_model import CodebaseModelRepository
+        self.conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, timeout=30.0)
+        self.conn.row_factory = sqlite3.Row
+        self.codebase_model = CodebaseModelRepository(self.conn)
+
+    def close(self):
+        self.conn.close()
+
+
 class PostTestCollector:
     """Collects objective evidence from multiple sources."""
 
+    # Sources that only read the DB through _get_db() and shell out, so they
+    # can run on worker threads. Prose/web collectors hold the shared
+    # connection and always run on the calling thread.
+    PARALLEL_SOURCES: ClassVar[frozenset[str]] = frozenset({
+        "artifacts", "noetic", "sentinel", "goals", "issues", "triage",
+        "codebase_model", "non_git_files", "pytest", "git", "code_quality",
+    })
+
+    # Wall-clock budget per parallel source (seconds). An overrunning source
+    # is recorded as failed; its thread is left to finish in the background.
+    SOURCE_TIME_BUDGETS: ClassVar[dict[str, float]] = {
+        "git": 30.0,
+        "non_git_files": 30.0,
+        "code_quality": 130.0,  # ruff 30s + radon 30s + pyright 60s, in sequence
+    }
+    DEFAULT_SOURCE_BUDGET: ClassVar[float] = 20.0
+
     def __init__(self, session_id: str, project_id: str | None = None,
                  db=None, phase: str = "combined",
                  check_timestamp: float | None = None,
@@ -215,8 +264,12 @@ class PostTestCollector:
         self._session_goal_ids: list[str] | None = None
         self._project_root: str | None = None  # Lazy-resolved
         self._project_maturity: dict[str, Any] | None = None  # Lazy-resolved
+        self._thread_db = threading.local()  # Per-worker read-only DB
 
     def _get_db(self):
+        thread_db = getattr(self._thread_db, "db", None)
+        if thread_db is not None:
+            return thread_db
         if self._db is None:
             from empirica.data.session_database import SessionDatabase
             self._db = SessionDatabase()
@@ -489,26 +542,27 @@ class PostTestCollector:
 
         collectors = universal + profile_collectors
 
-        for source_name, collector_fn in collectors:
-            try:
-                items = collector_fn()
-                if items:
-                    bundle.items.extend(items)
-                    bundle.sources_available.append(source_name)
-                else:
-                    # Ran cleanly but found nothing to grade. This is
-                    # different from crashing — track it separately so
-                    # genuine failures can be debugged.
-                    bundle.sources_empty.append(source_name)
-            except Exception as e:
-                logger.debug(f"Evidence source {source_name} failed: {e}")
+        outcomes = self._run_collectors(collectors)
+
+        for (source_name, _), (items, error, duration_ms) in zip(collectors, outcomes):
+            bundle.source_durations_ms[source_name] = duration_ms
+            if error is not None:
+                logger.debug(f"Evidence source {source_name} failed: {error}")
                 bundle.sources_failed.append(source_name)
                 # Capture exception type + truncated message so POSTFLIGHT
                 # output can surface the actual cause. Without this,
                 # sources_failed is opaque ("it failed but why?").
-                err_type = type(e).__name__
-                err_msg = str(e)[:200]
+                err_type = type(error).__name__
+                err_msg = str(error)[:200]
                 bundle.source_errors[source_name] = f"{err_type}: {err_msg}"
+            elif items:
+                bundle.items.extend(items)
+                bundle.sources_available.append(source_name)
+            else:
+                # Ran cleanly but found nothing to grade. This is
+                # different from crashing — track it separately so
+                # genuine failures can be debugged.
+                bundle.sources_empty.append(source_name)
 
         grounded_vectors = set()
         for item in bundle.items:
@@ -518,6 +572,101 @@ class PostTestCollector:
         self._close_db()
         return bundle
 
+    @staticmethod
+    def _timed_call(collector_fn) -> tuple[list[EvidenceItem], Exception | None, int]:
+        """Run one collector → (items, error, duration_ms)."""
+        start = time.perf_counter()
+        try:
+            items, error = collector_fn() or [], None
+        except Exception as e:
+            items, error = [], e
+        return items, error, int((time.perf_counter() - start) * 1000)
+
+    def _parallel_db_path(self) -> str | None:
+        """SQLite file the worker threads can open read-only, or None.
+
+        None (→ sequential collection) for PostgreSQL, in-memory or injected
+        non-SQLite DBs, and when the shared connection has uncommitted writes
+        that a separate connection would not see.
+        """
+        if os.environ.get("EMPIRICA_EVIDENCE_PARALLEL", "1").strip().lower() in ("0", "false", "no"):
+            return None
+        db = self._get_db()
+        conn = getattr(db, "conn", None)
+        db_path = getattr(db, "db_path", None)
+        if not isinstance(conn, sqlite3.Connection) or conn.in_transaction:
+            return None
+        if db_path is None or not Path(db_path).is_file():
+            return None
+        return str(db_path)
+
+    def _run_isolated(self, collector_fn, db_path: str) -> tuple[list[EvidenceItem], Exception | None, int]:
+        """Worker-thread body: run a collector against its own read-only DB."""
+        start = time.perf_counter()
+        try:
+            self._thread_db.db = _ReadOnlySessionDB(db_path)
+        except sqlite3.Error as e:
+            return [], e, int((time.perf_counter() - start) * 1000)
+        try:
+            return self._timed_call(collector_fn)
+        finally:
+            self._thread_db.db.close()
+            self._thread_db.db = None
+
+    @staticmethod
+    def _start_daemon(name: str, fn, *args) -> Future:
+        """Run fn(*args) on a daemon thread, returning a Future for its result.
+
+        Daemon rather than pool threads: a collector that overruns its budget
+        is abandoned, and must not hold up interpreter exit afterwards.
+        """
+        future: Future = Future()
+
+        def _body():
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:  # noqa: BLE001 — surfaced to the caller through the Future
+                future.set_exception(e)
+
+        threading.Thread(target=_body, name=name, daemon=True).start()
+        return future
+
+    def _run_collectors(self, collectors: list[tuple]) -> list[tuple[list[EvidenceItem], Exception | None, int]]:
+        """Run collectors, in parallel where safe; outcomes in input order."""
+        db_path = self._parallel_db_path()
+        parallel = [
+            i for i, (name, _) in enumerate(collectors)
+            if db_path and name in self.PARALLEL_SOURCES
+        ]
+        if len(parallel) < 2:
+            return [self._timed_call(fn) for _, fn in collectors]
+
+        # Warm shared lazy caches once on this thread instead of per worker
+        self._get_session_goal_ids()
+        self._resolve_project_root()
+
+        outcomes: list[tuple[list[EvidenceItem], Exception | None, int] | None] = [None] * len(collectors)
+        submitted = time.monotonic()
+        futures = {
+            i: self._start_daemon(f"evidence-{collectors[i][0]}", self._run_isolated, collectors[i][1], db_path)
+            for i in parallel
+        }
+        for i, (_, fn) in enumerate(collectors):
+            if i not in futures:
+                outcomes[i] = self._timed_call(fn)
+        for i, future in futures.items():
+            name = collectors[i][0]
+            budget = self.SOURCE_TIME_BUDGETS.get(name, self.DEFAULT_SOURCE_BUDGET)
+            wait([future], timeout=max(0.0, submitted + budget - time.monotonic()))
+            if future.done():
+                outcomes[i] = future.result()
+            else:
+                outcomes[i] = (
+                    [], TimeoutError(f"exceeded {budget:g}s time budget"), int(budget * 1000),
+                )
+        return outcomes  # type: ignore[return-value]
+
     def _collect_noetic_metrics(self) -> list[EvidenceItem]:
         """Collect investigation-phase evidence for noetic calibration.
 
@@ -29,8 +29,14 @@ References:
 - Sahoo et al. (NeurIPS 2021): "Reliable Decisions with Threshold Calibration"
 - Gneiting & Raftery (2007): "Strictly Proper Scoring Rules, Prediction, and Estimation"
 """
+import json
 import logging
+import sqlite3
+import sys
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -48,6 +54,12 @@ _FALLBACK_MAX_INFLATION = 0.05
 _FALLBACK_MIN_TRANSACTIONS = 5
 _FALLBACK_LOOKBACK = 20
 
+# Config sources, located without importing their (yaml-loading) readers:
+# ThresholdLoader's default cascade_styles.yaml and DomainRegistry's dirs.
+_CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
+_CASCADE_STYLES_PATH = _CONFIG_DIR / "mco" / "cascade_styles.yaml"
+_BUILTIN_DOMAINS_DIR = _CONFIG_DIR / "domains"
+
 
 def _load_calibration_config() -> dict:
     """Load calibration gating config from MCO cascade_styles.yaml via ThresholdLoader.
@@ -386,6 +398,120 @@ def compute_dynamic_thresholds(
         return static_result
 
 
+def _file_signature(paths) -> list:
+    """(name, mtime_ns, size) for each existing path — changes when a file does."""
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append([str(path), stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
+def _calibration_config_signature() -> Any:
+    """Identify the calibration config without loading it.
+
+    The cascade_styles.yaml stat identifies what a fresh ThresholdLoader
+    would read, which keeps the cache hit path free of YAML parsing. A loader
+    already live in this process that switched profile, path or carries
+    overrides adds its resolved values to the signature.
+    """
+    signature = _file_signature([_CASCADE_STYLES_PATH])
+    loader_module = sys.modules.get("empirica.config.threshold_loader")
+    loader = loader_module.ThresholdLoader._instance if loader_module else None
+    if loader is not None and (
+        loader.overrides
+        or Path(loader.config_path).resolve() != _CASCADE_STYLES_PATH
+        or loader.current_profile_name != loader.metadata.get("default_profile", "default")
+    ):
+        signature.append(_load_calibration_config())
+    return signature
+
+
+def domain_config_signature(project_path: str | None = None) -> list:
+    """Stat signature of the files DomainRegistry would load for project_path."""
+    paths = sorted(_BUILTIN_DOMAINS_DIR.glob("*.yaml"))
+    user_dir = Path.home() / ".empirica" / "domains"
+    if user_dir.is_dir():
+        paths += sorted(user_dir.glob("*.yaml"))
+    if project_path:
+        paths.append(Path(project_path) / ".empirica" / "domains.yaml")
+    return _file_signature(paths)
+
+
+def cached_threshold(db, key_parts: list, compute: Callable[[], Any]) -> Any:
+    """Return compute(), memoized in dynamic_threshold_cache per calibration generation.
+
+    key_parts must be JSON-serializable and identify every input that does
+    not live in calibration_trajectory; the calibration_generation counter
+    (migration 056) covers the rest. The result must survive a JSON round
+    trip. Falls back to compute() when the cache tables are unavailable.
+    """
+    conn = db.conn
+    key = json.dumps(key_parts, sort_keys=True, default=str)
+    try:
+        row = conn.execute("""
+            SELECT g.generation, c.generation, c.value
+            FROM calibration_generation g
+            LEFT JOIN dynamic_threshold_cache c ON c.cache_key = ?
+            WHERE g.id = 1
+        """, (key,)).fetchone()
+    except sqlite3.Error:
+        return compute()
+    if row is None:
+        return compute()
+
+    generation, cached_generation, value = row
+    if value is not None and cached_generation == generation:
+        return json.loads(value)
+
+    # Tagged with the generation read *before* computing: calibration data
+    # landing meanwhile leaves the row stale rather than wrongly current.
+    result = compute()
+    try:
+        in_transaction = conn.in_transaction
+        conn.execute(
+            "INSERT OR REPLACE INTO dynamic_threshold_cache (cache_key, generation, value, computed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, generation, json.dumps(result), time.time()),
+        )
+        if not in_transaction:
+            conn.commit()
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        logger.debug(f"Threshold cache write skipped: {e}")
+    return result
+
+
+def cached_dynamic_thresholds(
+    ai_id: str,
+    db,
+    base_thresholds: dict | None = None,
+    min_transactions: int | None = None,
+    lookback: int | None = None,
+) -> dict:
+    """compute_dynamic_thresholds(), reused until calibration data or config changes.
+
+    Same arguments and result as compute_dynamic_thresholds. A cache hit is
+    one indexed read — no MCO config load, no Brier decomposition — so this
+    is what per-tool-call readers (sentinel gate, statusline) should use.
+    """
+    key_parts = [
+        "dynamic_thresholds", ai_id, base_thresholds, min_transactions, lookback,
+        _calibration_config_signature(),
+    ]
+    return cached_threshold(
+        db, key_parts,
+        lambda: compute_dynamic_thresholds(
+            ai_id, db,
+            base_thresholds=base_thresholds,
+            min_transactions=min_transactions,
+            lookback=lookback,
+        ),
+    )
+
+
 def get_brier_profile(
     ai_id: str,
     db,
@@ -93,6 +93,7 @@ def _build_insufficient_evidence_response(
         'sources_failed': bundle.sources_failed if bundle else [],
         'sources_empty': getattr(bundle, 'sources_empty', []) if bundle else [],
         'source_errors': getattr(bundle, 'source_errors', {}) if bundle else {},
+        'source_durations_ms': getattr(bundle, 'source_durations_ms', {}) if bundle else {},
         'grounded_coverage': round(grounded_coverage, 2),
         'calibration_score': None,
         'holistic_calibration_score': None,
@@ -155,36 +156,35 @@ class GroundedCalibrationManager:
         self.conn = db.conn
 
     def get_grounded_beliefs(self, ai_id: str) -> dict[str, GroundedBelief]:
-        """Get current grounded beliefs for an AI, most recent per vector."""
+        """Get current grounded beliefs for an AI, most recent per vector.
+
+        Reads grounded_beliefs_current, which a trigger on grounded_beliefs
+        keeps at the latest row per vector (migration 055).
+        """
         cursor = self.conn.cursor()
 
         cursor.execute("""
             SELECT vector_name, mean, variance, evidence_count,
                    last_observation, last_observation_source,
                    self_referential_mean, divergence, last_updated
-            FROM grounded_beliefs
+            FROM grounded_beliefs_current
             WHERE ai_id = ?
-            ORDER BY last_updated DESC
         """, (ai_id,))
 
         beliefs = {}
-        seen = set()
 
         for row in cursor.fetchall():
-            vector_name = row[0]
-            if vector_name not in seen:
-                beliefs[vector_name] = GroundedBelief(
-                    vector_name=vector_name,
-                    mean=row[1],
-                    variance=row[2],
-                    evidence_count=row[3],
-                    last_observation=row[4],
-                    last_observation_source=row[5],
-                    self_referential_mean=row[6],
-                    divergence=row[7],
-                    last_updated=row[8],
-                )
-                seen.add(vector_name)
+            beliefs[row[0]] = GroundedBelief(
+                vector_name=row[0],
+                mean=row[1],
+                variance=row[2],
+                evidence_count=row[3],
+                last_observation=row[4],
+                last_observation_source=row[5],
+                self_referential_mean=row[6],
+                divergence=row[7],
+                last_updated=row[8],
+            )
 
         # Fill defaults for missing groundable vectors
         for vector in self.TRACKED_VECTORS:
@@ -813,6 +813,7 @@ def _run_single_phase_verification(
         'sources_failed': bundle.sources_failed,
         'sources_empty': getattr(bundle, 'sources_empty', []),
         'source_errors': getattr(bundle, 'source_errors', {}),
+        'source_durations_ms': getattr(bundle, 'source_durations_ms', {}),
         'grounded_coverage': round(assessment.grounded_coverage, 2),
         'calibration_score': assessment.overall_calibration_score,
         'calibration_status': 'grounded',
@@ -1107,6 +1108,7 @@ def _build_verification_summary(
     total_evidence = 0
     all_sources: list[str] = []
     all_failed: list[str] = []
+    source_durations_ms: dict[str, int] = {}
     verification_ids = []
 
     for phase_name, phase_result in results.items():
@@ -1114,6 +1116,8 @@ def _build_verification_summary(
         all_sources.extend(phase_result['sources'])
         all_failed.extend(phase_result['sources_failed'])
         verification_ids.append(phase_result['verification_id'])
+        for source, ms in phase_result.get('source_durations_ms', {}).items():
+            source_durations_ms[f"{phase_name}:{source}"] = ms
         for v, gap in phase_result.get('_internal_gaps', {}).items():
             all_gaps[f"{phase_name}:{v}"] = gap
         for v, u in phase_result.get('_internal_updates', {}).items():
@@ -1168,6 +1172,7 @@ def _build_verification_summary(
         'sources': list(set(all_sources)),
         'sources_failed': list(set(all_failed)),
         # === Metadata (structural, not scores) ===
+        'source_durations_ms': source_durations_ms,
         'verification_ids': verification_ids,
         'phase_aware': phase_boundary is not None and phase_boundary.get("has_check", False),
         'phase_weights': phase_weights,
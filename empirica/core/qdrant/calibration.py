@@ -6,6 +6,8 @@ from __future__ import annotations
 from empirica.core.qdrant.collections import _calibration_collection
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
+    _create_collection,
     _get_embedding_safe,
     _get_qdrant_client,
     _get_qdrant_imports,
@@ -49,9 +51,9 @@ def embed_grounded_verification(
             return False
         coll = _calibration_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         # Build semantic text from calibration gaps for embedding
         gap_descriptions = []
@@ -128,9 +130,9 @@ def embed_calibration_trajectory(
             return False
         coll = _calibration_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         # Build semantic text for trajectory point
         improving = []
@@ -214,7 +216,7 @@ def search_calibration_patterns(
             return []
         coll = _calibration_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         vector = _get_embedding_safe(query)
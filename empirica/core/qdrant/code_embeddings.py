@@ -6,18 +6,23 @@ so agents can search "how do I ingest a voice sample" and get the actual functio
 signature, parameters, and module path.
 
 Uses AST parsing (no runtime imports needed) — works across projects safely.
+Parsed facts come from the shared, incremental AstIndex (empirica.core.ast_index).
 """
 from __future__ import annotations
 
-import ast
 import hashlib
+import os
 import time
 from pathlib import Path
 
+from empirica.core.ast_index import AstIndex, ModuleFacts
 from empirica.core.qdrant.collections import _eidetic_collection
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
+    _create_collection,
     _get_embedding_safe,
+    _get_embeddings_batch_for_collection,
     _get_qdrant_client,
     _get_qdrant_imports,
     _get_vector_size,
@@ -27,136 +32,57 @@ from empirica.core.qdrant.connection import (
 # Code embeddings go into the eidetic collection with fact_type="code_api"
 # This avoids collection bloat while keeping code searchable alongside facts.
 
+# Points per Qdrant upsert call (stays well under the 32MB request limit)
+_UPSERT_BATCH = 200
+# Below this many changed files, process-pool startup costs more than it saves
+_PARALLEL_MIN_FILES = 32
 
-def _extract_function_signature(node) -> dict:
-    """Extract function signature from AST node."""
-    params = []
-    for arg in node.args.args:
-        param = {"name": arg.arg}
-        if arg.annotation:
-            try:
-                param["type"] = ast.unparse(arg.annotation)
-            except Exception:
-                pass
-        params.append(param)
-
-    # Defaults (aligned from the right)
-    defaults = node.args.defaults
-    if defaults:
-        offset = len(params) - len(defaults)
-        for i, default in enumerate(defaults):
-            try:
-                params[offset + i]["default"] = ast.unparse(default)
-            except Exception:
-                pass
-
-    returns = ""
-    if node.returns:
-        try:
-            returns = ast.unparse(node.returns)
-        except Exception:
-            pass
-
-    docstring = ast.get_docstring(node) or ""
-
-    decorators = []
-    for dec in node.decorator_list:
-        try:
-            decorators.append(ast.unparse(dec))
-        except Exception:
-            if isinstance(dec, ast.Name):
-                decorators.append(dec.id)
-
-    return {
-        "name": node.name,
-        "params": params,
-        "returns": returns,
-        "docstring": docstring[:500],
-        "decorators": decorators,
-        "line": node.lineno,
-    }
-
-
-def _extract_class_info(node: ast.ClassDef) -> dict:
-    """Extract class info from AST node."""
-    methods = []
-    for item in node.body:
-        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            sig = _extract_function_signature(item)
-            methods.append(sig)
 
-    bases = []
-    for base in node.bases:
-        try:
-            bases.append(ast.unparse(base))
-        except Exception:
-            if isinstance(base, ast.Name):
-                bases.append(base.id)
-
-    docstring = ast.get_docstring(node) or ""
-
-    return {
-        "name": node.name,
-        "bases": bases,
-        "methods": methods,
-        "docstring": docstring[:500],
-        "line": node.lineno,
-    }
-
-
-def extract_module_api(file_path: Path, root_dir: Path | None = None) -> dict:
-    """
-    Extract the public API surface from a Python file using AST.
-
-    Returns dict with module_path, functions, classes, and a searchable text summary.
-    """
-    try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
-    except (SyntaxError, UnicodeDecodeError) as e:
-        logger.debug(f"Cannot parse {file_path}: {e}")
-        return {}
-
-    # Compute module path
+def _module_path(file_path: Path, root_dir: Path | None) -> str:
+    """Dotted module path of `file_path` relative to `root_dir` (stem without one)."""
     if root_dir:
         try:
             rel = file_path.relative_to(root_dir)
             module_path = str(rel).replace("/", ".").replace(".py", "")
-            if module_path.endswith(".__init__"):
-                module_path = module_path[:-9]
+            return module_path.removesuffix(".__init__")
         except ValueError:
-            module_path = file_path.stem
-    else:
-        module_path = file_path.stem
-
-    module_docstring = ast.get_docstring(tree) or ""
-
-    functions = []
-    classes = []
+            pass
+    return file_path.stem
 
-    for node in ast.iter_child_nodes(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if not node.name.startswith("_"):  # Public only
-                functions.append(_extract_function_signature(node))
-        elif isinstance(node, ast.ClassDef):
-            if not node.name.startswith("_"):
-                classes.append(_extract_class_info(node))
 
-    if not functions and not classes:
+def _module_api(facts: ModuleFacts | None, file_path: Path, root_dir: Path | None) -> dict:
+    """Module API dict from indexed AST facts ({} when unparseable or no public API)."""
+    if facts is None or not facts.parsed:
+        if facts is not None:
+            logger.debug(f"Cannot parse {file_path}: {facts.error}")
+        return {}
+    if not facts.functions and not facts.classes:
         return {}
 
-    search_text = _build_search_text(module_path, module_docstring, functions, classes)
+    module_path = _module_path(file_path, root_dir)
+    search_text = _build_search_text(module_path, facts.module_docstring, facts.functions, facts.classes)
 
     return {
         "module_path": module_path,
-        "module_docstring": module_docstring[:500],
-        "functions": functions,
-        "classes": classes,
+        "module_docstring": facts.module_docstring,
+        "functions": facts.functions,
+        "classes": facts.classes,
         "search_text": search_text,
         "file_path": str(file_path),
     }
 
 
+def extract_module_api(file_path: Path, root_dir: Path | None = None) -> dict:
+    """
+    Extract the public API surface from a Python file using AST.
+
+    Reads through the shared AstIndex, so an unchanged file isn't re-parsed.
+    Returns dict with module_path, functions, classes, and a searchable text summary.
+    """
+    index = AstIndex.for_root(root_dir or file_path.parent)
+    return _module_api(index.get(file_path), file_path, root_dir)
+
+
 def _build_search_text(module_path: str, module_docstring: str,
                        functions: list, classes: list) -> str:
     """Build a searchable text summary from extracted module API."""
@@ -191,6 +117,44 @@ def _build_search_text(module_path: str, module_docstring: str,
     return "\n".join(summary_parts)
 
 
+def _code_point_id(module_path: str) -> int:
+    """Stable Qdrant point id for a module's code_api fact."""
+    return int(hashlib.md5(f"code_api:{module_path}".encode()).hexdigest()[:15], 16)
+
+
+def _module_content_hash(module_info: dict) -> str:
+    """Hash of the module's search text; unchanged hash → embedding is current."""
+    return hashlib.md5(module_info["search_text"].encode()).hexdigest()
+
+
+def _build_code_payload(module_info: dict, content_hash: str) -> dict:
+    """Structured payload for a module's code_api point."""
+    search_text = module_info["search_text"]
+    module_path = module_info["module_path"]
+    now = time.time()
+    return {
+        "type": "code_api",
+        "content": search_text[:500],
+        "content_full": search_text if len(search_text) <= 2000 else search_text[:2000],
+        "content_hash": content_hash,
+        "domain": module_path,
+        "confidence": 0.9,  # Code structure is objective
+        "confirmation_count": 1,
+        "first_seen": now,
+        "last_confirmed": now,
+        "source_sessions": [],
+        "source_findings": [],
+        "tags": ["code_api", module_path.split(".")[0]],
+        # Code-specific fields
+        "module_path": module_path,
+        "file_path": module_info.get("file_path", ""),
+        "function_count": len(module_info.get("functions", [])),
+        "class_count": len(module_info.get("classes", [])),
+        "function_names": [f["name"] for f in module_info.get("functions", [])],
+        "class_names": [c["name"] for c in module_info.get("classes", [])],
+    }
+
+
 def embed_code_api(
     project_id: str,
     module_info: dict,
@@ -199,7 +163,8 @@ def embed_code_api(
     Embed a module's API surface into eidetic memory as fact_type='code_api'.
 
     Stored in the eidetic collection alongside regular facts, but filterable
-    by type='code_api' and domain=module_path.
+    by type='code_api' and domain=module_path. For whole projects use
+    embed_project_code, which batches and skips unchanged modules.
     """
     if not _check_qdrant_available():
         return False
@@ -213,45 +178,17 @@ def embed_code_api(
             return False
 
         coll = _eidetic_collection(project_id)
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(
+            _create_collection(client, coll, vectors_config=VectorParams(
                 size=vector_size, distance=Distance.COSINE))
 
-        search_text = module_info["search_text"]
-        vector = _get_embedding_safe(search_text)
+        vector = _get_embedding_safe(module_info["search_text"])
         if vector is None:
             return False
 
-        module_path = module_info["module_path"]
-        content_hash = hashlib.md5(search_text.encode()).hexdigest()
-        fact_id = f"code_api:{module_path}"
-
-        # Structured payload for rich retrieval
-        payload = {
-            "type": "code_api",
-            "content": search_text[:500],
-            "content_full": search_text if len(search_text) <= 2000 else search_text[:2000],
-            "content_hash": content_hash,
-            "domain": module_path,
-            "confidence": 0.9,  # Code structure is objective
-            "confirmation_count": 1,
-            "first_seen": time.time(),
-            "last_confirmed": time.time(),
-            "source_sessions": [],
-            "source_findings": [],
-            "tags": ["code_api", module_path.split(".")[0]],
-            # Code-specific fields
-            "module_path": module_path,
-            "file_path": module_info.get("file_path", ""),
-            "function_count": len(module_info.get("functions", [])),
-            "class_count": len(module_info.get("classes", [])),
-            "function_names": [f["name"] for f in module_info.get("functions", [])],
-            "class_names": [c["name"] for c in module_info.get("classes", [])],
-        }
-
-        point_id = int(hashlib.md5(fact_id.encode()).hexdigest()[:15], 16)
-        point = PointStruct(id=point_id, vector=vector, payload=payload)
+        payload = _build_code_payload(module_info, _module_content_hash(module_info))
+        point = PointStruct(id=_code_point_id(module_info["module_path"]), vector=vector, payload=payload)
         client.upsert(collection_name=coll, points=[point])
         return True
     except Exception as e:
@@ -277,7 +214,7 @@ def search_code_api(
         if client is None:
             return []
         coll = _eidetic_collection(project_id)
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         vector = _get_embedding_safe(query)
@@ -314,6 +251,43 @@ def search_code_api(
         return []
 
 
+def _extract_modules(py_files: list[Path], root_dir: Path) -> list[dict]:
+    """Module APIs for `py_files` from the project's AST index.
+
+    Only files changed since the last run are parsed, in a process pool
+    for large batches. Workers default to os.cpu_count();
+    EMPIRICA_CODE_EMBED_WORKERS=1 forces in-process parsing.
+    """
+    workers = int(os.environ.get("EMPIRICA_CODE_EMBED_WORKERS", "0")) or None
+    facts = AstIndex.for_root(root_dir).update(py_files, workers=workers, parallel_min=_PARALLEL_MIN_FILES)
+    return [_module_api(f, path, root_dir) for f, path in zip(facts, py_files)]
+
+
+def _existing_code_hashes(client, coll: str) -> dict[str, str]:
+    """module_path → content_hash of every code_api point already in the collection."""
+    from qdrant_client.models import FieldCondition, Filter, MatchValue
+
+    hashes: dict[str, str] = {}
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=coll,
+            scroll_filter=Filter(must=[
+                FieldCondition(key="type", match=MatchValue(value="code_api"))
+            ]),
+            limit=1000,
+            offset=offset,
+            with_payload=["module_path", "content_hash"],
+            with_vectors=False,
+        )
+        for point in points:
+            payload = point.payload or {}
+            if payload.get("module_path"):
+                hashes[payload["module_path"]] = payload.get("content_hash", "")
+        if offset is None:
+            return hashes
+
+
 def embed_project_code(
     project_id: str,
     root_dir: Path,
@@ -323,31 +297,95 @@ def embed_project_code(
     """
     Extract and embed all Python module API surfaces for a project.
 
-    Returns summary dict with counts.
+    Incremental: modules whose stored content_hash matches the freshly
+    extracted API are left alone. Changed modules are embedded in batches
+    (EMPIRICA_EMBED_BATCH_SIZE, default 50) and upserted in chunks over one
+    client, so a rebuild costs a handful of round-trips instead of several
+    per module.
+
+    Returns summary dict with counts:
+        files_scanned, modules_embedded, unchanged (hash matched),
+        skipped (no public API), errors, duration_ms
     """
+    start = time.perf_counter()
     exclude = exclude_patterns or ["__pycache__", ".git", "node_modules", ".venv", "venv"]
 
     py_files = list(root_dir.glob(glob_pattern))
     py_files = [f for f in py_files if not any(ex in str(f) for ex in exclude)]
 
-    embedded = 0
+    modules = []
     skipped = 0
-    errors = 0
-
-    for py_file in py_files:
-        module_info = extract_module_api(py_file, root_dir)
-        if not module_info:
-            skipped += 1
-            continue
-
-        if embed_code_api(project_id, module_info):
-            embedded += 1
+    for module_info in _extract_modules(py_files, root_dir):
+        if module_info and module_info.get("search_text"):
+            modules.append(module_info)
         else:
-            errors += 1
+            skipped += 1
 
-    return {
+    result = {
         "files_scanned": len(py_files),
-        "modules_embedded": embedded,
+        "modules_embedded": 0,
+        "unchanged": 0,
         "skipped": skipped,
-        "errors": errors,
+        "errors": 0,
     }
+
+    def _done() -> dict:
+        result["duration_ms"] = int((time.perf_counter() - start) * 1000)
+        return result
+
+    if not modules:
+        return _done()
+
+    client = _get_qdrant_client() if _check_qdrant_available() else None
+    if client is None:
+        result["errors"] = len(modules)
+        return _done()
+
+    coll = _eidetic_collection(project_id)
+    try:
+        existing = _existing_code_hashes(client, coll) if _collection_exists(client, coll) else {}
+    except Exception as e:
+        logger.debug(f"Could not read stored code_api hashes for {coll}: {e}")
+        existing = {}
+
+    changed = []
+    for module_info in modules:
+        content_hash = _module_content_hash(module_info)
+        if existing.get(module_info["module_path"]) == content_hash:
+            result["unchanged"] += 1
+        else:
+            changed.append((module_info, content_hash))
+
+    _, _, _, PointStruct = _get_qdrant_imports()
+    embed_batch_size = int(os.environ.get("EMPIRICA_EMBED_BATCH_SIZE", "50"))
+    points = []
+    for i in range(0, len(changed), embed_batch_size):
+        batch = changed[i:i + embed_batch_size]
+        try:
+            vectors = _get_embeddings_batch_for_collection(
+                client, coll, [m["search_text"] for m, _ in batch], create_if_missing=True,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to embed code API batch for {project_id}: {e}")
+            result["errors"] += len(batch)
+            continue
+        for (module_info, content_hash), vector in zip(batch, vectors):
+            if vector is None:
+                result["errors"] += 1
+                continue
+            points.append(PointStruct(
+                id=_code_point_id(module_info["module_path"]),
+                vector=vector,
+                payload=_build_code_payload(module_info, content_hash),
+            ))
+
+    for i in range(0, len(points), _UPSERT_BATCH):
+        batch = points[i:i + _UPSERT_BATCH]
+        try:
+            client.upsert(collection_name=coll, points=batch)
+            result["modules_embedded"] += len(batch)
+        except Exception as e:
+            logger.warning(f"Failed to upsert code API batch for {project_id}: {e}")
+            result["errors"] += len(batch)
+
+    return _done()
@@ -23,6 +23,9 @@ __all__ = [
 
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
+    _create_collection,
+    _delete_collection,
     _get_qdrant_client,
     _get_qdrant_imports,
     _get_vector_size,
@@ -123,9 +126,9 @@ def init_global_collection() -> bool:
         if client is None:
             return False
         coll = _global_learnings_collection()
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
             logger.info(f"Created global_learnings collection with vector size {vector_size}")
         return True
     except Exception as e:
@@ -154,12 +157,13 @@ def recreate_collection(collection_name: str) -> bool:
         vector_size = _get_vector_size()
 
         # Delete if exists
-        if client.collection_exists(collection_name):
-            client.delete_collection(collection_name)
+        if _collection_exists(client, collection_name):
+            _delete_collection(client, collection_name)
             logger.info(f"Deleted collection {collection_name}")
 
         # Create with new dimensions
-        client.create_collection(
+        _create_collection(
+            client,
             collection_name,
             vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE)
         )
@@ -270,7 +274,7 @@ def cleanup_empty_collections(dry_run: bool = True) -> dict:
         if not dry_run:
             for name in empty:
                 try:
-                    client.delete_collection(name)
+                    _delete_collection(client, name)
                     deleted.append(name)
                     logger.info(f"Deleted empty collection: {name}")
                 except Exception as e:
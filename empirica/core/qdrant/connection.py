@@ -3,11 +3,16 @@ Qdrant connection infrastructure and embedding utilities.
 
 This module is OPTIONAL. Empirica core works without Qdrant.
 Set EMPIRICA_ENABLE_EMBEDDINGS=true to enable semantic search features.
+Without a Qdrant server, EMPIRICA_QDRANT_EMBEDDED opts into an embedded,
+in-process store (qdrant-client local mode) behind the same client API.
 """
 from __future__ import annotations
 
 import logging
 import os
+import threading
+import time
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +20,9 @@ logger = logging.getLogger(__name__)
 # by other qdrant modules (vector_store, calibration, decay, memory, etc.)
 __all__ = [
     "_check_qdrant_available",
+    "_collection_exists",
+    "_create_collection",
+    "_delete_collection",
     "_extract_vector_size",
     "_get_embedding_for_collection",
     "_get_embedding_safe",
@@ -24,6 +32,8 @@ __all__ = [
     "_get_qdrant_client",
     "_get_qdrant_imports",
     "_get_vector_size",
+    "_invalidate_collection_meta",
+    "_local_store_path",
     "_rest_search",
 ]
 
@@ -31,6 +41,25 @@ __all__ = [
 _qdrant_available = None
 _qdrant_warned = False
 
+# Process-wide client pool keyed by (client class, url). qdrant-client keeps
+# a keep-alive HTTP session per instance, so reusing one avoids a connection
+# setup on every call.
+_client_pool: dict[tuple[object, str], object] = {}
+_pool_lock = threading.Lock()
+_DEFAULT_URL = "http://localhost:6333"
+# A successful localhost probe is trusted this long before probing again
+_LOCALHOST_RECHECK_SECONDS = 30.0
+_localhost_verified_at = 0.0
+# Embedded store paths already reported as locked by another process
+_embedded_lock_warned: set[str] = set()
+
+# Collection existence/config per client: {name: (expires_at, exists, vector_size)}.
+# Creates and deletes made through this module update it immediately; changes
+# made by other processes are picked up after EMPIRICA_QDRANT_META_TTL seconds.
+_collection_meta: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_meta_lock = threading.Lock()
+_DEFAULT_META_TTL = 30.0
+
 
 class CollectionDimensionMismatchError(RuntimeError):
     """Raised when an existing Qdrant collection and embeddings provider disagree."""
@@ -137,24 +166,112 @@ def _extract_vector_size(vectors_config) -> int | None:
     return None
 
 
+def _meta_ttl() -> float:
+    try:
+        return float(os.getenv("EMPIRICA_QDRANT_META_TTL", _DEFAULT_META_TTL))
+    except ValueError:
+        return _DEFAULT_META_TTL
+
+
+def _client_meta(client) -> dict | None:
+    """The metadata map for `client` (None if the client can't be weakly keyed)."""
+    try:
+        return _collection_meta.setdefault(client, {})
+    except TypeError:
+        return None
+
+
+def _remember_collection(client, collection_name: str, exists: bool, vector_size: int | None = None) -> None:
+    with _meta_lock:
+        meta = _client_meta(client)
+        if meta is not None:
+            meta[collection_name] = (time.monotonic() + _meta_ttl(), exists, vector_size)
+
+
+def _cached_collection(client, collection_name: str) -> tuple[bool, int | None] | None:
+    with _meta_lock:
+        meta = _client_meta(client)
+        entry = meta.get(collection_name) if meta is not None else None
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1], entry[2]
+
+
+def _invalidate_collection_meta(client=None, collection_name: str | None = None) -> None:
+    """Forget cached collection metadata — for one collection, one client, or all."""
+    with _meta_lock:
+        if client is None:
+            _collection_meta.clear()
+            return
+        meta = _client_meta(client)
+        if meta is None:
+            return
+        if collection_name is None:
+            meta.clear()
+        else:
+            meta.pop(collection_name, None)
+
+
+def _collection_exists(client, collection_name: str) -> bool:
+    """`client.collection_exists`, answered from the TTL'd metadata cache."""
+    cached = _cached_collection(client, collection_name)
+    if cached is not None:
+        return cached[0]
+    exists = bool(client.collection_exists(collection_name))
+    _remember_collection(client, collection_name, exists)
+    return exists
+
+
+def _create_collection(client, collection_name: str, **kwargs) -> bool:
+    """`client.create_collection` that keeps the metadata cache current.
+
+    A create that fails because another process created the collection
+    first (possible while our cache still says "missing") is treated as done.
+    """
+    try:
+        created = client.create_collection(collection_name, **kwargs)
+    except Exception:
+        _invalidate_collection_meta(client, collection_name)
+        if _collection_exists(client, collection_name):
+            return False
+        raise
+    _remember_collection(client, collection_name, True)
+    return created
+
+
+def _delete_collection(client, collection_name: str) -> bool:
+    """`client.delete_collection` that keeps the metadata cache current."""
+    try:
+        return client.delete_collection(collection_name)
+    finally:
+        _invalidate_collection_meta(client, collection_name)
+
+
 def _get_collection_vector_size(client, collection_name: str) -> int | None:
-    """Read the configured vector size for an existing Qdrant collection."""
+    """Read the configured vector size for an existing Qdrant collection (cached)."""
+    cached = _cached_collection(client, collection_name)
+    if cached is not None and cached[0] and cached[1] is not None:
+        return cached[1]
     try:
         coll_info = client.get_collection(collection_name)
         vectors_config = coll_info.config.params.vectors
-        return _extract_vector_size(vectors_config)
+        vector_size = _extract_vector_size(vectors_config)
     except Exception as e:
         logger.debug(f"Could not read collection dimensions for {collection_name}: {e}")
         return None
+    _remember_collection(client, collection_name, True, vector_size)
+    return vector_size
 
 
 def _create_collection_with_size(client, collection_name: str, vector_size: int) -> None:
     """Create a single-vector cosine collection with the resolved dimension."""
     _, Distance, VectorParams, _ = _get_qdrant_imports()
-    client.create_collection(
-        collection_name=collection_name,
+    _create_collection(
+        client,
+        collection_name,
         vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
     )
+    _remember_collection(client, collection_name, True, vector_size)
 
 
 def _ensure_collection_matches_vector(
@@ -165,7 +282,7 @@ def _ensure_collection_matches_vector(
     create_if_missing: bool = False,
 ) -> bool:
     """Ensure a collection exists with the same dimension as the resolved embeddings."""
-    if client.collection_exists(collection_name):
+    if _collection_exists(client, collection_name):
         existing_size = _get_collection_vector_size(client, collection_name)
         if existing_size is not None and existing_size != vector_size:
             provider_context = _get_provider_context()
@@ -236,8 +353,60 @@ def _get_embeddings_batch_for_collection(
     return vectors
 
 
+def _pooled_client(client_cls, url: str | None = None, path: str | None = None):
+    """The process-wide client for (client_cls, url or path), created on first use."""
+    key = (client_cls, url or f"path:{path}")
+    with _pool_lock:
+        client = _client_pool.get(key)
+        if client is None:
+            client = client_cls(url=url) if url else client_cls(path=path)
+            _client_pool[key] = client
+        return client
+
+
+def _local_store_path() -> str | None:
+    """Directory of the embedded Qdrant store, or None unless EMPIRICA_QDRANT_EMBEDDED enables it.
+
+    on|true|1 selects ~/.empirica/qdrant_local; any other value is a path,
+    anchored at ~/.empirica when relative (never the current working
+    directory). EMPIRICA_QDRANT_PATH is not read: older docs pointed it at
+    ./.qdrant_data, which must not silently switch a server setup to an
+    empty embedded store.
+    """
+    value = os.getenv("EMPIRICA_QDRANT_EMBEDDED", "").strip()
+    if not value or value.lower() in ("off", "false", "0", "no"):
+        return None
+    from pathlib import Path
+
+    from empirica.config.path_resolver import get_global_empirica_home
+    home = get_global_empirica_home()
+    if value.lower() in ("on", "true", "1", "yes"):
+        return str(home / "qdrant_local")
+    path = Path(value).expanduser()
+    return str(path if path.is_absolute() else home / path)
+
+
+def _reset_client_pool() -> None:
+    """Drop pooled clients and cached collection metadata (tests, config changes)."""
+    global _localhost_verified_at
+    with _pool_lock:
+        clients = list(_client_pool.values())
+        _client_pool.clear()
+        _localhost_verified_at = 0.0
+        _embedded_lock_warned.clear()
+    _invalidate_collection_meta()
+    for client in clients:
+        try:
+            client.close()  # releases an embedded store's lock
+        except Exception as e:
+            logger.debug(f"Closing pooled Qdrant client failed: {e}")
+
+
 def _get_qdrant_client(qdrant_url: str | None = None):
-    """Get Qdrant client with lazy imports.
+    """Get the shared Qdrant client with lazy imports.
+
+    Clients are pooled per URL for the life of the process, so repeated
+    calls reuse one keep-alive connection instead of building a new client.
 
     Args:
         qdrant_url: Optional per-request URL override. When provided, connect
@@ -250,31 +419,56 @@ def _get_qdrant_client(qdrant_url: str | None = None):
     Priority:
     1. `qdrant_url` argument (explicit per-request URL)
     2. EMPIRICA_QDRANT_URL environment variable (explicit URL)
-    3. localhost:6333 if Qdrant server is running
-
-    Returns None if no Qdrant server is available. File-based storage was
-    removed (#45) because it creates incompatible storage formats, causes
-    lock conflicts with concurrent processes, and uses CWD-relative paths.
+    3. EMPIRICA_QDRANT_EMBEDDED store (in-process, no server)
+    4. localhost:6333 if Qdrant server is running
+
+    Returns None if no Qdrant is available. The embedded store is opt-in and
+    avoids what got the old file-based storage removed (#45): its path never
+    depends on the CWD, one pooled client per process holds the store's lock,
+    and its contents are rebuildable from SQLite with rebuild_qdrant_from_db().
+    While another process (an MCP server, the hook daemon) holds the lock,
+    this warns once and falls through to the localhost server.
     """
+    global _localhost_verified_at
     QdrantClient, _, _, _ = _get_qdrant_imports()
 
     # Priority 1: Per-request URL (cortex per-org routing)
     if qdrant_url:
-        return QdrantClient(url=qdrant_url)
+        return _pooled_client(QdrantClient, qdrant_url)
 
     # Priority 2: Module default from env
     url = os.getenv("EMPIRICA_QDRANT_URL")
     if url:
-        return QdrantClient(url=url)
-
-    # Priority 3: Check if Qdrant server is running on localhost:6333
-    default_url = "http://localhost:6333"
+        return _pooled_client(QdrantClient, url)
+
+    # Priority 3: Embedded store — vectors searched in-process, persisted locally
+    local_path = _local_store_path()
+    if local_path:
+        try:
+            return _pooled_client(QdrantClient, path=local_path)
+        except Exception as e:
+            if local_path not in _embedded_lock_warned:
+                _embedded_lock_warned.add(local_path)
+                logger.warning(
+                    f"Embedded Qdrant store at {local_path} is unavailable ({e}). "
+                    "It allows one process at a time; run a Qdrant server and set "
+                    "EMPIRICA_QDRANT_URL to share vectors between processes. "
+                    "Trying localhost:6333 instead."
+                )
+
+    # Priority 4: Check if Qdrant server is running on localhost:6333
+    # (skipped while a pooled localhost client was verified recently)
+    default_url = _DEFAULT_URL
+    if ((QdrantClient, default_url) in _client_pool
+            and time.monotonic() - _localhost_verified_at < _LOCALHOST_RECHECK_SECONDS):
+        return _client_pool[(QdrantClient, default_url)]
     try:
         import urllib.request
         req = urllib.request.Request(f"{default_url}/collections", method='GET')
         with urllib.request.urlopen(req, timeout=1) as resp:
             if resp.status == 200:
-                return QdrantClient(url=default_url)
+                _localhost_verified_at = time.monotonic()
+                return _pooled_client(QdrantClient, default_url)
     except Exception:
         pass  # Server not available
 
@@ -10,6 +10,7 @@ from empirica.core.qdrant.collections import (
 )
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
     _get_qdrant_client,
     logger,
 )
@@ -39,10 +40,10 @@ def decay_eidetic_fact(
             return False
         coll = _eidetic_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return False
 
-        from qdrant_client.models import FieldCondition, Filter, MatchValue, PointStruct
+        from qdrant_client.models import FieldCondition, Filter, MatchValue
 
         results = client.scroll(
             collection_name=coll,
@@ -51,7 +52,7 @@ def decay_eidetic_fact(
             ),
             limit=1,
             with_payload=True,
-            with_vectors=True,
+            with_vectors=False,
         )
 
         points, _ = results
@@ -59,16 +60,19 @@ def decay_eidetic_fact(
             return False
 
         point = points[0]
-        payload = point.payload
+        payload = point.payload or {}
         old_confidence = payload.get("confidence", 0.5)
         new_confidence = max(min_confidence, old_confidence - decay_amount)
 
-        payload["confidence"] = new_confidence
-        payload["last_decayed"] = _time.time()
-        payload["decay_reason"] = reason or "contradicted by finding"
-
-        updated_point = PointStruct(id=point.id, vector=point.vector, payload=payload)
-        client.upsert(collection_name=coll, points=[updated_point])
+        client.set_payload(
+            collection_name=coll,
+            payload={
+                "confidence": new_confidence,
+                "last_decayed": _time.time(),
+                "decay_reason": reason or "contradicted by finding",
+            },
+            points=[point.id],
+        )
 
         logger.info(f"Decayed eidetic fact: {old_confidence:.2f} → {new_confidence:.2f} ({reason or 'finding'})")
         return True
@@ -150,10 +154,10 @@ def propagate_lesson_confidence_to_qdrant(
             return False
         coll = _memory_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return False
 
-        from qdrant_client.models import FieldCondition, Filter, MatchValue, PointStruct
+        from qdrant_client.models import FieldCondition, Filter, MatchValue
 
         # Find lesson by type + text content match
         results = client.scroll(
@@ -162,8 +166,8 @@ def propagate_lesson_confidence_to_qdrant(
                 must=[FieldCondition(key="type", match=MatchValue(value="lesson"))]
             ),
             limit=50,  # Scan lessons
-            with_payload=True,
-            with_vectors=True,
+            with_payload=["text"],
+            with_vectors=False,
         )
 
         points, _ = results
@@ -171,13 +175,12 @@ def propagate_lesson_confidence_to_qdrant(
             text = point.payload.get("text", "")
             # Match by lesson name appearing in embedded text
             if lesson_name.lower() in text.lower():
-                payload = point.payload
-                payload["confidence"] = new_confidence
                 import time as _time
-                payload["confidence_synced_at"] = _time.time()
-
-                updated = PointStruct(id=point.id, vector=point.vector, payload=payload)
-                client.upsert(collection_name=coll, points=[updated])
+                client.set_payload(
+                    collection_name=coll,
+                    payload={"confidence": new_confidence, "confidence_synced_at": _time.time()},
+                    points=[point.id],
+                )
                 logger.debug(f"Synced lesson '{lesson_name}' confidence to {new_confidence:.2f} in Qdrant")
                 return True
 
@@ -247,6 +250,17 @@ def auto_sync_session_to_global(
         return 0
 
 
+# A collection is decayed at most once per this many seconds (its high-water
+# mark); staleness moves ~0.006/day at the default 180-day horizon, well
+# under the 0.05 change that triggers an update.
+_STALENESS_PASS_INTERVAL = 86400
+# Only rewrite staleness when it moved by more than this
+_STALENESS_EPSILON = 0.05
+# Point ids per set_payload operation, and operations per update request
+_SET_PAYLOAD_IDS = 500
+_SET_PAYLOAD_OPS = 100
+
+
 def apply_staleness_signal(
     project_id: str,
     max_age_days: int = 180,
@@ -257,6 +271,10 @@ def apply_staleness_signal(
     Items are NOT deleted — staleness_factor is informational for retrieval
     ranking. Formula: staleness = min(1.0, age_days / max_age_days).
 
+    Payload-only: points are scrolled without vectors and updated with
+    set_payload, grouped by their new staleness value. A per-collection
+    high-water mark skips collections already decayed within the last day.
+
     Also updates assumption urgency via update_assumption_urgency().
 
     Returns number of items updated.
@@ -271,18 +289,26 @@ def apply_staleness_signal(
             return 0
         coll = _memory_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return 0
 
-        all_points = _scroll_all_points(client, coll)
         now = _time.time()
-        batch = _compute_staleness_updates(all_points, now, period_days, max_age_days)
-        updated = len(batch)
-
-        # Batch upsert
-        if batch:
-            for i in range(0, len(batch), 50):
-                client.upsert(collection_name=coll, points=batch[i:i+50])
+        updated = 0
+        marks = _load_decay_marks()
+        if now - marks.get(coll, 0.0) >= _STALENESS_PASS_INTERVAL:
+            points = _scroll_all_points(
+                client, coll,
+                scroll_filter=_staleness_candidates_filter(now, max_age_days),
+                payload_fields=["timestamp", "staleness_factor"],
+            )
+            groups = _compute_staleness_updates(points, now, period_days, max_age_days)
+            _set_payload_groups(client, coll, {
+                (("staleness_factor", value), ("staleness_updated_at", now)): ids
+                for value, ids in groups.items()
+            })
+            updated = sum(len(ids) for ids in groups.values())
+            marks[coll] = now
+            _save_decay_marks(marks)
 
         # Also update assumption urgency
         assumption_updated = update_assumption_urgency(project_id)
@@ -296,17 +322,61 @@ def apply_staleness_signal(
         return 0
 
 
-def _scroll_all_points(client, coll):
-    """Scroll all points from a Qdrant collection."""
+def _decay_marks_path():
+    from empirica.config.path_resolver import get_global_empirica_home
+    return get_global_empirica_home() / "cache" / "decay_marks.json"
+
+
+def _load_decay_marks() -> dict[str, float]:
+    """Per-collection time of the last staleness pass ({} if unreadable)."""
+    import json
+    try:
+        marks = json.loads(_decay_marks_path().read_text())
+    except (OSError, ValueError):
+        return {}
+    return marks if isinstance(marks, dict) else {}
+
+
+def _save_decay_marks(marks: dict[str, float]) -> None:
+    import json
+    import os
+    path = _decay_marks_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(marks, sort_keys=True))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Could not record decay marks: {e}")
+
+
+def _staleness_candidates_filter(now: float, max_age_days: int):
+    """Exclude points whose staleness can't have moved past the update threshold.
+
+    Points already at 1.0 stay there, and points rewritten within the last
+    _STALENESS_EPSILON * max_age_days days have drifted less than the threshold.
+    """
+    from qdrant_client.models import FieldCondition, Filter, Range
+
+    fresh_since = now - _STALENESS_EPSILON * max_age_days * 86400
+    return Filter(must_not=[
+        FieldCondition(key="staleness_factor", range=Range(gte=1.0)),
+        FieldCondition(key="staleness_updated_at", range=Range(gte=fresh_since)),
+    ])
+
+
+def _scroll_all_points(client, coll, scroll_filter=None, payload_fields=None):
+    """Scroll all points (payload only, optionally just `payload_fields`)."""
     all_points = []
     offset = None
     while True:
         results = client.scroll(
             collection_name=coll,
-            limit=100,
+            scroll_filter=scroll_filter,
+            limit=256,
             offset=offset,
-            with_payload=True,
-            with_vectors=True,
+            with_payload=payload_fields or True,
+            with_vectors=False,
         )
         points, next_offset = results
         all_points.extend(points)
@@ -316,6 +386,23 @@ def _scroll_all_points(client, coll):
     return all_points
 
 
+def _set_payload_groups(client, coll, groups) -> None:
+    """Apply set_payload per group of point ids, batching the operations.
+
+    `groups` maps a payload (as a tuple of (key, value) pairs) to the ids
+    that receive it.
+    """
+    from qdrant_client.models import SetPayload, SetPayloadOperation
+
+    operations = [
+        SetPayloadOperation(set_payload=SetPayload(payload=dict(payload), points=ids[i:i + _SET_PAYLOAD_IDS]))
+        for payload, ids in groups.items()
+        for i in range(0, len(ids), _SET_PAYLOAD_IDS)
+    ]
+    for i in range(0, len(operations), _SET_PAYLOAD_OPS):
+        client.batch_update_points(collection_name=coll, update_operations=operations[i:i + _SET_PAYLOAD_OPS])
+
+
 def _parse_timestamp(ts) -> float | None:
     """Parse a timestamp value to float. Returns None if unparseable."""
     if isinstance(ts, str):
@@ -327,13 +414,12 @@ def _parse_timestamp(ts) -> float | None:
     return float(ts)
 
 
-def _compute_staleness_updates(all_points, now, period_days, max_age_days):
-    """Compute staleness updates for points that need updating."""
-    from qdrant_client.models import PointStruct
-
-    batch = []
+def _compute_staleness_updates(all_points, now, period_days, max_age_days) -> dict[float, list]:
+    """Group ids of points needing an update by their new rounded staleness."""
+    groups: dict[float, list] = {}
     for point in all_points:
-        ts = point.payload.get("timestamp")
+        payload = point.payload or {}
+        ts = payload.get("timestamp")
         if not ts:
             continue
 
@@ -346,15 +432,12 @@ def _compute_staleness_updates(all_points, now, period_days, max_age_days):
             continue
 
         new_staleness = min(1.0, age_days / max_age_days)
-        old_staleness = point.payload.get("staleness_factor", 0.0)
+        old_staleness = payload.get("staleness_factor", 0.0)
 
-        if abs(new_staleness - old_staleness) > 0.05:
-            payload = point.payload
-            payload["staleness_factor"] = round(new_staleness, 3)
-            payload["staleness_updated_at"] = now
-            batch.append(PointStruct(id=point.id, vector=point.vector, payload=payload))
+        if abs(new_staleness - old_staleness) > _STALENESS_EPSILON:
+            groups.setdefault(round(new_staleness, 3), []).append(point.id)
 
-    return batch
+    return groups
 
 
 def update_assumption_urgency(
@@ -378,50 +461,43 @@ def update_assumption_urgency(
             return 0
         coll = _assumptions_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return 0
 
-        from qdrant_client.models import PointStruct
-
         results = client.scroll(
             collection_name=coll,
             limit=200,
-            with_payload=True,
-            with_vectors=True,
+            with_payload=["status", "timestamp", "confidence", "urgency_signal"],
+            with_vectors=False,
         )
 
         points, _ = results
         now = _time.time()
         updated = 0
-        batch = []
+        groups: dict[tuple, list] = {}
 
         for point in points:
-            status = point.payload.get("status", "unverified")
-            ts = point.payload.get("timestamp", now)
-            confidence = point.payload.get("confidence", 0.5)
+            payload = point.payload or {}
+            status = payload.get("status", "unverified")
+            ts = payload.get("timestamp", now)
+            confidence = payload.get("confidence", 0.5)
 
             if status != "unverified":
                 # Resolved: urgency should be 0
-                if point.payload.get("urgency_signal", 0) != 0:
-                    payload = point.payload
-                    payload["urgency_signal"] = 0.0
-                    batch.append(PointStruct(id=point.id, vector=point.vector, payload=payload))
+                if payload.get("urgency_signal", 0) != 0:
+                    groups.setdefault((("urgency_signal", 0.0),), []).append(point.id)
                     updated += 1
                 continue
 
             age_days = (now - float(ts)) / 86400
             new_urgency = min(1.0, (age_days / max_age_days) * (1.0 - confidence))
-            old_urgency = point.payload.get("urgency_signal", 0.0)
+            old_urgency = payload.get("urgency_signal", 0.0)
 
             if abs(new_urgency - old_urgency) > 0.05:
-                payload = point.payload
-                payload["urgency_signal"] = round(new_urgency, 3)
-                batch.append(PointStruct(id=point.id, vector=point.vector, payload=payload))
+                groups.setdefault((("urgency_signal", round(new_urgency, 3)),), []).append(point.id)
                 updated += 1
 
-        if batch:
-            for i in range(0, len(batch), 50):
-                client.upsert(collection_name=coll, points=batch[i:i+50])
+        _set_payload_groups(client, coll, groups)
 
         return updated
     except Exception as e:
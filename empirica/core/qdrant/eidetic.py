@@ -6,6 +6,8 @@ from __future__ import annotations
 from empirica.core.qdrant.collections import _eidetic_collection
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
+    _create_collection,
     _get_embedding_safe,
     _get_qdrant_client,
     _get_qdrant_imports,
@@ -48,9 +50,9 @@ def embed_eidetic(
         coll = _eidetic_collection(project_id)
 
         # Ensure collection exists
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         vector = _get_embedding_safe(content)
         if vector is None:
@@ -115,7 +117,7 @@ def search_eidetic(
             return []
         coll = _eidetic_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         vector = _get_embedding_safe(query)
@@ -196,7 +198,7 @@ def confirm_eidetic_fact(
             return False
         coll = _eidetic_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return False
 
         from qdrant_client.models import FieldCondition, Filter, MatchValue
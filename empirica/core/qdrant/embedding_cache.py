@@ -0,0 +1,223 @@
+"""
+Persistent, content-addressed embedding cache.
+
+The same text is embedded many times across one workflow — a finding during
+`rebuild_qdrant_from_db`, again in `embed_eidetic`, again in
+`sync_high_impact_to_global`; the same prompt for tool-router relevance and
+pattern retrieval; unchanged modules during code embedding. EmbeddingsProvider
+consults this cache from both `embed` and `batch_embed` so each distinct text
+reaches the provider once.
+
+Storage: one SQLite file (default ~/.empirica/cache/embeddings.db, shared by
+every project since entries are content-addressed). Vectors are float32
+blobs keyed by sha256(provider, model, normalized text), where normalization
+collapses whitespace and NULs the way the Ollama prompt preparation does.
+
+Eviction: least-recently-used rows are deleted once the stored vectors
+exceed EMPIRICA_EMBEDDINGS_CACHE_MB (default 256). Hits refresh last_used.
+
+ENV:
+- EMPIRICA_EMBEDDINGS_CACHE: cache file path, or off|false|0 to disable
+- EMPIRICA_EMBEDDINGS_CACHE_MB: size bound in MB (default: 256)
+
+Every SQLite or filesystem error degrades to a cache miss — the cache never
+fails an embed.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 256
+# Evict down to this fraction of the bound so eviction doesn't run every put
+_EVICT_TARGET = 0.9
+# Re-check the stored size after this many inserted vectors
+_SIZE_CHECK_EVERY = 256
+# SQLite's default host-parameter limit is 999 on older builds
+_SQL_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key BLOB PRIMARY KEY,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Whitespace- and NUL-insensitive form of `text` used for cache keys."""
+    return " ".join((text or "").replace("\x00", " ").split())
+
+
+def cache_key(provider: str, model: str, text: str) -> bytes:
+    """Content address of one (provider, model, text) embedding."""
+    return hashlib.sha256(
+        f"{provider}\x00{model}\x00{normalize_text(text)}".encode()
+    ).digest()
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """Size-bounded LRU store of float32 vectors in SQLite."""
+
+    def __init__(self, path: str | Path, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._puts_since_check = _SIZE_CHECK_EVERY  # check on the first put
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, list[float]]:
+        """Cached vectors for the keys that are present; refreshes their recency."""
+        unique = list(dict.fromkeys(keys))
+        found: dict[bytes, list[float]] = {}
+        if unique:
+            try:
+                with self._lock:
+                    conn = self._connect()
+                    for i in range(0, len(unique), _SQL_CHUNK):
+                        chunk = unique[i:i + _SQL_CHUNK]
+                        marks = ",".join("?" * len(chunk))
+                        for key, blob in conn.execute(
+                            f"SELECT key, vector FROM embeddings WHERE key IN ({marks})", chunk,
+                        ):
+                            found[bytes(key)] = _unpack(blob)
+                    if found:
+                        now = time.time()
+                        conn.executemany(
+                            "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                            [(now, key) for key in found],
+                        )
+                        conn.commit()
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Embedding cache read failed ({self.path}): {e}")
+                found = {}
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def get(self, key: bytes) -> list[float] | None:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: dict[bytes, list[float]]) -> None:
+        """Store vectors, evicting least-recently-used rows past the size bound."""
+        if not items:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                    [(key, _pack(vector), now) for key, vector in items.items()],
+                )
+                self._puts_since_check += len(items)
+                if self._puts_since_check >= _SIZE_CHECK_EVERY:
+                    self._puts_since_check = 0
+                    self._evict(conn)
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Embedding cache write failed ({self.path}): {e}")
+            if self._conn is not None:
+                try:
+                    self._conn.rollback()
+                except sqlite3.Error:
+                    pass
+
+    def put(self, key: bytes, vector: list[float]) -> None:
+        self.put_many({key: vector})
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        count, stored = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+        ).fetchone()
+        if stored <= self.max_bytes or not count:
+            return
+        average = stored / count
+        excess = stored - self.max_bytes * _EVICT_TARGET
+        conn.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+            (max(1, int(excess / average) + 1),),
+        )
+
+    def stats(self) -> dict:
+        """Hit/miss counters for this process plus the stored entry count and size."""
+        entries = stored = 0
+        try:
+            with self._lock:
+                entries, stored = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings"
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Embedding cache stats unavailable ({self.path}): {e}")
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "bytes": stored,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def open_embedding_cache() -> EmbeddingCache | None:
+    """The cache configured by env, or None when disabled."""
+    location = os.getenv("EMPIRICA_EMBEDDINGS_CACHE", "").strip()
+    if location.lower() in ("off", "false", "0", "no"):
+        return None
+    if not location:
+        from empirica.config.path_resolver import get_global_empirica_home
+        location = str(get_global_empirica_home() / "cache" / "embeddings.db")
+    try:
+        max_mb = float(os.getenv("EMPIRICA_EMBEDDINGS_CACHE_MB", str(DEFAULT_MAX_MB)))
+    except ValueError:
+        max_mb = DEFAULT_MAX_MB
+    return EmbeddingCache(location, max_bytes=int(max_mb * 1024 * 1024))
+
+
+__all__ = [
+    "EmbeddingCache",
+    "cache_key",
+    "normalize_text",
+    "open_embedding_cache",
+]
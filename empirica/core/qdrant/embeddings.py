@@ -9,6 +9,11 @@ ENV:
 - OPENAI_API_KEY (for provider=openai)
 - JINA_API_KEY (for provider=jina)
 - VOYAGE_API_KEY (for provider=voyage)
+- EMPIRICA_EMBEDDINGS_CACHE: embedding cache path, or off to disable
+  (default: ~/.empirica/cache/embeddings.db — see embedding_cache.py)
+- EMPIRICA_EMBEDDINGS_CACHE_MB: cache size bound, LRU-evicted (default: 256)
+- EMPIRICA_EMBEDDINGS_CONCURRENCY: parallel batch requests to hosted
+  providers (default: 4)
 
 Providers:
 - auto: Auto-detect best available (ollama if running, else local)
@@ -24,11 +29,40 @@ import logging
 import os
 import time
 
+from .embedding_cache import EmbeddingCache, cache_key, open_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 # Cache for Ollama availability check
 _ollama_available: bool | None = None
 
+# Hosted REST providers: endpoint, extra request fields, max inputs per request
+_HOSTED_ENDPOINTS = {
+    "jina": ("https://api.jina.ai/v1/embeddings", {"encoding_type": "float"}, 128),
+    "voyage": ("https://api.voyageai.com/v1/embeddings", {"input_type": "document"}, 128),  # or "query"
+}
+# OpenAI accepts up to 2048 inputs; smaller requests parallelize better
+_OPENAI_BATCH = 256
+_DEFAULT_CONCURRENCY = 4
+# Throttled/unavailable responses are retried with exponential backoff
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+_RETRIES = 3
+_BACKOFF_SECONDS = 0.5
+# Rejections one bad input can cause; a failing batch is split to isolate it
+_INPUT_ERROR_STATUS = frozenset({400, 413, 422})
+
+
+def _concurrency() -> int:
+    try:
+        return max(1, int(os.getenv("EMPIRICA_EMBEDDINGS_CONCURRENCY", _DEFAULT_CONCURRENCY)))
+    except ValueError:
+        return _DEFAULT_CONCURRENCY
+
+
+def _input_error(exc: Exception) -> bool:
+    """True if a failed batch request may have been rejected for one of its inputs."""
+    return getattr(getattr(exc, "response", None), "status_code", None) in _INPUT_ERROR_STATUS
+
 try:
     from openai import OpenAI  # type: ignore
 except Exception:  # pragma: no cover
@@ -183,6 +217,12 @@ class EmbeddingsProvider:
     # Type declarations for conditional attributes
     _jina_api_key: str | None = None
     _voyage_api_key: str | None = None
+    _cache: EmbeddingCache | None = None
+    # Keep-alive HTTP session for the hosted REST providers (jina, voyage)
+    _session = None
+    # Bumped whenever a provider call degrades to the local hash; such
+    # vectors are never written to the embedding cache.
+    _fallbacks: int = 0
 
     def __init__(self) -> None:
         """Initialize embeddings provider based on environment configuration.
@@ -255,12 +295,41 @@ class EmbeddingsProvider:
         else:
             raise RuntimeError(f"Unsupported provider '{self.provider}'. Set EMPIRICA_EMBEDDINGS_PROVIDER=openai|ollama|jina|voyage|local|auto")
 
+        # The local hash is cheaper to recompute than to look up
+        if self.provider != "local":
+            self._cache = open_embedding_cache()
+
         logger.debug(f"Embeddings provider: {self.provider}, model: {self.model}")
 
+    def _cache_key(self, text: str) -> bytes:
+        return cache_key(self.provider, self.model, text)
+
+    def _fallback_hash(self, text: str) -> list[float]:
+        """Local-hash vector standing in for a failed provider call (not cached)."""
+        self._fallbacks += 1
+        return self._embed_local_hash(text)
+
     def embed(self, text: str) -> list[float]:
-        """Generate embedding vector for the given text using configured provider."""
-        text = text or ""
+        """Generate embedding vector for the given text using configured provider.
 
+        Served from the embedding cache when this provider/model has already
+        embedded the same (whitespace-normalized) text.
+        """
+        text = text or ""
+        if self._cache is None:
+            return self._embed_uncached(text)
+
+        key = self._cache_key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        fallbacks = self._fallbacks
+        vector = self._embed_uncached(text)
+        if vector and self._fallbacks == fallbacks:
+            self._cache.put(key, vector)
+        return vector
+
+    def _embed_uncached(self, text: str) -> list[float]:
         if self.provider == "openai":
             resp = self._client.embeddings.create(model=self.model, input=text)  # type: ignore
             return resp.data[0].embedding  # type: ignore
@@ -268,11 +337,8 @@ class EmbeddingsProvider:
         if self.provider == "ollama":
             return self._embed_ollama(text)
 
-        if self.provider == "jina":
-            return self._embed_jina(text)
-
-        if self.provider == "voyage":
-            return self._embed_voyage(text)
+        if self.provider in _HOSTED_ENDPOINTS:
+            return self._embed_hosted(text)
 
         if self.provider == "local":
             return self._embed_local_hash(text)
@@ -314,7 +380,7 @@ class EmbeddingsProvider:
                         time.sleep(0.4 * attempt)
                         continue
                     logger.warning(f"Ollama returned empty embedding for model {self.model}")
-                    return self._embed_local_hash(text)
+                    return self._fallback_hash(text)
 
                 # Validate and cache actual vector size from model response
                 actual_size = len(embedding)
@@ -338,7 +404,7 @@ class EmbeddingsProvider:
 
             except requests.exceptions.ConnectionError:
                 logger.warning(f"Cannot connect to Ollama at {self.ollama_url} - falling back to local hash")
-                return self._embed_local_hash(text)
+                return self._fallback_hash(text)
             except Exception as e:
                 if attempt < len(prompt_sizes):
                     logger.warning(
@@ -347,20 +413,123 @@ class EmbeddingsProvider:
                     time.sleep(0.4 * attempt)
                     continue
                 logger.warning(f"Ollama embedding failed: {e} - falling back to local hash")
-                return self._embed_local_hash(text)
+                return self._fallback_hash(text)
 
         # Unreachable in practice (prompt_sizes is non-empty), but satisfies type checker
-        return self._embed_local_hash(text)
+        return self._fallback_hash(text)
 
     def batch_embed(self, texts: list[str], max_chars: int = 1200) -> list[list[float] | None]:
-        """Batch embed multiple texts. Returns list of vectors (None for failures)."""
+        """Batch embed multiple texts. Returns list of vectors (None for failures).
+
+        Uses each provider's native batch endpoint (requests for hosted
+        providers run concurrently). Shares the embedding cache with embed():
+        only texts not cached yet (deduplicated) are sent to the provider.
+        """
+        if self.provider == "local":
+            return [self.embed(t) for t in texts]
+        if self._cache is None:
+            return self._batch_embed_uncached(texts, max_chars)[0]
+
+        keys = [self._cache_key(t) for t in texts]
+        vectors = self._cache.get_many(keys)
+        pending = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        if pending:
+            fresh, uncacheable = self._batch_embed_uncached(list(pending.values()), max_chars)
+            vectors.update({key: vec for key, vec in zip(pending, fresh) if vec})
+            self._cache.put_many({
+                key: vec for i, (key, vec) in enumerate(zip(pending, fresh))
+                if vec and i not in uncacheable
+            })
+        return [vectors.get(key) for key in keys]
+
+    def _batch_embed_uncached(
+        self, texts: list[str], max_chars: int,
+    ) -> tuple[list[list[float] | None], set[int]]:
+        """Embed `texts` → (vectors, positions batch_embed must not cache).
+
+        Excluded positions hold local-hash stand-ins, or vectors embed()
+        produced (and cached itself, if genuine).
+        """
         if self.provider == "ollama":
             return self._batch_embed_ollama(texts, max_chars)
-        # Fallback: sequential for non-Ollama providers
-        return [self.embed(t) for t in texts]
+        if self.provider == "openai":
+            return self._embed_chunks(texts, _OPENAI_BATCH, self._openai_batch, degrade=False)
+        if self.provider in _HOSTED_ENDPOINTS:
+            return self._embed_chunks(texts, _HOSTED_ENDPOINTS[self.provider][2], self._post_embeddings)
+        return [self.embed(t) for t in texts], set(range(len(texts)))
+
+    def _embed_chunks(
+        self, texts: list[str], batch_size: int, send, degrade: bool = True,
+    ) -> tuple[list[list[float] | None], set[int]]:
+        """Send `texts` in chunks of `batch_size`, up to EMPIRICA_EMBEDDINGS_CONCURRENCY at once.
+
+        With `degrade`, failures become local-hash stand-ins, whose positions
+        are returned so they stay out of the cache. `send` already retried
+        throttling, 5xx and connection errors, so such a chunk is not
+        re-requested. A chunk rejected for its input (400/413/422, or a short
+        response) is split in halves until the offending text is isolated.
+        Without `degrade` (OpenAI) errors propagate, as they do from embed().
+        """
+        chunks = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+
+        def run(chunk):
+            try:
+                got = send(chunk)
+            except Exception as e:
+                if not degrade:
+                    raise
+                error, split = e, _input_error(e)
+            else:
+                if len(got) == len(chunk):
+                    return got, set()
+                error, split = f"expected {len(chunk)} vectors, got {len(got)}", True
+            if split and len(chunk) > 1:
+                mid = len(chunk) // 2
+                head, head_failed = run(chunk[:mid])
+                tail, tail_failed = run(chunk[mid:])
+                return head + tail, head_failed | {mid + i for i in tail_failed}
+            logger.warning(f"{self.provider} embedding of {len(chunk)} text(s) failed: {error} — falling back to local hash")
+            return [None] * len(chunk), set(range(len(chunk)))
+
+        workers = min(_concurrency(), len(chunks))
+        if workers <= 1:
+            results = [run(chunk) for chunk in chunks]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(run, chunks))
 
-    def _batch_embed_ollama(self, texts: list[str], max_chars: int = 1200) -> list[list[float] | None]:
-        """Batch embed using Ollama /api/embed endpoint (accepts input list)."""
+        if self._vector_size is None:
+            self._vector_size = next(
+                (len(v) for got, _ in results for v in got if v), None)
+
+        vectors: list[list[float] | None] = []
+        fallback: set[int] = set()
+        for chunk, (got, failed) in zip(chunks, results):
+            if failed:
+                self._fallbacks += 1
+                got = [self._embed_local_hash(t) if i in failed else v
+                       for i, (t, v) in enumerate(zip(chunk, got))]
+                fallback.update(len(vectors) + i for i in failed)
+            vectors.extend(got)
+        return vectors, fallback
+
+    def _openai_batch(self, texts: list[str]) -> list[list[float]]:
+        # The OpenAI client keeps its own connection pool and retries
+        resp = self._client.embeddings.create(model=self.model, input=texts)  # type: ignore
+        return [d.embedding for d in sorted(resp.data, key=lambda d: d.index)]  # type: ignore
+
+    def cache_stats(self) -> dict | None:
+        """Embedding cache hit/miss and size stats, or None when uncached."""
+        return self._cache.stats() if self._cache is not None else None
+
+    def _batch_embed_ollama(
+        self, texts: list[str], max_chars: int = 1200,
+    ) -> tuple[list[list[float] | None], set[int]]:
+        """Batch embed using Ollama /api/embed endpoint (accepts input list).
+
+        Returns (vectors, positions not to cache) like _batch_embed_uncached.
+        """
         import requests
 
         url = f"{self.ollama_url}/api/embed"
@@ -388,82 +557,84 @@ class EmbeddingsProvider:
                     logger.info(f"Ollama {self.model} vector size: {self._vector_size}")
                     break
 
-            return embeddings
+            return embeddings, set()
         except Exception as e:
             logger.warning(f"Batch embed failed: {e} — falling back to sequential")
-            return [self.embed(t) for t in texts]
-
-    def _embed_jina(self, text: str) -> list[float]:
-        """Embed using Jina AI API (jina-embeddings-v3, etc.)."""
+            self._fallbacks += 1
+            return [self.embed(t) for t in texts], set(range(len(texts)))
+
+    def _http(self):
+        """Keep-alive session for the hosted REST provider, created on first use."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_concurrency())
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            api_key = self._jina_api_key if self.provider == "jina" else self._voyage_api_key
+            session.headers.update({
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            })
+            self._session = session
+        return self._session
+
+    def _post_embeddings(self, texts: list[str]) -> list[list[float] | None]:
+        """POST one batch to the hosted provider's embeddings endpoint.
+
+        Throttled (429) and 5xx responses and connection errors are retried
+        with exponential backoff (honouring Retry-After). Returns vectors in
+        input order; raises requests.RequestException once retries run out.
+        """
         import requests
 
-        url = "https://api.jina.ai/v1/embeddings"
-        headers = {
-            "Authorization": f"Bearer {self._jina_api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "model": self.model,
-            "input": [text],
-            "encoding_type": "float"
-        }
-
-        try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=30)
+        url, extra, _ = _HOSTED_ENDPOINTS[self.provider]
+        payload = {"model": self.model, "input": texts, **extra}
+        for attempt in range(_RETRIES):
+            last = attempt == _RETRIES - 1
+            try:
+                resp = self._http().post(url, json=payload, timeout=30)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if last:
+                    raise
+                time.sleep(_BACKOFF_SECONDS * 2 ** attempt)
+                continue
+            if resp.status_code in _RETRY_STATUS and not last:
+                try:
+                    delay = min(float(resp.headers.get("Retry-After", "")), 30.0)
+                except ValueError:
+                    delay = _BACKOFF_SECONDS * 2 ** attempt
+                time.sleep(delay)
+                continue
             resp.raise_for_status()
-            data = resp.json()
-            embedding = data.get("data", [{}])[0].get("embedding", [])
-
-            if not embedding:
-                logger.warning(f"Jina returned empty embedding for model {self.model}")
-                return self._embed_local_hash(text)
-
-            # Cache vector size
-            if self._vector_size is None:
-                self._vector_size = len(embedding)
-                logger.info(f"Jina {self.model} vector size: {self._vector_size}")
+            data = sorted(resp.json().get("data", []), key=lambda d: d.get("index", 0))
+            return [d.get("embedding") or None for d in data]
+        return []  # unreachable: the last attempt returns or raises
 
-            return embedding
-
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Jina embedding failed: {e} - falling back to local hash")
-            return self._embed_local_hash(text)
-
-    def _embed_voyage(self, text: str) -> list[float]:
-        """Embed using Voyage AI API (voyage-3.5, voyage-3-lite, etc.)."""
+    def _embed_hosted(self, text: str) -> list[float]:
+        """Embed one text with Jina AI (jina-embeddings-v3, ...) or Voyage AI (voyage-3.5, ...)."""
         import requests
 
-        url = "https://api.voyageai.com/v1/embeddings"
-        headers = {
-            "Authorization": f"Bearer {self._voyage_api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "model": self.model,
-            "input": [text],
-            "input_type": "document"  # or "query" for search queries
-        }
-
+        name = self.provider.capitalize()
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-            embedding = data.get("data", [{}])[0].get("embedding", [])
-
-            if not embedding:
-                logger.warning(f"Voyage returned empty embedding for model {self.model}")
-                return self._embed_local_hash(text)
+            vectors = self._post_embeddings([text])
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"{name} embedding failed: {e} - falling back to local hash")
+            return self._fallback_hash(text)
 
-            # Cache vector size
-            if self._vector_size is None:
-                self._vector_size = len(embedding)
-                logger.info(f"Voyage {self.model} vector size: {self._vector_size}")
+        embedding = vectors[0] if vectors else None
+        if not embedding:
+            logger.warning(f"{name} returned empty embedding for model {self.model}")
+            return self._fallback_hash(text)
 
-            return embedding
+        # Cache vector size
+        if self._vector_size is None:
+            self._vector_size = len(embedding)
+            logger.info(f"{name} {self.model} vector size: {self._vector_size}")
 
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Voyage embedding failed: {e} - falling back to local hash")
-            return self._embed_local_hash(text)
+        return embedding
 
     def _embed_local_hash(self, text: str) -> list[float]:
         """Simple hashing embedding for testing/fallback (no external deps).
@@ -6,6 +6,8 @@ from __future__ import annotations
 from empirica.core.qdrant.collections import _episodic_collection
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
+    _create_collection,
     _get_embedding_safe,
     _get_qdrant_client,
     _get_qdrant_imports,
@@ -48,9 +50,9 @@ def embed_episodic(
             return False
         coll = _episodic_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         vector = _get_embedding_safe(narrative)
         if vector is None:
@@ -140,7 +142,7 @@ def search_episodic(
             return []
         coll = _episodic_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         vector = _get_embedding_safe(query)
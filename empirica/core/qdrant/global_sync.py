@@ -11,6 +11,8 @@ from empirica.core.qdrant.collections import (
 )
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
+    _create_collection,
     _get_embedding_safe,
     _get_qdrant_client,
     _get_qdrant_imports,
@@ -47,9 +49,9 @@ def embed_to_global(
         coll = _global_learnings_collection()
 
         # Ensure collection exists
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         vector = _get_embedding_safe(text)
         if vector is None:
@@ -110,7 +112,7 @@ def search_global(
             return []
         coll = _global_learnings_collection()
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         # Build filter if needed
@@ -422,9 +424,9 @@ def embed_dead_end_with_branch_context(
         coll = _memory_collection(project_id)
 
         # Ensure collection exists
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         # Rich text for embedding - captures what was tried and why it failed
         text = f"Dead end approach: {approach}\nWhy failed: {why_failed}"
@@ -494,7 +496,7 @@ def search_similar_dead_ends(
             return []
         coll = _memory_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         # Filter for dead_end type only
@@ -8,6 +8,8 @@ import json
 from empirica.core.qdrant.collections import _goals_collection
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
+    _create_collection,
     _get_embedding_safe,
     _get_qdrant_client,
     _get_qdrant_imports,
@@ -69,9 +71,9 @@ def embed_goal(
         coll = _goals_collection(project_id)
 
         # Ensure collection exists
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         # Build rich text for embedding - combines objective, description, criteria
         text_parts = [objective]
@@ -170,9 +172,9 @@ def embed_subtask(
         coll = _goals_collection(project_id)
 
         # Ensure collection exists
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         # Build rich text for embedding - combines subtask + goal context
         text_parts = [description]
@@ -254,7 +256,7 @@ def search_goals(
             return []
         coll = _goals_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         vector = _get_embedding_safe(query)
@@ -340,7 +342,7 @@ def update_goal_status(
             return False
         coll = _goals_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return False
 
         import hashlib
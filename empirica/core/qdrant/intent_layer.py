@@ -11,6 +11,8 @@ from empirica.core.qdrant.collections import (
 )
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
+    _create_collection,
     _get_embedding_safe,
     _get_qdrant_client,
     _get_qdrant_imports,
@@ -53,10 +55,10 @@ def embed_assumption(
             return False
         coll = _assumptions_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
             from qdrant_client.models import Distance
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         ts = timestamp or _time.time()
         # Urgency: increases with age for unverified assumptions
@@ -129,10 +131,10 @@ def embed_decision(
             return False
         coll = _decisions_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
             from qdrant_client.models import Distance
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         # Rich text for embedding: choice + rationale + alternatives
         embed_text = f"{choice}. Rationale: {rationale}"
@@ -208,10 +210,10 @@ def embed_intent_edge(
             return False
         coll = _intents_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             vector_size = _get_vector_size()
             from qdrant_client.models import Distance
-            client.create_collection(coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
+            _create_collection(client, coll, vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE))
 
         # Rich text for semantic search over intent reasoning
         embed_text = (
@@ -279,7 +281,7 @@ def search_assumptions(
             return []
         coll = _assumptions_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         vector = _get_embedding_safe(query)
@@ -352,7 +354,7 @@ def search_decisions(
             return []
         coll = _decisions_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         vector = _get_embedding_safe(query)
@@ -418,7 +420,7 @@ def search_intents(
             return []
         coll = _intents_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         vector = _get_embedding_safe(query)
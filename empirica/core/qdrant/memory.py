@@ -14,6 +14,7 @@ from empirica.core.qdrant.collections import (
 )
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
     _get_embedding_for_collection,
     _get_embeddings_batch_for_collection,
     _get_qdrant_client,
@@ -174,7 +175,7 @@ def upsert_memory(project_id: str, items: list[dict], qdrant_url: str | None = N
                 client,
                 coll,
                 batch_texts,
-                create_if_missing=not client.collection_exists(coll),
+                create_if_missing=not _collection_exists(client, coll),
             )
             vectors.extend(batch_vectors)
 
@@ -334,7 +335,7 @@ def _search_single_collection(client, coll_fn, project_id, query_text,
     """Search a single Qdrant collection via client, returning formatted results."""
     try:
         coll_name = coll_fn(project_id)
-        if not client.collection_exists(coll_name):
+        if not _collection_exists(client, coll_name):
             return []
         qvec = _get_embedding_for_collection(client, coll_name, query_text, create_if_missing=False)
         if qvec is None:
@@ -356,7 +357,7 @@ def _rest_search_collection(client, coll_fn, project_id, query_text, fields, lim
                             qdrant_url=None):
     """Search a single collection via REST fallback."""
     coll_name = coll_fn(project_id)
-    if client.collection_exists(coll_name):
+    if _collection_exists(client, coll_name):
         qvec = _get_embedding_for_collection(client, coll_name, query_text, create_if_missing=False)
     else:
         qvec = None
@@ -95,8 +95,9 @@ def compute_time_gap_info(last_session_timestamp: float | None = None) -> dict[s
 
 
 def get_qdrant_url() -> str | None:
-    """Check if Qdrant is configured."""
-    return os.getenv("EMPIRICA_QDRANT_URL")
+    """Check if Qdrant is configured (server URL, or the embedded store's path)."""
+    from .connection import _local_store_path
+    return os.getenv("EMPIRICA_QDRANT_URL") or _local_store_path()
 
 
 def _search_memory_by_type(
@@ -110,47 +111,75 @@ def _search_memory_by_type(
     Search memory collection filtered by type.
     Returns empty list if Qdrant not available (optional behavior).
     """
+    return _search_memory_types(project_id, {memory_type: (query_text, limit)}, min_score)[memory_type]
+
+
+def _search_memory_types(
+    project_id: str,
+    searches: dict[str, tuple[str, int]],
+    min_score: float = DEFAULT_THRESHOLD
+) -> dict[str, list[dict]]:
+    """
+    Run several type-filtered memory searches in one round trip.
+
+    `searches` maps memory_type -> (query_text, limit). The distinct query
+    texts are embedded in one batch and every search goes out in a single
+    query_batch_points request; results come back keyed by memory_type.
+    Types that can't be searched get an empty list (optional behavior).
+    """
+    results: dict[str, list[dict]] = {memory_type: [] for memory_type in searches}
     try:
-        from .vector_store import _check_qdrant_available, _get_embedding_safe, _get_qdrant_client, _memory_collection
+        from .vector_store import (
+            _check_qdrant_available,
+            _collection_exists,
+            _get_embeddings_batch,
+            _get_qdrant_client,
+            _memory_collection,
+        )
 
-        if not _check_qdrant_available():
-            return []
+        if not searches or not _check_qdrant_available():
+            return results
 
-        qvec = _get_embedding_safe(query_text)
-        if qvec is None:
-            return []
+        texts = list(dict.fromkeys(query_text for query_text, _ in searches.values()))
+        vectors = dict(zip(texts, _get_embeddings_batch(texts)))
+        types = [t for t, (query_text, _) in searches.items() if vectors.get(query_text) is not None]
+        if not types:
+            return results
 
-        from qdrant_client.models import FieldCondition, Filter, MatchValue
+        from qdrant_client.models import FieldCondition, Filter, MatchValue, QueryRequest
         client = _get_qdrant_client()
         coll = _memory_collection(project_id)
 
-        if not client.collection_exists(coll):
-            return []
+        if not _collection_exists(client, coll):
+            return results
 
-        query_filter = Filter(must=[
-            FieldCondition(key="type", match=MatchValue(value=memory_type))
-        ])
-
-        results = client.query_points(
+        responses = client.query_batch_points(
             collection_name=coll,
-            query=qvec,
-            query_filter=query_filter,
-            limit=limit,
-            with_payload=True
+            requests=[
+                QueryRequest(
+                    query=vectors[searches[t][0]],
+                    filter=Filter(must=[FieldCondition(key="type", match=MatchValue(value=t))]),
+                    limit=searches[t][1],
+                    with_payload=True,
+                )
+                for t in types
+            ],
         )
 
-        # Filter by min_score and return
-        return [
-            {
-                "score": getattr(r, 'score', 0.0) or 0.0,
-                **(r.payload or {})
-            }
-            for r in results.points
-            if (getattr(r, 'score', 0.0) or 0.0) >= min_score
-        ]
+        # Filter by min_score per type
+        for memory_type, response in zip(types, responses):
+            results[memory_type] = [
+                {
+                    "score": getattr(r, 'score', 0.0) or 0.0,
+                    **(r.payload or {})
+                }
+                for r in response.points
+                if (getattr(r, 'score', 0.0) or 0.0) >= min_score
+            ]
+        return results
     except Exception as e:
-        logger.debug(f"_search_memory_by_type({memory_type}) failed: {e}")
-        return []
+        logger.debug(f"_search_memory_types({', '.join(searches)}) failed: {e}")
+        return results
 
 
 def _search_related_docs(
@@ -166,7 +195,13 @@ def _search_related_docs(
     Returns list of related docs with path, description, and relevance score.
     """
     try:
-        from .vector_store import _check_qdrant_available, _docs_collection, _get_embedding_safe, _get_qdrant_client
+        from .vector_store import (
+            _check_qdrant_available,
+            _collection_exists,
+            _docs_collection,
+            _get_embedding_safe,
+            _get_qdrant_client,
+        )
 
         if not _check_qdrant_available():
             return []
@@ -178,7 +213,7 @@ def _search_related_docs(
         client = _get_qdrant_client()
         coll = _docs_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         results = client.query_points(
@@ -450,15 +485,23 @@ def retrieve_task_patterns(
     # Adaptive limits: scale retrieval depth by vector state
     limits = _compute_adaptive_limits(vectors, limit)
 
-    # Search for lessons (procedural knowledge). Over-fetch, then recency-rerank
-    # with confidence as the longevity modulator so stale lessons sink.
-    lessons_raw = _search_memory_by_type(
+    # Lessons, dead ends and findings share the memory collection: one batched
+    # embed + one query_batch_points request instead of three round trips.
+    # Findings use task_context itself, so the follow-up searches below
+    # (eidetic, goals, assumptions, ...) find its embedding already cached.
+    memory_hits = _search_memory_types(
         project_id,
-        f"How to: {task_context}",
-        "lesson",
-        limits["lessons"] * _RECENCY_OVERFETCH,
-        threshold
+        {
+            "lesson": (f"How to: {task_context}", limits["lessons"] * _RECENCY_OVERFETCH),
+            "dead_end": (f"Approach for: {task_context}", limits["dead_ends"]),
+            "finding": (task_context, limits["findings"] * _RECENCY_OVERFETCH),
+        },
+        threshold,
     )
+
+    # Lessons (procedural knowledge): over-fetched, then recency-reranked
+    # with confidence as the longevity modulator so stale lessons sink.
+    lessons_raw = memory_hits["lesson"]
     lessons_ranked = _apply_recency_rerank(
         lessons_raw, limits["lessons"], modulator_key="confidence", ts_key="timestamp")
     lessons = [
@@ -474,14 +517,8 @@ def retrieve_task_patterns(
         for l in lessons_ranked
     ]
 
-    # Search for dead ends (what NOT to try)
-    dead_ends_raw = _search_memory_by_type(
-        project_id,
-        f"Approach for: {task_context}",
-        "dead_end",
-        limits["dead_ends"],
-        threshold
-    )
+    # Dead ends (what NOT to try)
+    dead_ends_raw = memory_hits["dead_end"]
     dead_ends = [
         {
             "approach": d.get("text", "").replace("DEAD END: ", "").split(" Why failed:")[0] if d.get("text") else "",
@@ -491,15 +528,9 @@ def retrieve_task_patterns(
         for d in dead_ends_raw
     ]
 
-    # Search for relevant findings (high-impact facts). Over-fetch, then re-rank
+    # Relevant findings (high-impact facts): over-fetched, then re-ranked
     # by recency at read-time so stale findings sink below fresh relevant ones.
-    findings_raw = _search_memory_by_type(
-        project_id,
-        task_context,
-        "finding",
-        limits["findings"] * _RECENCY_OVERFETCH,
-        threshold
-    )
+    findings_raw = memory_hits["finding"]
     findings_ranked = _apply_recency_rerank(
         findings_raw, limits["findings"], modulator_key="impact", ts_key="timestamp")
     relevant_findings = [
@@ -690,7 +721,13 @@ def search_lessons_for_task(
         List of lessons with name, description, domain, confidence, score
     """
     try:
-        from .vector_store import _check_qdrant_available, _get_embedding_safe, _get_qdrant_client, _memory_collection
+        from .vector_store import (
+            _check_qdrant_available,
+            _collection_exists,
+            _get_embedding_safe,
+            _get_qdrant_client,
+            _memory_collection,
+        )
 
         if not _check_qdrant_available():
             return []
@@ -703,7 +740,7 @@ def search_lessons_for_task(
         client = _get_qdrant_client()
         coll = _memory_collection(project_id)
 
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         # Build filter
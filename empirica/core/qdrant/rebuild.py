@@ -356,4 +356,11 @@ def rebuild_qdrant_from_db() -> dict:
     except Exception as e:
         results['global_collections'] = {'error': str(e)}
 
+    # Repeated texts across projects/collections are served from the cache
+    try:
+        from empirica.core.qdrant.embeddings import get_embedding_provider
+        results['embedding_cache'] = get_embedding_provider().cache_stats()
+    except Exception as e:
+        logger.debug(f"Embedding cache stats unavailable: {e}")
+
     return results
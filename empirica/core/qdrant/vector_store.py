@@ -50,7 +50,9 @@ from empirica.core.qdrant.collections import (  # noqa: F401
 )
 from empirica.core.qdrant.connection import (  # noqa: F401
     _check_qdrant_available,
+    _collection_exists,
     _get_embedding_safe,
+    _get_embeddings_batch,
     _get_qdrant_client,
     _get_qdrant_imports,
     _get_vector_size,
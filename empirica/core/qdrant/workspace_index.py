@@ -16,6 +16,8 @@ from typing import Any
 
 from empirica.core.qdrant.connection import (
     _check_qdrant_available,
+    _collection_exists,
+    _create_collection,
     _get_embedding_safe,
     _get_qdrant_client,
     _get_qdrant_imports,
@@ -34,9 +36,10 @@ def _workspace_index_collection() -> str:
 def _ensure_collection(client, Distance, VectorParams) -> bool:
     """Lazy-create workspace_index collection if absent."""
     coll = _workspace_index_collection()
-    if not client.collection_exists(coll):
+    if not _collection_exists(client, coll):
         vector_size = _get_vector_size()
-        client.create_collection(
+        _create_collection(
+            client,
             coll,
             vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
         )
@@ -176,7 +179,7 @@ def search_workspace_index(
             return []
 
         coll = _workspace_index_collection()
-        if not client.collection_exists(coll):
+        if not _collection_exists(client, coll):
             return []
 
         # Build Qdrant filter
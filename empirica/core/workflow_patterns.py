@@ -9,12 +9,15 @@ Architecture:
 - Patterns surfaced as findings via CLI or at session start
 
 Algorithm (inspired by Zoku, adapted for Empirica):
-1. Extract contiguous subsequences (length 3-10)
-2. Normalize: tool_name + phase only (ignore targets for matching)
-3. Count distinct transactions per subsequence
-4. Filter: appears in 2+ transactions
-5. Remove strict subsets of longer patterns
-6. Rank by frequency then length
+1. Normalize: tool_name + phase only (ignore targets for matching)
+2. Mine contiguous subsequences (length 3-10) level by level: each
+   length-k subsequence is identified by its (k-1)-length prefix and suffix
+   classes, so counting is one pass over the positions still in play
+3. Count distinct transactions per subsequence; positions whose prefix or
+   suffix is below 2 transactions are pruned from the next level
+4. Keep only closed patterns: drop a pattern when a one-step longer
+   extension appears in the same number of transactions
+5. Rank by frequency then length
 
 Suggestion Engine (Layer 3 — epistemic-correlated):
 - Joins tool_trace with PREFLIGHT/POSTFLIGHT vectors per transaction
@@ -63,6 +66,15 @@ class WorkflowPattern:
         }
 
 
+def _trace_tokens(trace: list[list[str]]) -> list[tuple[int, str]]:
+    """(index in trace, normalized token) for every usable entry of a trace."""
+    return [
+        (i, f"{entry[0]}({entry[2]})")
+        for i, entry in enumerate(trace)
+        if entry and len(entry) >= 3
+    ]
+
+
 def normalize_trace(trace: list[list[str]]) -> list[str]:
     """Normalize a tool trace to comparable tokens.
 
@@ -71,45 +83,94 @@ def normalize_trace(trace: list[list[str]]) -> list[str]:
 
     Targets are dropped for matching (Read(n) matches Read(n) regardless of file).
     """
-    tokens = []
-    for entry in trace:
-        if not entry or len(entry) < 3:
-            continue
-        tool_name = entry[0]
-        phase = entry[2] if len(entry) > 2 else "n"
-        tokens.append(f"{tool_name}({phase})")
-    return tokens
-
-
-def extract_subsequences(tokens: list[str], min_len: int = MIN_SEQ_LEN,
-                         max_len: int = MAX_SEQ_LEN) -> list[tuple[str, ...]]:
-    """Extract all contiguous subsequences of the given length range."""
-    subsequences = []
-    for length in range(min_len, min(max_len + 1, len(tokens) + 1)):
-        for start in range(len(tokens) - length + 1):
-            subseq = tuple(tokens[start:start + length])
-            subsequences.append(subseq)
-    return subsequences
-
-
-def remove_subsets(patterns: dict[tuple[str, ...], set[str]]) -> dict[tuple[str, ...], set[str]]:
-    """Remove patterns that are strict subsets of longer patterns with same frequency."""
-    to_remove = set()
-    sorted_patterns = sorted(patterns.keys(), key=len, reverse=True)
-
-    for i, longer in enumerate(sorted_patterns):
-        for shorter in sorted_patterns[i + 1:]:
-            if shorter in to_remove:
-                continue
-            # Check if shorter is a contiguous subsequence of longer
-            longer_str = " ".join(longer)
-            shorter_str = " ".join(shorter)
-            if shorter_str in longer_str:
-                # Only remove if frequency is same or lower
-                if len(patterns[shorter]) <= len(patterns[longer]):
-                    to_remove.add(shorter)
+    return [token for _, token in _trace_tokens(trace)]
+
+
+def _count_level(prev_cls: list[list[int]], frequent: list[bool], track: bool):
+    """Assign k-gram classes from (k-1)-gram classes and count their support.
 
-    return {k: v for k, v in patterns.items() if k not in to_remove}
+    A position gets a class only if its (k-1)-gram prefix (same position)
+    and suffix (next position) classes are both frequent; -1 otherwise.
+    Returns (classes per sequence, {(prefix, suffix): class}, support per
+    class, first occurrences per class — only when ``track``).
+    """
+    keys: dict[tuple[int, int], int] = {}
+    support: list[int] = []
+    last_seen: list[int] = []
+    occ: list[list[tuple[int, int]]] = []
+
+    cls: list[list[int]] = []
+    for t, row_prev in enumerate(prev_cls):
+        live = [c if c >= 0 and frequent[c] else -1 for c in row_prev]
+        row = []
+        for i, (a, b) in enumerate(zip(live, live[1:])):
+            if a < 0 or b < 0:
+                row.append(-1)
+                continue
+            c = keys.get((a, b))
+            if c is None:
+                c = keys[(a, b)] = len(support)
+                support.append(0)
+                last_seen.append(-1)
+                occ.append([])
+            row.append(c)
+            if last_seen[c] != t:
+                last_seen[c] = t
+                support[c] += 1
+                if track:
+                    occ[c].append((t, i))
+        cls.append(row)
+    return cls, keys, support, occ
+
+
+def _mine_closed_ngrams(sequences: list[list[int]], min_support: int,
+                        min_len: int = MIN_SEQ_LEN, max_len: int = MAX_SEQ_LEN):
+    """Yield closed frequent contiguous n-grams of ``sequences``.
+
+    Level k identifies the k-gram at each start position by the classes of
+    its (k-1)-gram prefix and suffix — the depth-k buckets of the
+    sequences' suffix array — so only positions whose shorter n-grams are
+    frequent are revisited, instead of materializing every subsequence.
+    Support is the number of distinct sequences, counted as positions
+    stream past in sequence order.
+
+    A k-gram is closed when neither one-step extension (the (k+1)-grams
+    keyed by it as prefix or suffix) has the same support; n-grams of
+    ``max_len`` are always closed.
+
+    Yields (length, occurrences) where occurrences is [(sequence_index,
+    first_start), ...] in sequence order, one per supporting sequence.
+    """
+    counts: dict[int, int] = {}
+    for seq in sequences:
+        for token in set(seq):
+            counts[token] = counts.get(token, 0) + 1
+
+    prev_cls = sequences
+    prev_support = [counts.get(c, 0) for c in range(len(counts))]
+    prev_occ: list[list[tuple[int, int]]] = []
+
+    for k in range(2, max_len + 1):
+        frequent = [n >= min_support for n in prev_support]
+        cls, keys, support, occ = _count_level(prev_cls, frequent, track=k >= min_len)
+
+        if k > min_len:
+            subsumed = [False] * len(prev_support)
+            for (a, b), c in keys.items():
+                if support[c] >= min_support:
+                    subsumed[a] = subsumed[a] or support[c] == prev_support[a]
+                    subsumed[b] = subsumed[b] or support[c] == prev_support[b]
+            for c, is_frequent in enumerate(frequent):
+                if is_frequent and not subsumed[c]:
+                    yield k - 1, prev_occ[c]
+
+        prev_cls, prev_support, prev_occ = cls, support, occ
+        if not any(n >= min_support for n in support):
+            return
+
+    for c, n in enumerate(prev_support):
+        if n >= min_support:
+            yield max_len, prev_occ[c]
 
 
 def detect_patterns(traces: dict[str, list[list[str]]],
@@ -127,68 +188,50 @@ def detect_patterns(traces: dict[str, list[list[str]]],
     if len(traces) < min_frequency:
         return []
 
-    # Step 1: Normalize all traces
-    normalized: dict[str, list[str]] = {}
-    raw_traces: dict[str, list[list[str]]] = {}
-    for tx_id, trace in traces.items():
-        tokens = normalize_trace(trace)
+    # Step 1: Normalize all traces, interning tokens as ints
+    vocab: dict[str, int] = {}
+    tx_ids: list[str] = []
+    sequences: list[list[int]] = []
+    entry_index: list[list[int]] = []
+    for tx_id in sorted(traces):
+        tokens = _trace_tokens(traces[tx_id])
         if len(tokens) >= MIN_SEQ_LEN:
-            normalized[tx_id] = tokens
-            raw_traces[tx_id] = trace
+            tx_ids.append(tx_id)
+            sequences.append([vocab.setdefault(token, len(vocab)) for _, token in tokens])
+            entry_index.append([i for i, _ in tokens])
 
-    if len(normalized) < min_frequency:
+    if len(sequences) < min_frequency:
         return []
+    names = list(vocab)
+    position_scale = [1 / max(len(seq) - 1, 1) for seq in sequences]
 
-    # Step 2: Extract subsequences per transaction, count distinct transactions
-    pattern_txs: dict[tuple[str, ...], set[str]] = {}
-    pattern_positions: dict[tuple[str, ...], list[float]] = {}
-
-    for tx_id, tokens in normalized.items():
-        seen_in_tx: set[tuple[str, ...]] = set()
-        subseqs = extract_subsequences(tokens)
-        for subseq in subseqs:
-            if subseq not in seen_in_tx:
-                seen_in_tx.add(subseq)
-                pattern_txs.setdefault(subseq, set()).add(tx_id)
-                # Track position (normalized 0-1)
-                idx = tokens.index(subseq[0]) if subseq[0] in tokens else 0
-                pos = idx / max(len(tokens) - 1, 1)
-                pattern_positions.setdefault(subseq, []).append(pos)
-
-    # Step 3: Filter by minimum frequency
-    frequent = {seq: txs for seq, txs in pattern_txs.items()
-                if len(txs) >= min_frequency}
-
-    if not frequent:
-        return []
-
-    # Step 4: Remove strict subsets
-    filtered = remove_subsets(frequent)
-
-    # Step 5: Build WorkflowPattern objects
+    # Steps 2-4: Mine closed frequent subsequences
     patterns = []
-    for seq, tx_ids in filtered.items():
-        # Get example targets from the first matching transaction
+    for length, occurrences in _mine_closed_ngrams(sequences, min_frequency):
+        t, start = occurrences[0]
+
+        # Example targets from the pattern's first occurrence
         example_targets = []
-        for tx_id in list(tx_ids)[:1]:
-            raw = raw_traces.get(tx_id, [])
-            for entry in raw:
-                if len(entry) >= 2 and entry[1]:
-                    example_targets.append(f"{entry[0]}:{entry[1]}")
-                    if len(example_targets) >= 3:
-                        break
+        raw = traces[tx_ids[t]]
+        for i in entry_index[t][start:start + length]:
+            entry = raw[i]
+            if len(entry) >= 2 and entry[1]:
+                example_targets.append(f"{entry[0]}:{entry[1]}")
+                if len(example_targets) >= 3:
+                    break
 
-        avg_pos = sum(pattern_positions.get(seq, [0])) / max(len(pattern_positions.get(seq, [1])), 1)
+        # Position (normalized 0-1) of the first occurrence in each transaction
+        avg_pos = sum(i * position_scale[tx] for tx, i in occurrences) / len(occurrences)
 
         patterns.append(WorkflowPattern(
-            sequence=list(seq),
-            frequency=len(tx_ids),
-            transaction_ids=sorted(tx_ids),
+            sequence=[names[token] for token in sequences[t][start:start + length]],
+            frequency=len(occurrences),
+            transaction_ids=[tx_ids[tx] for tx, _ in occurrences],
             avg_position=avg_pos,
             example_targets=example_targets,
         ))
 
-    # Step 6: Sort by frequency (desc), then length (desc)
+    # Step 5: Sort by frequency (desc), then length (desc)
     patterns.sort(key=lambda p: (-p.frequency, -len(p.sequence)))
 
     return patterns
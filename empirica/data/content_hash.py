@@ -0,0 +1,39 @@
+"""Normalized content hashes for artifact deduplication.
+
+Logging the same finding, unknown or dead end twice in a project returns the
+existing artifact instead of inserting a copy. Identity is the artifact's
+text after normalization (trimmed, lower-cased, whitespace collapsed), so
+``"Fix  the Bug"`` and ``"fix the bug "`` are the same artifact.
+
+The hash is persisted in a ``content_hash`` column on every artifact table
+(migration 051) and indexed on ``(project_id, content_hash)``, so duplicate
+detection is one indexed lookup rather than re-hashing every row of the
+project in Python on each insert.
+"""
+
+import hashlib
+
+# Columns that make up each artifact's content identity, in hash order.
+CONTENT_HASH_FIELDS: dict[str, tuple[str, ...]] = {
+    'project_findings': ('finding',),
+    'project_unknowns': ('unknown',),
+    'project_dead_ends': ('approach', 'why_failed'),
+    'mistakes_made': ('mistake', 'why_wrong'),
+    'assumptions': ('assumption',),
+    'decisions': ('choice', 'rationale'),
+}
+
+
+def normalize_content(text: str | None) -> str:
+    """Trim, lower-case and collapse whitespace (``None`` → ``''``)."""
+    return " ".join((text or "").strip().lower().split())
+
+
+def content_hash(*parts: str | None) -> str:
+    """MD5 hex digest of the normalized parts joined with ``||``.
+
+    A single part hashes its normalized text alone, matching the hashes the
+    breadcrumbs repository computed before the column existed.
+    """
+    normalized = "||".join(normalize_content(p) for p in parts)
+    return hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()
@@ -3,7 +3,7 @@ import logging
 import sqlite3
 from collections.abc import Callable
 
-from .migration_runner import add_column_if_missing
+from .migration_runner import add_column_if_missing, table_exists
 
 logger = logging.getLogger(__name__)
 
@@ -1275,6 +1275,13 @@ ALL_MIGRATIONS: list[tuple[str, str, Callable]] = [
     ("048_beads_table", "Add beads v0 coordination-records table (HISTORICAL — the v0 bead concept retired 2026-06-02 / empirica 1.11.2; cross-practitioner coordination state lives in cortex-resident SER now per empirica-cortex SHARED_EPISTEMIC_RECORD.md). Table kept intact for legacy-row readability; no current code path writes to it.", lambda cursor: migration_048_beads_table(cursor)),
     ("049_source_visibility", "Add visibility tier column to epistemic_sources (substrate prereq for cross-mesh epistemic source map). Sources missed migration 039's visibility wave because source-add uses a hand-rolled INSERT rather than the breadcrumbs repo path. Default 'shared' matches the artifact-table invariant.", lambda cursor: migration_049_source_visibility(cursor)),
     ("050_source_content_identity", "Add content-identity columns (content_hash, size_bytes, canonical_path, mime_type) to epistemic_sources — empirica slice of the unified source-identity model: reconcile matching + sync-when-small both key on content identity; canonical_path ends the source_url path/URL overload behind the title-in-url bug class.", lambda cursor: migration_050_source_content_identity(cursor)),
+    ("051_artifact_content_hash", "Add normalized content_hash column (backfilled) + (project_id, content_hash) index to artifact tables so breadcrumb deduplication is one indexed lookup instead of hashing every project row in Python per insert", lambda cursor: migration_051_artifact_content_hash(cursor)),
+    ("052_artifact_mention_index", "Add trigger-maintained artifact_mentions table + FTS5 index over artifact text so the PreToolUse file-relevance nudge looks up file mentions by token instead of LIKE-scanning six artifact tables", lambda cursor: migration_052_artifact_mention_index(cursor)),
+    ("053_lesson_cache_generation", "Add trigger-maintained lesson_cache_generation counter bumped on every lesson, delta, prerequisite and lesson-graph change so the lesson hot-cache snapshot can be validated with one row read", lambda cursor: migration_053_lesson_cache_generation(cursor)),
+    ("054_finding_minhash", "Add MinHash signature column to project_findings + artifact_minhash_bands LSH bucket table (backfilled, trigger-cleaned) so near-duplicate finding lookups probe band buckets instead of comparing against every finding", lambda cursor: migration_054_finding_minhash(cursor)),
+    ("055_current_beliefs", "Add trigger-maintained bayesian_beliefs_current / grounded_beliefs_current tables (latest belief per ai_id + vector, backfilled) so calibration managers read current beliefs with a primary-key lookup instead of scanning the append-only belief history", lambda cursor: migration_055_current_beliefs(cursor)),
+    ("056_threshold_cache", "Add trigger-maintained calibration_generation counter (bumped on every calibration_trajectory change) + dynamic_threshold_cache table so sentinel/statusline threshold lookups reuse thresholds computed at the current generation instead of recomputing Brier decomposition per tool call", lambda cursor: migration_056_threshold_cache(cursor)),
+    ("057_project_counters", "Add trigger-maintained project_counters table (per-type artifact counts, open goals, unresolved/goal-linked unknowns, latest reflex completion per project) so statusline/cockpit/bootstrap read project aggregates with one primary-key lookup instead of COUNT queries per render", lambda cursor: migration_057_project_counters(cursor)),
 ]
 
 
@@ -1831,6 +1838,639 @@ def migration_050_source_content_identity(cursor: sqlite3.Cursor):
     )
 
 
+def migration_051_artifact_content_hash(cursor: sqlite3.Cursor):
+    """Add a persisted content_hash to artifact tables for indexed deduplication.
+
+    BreadcrumbRepository used to dedupe findings/unknowns/dead ends by
+    selecting every row of the project and MD5-hashing each one in Python
+    on every insert — O(N) per log, O(N·M) for a batch. The normalized hash
+    (see data/content_hash.py) is now stored on the row and indexed on
+    (project_id, content_hash), making the check a single index probe.
+
+    Mistakes, assumptions and decisions get the column too so every
+    artifact type shares one content identity.
+
+    Existing rows are backfilled here. Rows written later by paths that
+    bypass the repository (direct INSERTs) keep NULL and are hashed lazily
+    by the repository on its next dedup check for that project.
+    Idempotent: only NULL hashes are computed, indexes use IF NOT EXISTS.
+    """
+    from empirica.data.content_hash import CONTENT_HASH_FIELDS, content_hash
+
+    backfilled = 0
+    for table, fields in CONTENT_HASH_FIELDS.items():
+        if not table_exists(cursor, table):
+            continue
+        add_column_if_missing(cursor, table, "content_hash", "TEXT", "NULL")
+        rows = cursor.execute(
+            f"SELECT id, {', '.join(fields)} FROM {table} WHERE content_hash IS NULL"
+        ).fetchall()
+        cursor.executemany(
+            f"UPDATE {table} SET content_hash = ? WHERE id = ?",
+            [(content_hash(*row[1:]), row[0]) for row in rows],
+        )
+        backfilled += len(rows)
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_content_hash "
+            f"ON {table}(project_id, content_hash)"
+        )
+
+    logger.info(
+        f"✅ Migration 051 complete: content_hash added to {len(CONTENT_HASH_FIELDS)} artifact tables "
+        f"({backfilled} rows backfilled)"
+    )
+
+
+# Artifact text indexed for file mentions: table → text columns.
+# Snapshot for migration 052; file_relevance reads the index by table name.
+_MENTION_INDEX_TABLES: dict[str, tuple[str, ...]] = {
+    "project_findings": ("finding",),
+    "project_unknowns": ("unknown",),
+    "project_dead_ends": ("approach", "why_failed"),
+    "mistakes_made": ("mistake", "why_wrong"),
+    "assumptions": ("assumption",),
+    "decisions": ("choice", "rationale"),
+}
+
+
+def migration_052_artifact_mention_index(cursor: sqlite3.Cursor):
+    """Add an FTS5 index of artifact text for file-mention lookups.
+
+    get_file_relevant_artifacts (PreToolUse on every Edit/Write) searched
+    for a file's basename / relative path with LIKE '%needle%' across six
+    artifact tables — full scans that grow with project history.
+
+    artifact_mentions holds one row per artifact (kind = source table,
+    artifact_id, project_id, created_timestamp, body = text columns) and
+    artifact_mentions_fts is an external-content FTS5 index over it.
+    The tokenizer keeps '.', '_' and '-' inside tokens so 'auth.py' and
+    'file_relevance.py' are single terms; path separators split tokens so
+    'src/auth/auth.py' is queried as a phrase. Triggers on the six artifact
+    tables keep artifact_mentions current on INSERT/UPDATE/DELETE, and
+    triggers on artifact_mentions keep the FTS index current.
+
+    Skipped (file_relevance falls back to LIKE) if SQLite lacks FTS5.
+    Idempotent: IF NOT EXISTS everywhere, backfill uses INSERT OR IGNORE.
+    """
+    try:
+        cursor.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS artifact_mentions_fts USING fts5(
+                body,
+                content='artifact_mentions',
+                content_rowid='id',
+                tokenize="unicode61 tokenchars '._-'"
+            )
+            """
+        )
+    except sqlite3.OperationalError as e:
+        logger.warning(f"⚠️ Migration 052 skipped: FTS5 unavailable ({e})")
+        return
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS artifact_mentions (
+            id INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL,
+            artifact_id TEXT NOT NULL,
+            project_id TEXT,
+            created_timestamp REAL,
+            body TEXT NOT NULL,
+            UNIQUE (kind, artifact_id)
+        )
+        """
+    )
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS artifact_mentions_ai AFTER INSERT ON artifact_mentions BEGIN
+            INSERT INTO artifact_mentions_fts(rowid, body) VALUES (new.id, new.body);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS artifact_mentions_ad AFTER DELETE ON artifact_mentions BEGIN
+            INSERT INTO artifact_mentions_fts(artifact_mentions_fts, rowid, body) VALUES ('delete', old.id, old.body);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS artifact_mentions_au AFTER UPDATE OF body ON artifact_mentions BEGIN
+            INSERT INTO artifact_mentions_fts(artifact_mentions_fts, rowid, body) VALUES ('delete', old.id, old.body);
+            INSERT INTO artifact_mentions_fts(rowid, body) VALUES (new.id, new.body);
+        END
+    """)
+
+    indexed = 0
+    for table, columns in _MENTION_INDEX_TABLES.items():
+        if not table_exists(cursor, table):
+            continue
+        body = " || ' ' || ".join(f"coalesce({{row}}.{col}, '')" for col in columns)
+        watched = ", ".join(("id", "project_id", "created_timestamp", *columns))
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_mentions_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO artifact_mentions (kind, artifact_id, project_id, created_timestamp, body)
+                VALUES ('{table}', new.id, new.project_id, new.created_timestamp, {body.format(row="new")})
+                ON CONFLICT (kind, artifact_id) DO UPDATE SET
+                    project_id = excluded.project_id,
+                    created_timestamp = excluded.created_timestamp,
+                    body = excluded.body;
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_mentions_au AFTER UPDATE OF {watched} ON {table} BEGIN
+                UPDATE artifact_mentions SET
+                    artifact_id = new.id,
+                    project_id = new.project_id,
+                    created_timestamp = new.created_timestamp,
+                    body = {body.format(row="new")}
+                WHERE kind = '{table}' AND artifact_id = old.id;
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_mentions_ad AFTER DELETE ON {table} BEGIN
+                DELETE FROM artifact_mentions WHERE kind = '{table}' AND artifact_id = old.id;
+            END
+        """)
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO artifact_mentions (kind, artifact_id, project_id, created_timestamp, body)
+            SELECT '{table}', id, project_id, created_timestamp, {body.format(row=table)} FROM {table}
+        """)
+        indexed += max(cursor.rowcount, 0)
+
+    logger.info(f"✅ Migration 052 complete: artifact mention index created ({indexed} artifacts indexed)")
+
+
+# Tables feeding the lesson hot cache: table → (UPDATE OF columns, row filter).
+# Snapshot for migration 053; the filter is formatted with row = new/old.
+_LESSON_CACHE_TABLES: dict[str, tuple[str, str]] = {
+    "lessons": ("id, name, domain", "1"),
+    "lesson_epistemic_deltas": ("lesson_id, vector_name, delta_value", "1"),
+    "lesson_prerequisites": ("lesson_id, prereq_type, prereq_id", "1"),
+    "knowledge_graph": (
+        "source_type, source_id, relation_type, target_type, target_id",
+        "{row}.source_type = 'lesson' AND {row}.target_type = 'lesson'",
+    ),
+}
+
+
+def migration_053_lesson_cache_generation(cursor: sqlite3.Cursor):
+    """Add a change counter for the lesson hot cache.
+
+    LessonStorageManager rebuilds the in-memory lesson graph from SQLite in
+    every process. It now persists a snapshot of the hot cache next to the
+    database, keyed by (epoch, generation) from this single-row table.
+
+    Triggers on lessons, lesson_epistemic_deltas, lesson_prerequisites and
+    lesson→lesson knowledge_graph edges bump generation on INSERT, DELETE and
+    UPDATE of the columns the hot cache reads (so replay/feedback counters
+    on lessons don't invalidate it). epoch is random per database, so a
+    recreated database never matches a snapshot of the old one.
+
+    Idempotent: IF NOT EXISTS everywhere, the row is seeded with INSERT OR IGNORE.
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS lesson_cache_generation (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            epoch TEXT NOT NULL,
+            generation INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cursor.execute(
+        "INSERT OR IGNORE INTO lesson_cache_generation (id, epoch, generation) "
+        "VALUES (1, lower(hex(randomblob(8))), 0)"
+    )
+
+    bump = "UPDATE lesson_cache_generation SET generation = generation + 1 WHERE id = 1;"
+    watched = 0
+    for table, (columns, condition) in _LESSON_CACHE_TABLES.items():
+        if not table_exists(cursor, table):
+            continue
+        for suffix, event, row in (
+            ("ai", "INSERT", "new"),
+            ("au", f"UPDATE OF {columns}", "new"),
+            ("ad", "DELETE", "old"),
+        ):
+            when = condition.format(row=row)
+            if suffix == "au" and when != "1":
+                when = f"({when}) OR ({condition.format(row='old')})"
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_lesson_cache_{suffix} AFTER {event} ON {table}
+                WHEN {when} BEGIN
+                    {bump}
+                END
+            """)
+        watched += 1
+
+    logger.info(f"✅ Migration 053 complete: lesson cache generation tracked on {watched} tables")
+
+
+def migration_054_finding_minhash(cursor: sqlite3.Cursor):
+    """Persist MinHash signatures and LSH band buckets for project findings.
+
+    Novelty scoring and rollup dedup compared each new finding's word set
+    with every existing finding. project_findings.minhash now stores the
+    finding's signature (see data/minhash.py) and artifact_minhash_bands
+    holds one (kind, artifact_id, band) → bucket row per band, indexed on
+    (project_id, kind, bucket), so candidates for a near-duplicate lookup
+    are a handful of index probes; the repository verifies them with exact
+    Jaccard.
+
+    Triggers drop a finding's band rows when it is deleted, and clear its
+    signature when its text changes so the repository re-indexes it.
+    Rows written by paths that bypass the repository (NULL minhash) are
+    indexed with the project's next logged finding; a partial index on
+    those pending rows keeps that check cheap.
+    Idempotent: IF NOT EXISTS everywhere, only NULL signatures are computed.
+    """
+    from empirica.data.minhash import index_artifact_rows
+
+    if not table_exists(cursor, "project_findings"):
+        return
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS artifact_minhash_bands (
+            kind TEXT NOT NULL,
+            artifact_id TEXT NOT NULL,
+            project_id TEXT,
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            PRIMARY KEY (kind, artifact_id, band)
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_artifact_minhash_bands_bucket "
+        "ON artifact_minhash_bands(project_id, kind, bucket)"
+    )
+    add_column_if_missing(cursor, "project_findings", "minhash", "BLOB", "NULL")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_project_findings_minhash_pending "
+        "ON project_findings(project_id) WHERE minhash IS NULL"
+    )
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS project_findings_minhash_ad AFTER DELETE ON project_findings BEGIN
+            DELETE FROM artifact_minhash_bands WHERE kind = 'project_findings' AND artifact_id = old.id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS project_findings_minhash_au AFTER UPDATE OF finding ON project_findings BEGIN
+            DELETE FROM artifact_minhash_bands WHERE kind = 'project_findings' AND artifact_id = old.id;
+            UPDATE project_findings SET minhash = NULL WHERE id = new.id;
+        END
+    """)
+
+    rows = cursor.execute(
+        "SELECT id, project_id, finding FROM project_findings WHERE minhash IS NULL"
+    ).fetchall()
+    indexed = index_artifact_rows(cursor, "project_findings", rows)
+
+    logger.info(f"✅ Migration 054 complete: MinHash signatures computed for {indexed} findings")
+
+
+# Upsert guard for migration 055: the incoming row replaces {table}'s row
+# unless it is older, or undated while the current row is dated.
+_NEWER_BELIEF = (
+    "{table}.last_updated IS NULL OR excluded.last_updated >= {table}.last_updated"
+)
+
+
+def migration_055_current_beliefs(cursor: sqlite3.Cursor):
+    """Materialize the latest belief per (ai_id, vector_name).
+
+    bayesian_beliefs and grounded_beliefs are append-only histories (kept for
+    trajectory analysis), and the calibration managers used to read an AI's
+    whole history ordered by last_updated to keep the newest row per vector.
+    bayesian_beliefs_current / grounded_beliefs_current hold just that row,
+    keyed by (ai_id, vector_name), so the lookup no longer grows with history.
+
+    AFTER INSERT triggers upsert the new row when it is at least as recent as
+    the current one (a NULL last_updated never displaces a dated row, as with
+    the old ORDER BY last_updated DESC). bayesian_beliefs rows carry no ai_id;
+    it is resolved through cascades → sessions when the row is written, and
+    rows whose cascade is unknown are skipped, as the old join skipped them.
+
+    Idempotent: IF NOT EXISTS everywhere; the backfill only upserts.
+    """
+    if table_exists(cursor, "grounded_beliefs"):
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS grounded_beliefs_current (
+                ai_id TEXT NOT NULL,
+                vector_name TEXT NOT NULL,
+                belief_id TEXT NOT NULL,
+                session_id TEXT,
+                mean REAL NOT NULL,
+                variance REAL NOT NULL,
+                evidence_count INTEGER DEFAULT 0,
+                last_observation REAL,
+                last_observation_source TEXT,
+                self_referential_mean REAL,
+                divergence REAL,
+                last_updated REAL,
+                phase TEXT,
+                PRIMARY KEY (ai_id, vector_name)
+            )
+            """
+        )
+        columns = (
+            "ai_id, vector_name, belief_id, session_id, mean, variance, evidence_count, "
+            "last_observation, last_observation_source, self_referential_mean, divergence, "
+            "last_updated, phase"
+        )
+        upsert = f"""
+            ON CONFLICT (ai_id, vector_name) DO UPDATE SET
+                belief_id = excluded.belief_id,
+                session_id = excluded.session_id,
+                mean = excluded.mean,
+                variance = excluded.variance,
+                evidence_count = excluded.evidence_count,
+                last_observation = excluded.last_observation,
+                last_observation_source = excluded.last_observation_source,
+                self_referential_mean = excluded.self_referential_mean,
+                divergence = excluded.divergence,
+                last_updated = excluded.last_updated,
+                phase = excluded.phase
+            WHERE {_NEWER_BELIEF.format(table="grounded_beliefs_current")}
+        """
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS grounded_beliefs_current_ai AFTER INSERT ON grounded_beliefs BEGIN
+                INSERT INTO grounded_beliefs_current ({columns})
+                SELECT {", ".join(f"new.{c.strip()}" for c in columns.split(","))} WHERE 1
+                {upsert};
+            END
+        """)
+        cursor.execute(f"""
+            INSERT INTO grounded_beliefs_current ({columns})
+            SELECT {columns} FROM grounded_beliefs WHERE 1
+            ORDER BY last_updated IS NOT NULL, last_updated
+            {upsert}
+        """)
+
+    if table_exists(cursor, "bayesian_beliefs"):
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS bayesian_beliefs_current (
+                ai_id TEXT NOT NULL,
+                vector_name TEXT NOT NULL,
+                belief_id TEXT NOT NULL,
+                cascade_id TEXT NOT NULL,
+                mean REAL NOT NULL,
+                variance REAL NOT NULL,
+                evidence_count INTEGER DEFAULT 0,
+                prior_mean REAL NOT NULL,
+                prior_variance REAL NOT NULL,
+                last_updated TIMESTAMP,
+                PRIMARY KEY (ai_id, vector_name)
+            )
+            """
+        )
+        columns = (
+            "ai_id, vector_name, belief_id, cascade_id, mean, variance, evidence_count, "
+            "prior_mean, prior_variance, last_updated"
+        )
+        upsert = f"""
+            ON CONFLICT (ai_id, vector_name) DO UPDATE SET
+                belief_id = excluded.belief_id,
+                cascade_id = excluded.cascade_id,
+                mean = excluded.mean,
+                variance = excluded.variance,
+                evidence_count = excluded.evidence_count,
+                prior_mean = excluded.prior_mean,
+                prior_variance = excluded.prior_variance,
+                last_updated = excluded.last_updated
+            WHERE {_NEWER_BELIEF.format(table="bayesian_beliefs_current")}
+        """
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS bayesian_beliefs_current_ai AFTER INSERT ON bayesian_beliefs BEGIN
+                INSERT INTO bayesian_beliefs_current ({columns})
+                SELECT s.ai_id, new.vector_name, new.belief_id, new.cascade_id, new.mean,
+                       new.variance, new.evidence_count, new.prior_mean, new.prior_variance,
+                       new.last_updated
+                FROM cascades c JOIN sessions s ON s.session_id = c.session_id
+                WHERE c.cascade_id = new.cascade_id
+                {upsert};
+            END
+        """)
+        cursor.execute(f"""
+            INSERT INTO bayesian_beliefs_current ({columns})
+            SELECT s.ai_id, bb.vector_name, bb.belief_id, bb.cascade_id, bb.mean, bb.variance,
+                   bb.evidence_count, bb.prior_mean, bb.prior_variance, bb.last_updated
+            FROM bayesian_beliefs bb
+            JOIN cascades c ON bb.cascade_id = c.cascade_id
+            JOIN sessions s ON c.session_id = s.session_id
+            WHERE 1
+            ORDER BY bb.last_updated IS NOT NULL, bb.last_updated
+            {upsert}
+        """)
+
+    logger.info("✅ Migration 055 complete: current-belief tables materialized")
+
+
+def migration_056_threshold_cache(cursor: sqlite3.Cursor):
+    """Add a calibration generation counter and a dynamic-threshold cache.
+
+    compute_dynamic_thresholds reloads the MCO config and recomputes the
+    Brier decomposition over calibration_trajectory on every praxic tool
+    call (sentinel gate, statusline), although its inputs only change when
+    CHECK/POSTFLIGHT record calibration points.
+
+    calibration_generation is a single-row counter bumped by triggers on
+    every INSERT, UPDATE and DELETE of calibration_trajectory.
+    dynamic_threshold_cache stores computed thresholds (JSON) per cache key,
+    tagged with the generation they were computed at; a row is only served
+    while its generation is current (see post_test/dynamic_thresholds.py).
+
+    Idempotent: IF NOT EXISTS everywhere, the row is seeded with INSERT OR IGNORE.
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS calibration_generation (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            generation INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cursor.execute(
+        "INSERT OR IGNORE INTO calibration_generation (id, generation) VALUES (1, 0)"
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS dynamic_threshold_cache (
+            cache_key TEXT PRIMARY KEY,
+            generation INTEGER NOT NULL,
+            value TEXT NOT NULL,
+            computed_at REAL
+        )
+        """
+    )
+
+    if not table_exists(cursor, "calibration_trajectory"):
+        return
+
+    bump = "UPDATE calibration_generation SET generation = generation + 1 WHERE id = 1;"
+    for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE")):
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS calibration_trajectory_generation_{suffix}
+            AFTER {event} ON calibration_trajectory BEGIN
+                {bump}
+            END
+        """)
+
+    logger.info("✅ Migration 056 complete: calibration generation tracked for threshold cache")
+
+
+# Per-project counters for migration 057: source table → (extra UPDATE OF
+# columns, [(counter column, row condition or None for every row)]).
+# Snapshot — later schema changes belong in a new migration.
+_PROJECT_COUNTER_SOURCES: dict[str, tuple[str, list[tuple[str, str | None]]]] = {
+    "sessions": ("", [("sessions", None)]),
+    "goals": ("is_completed", [("goals", None), ("open_goals", "is_completed = 0")]),
+    "project_findings": ("", [("findings", None)]),
+    "project_unknowns": ("is_resolved, goal_id", [
+        ("unknowns", None),
+        ("open_unknowns", "is_resolved = 0"),
+        ("goal_linked_unknowns", "is_resolved = 0 AND goal_id IS NOT NULL"),
+    ]),
+    "project_dead_ends": ("", [("dead_ends", None)]),
+    "mistakes_made": ("", [("mistakes", None)]),
+    "assumptions": ("", [("assumptions", None)]),
+    "decisions": ("", [("decisions", None)]),
+}
+
+
+def migration_057_project_counters(cursor: sqlite3.Cursor):
+    """Add trigger-maintained per-project counters.
+
+    The statusline (every render), cockpit, bootstrap and
+    SessionDatabase._count_project_artifacts each ran their own COUNT
+    queries over goals, project_unknowns, sessions and reflexes.
+    project_counters holds one row per project_id ('' for rows without
+    one) with per-type artifact counts, open goals, unresolved and
+    goal-linked unknowns, and the project's latest reflex completion;
+    empirica/data/project_counters.py is the read API.
+
+    Triggers recount the affected project's columns from the source table
+    after each INSERT, DELETE and relevant UPDATE (recounting rather than
+    incrementing keeps them exact under INSERT OR REPLACE / OR IGNORE).
+    Recounts are indexed, so goals gains an index on project_id, and goals
+    created without a project_id inherit their session's, matching how
+    GoalRepository now inserts them.
+
+    Idempotent: IF NOT EXISTS everywhere; counters are rebuilt from scratch.
+    """
+    counters = [c for _, columns in _PROJECT_COUNTER_SOURCES.values() for c, _ in columns]
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS project_counters (
+            project_id TEXT PRIMARY KEY,
+            {", ".join(f"{c} INTEGER NOT NULL DEFAULT 0" for c in counters)},
+            latest_reflex_id INTEGER,
+            latest_completion REAL,
+            latest_completion_session TEXT,
+            latest_completion_at REAL
+        )
+    """)
+    cursor.execute("DELETE FROM project_counters")
+
+    if table_exists(cursor, "goals") and table_exists(cursor, "sessions"):
+        cursor.execute("""
+            UPDATE goals SET project_id = (
+                SELECT project_id FROM sessions WHERE sessions.session_id = goals.session_id
+            ) WHERE project_id IS NULL
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_goals_project ON goals(project_id)")
+
+    # Not INSERT OR IGNORE: a triggering INSERT OR REPLACE overrides the
+    # conflict clause of statements in the trigger body and would reset the row
+    ensure_row = (
+        "INSERT INTO project_counters (project_id) SELECT COALESCE({row}.project_id, '') "
+        "WHERE NOT EXISTS (SELECT 1 FROM project_counters "
+        "WHERE project_id = COALESCE({row}.project_id, ''));"
+    )
+    for table, (watched, columns) in _PROJECT_COUNTER_SOURCES.items():
+        if not table_exists(cursor, table):
+            continue
+        names = ", ".join(c for c, _ in columns)
+        aggregates = ", ".join(
+            "COUNT(*)" if cond is None else f"COUNT(CASE WHEN {cond} THEN 1 END)"
+            for _, cond in columns
+        )
+        recount = (
+            f"UPDATE project_counters SET ({names}) = ("
+            f"SELECT {aggregates} FROM {table} WHERE project_id IS {{row}}.project_id"
+            f") WHERE project_id = COALESCE({{row}}.project_id, '');"
+        )
+        update_of = "project_id" + (f", {watched}" if watched else "")
+        for suffix, event, rows in (
+            ("ai", "INSERT", ("new",)),
+            ("ad", "DELETE", ("old",)),
+            ("au", f"UPDATE OF {update_of}", ("old", "new")),
+        ):
+            body = "\n".join(
+                (ensure_row + recount).format(row=row) for row in rows
+            )
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_project_counters_{suffix}
+                AFTER {event} ON {table} BEGIN
+                    {body}
+                END
+            """)
+        cursor.execute(f"""
+            INSERT INTO project_counters (project_id, {names})
+            SELECT COALESCE(project_id, ''), {aggregates} FROM {table} WHERE 1
+            GROUP BY COALESCE(project_id, '')
+            ON CONFLICT (project_id) DO UPDATE SET
+                {", ".join(f"{c} = excluded.{c}" for c, _ in columns)}
+        """)
+
+    if table_exists(cursor, "reflexes"):
+        latest = (
+            "UPDATE project_counters SET "
+            "(latest_reflex_id, latest_completion, latest_completion_session, latest_completion_at) = ("
+            "SELECT id, completion, session_id, timestamp FROM reflexes "
+            "WHERE project_id IS {row}.project_id ORDER BY timestamp DESC, id DESC LIMIT 1"
+            ") WHERE project_id = COALESCE({row}.project_id, '')"
+        )
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS reflexes_project_counters_ai AFTER INSERT ON reflexes BEGIN
+                {ensure_row.format(row="new")}
+                UPDATE project_counters SET
+                    latest_reflex_id = new.id,
+                    latest_completion = new.completion,
+                    latest_completion_session = new.session_id,
+                    latest_completion_at = new.timestamp
+                WHERE project_id = COALESCE(new.project_id, '')
+                  AND (latest_completion_at IS NULL OR new.timestamp >= latest_completion_at);
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS reflexes_project_counters_ad AFTER DELETE ON reflexes BEGIN
+                {latest.format(row="old")} AND latest_reflex_id = old.id;
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS reflexes_project_counters_au
+            AFTER UPDATE OF project_id, session_id, timestamp, completion ON reflexes BEGIN
+                {latest.format(row="old")};
+                {ensure_row.format(row="new")}
+                {latest.format(row="new")};
+            END
+        """)
+        cursor.execute("""
+            INSERT OR IGNORE INTO project_counters (project_id)
+            SELECT DISTINCT COALESCE(project_id, '') FROM reflexes
+        """)
+        cursor.execute("""
+            UPDATE project_counters SET
+                (latest_reflex_id, latest_completion, latest_completion_session, latest_completion_at) = (
+                    SELECT id, completion, session_id, timestamp FROM reflexes
+                    WHERE reflexes.project_id IS NULLIF(project_counters.project_id, '')
+                    ORDER BY timestamp DESC, id DESC LIMIT 1
+                )
+        """)
+
+    logger.info("✅ Migration 057 complete: project counters trigger-maintained")
+
+
 def migration_044_source_lifecycle(cursor: sqlite3.Cursor):
     """Add lifecycle columns to epistemic_sources for SOURCES_LIFECYCLE_SPEC Phase 1.
 
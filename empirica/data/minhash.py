@@ -0,0 +1,172 @@
+"""MinHash signatures and an LSH index for near-duplicate artifact text.
+
+Novelty scoring and rollup deduplication measure how similar two pieces of
+text are as the Jaccard similarity of their word sets (see text_tokens).
+Comparing a new finding with every existing one re-tokenizes the whole
+corpus on each call; with a MinHash signature per text and LSH banding,
+only texts that share a band bucket are compared, and those candidates are
+verified with exact Jaccard.
+
+Signatures use NUM_PERM seeded permutations of a stable 32-bit token hash,
+so they can be persisted and compared across processes. They are split
+into bands of BAND_ROWS values; two texts become candidates when any band
+matches. With 32 bands of 2 rows a pair at Jaccard 0.7 is a candidate with
+probability > 0.9999, at 0.3 ~0.95, and unrelated text (< 0.05) rarely.
+
+Project findings persist their signature (``project_findings.minhash``) and
+band buckets (``artifact_minhash_bands``, migration 054) so similarity
+lookups against a project's history are index probes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import struct
+from collections.abc import Hashable, Iterable
+from functools import lru_cache
+
+NUM_PERM = 64
+BAND_ROWS = 2
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_rng = random.Random(0x4D696E48)  # noqa: S311 - fixed: signatures are persisted
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_WORD = re.compile(r'\b\w{3,}\b')
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'that', 'this', 'with', 'from', 'are', 'was',
+    'were', 'been', 'have', 'has', 'had', 'not', 'but', 'can', 'will',
+    'should', 'would', 'could', 'which', 'there', 'their', 'about',
+})
+
+
+@lru_cache(maxsize=8192)
+def text_tokens(text: str) -> frozenset[str]:
+    """Lower-cased words of 3+ characters, minus common stop words."""
+    return frozenset(_WORD.findall(text.lower())) - STOP_WORDS
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Jaccard similarity of two token sets (0.0 if either is empty)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def minhash_signature(tokens: Iterable[str]) -> tuple[int, ...]:
+    """NUM_PERM-value MinHash signature of a token set (``()`` if empty)."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(t.encode(), digest_size=4).digest(), 'little')
+        for t in tokens
+    ]
+    if not hashes:
+        return ()
+    # min over a list is markedly faster than over a generator here
+    return tuple(
+        min([(a * h + b) % _MERSENNE_PRIME for h in hashes])
+        for a, b in _PERMUTATIONS
+    )
+
+
+def band_buckets(signature: tuple[int, ...]) -> list[int]:
+    """One signed 64-bit bucket id per band; equal ids mean the band matches."""
+    buckets = []
+    for band, start in enumerate(range(0, len(signature), BAND_ROWS)):
+        rows = struct.pack(f'<H{BAND_ROWS}I', band, *signature[start:start + BAND_ROWS])
+        buckets.append(int.from_bytes(hashlib.blake2b(rows, digest_size=8).digest(), 'little', signed=True))
+    return buckets
+
+
+def pack_signature(signature: tuple[int, ...]) -> bytes:
+    """Serialize a signature for the ``minhash`` BLOB column."""
+    return struct.pack(f'<{len(signature)}I', *signature)
+
+
+def unpack_signature(blob: bytes) -> tuple[int, ...]:
+    """Inverse of pack_signature."""
+    return struct.unpack(f'<{len(blob) // 4}I', blob)
+
+
+def index_artifact_rows(cursor, table: str, rows: Iterable[tuple]) -> int:
+    """Store signatures and band buckets for (id, project_id, text) rows of `table`.
+
+    Shared by migration 054's backfill and BreadcrumbRepository's writes.
+    Returns the number of rows indexed.
+    """
+    signatures = []
+    bands = []
+    for artifact_id, project_id, text in rows:
+        signature = minhash_signature(text_tokens(text or ''))
+        signatures.append((pack_signature(signature), artifact_id))
+        bands.extend(
+            (table, artifact_id, project_id, band, bucket)
+            for band, bucket in enumerate(band_buckets(signature))
+        )
+    cursor.executemany(f"UPDATE {table} SET minhash = ? WHERE id = ?", signatures)
+    cursor.executemany(
+        "INSERT OR REPLACE INTO artifact_minhash_bands (kind, artifact_id, project_id, band, bucket) "
+        "VALUES (?, ?, ?, ?, ?)",
+        bands,
+    )
+    return len(signatures)
+
+
+class NearDuplicateIndex:
+    """In-memory MinHash/LSH index over texts, with exact Jaccard verification.
+
+    Keys are caller-chosen (ids, positions); texts are kept for verification.
+    """
+
+    def __init__(self, texts: Iterable[str] = ()) -> None:
+        self._buckets: dict[int, list[Hashable]] = {}
+        self._texts: dict[Hashable, str] = {}
+        for text in texts:
+            self.add(len(self._texts), text)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Index `text` under `key`."""
+        self._texts[key] = text
+        for bucket in band_buckets(minhash_signature(text_tokens(text))):
+            self._buckets.setdefault(bucket, []).append(key)
+
+    def candidates(self, text: str) -> set[Hashable]:
+        """Keys sharing at least one band bucket with `text`."""
+        found: set[Hashable] = set()
+        for bucket in band_buckets(minhash_signature(text_tokens(text))):
+            found.update(self._buckets.get(bucket, ()))
+        return found
+
+    def query(self, text: str, threshold: float) -> list[tuple[Hashable, float]]:
+        """(key, Jaccard) of indexed texts at or above `threshold`, most similar first."""
+        tokens = text_tokens(text)
+        matches = []
+        for key in self.candidates(text):
+            similarity = jaccard(tokens, text_tokens(self._texts[key]))
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda m: m[1], reverse=True)
+        return matches
+
+    def max_similarity(self, text: str) -> float:
+        """Highest verified Jaccard between `text` and any indexed text.
+
+        Texts with no tokens count as fully similar to a non-empty index,
+        matching novelty_score's treatment of empty findings.
+        """
+        if not self._texts:
+            return 0.0
+        tokens = text_tokens(text)
+        if not tokens:
+            return 1.0
+        return max(
+            (jaccard(tokens, text_tokens(self._texts[key])) for key in self.candidates(text)),
+            default=0.0,
+        )
@@ -0,0 +1,55 @@
+"""Read API for the trigger-maintained project_counters table (migration 057).
+
+One row per project_id ('' for artifacts without a project) holds per-type
+artifact counts, open goals, unresolved and goal-linked unknowns, and the
+project's latest reflex (completion, session, timestamp). Triggers on the
+source tables keep it exact, so surfaces that render on every tool call
+(statusline, cockpit, bootstrap) read it with one primary-key lookup.
+
+Takes a plain sqlite3 connection or cursor so hooks and scripts that open
+their own connection can use it without constructing a SessionDatabase.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+COUNTER_COLUMNS = (
+    'sessions', 'goals', 'open_goals',
+    'findings', 'unknowns', 'open_unknowns', 'goal_linked_unknowns',
+    'dead_ends', 'mistakes', 'assumptions', 'decisions',
+)
+LATEST_COLUMNS = ('latest_completion', 'latest_completion_session', 'latest_completion_at')
+
+
+def read_project_counters(conn, project_id: str | None = None) -> dict | None:
+    """Counters for project_id, or summed over every project when None.
+
+    Returns a dict keyed by COUNTER_COLUMNS + LATEST_COLUMNS (zeros and
+    None for a project with no artifacts yet), or None when the table is
+    unavailable — callers fall back to counting the source tables.
+    """
+    try:
+        if project_id is not None:
+            row = conn.execute(
+                f"SELECT {', '.join(COUNTER_COLUMNS + LATEST_COLUMNS)} "
+                "FROM project_counters WHERE project_id = ?",
+                (project_id,),
+            ).fetchone()
+        else:
+            # Latest reflex across projects: bare columns take the values of
+            # the row that supplies MAX() (SQLite)
+            row = conn.execute(
+                f"SELECT {', '.join(f'TOTAL({c})' for c in COUNTER_COLUMNS)}, "
+                "latest_completion, latest_completion_session, MAX(latest_completion_at) "
+                "FROM project_counters"
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+
+    if row is None:
+        return dict.fromkeys(COUNTER_COLUMNS, 0) | dict.fromkeys(LATEST_COLUMNS)
+    row = tuple(row)
+    counts = {name: int(value or 0) for name, value in zip(COUNTER_COLUMNS, row)}
+    counts.update(zip(LATEST_COLUMNS, row[len(COUNTER_COLUMNS):]))
+    return counts
@@ -11,7 +11,9 @@ import time
 import uuid
 from datetime import datetime
 
+from ..content_hash import CONTENT_HASH_FIELDS, content_hash
 from ..epistemic_source import normalize_epistemic_source
+from ..minhash import band_buckets, index_artifact_rows, jaccard, minhash_signature, text_tokens
 from ..visibility import normalize_visibility
 from .base import BaseRepository
 
@@ -56,65 +58,105 @@ class BreadcrumbRepository(BaseRepository):
         union = len(words1 | words2)
         return intersection / union if union > 0 else 0.0
 
-    def _content_hash(self, text: str) -> str:
-        """MD5 hash of normalized text for exact content deduplication."""
-        import hashlib
-        normalized = " ".join(text.strip().lower().split())
-        return hashlib.md5(normalized.encode()).hexdigest()
+    def _backfill_content_hashes(self, table: str, project_id: str) -> None:
+        """Hash this project's rows that were inserted without a content_hash.
 
-    def _find_duplicate_finding(self, project_id: str, finding: str) -> str | None:
-        """Check if a finding with identical content already exists."""
-        content_hash = self._content_hash(finding)
-        cursor = self._execute("""
-            SELECT id, finding FROM project_findings
-            WHERE project_id = ?
-            ORDER BY created_timestamp DESC
+        Writers outside this repository (profile import, direct INSERTs)
+        leave the column NULL; hashing them here keeps dedup lookups exact.
+        """
+        fields = CONTENT_HASH_FIELDS[table]
+        cursor = self._execute(f"""
+            SELECT id, {', '.join(fields)} FROM {table}
+            WHERE project_id = ? AND content_hash IS NULL
         """, (project_id,))
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        self._execute_many(
+            f"UPDATE {table} SET content_hash = ? WHERE id = ?",
+            [(content_hash(*tuple(row)[1:]), row[0]) for row in rows],
+        )
+        self.commit()
 
-        for row in cursor.fetchall():
-            existing_id, existing_text = row
-            if self._content_hash(existing_text) == content_hash:
-                return existing_id
-        return None
+    def _find_duplicate(self, table: str, project_id: str, *parts: str) -> str | None:
+        """Id of the newest artifact in `table` with identical normalized content.
 
-    def _find_duplicate_unknown(self, project_id: str, unknown: str) -> str | None:
-        """Check if an unknown with identical content already exists."""
-        content_hash = self._content_hash(unknown)
-        cursor = self._execute("""
-            SELECT id, unknown FROM project_unknowns
-            WHERE project_id = ?
+        One lookup on the (project_id, content_hash) index from migration 051.
+        """
+        self._backfill_content_hashes(table, project_id)
+        cursor = self._execute(f"""
+            SELECT id FROM {table}
+            WHERE project_id = ? AND content_hash = ?
             ORDER BY created_timestamp DESC
+            LIMIT 1
+        """, (project_id, content_hash(*parts)))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _index_pending_minhashes(self, project_id: str) -> None:
+        """Index this project's findings that have no signature yet.
+
+        Covers the row just logged plus rows inserted or edited by paths that
+        bypass the repository (the partial index of migration 054 keeps this
+        to the pending rows). Runs in the caller's transaction.
+        """
+        cursor = self._execute("""
+            SELECT id, project_id, finding FROM project_findings
+            WHERE project_id = ? AND minhash IS NULL
         """, (project_id,))
+        rows = [tuple(row) for row in cursor.fetchall()]
+        if rows:
+            index_artifact_rows(self.conn.cursor(), 'project_findings', rows)
 
-        for row in cursor.fetchall():
-            existing_id, existing_text = row
-            if self._content_hash(existing_text) == content_hash:
-                return existing_id
-        return None
+    def find_similar_findings(
+        self,
+        project_id: str,
+        text: str,
+        threshold: float = 0.7,
+        limit: int = 5,
+    ) -> list[dict]:
+        """Findings whose word-set Jaccard similarity to `text` is >= threshold.
+
+        Candidates come from the LSH band buckets of migration 054 (index
+        probes, not a scan of the project's findings) and are verified with
+        exact Jaccard. Most similar first. Read-only: findings are indexed
+        when logged.
+        """
+        tokens = text_tokens(text)
+        if not tokens:
+            return []
+
+        buckets = band_buckets(minhash_signature(tokens))
+        cursor = self._execute(f"""
+            SELECT DISTINCT f.id, f.finding FROM artifact_minhash_bands b
+            JOIN project_findings f ON f.id = b.artifact_id
+            WHERE b.project_id = ? AND b.kind = 'project_findings'
+            AND b.bucket IN ({', '.join('?' * len(buckets))})
+        """, (project_id, *buckets))
+
+        matches = []
+        for finding_id, finding in cursor.fetchall():
+            similarity = jaccard(tokens, text_tokens(finding))
+            if similarity >= threshold:
+                matches.append({'id': finding_id, 'finding': finding, 'similarity': similarity})
+        matches.sort(key=lambda m: m['similarity'], reverse=True)
+        return matches[:limit]
+
+    def _find_duplicate_finding(self, project_id: str, finding: str) -> str | None:
+        """Check if a finding with identical content already exists."""
+        return self._find_duplicate('project_findings', project_id, finding)
+
+    def _find_duplicate_unknown(self, project_id: str, unknown: str) -> str | None:
+        """Check if an unknown with identical content already exists."""
+        return self._find_duplicate('project_unknowns', project_id, unknown)
 
     def _find_duplicate_dead_end(self, project_id: str, approach: str, why_failed: str) -> str | None:
         """Check if a dead end with identical content already exists.
 
-        Normalizes each field individually before combining to avoid
-        whitespace differences around the || separator.
+        Each field is normalized individually before combining, so whitespace
+        around the || separator doesn't matter.
         """
-        def _norm(t: str) -> str:
-            return " ".join((t or "").strip().lower().split())
-
-        combined = f"{_norm(approach)}||{_norm(why_failed)}"
-        target_hash = self._content_hash(combined)
-        cursor = self._execute("""
-            SELECT id, approach, why_failed FROM project_dead_ends
-            WHERE project_id = ?
-            ORDER BY created_timestamp DESC
-        """, (project_id,))
-
-        for row in cursor.fetchall():
-            existing_id, existing_approach, existing_why = row
-            existing_combined = f"{_norm(existing_approach)}||{_norm(existing_why)}"
-            if self._content_hash(existing_combined) == target_hash:
-                return existing_id
-        return None
+        return self._find_duplicate('project_dead_ends', project_id, approach, why_failed)
 
     def log_finding(
         self,
@@ -195,14 +237,15 @@ class BreadcrumbRepository(BaseRepository):
                 id, project_id, session_id, goal_id, subtask_id,
                 finding, created_timestamp, finding_data, subject, impact,
                 transaction_id, entity_type, entity_id, source_refs, visibility,
-                epistemic_source
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                epistemic_source, content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             finding_id, project_id, session_id, goal_id, subtask_id,
             finding, time.time(), json.dumps(finding_data), subject, impact,
             transaction_id, entity_type, entity_id, source_refs_json, visibility_tier,
-            source_tag
+            source_tag, content_hash(finding)
         ))
+        self._index_pending_minhashes(project_id)
 
         self.commit()
         logger.info(f"📝 Finding logged: {finding[:50]}...")
@@ -280,12 +323,14 @@ class BreadcrumbRepository(BaseRepository):
             INSERT INTO project_unknowns (
                 id, project_id, session_id, goal_id, subtask_id,
                 unknown, created_timestamp, unknown_data, subject, impact,
-                transaction_id, entity_type, entity_id, visibility, epistemic_source
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                transaction_id, entity_type, entity_id, visibility, epistemic_source,
+                content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             unknown_id, project_id, session_id, goal_id, subtask_id,
             unknown, time.time(), json.dumps(unknown_data), subject, impact,
-            transaction_id, entity_type, entity_id, visibility_tier, source_tag
+            transaction_id, entity_type, entity_id, visibility_tier, source_tag,
+            content_hash(unknown)
         ))
 
         self.commit()
@@ -394,12 +439,14 @@ class BreadcrumbRepository(BaseRepository):
             INSERT INTO project_dead_ends (
                 id, project_id, session_id, goal_id, subtask_id,
                 approach, why_failed, created_timestamp, dead_end_data, subject,
-                transaction_id, entity_type, entity_id, visibility, epistemic_source
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                transaction_id, entity_type, entity_id, visibility, epistemic_source,
+                content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             dead_end_id, project_id, session_id, goal_id, subtask_id,
             approach, why_failed, time.time(), json.dumps(dead_end_data), subject,
-            transaction_id, entity_type, entity_id, visibility_tier, source_tag
+            transaction_id, entity_type, entity_id, visibility_tier, source_tag,
+            content_hash(approach, why_failed)
         ))
 
         self.commit()
@@ -751,13 +798,14 @@ class BreadcrumbRepository(BaseRepository):
                 id, session_id, goal_id, project_id, mistake, why_wrong,
                 cost_estimate, root_cause_vector, prevention,
                 created_timestamp, mistake_data, transaction_id,
-                entity_type, entity_id, visibility, epistemic_source
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                entity_type, entity_id, visibility, epistemic_source, content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             mistake_id, session_id, goal_id, project_id, mistake, why_wrong,
             cost_estimate, root_cause_vector, prevention,
             time.time(), json.dumps(mistake_data), transaction_id,
-            entity_type, entity_id, visibility_tier, source_tag
+            entity_type, entity_id, visibility_tier, source_tag,
+            content_hash(mistake, why_wrong)
         ))
 
         self.commit()
@@ -861,13 +909,13 @@ class BreadcrumbRepository(BaseRepository):
                 id, assumption, confidence, status,
                 entity_type, entity_id, project_id, session_id,
                 transaction_id, goal_id, created_timestamp, visibility, epistemic_source,
-                description
-            ) VALUES (?, ?, ?, 'unverified', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                description, content_hash
+            ) VALUES (?, ?, ?, 'unverified', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             assumption_id, assumption, confidence,
             entity_type, entity_id, project_id, session_id,
             transaction_id, goal_id, time.time(), visibility_tier, source_tag,
-            description
+            description, content_hash(assumption)
         ))
 
         self.commit()
@@ -913,14 +961,14 @@ class BreadcrumbRepository(BaseRepository):
                 confidence_at_decision, reversibility,
                 entity_type, entity_id, project_id, session_id,
                 transaction_id, goal_id, created_timestamp, evidence_refs, visibility,
-                epistemic_source, description
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                epistemic_source, description, content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             decision_id, choice, alternatives, rationale,
             confidence, reversibility,
             entity_type, entity_id, project_id, session_id,
             transaction_id, goal_id, time.time(), evidence_refs_json, visibility_tier,
-            source_tag, description
+            source_tag, description, content_hash(choice, rationale)
         ))
 
         self.commit()
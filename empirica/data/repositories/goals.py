@@ -70,10 +70,11 @@ class GoalDataRepository(BaseRepository):
             'coordination': scope_coordination
         }
 
+        # Goals inherit their session's project scope (as core GoalRepository does)
         self._execute("""
-            INSERT INTO goals (id, session_id, objective, description, scope, status, created_timestamp, is_completed, goal_data, beads_issue_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?)
-        """, (goal_id, session_id, objective, description, json.dumps(scope_data), status, time.time(), json.dumps({}), beads_issue_id))
+            INSERT INTO goals (id, session_id, objective, description, scope, status, created_timestamp, is_completed, goal_data, beads_issue_id, project_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?, ?, (SELECT project_id FROM sessions WHERE session_id = ?))
+        """, (goal_id, session_id, objective, description, json.dumps(scope_data), status, time.time(), json.dumps({}), beads_issue_id, session_id))
 
         self.commit()
         return goal_id
@@ -71,6 +71,95 @@ def _resolve_canonical_project_root() -> str | None:
     return None
 
 
+# Indexes created on every full schema pass (see SessionDatabase._create_tables).
+# Part of the schema fingerprint — adding/changing an entry forces one full pass.
+CORE_INDEX_STATEMENTS: tuple[str, ...] = (
+    "CREATE INDEX IF NOT EXISTS idx_sessions_ai ON sessions(ai_id)",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions(start_time)",
+    "CREATE INDEX IF NOT EXISTS idx_cascades_session ON cascades(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_cascades_confidence ON cascades(final_confidence)",
+    "CREATE INDEX IF NOT EXISTS idx_beliefs_cascade ON bayesian_beliefs(cascade_id)",
+    # Index for reflexes table (replaces old cascade_metadata index)
+    "CREATE INDEX IF NOT EXISTS idx_snapshots_session ON epistemic_snapshots(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_snapshots_ai ON epistemic_snapshots(ai_id)",
+    "CREATE INDEX IF NOT EXISTS idx_snapshots_cascade ON epistemic_snapshots(cascade_id)",
+    "CREATE INDEX IF NOT EXISTS idx_snapshots_created ON epistemic_snapshots(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_reflexes_session ON reflexes(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_reflexes_phase ON reflexes(phase)",
+    "CREATE INDEX IF NOT EXISTS idx_goals_session ON goals(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_goals_status ON goals(status)",
+    "CREATE INDEX IF NOT EXISTS idx_subtasks_goal ON subtasks(goal_id)",
+    "CREATE INDEX IF NOT EXISTS idx_subtasks_status ON subtasks(status)",
+    "CREATE INDEX IF NOT EXISTS idx_mistakes_session ON mistakes_made(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_mistakes_goal ON mistakes_made(goal_id)",
+    "CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status)",
+    "CREATE INDEX IF NOT EXISTS idx_projects_activity ON projects(last_activity_timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_project_handoffs_project ON project_handoffs(project_id)",
+    "CREATE INDEX IF NOT EXISTS idx_project_handoffs_timestamp ON project_handoffs(created_timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_sessions_project ON sessions(project_id)",
+    "CREATE INDEX IF NOT EXISTS idx_project_findings_project ON project_findings(project_id)",
+    "CREATE INDEX IF NOT EXISTS idx_project_findings_session ON project_findings(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_project_unknowns_project ON project_unknowns(project_id)",
+    "CREATE INDEX IF NOT EXISTS idx_project_unknowns_resolved ON project_unknowns(is_resolved)",
+    "CREATE INDEX IF NOT EXISTS idx_project_dead_ends_project ON project_dead_ends(project_id)",
+    # idx_project_reference_docs_project dropped in goal 3d6aeb08 Phase 3 —
+    # the project_reference_docs table is dropped by migration 047.
+    "CREATE INDEX IF NOT EXISTS idx_epistemic_sources_project ON epistemic_sources(project_id)",
+    "CREATE INDEX IF NOT EXISTS idx_epistemic_sources_session ON epistemic_sources(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_epistemic_sources_type ON epistemic_sources(source_type)",
+    "CREATE INDEX IF NOT EXISTS idx_epistemic_sources_confidence ON epistemic_sources(confidence)",
+    # investigation_branches
+    "CREATE INDEX IF NOT EXISTS idx_investigation_branches_session ON investigation_branches(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_investigation_branches_status ON investigation_branches(status)",
+    "CREATE INDEX IF NOT EXISTS idx_investigation_branches_winner ON investigation_branches(is_winner)",
+    "CREATE INDEX IF NOT EXISTS idx_investigation_branches_merge_score ON investigation_branches(merge_score)",
+    # merge_decisions
+    "CREATE INDEX IF NOT EXISTS idx_merge_decisions_session ON merge_decisions(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_merge_decisions_round ON merge_decisions(investigation_round)",
+    "CREATE INDEX IF NOT EXISTS idx_merge_decisions_winning_branch ON merge_decisions(winning_branch_id)",
+    # token_savings
+    "CREATE INDEX IF NOT EXISTS idx_token_savings_session ON token_savings(session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_token_savings_type ON token_savings(saving_type)",
+)
+
+_TRANSACTION_INDEXES: tuple[tuple[str, str], ...] = (
+    ("assumptions", "idx_assumptions_transaction"),
+    ("decisions", "idx_decisions_transaction"),
+    ("project_findings", "idx_findings_transaction"),
+    ("project_unknowns", "idx_unknowns_transaction"),
+    ("project_dead_ends", "idx_dead_ends_transaction"),
+)
+
+_SCHEMA_FINGERPRINT: int | None = None
+
+
+def schema_fingerprint() -> int:
+    """Fingerprint of the schema this code expects, stored in PRAGMA user_version.
+
+    Hashes ALL_SCHEMAS DDL, the ordered migration IDs and the index set.
+    Truncated to 28 bits so it fits SQLite's signed 32-bit user_version and
+    is never 0 (0 means "never set up by this scheme"). Computed once per process.
+    """
+    global _SCHEMA_FINGERPRINT
+    if _SCHEMA_FINGERPRINT is None:
+        import hashlib
+
+        from empirica.data.migrations import ALL_MIGRATIONS
+        from empirica.data.schema import ALL_SCHEMAS
+
+        h = hashlib.sha256()
+        for schema_sql in ALL_SCHEMAS:
+            h.update(schema_sql.encode("utf-8"))
+        for migration_id, _description, _func in ALL_MIGRATIONS:
+            h.update(migration_id.encode("utf-8"))
+        for index_sql in CORE_INDEX_STATEMENTS:
+            h.update(index_sql.encode("utf-8"))
+        for table, idx_name in _TRANSACTION_INDEXES:
+            h.update(f"{table}:{idx_name}".encode())
+        _SCHEMA_FINGERPRINT = int(h.hexdigest()[:7], 16) or 1
+    return _SCHEMA_FINGERPRINT
+
+
 class SessionDatabase:
     """Central database for all session data (supports SQLite and PostgreSQL)"""
 
@@ -203,11 +292,21 @@ class SessionDatabase:
             ) from e
 
     def _create_tables(self):
-        """Create all database tables from schema modules (dialect-aware)"""
+        """Create all database tables from schema modules (dialect-aware).
+
+        SQLite databases carry a schema fingerprint in ``PRAGMA user_version``.
+        When it matches the fingerprint of the running code the full DDL /
+        migration / index pass is skipped, so an up-to-date database opens
+        with a single read. Any schema, migration or index change alters the
+        fingerprint and triggers the full (idempotent) pass once.
+        """
+        dialect = self.adapter.dialect
+        if dialect == "sqlite" and self._read_schema_fingerprint() == schema_fingerprint():
+            return
+
         from empirica.data.schema import ALL_SCHEMAS
         from empirica.data.schema.dialect import adapt_all_schemas
 
-        dialect = self.adapter.dialect
         cursor = self.conn.cursor()
 
         # Adapt and execute all table schemas for current dialect
@@ -222,72 +321,40 @@ class SessionDatabase:
             migration_runner.run_all(ALL_MIGRATIONS)
 
         # Create indexes for performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_ai ON sessions(ai_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions(start_time)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cascades_session ON cascades(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cascades_confidence ON cascades(final_confidence)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_beliefs_cascade ON bayesian_beliefs(cascade_id)")
+        for index_sql in CORE_INDEX_STATEMENTS:
+            cursor.execute(index_sql)
+
         # BEADS integration index (check if column exists first)
         if self.adapter.column_exists("goals", "beads_issue_id"):
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_goals_beads_issue_id ON goals(beads_issue_id)")
-        # Index for reflexes table (replaces old cascade_metadata index)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_session ON epistemic_snapshots(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_ai ON epistemic_snapshots(ai_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_cascade ON epistemic_snapshots(cascade_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_created ON epistemic_snapshots(created_at)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_reflexes_session ON reflexes(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_reflexes_phase ON reflexes(phase)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_goals_session ON goals(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_goals_status ON goals(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_subtasks_goal ON subtasks(goal_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_subtasks_status ON subtasks(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_mistakes_session ON mistakes_made(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_mistakes_goal ON mistakes_made(goal_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_projects_activity ON projects(last_activity_timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_project_handoffs_project ON project_handoffs(project_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_project_handoffs_timestamp ON project_handoffs(created_timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_project ON sessions(project_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_project_findings_project ON project_findings(project_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_project_findings_session ON project_findings(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_project_unknowns_project ON project_unknowns(project_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_project_unknowns_resolved ON project_unknowns(is_resolved)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_project_dead_ends_project ON project_dead_ends(project_id)")
-        # idx_project_reference_docs_project dropped in goal 3d6aeb08 Phase 3 —
-        # the project_reference_docs table is dropped by migration 047.
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_epistemic_sources_project ON epistemic_sources(project_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_epistemic_sources_session ON epistemic_sources(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_epistemic_sources_type ON epistemic_sources(source_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_epistemic_sources_confidence ON epistemic_sources(confidence)")
-
-        # Indexes for investigation_branches
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_investigation_branches_session ON investigation_branches(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_investigation_branches_status ON investigation_branches(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_investigation_branches_winner ON investigation_branches(is_winner)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_investigation_branches_merge_score ON investigation_branches(merge_score)")
-
-        # Indexes for merge_decisions
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_merge_decisions_session ON merge_decisions(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_merge_decisions_round ON merge_decisions(investigation_round)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_merge_decisions_winning_branch ON merge_decisions(winning_branch_id)")
-
-        # Indexes for token_savings
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_token_savings_session ON token_savings(session_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_token_savings_type ON token_savings(saving_type)")
 
         # transaction_id indexes — must run AFTER migrations that add the column (#44)
-        for table, idx_name in [
-            ("assumptions", "idx_assumptions_transaction"),
-            ("decisions", "idx_decisions_transaction"),
-            ("project_findings", "idx_findings_transaction"),
-            ("project_unknowns", "idx_unknowns_transaction"),
-            ("project_dead_ends", "idx_dead_ends_transaction"),
-        ]:
+        for table, idx_name in _TRANSACTION_INDEXES:
             if self.adapter.column_exists(table, "transaction_id"):
                 cursor.execute(f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table}(transaction_id)")
 
         self.conn.commit()
 
+        if dialect == "sqlite":
+            self._write_schema_fingerprint(schema_fingerprint())
+
+    def _read_schema_fingerprint(self) -> int:
+        """Return the fingerprint stored in PRAGMA user_version (0 if unset)."""
+        try:
+            row = self.conn.execute("PRAGMA user_version").fetchone()
+            return int(row[0]) if row else 0
+        except Exception:
+            return 0
+
+    def _write_schema_fingerprint(self, fingerprint: int) -> None:
+        """Persist the schema fingerprint after a successful full setup pass."""
+        try:
+            # PRAGMA does not accept bound parameters; fingerprint is an int we computed
+            self.conn.execute(f"PRAGMA user_version = {int(fingerprint)}")
+            self.conn.commit()
+        except Exception as e:
+            logger.debug(f"Could not persist schema fingerprint: {e}")
+
     def create_session(self, ai_id: str, components_loaded: int = 0,
                       user_id: str | None = None, subject: str | None = None,
                       bootstrap_level: int = 1,
@@ -1476,13 +1543,9 @@ class SessionDatabase:
             return None
 
     @staticmethod
-    def _analyze_py_file_imports(py_file, root_path, package_prefixes, reverse_graph, external_deps, entry_points):
-        """Analyze a single Python file for imports and entry points."""
-        import ast
-        try:
-            file_content = py_file.read_text(errors='replace')
-            tree = ast.parse(file_content)
-        except (SyntaxError, UnicodeDecodeError):
+    def _analyze_py_file_imports(py_file, facts, root_path, package_prefixes, reverse_graph, external_deps, entry_points):
+        """Fold one file's indexed AST facts into the import graph and entry points."""
+        if facts is None or not facts.parsed:
             return
         try:
             rel_parts = list(py_file.relative_to(root_path).parts)
@@ -1493,27 +1556,20 @@ class SessionDatabase:
             module_name = ".".join(rel_parts)
         except ValueError:
             return
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    top = alias.name.split('.')[0]
-                    if top in package_prefixes:
-                        reverse_graph[alias.name].add(module_name)
-                    else:
-                        external_deps.add(top)
-            elif isinstance(node, ast.ImportFrom) and node.module:
-                top = node.module.split('.')[0]
-                if top in package_prefixes:
-                    reverse_graph[node.module].add(module_name)
-                elif node.level == 0:
-                    external_deps.add(top)
-        for node in ast.walk(tree):
-            if (isinstance(node, ast.If) and isinstance(node.test, ast.Compare) and len(node.test.comparators) == 1):
-                left = node.test.left
-                comp = node.test.comparators[0]
-                if isinstance(left, ast.Name) and left.id == '__name__' and isinstance(comp, ast.Constant) and comp.value == '__main__':
-                    entry_points.append(module_name)
-                    break
+        for name in facts.imports:
+            top = name.split('.')[0]
+            if top in package_prefixes:
+                reverse_graph[name].add(module_name)
+            else:
+                external_deps.add(top)
+        for module, level in facts.from_imports:
+            top = module.split('.')[0]
+            if top in package_prefixes:
+                reverse_graph[module].add(module_name)
+            elif level == 0:
+                external_deps.add(top)
+        if facts.entry_point:
+            entry_points.append(module_name)
 
     def _generate_dependency_summary(self, project_root: str) -> dict | None:
         """Generate lightweight dependency summary using AST import analysis.
@@ -1522,6 +1578,8 @@ class SessionDatabase:
         injection. Replaces the old file tree with semantically useful information.
 
         Uses 5-minute cache since import structure changes less often than files.
+        Past that, per-file imports come from the project's AstIndex, so only
+        files changed since the last summary are re-parsed.
 
         Returns dict with:
           - packages: Top-level Python packages found
@@ -1535,6 +1593,8 @@ class SessionDatabase:
         from collections import defaultdict
         from pathlib import Path
 
+        from empirica.core.ast_index import AstIndex
+
         root_path = Path(project_root)
 
         # Belt-and-suspenders: refuse to mkdir .empirica/ under a path that
@@ -1578,6 +1638,7 @@ class SessionDatabase:
         module_count = 0
         all_module_basenames = set()  # Track all file basenames for filtering
 
+        py_files = []
         for py_file in root_path.rglob("*.py"):
             # Skip unwanted directories
             if any(_should_skip(part) for part in py_file.relative_to(root_path).parts):
@@ -1585,8 +1646,10 @@ class SessionDatabase:
 
             module_count += 1
             all_module_basenames.add(py_file.stem)
+            py_files.append(py_file)
 
-            self._analyze_py_file_imports(py_file, root_path, package_prefixes, reverse_graph, external_deps, entry_points)
+        for py_file, facts in zip(py_files, AstIndex.for_root(root_path).update(py_files)):
+            self._analyze_py_file_imports(py_file, facts, root_path, package_prefixes, reverse_graph, external_deps, entry_points)
 
         # Build hotspots (top 10 by importer count)
         hotspots = sorted(
@@ -1674,13 +1737,14 @@ class SessionDatabase:
         try:
             from empirica.core.qdrant.vector_store import (
                 _check_qdrant_available,
+                _collection_exists,
                 _decisions_collection,
                 _get_qdrant_client,
             )
             if _check_qdrant_available():
                 client = _get_qdrant_client()
                 coll = _decisions_collection(project_id)
-                if client and client.collection_exists(coll):
+                if client and _collection_exists(client, coll):
                     results = client.scroll(collection_name=coll, limit=DECISIONS_LIMIT, with_payload=True)
                     for pt in results[0]:
                         p = pt.payload or {}
@@ -1779,14 +1843,18 @@ class SessionDatabase:
         from empirica.core.bootstrap.situation import build_situation
         return build_situation(project_root, project_id)
 
+    def get_project_counters(self, project_id: str | None = None) -> dict | None:
+        """Trigger-maintained per-project counts, or None if unavailable (see data/project_counters.py)"""
+        from .project_counters import read_project_counters
+        return read_project_counters(self.conn, project_id)
+
     def _count_project_artifacts(self, project_id: str) -> dict:
         """Live counts for a project — sessions + transactions + goals.
 
         The `projects.total_sessions` / `total_goals` columns are
         denormalized counters that were never wired to insert triggers
-        and have drifted to 0. Until we either add triggers or drop the
-        columns, callers that want accurate counts should use this helper
-        instead of reading those columns directly.
+        and have drifted to 0. Callers that want accurate counts should
+        use this helper instead of reading those columns directly.
 
         `total_transactions` is the more meaningful unit-of-work measure
         (sessions are compaction-window boundaries; transactions are
@@ -1794,15 +1862,31 @@ class SessionDatabase:
         transaction_ids on reflexes — each transaction creates ≥1
         reflex row at PREFLIGHT.
 
-        Cost: 3 indexed COUNT queries. ~3ms on a warm cache.
+        Sessions and goals come from the trigger-maintained
+        project_counters row (migration 057) when available.
+        Cost: 1 point read + 1 indexed COUNT.
         """
-        try:
-            sessions_count = self._execute(
-                "SELECT COUNT(*) FROM sessions WHERE project_id = ?",
-                (project_id,),
-            ).fetchone()[0]
-        except Exception:
-            sessions_count = 0
+        counters = self.get_project_counters(project_id)
+        if counters is not None:
+            sessions_count = counters['sessions']
+            goals_count = counters['goals']
+        else:
+            try:
+                sessions_count = self._execute(
+                    "SELECT COUNT(*) FROM sessions WHERE project_id = ?",
+                    (project_id,),
+                ).fetchone()[0]
+            except Exception:
+                sessions_count = 0
+            try:
+                # Goals are session-scoped — count via the sessions join
+                goals_count = self._execute(
+                    "SELECT COUNT(*) FROM goals WHERE session_id IN "
+                    "(SELECT session_id FROM sessions WHERE project_id = ?)",
+                    (project_id,),
+                ).fetchone()[0]
+            except Exception:
+                goals_count = 0
         try:
             transactions_count = self._execute(
                 "SELECT COUNT(DISTINCT transaction_id) FROM reflexes "
@@ -1811,15 +1895,6 @@ class SessionDatabase:
             ).fetchone()[0]
         except Exception:
             transactions_count = 0
-        try:
-            # Goals are session-scoped — count via the sessions join
-            goals_count = self._execute(
-                "SELECT COUNT(*) FROM goals WHERE session_id IN "
-                "(SELECT session_id FROM sessions WHERE project_id = ?)",
-                (project_id,),
-            ).fetchone()[0]
-        except Exception:
-            goals_count = 0
         return {
             'total_sessions': int(sessions_count),
             'total_transactions': int(transactions_count),
@@ -2407,6 +2482,16 @@ class SessionDatabase:
             description=description,
         )
 
+    def find_similar_findings(
+        self,
+        project_id: str,
+        text: str,
+        threshold: float = 0.7,
+        limit: int = 5,
+    ) -> list[dict]:
+        """Near-duplicate findings by word-set Jaccard (delegates to BreadcrumbRepository)"""
+        return self.breadcrumbs.find_similar_findings(project_id, text, threshold, limit)
+
     def log_session_finding(
         self,
         session_id: str,
@@ -24,6 +24,12 @@ _lib_path = Path(__file__).parent.parent / 'lib'
 if str(_lib_path) not in sys.path:
     sys.path.insert(0, str(_lib_path))
 
+# Opt-in warm path: when `empirica hook-daemon` is running it executes this
+# script in a warm interpreter and we exit here; otherwise continue in-process.
+if __name__ == '__main__':
+    from hook_daemon_client import forward_to_daemon
+    forward_to_daemon(__file__)
+
 from project_resolver import _get_instance_suffix, get_instance_id  # noqa: E402 — after sys.path setup
 
 
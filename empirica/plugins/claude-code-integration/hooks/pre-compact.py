@@ -34,8 +34,8 @@ _SKIP_PATTERNS = [
 ]
 
 
-def _extract_last_task(transcript_path: str, max_chars: int = 500) -> str:
-    """Extract the last human task message from the JSONL transcript.
+def _is_human_task(entry: dict) -> bool:
+    """True for a user record that is a human-typed task, not injected content.
 
     Filters out:
     - Tool results (content is array, not string)
@@ -43,47 +43,41 @@ def _extract_last_task(transcript_path: str, max_chars: int = 500) -> str:
     - System reminders
     - Very long messages (>2000 chars = likely injected content)
     """
-    if not transcript_path or not Path(transcript_path).exists():
-        return ""
+    message = entry.get('message', {})
+    content = message.get('content', '') if isinstance(message, dict) else ''
 
-    try:
-        lines = Path(transcript_path).read_text().strip().split('\n')
-        for line in reversed(lines):
-            if not line.strip():
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    # Content must be a string (array = tool result)
+    if not isinstance(content, str):
+        return False
 
-            if entry.get('type') != 'user':
-                continue
+    content = content.strip()
+    if not content:
+        return False
 
-            message = entry.get('message', {})
-            content = message.get('content', '')
+    # Skip known non-human patterns
+    if any(pattern in content[:300] for pattern in _SKIP_PATTERNS):
+        return False
 
-            # Content must be a string (array = tool result)
-            if not isinstance(content, str):
-                continue
+    # Skip very long messages (injected content, not human input)
+    return len(content) <= 2000
 
-            content = content.strip()
-            if not content:
-                continue
 
-            # Skip known non-human patterns
-            skip = False
-            for pattern in _SKIP_PATTERNS:
-                if pattern in content[:300]:
-                    skip = True
-                    break
-            if skip:
-                continue
+def _extract_last_task(transcript_path: str, max_chars: int = 500) -> str:
+    """Extract the last human task message from the JSONL transcript.
 
-            # Skip very long messages (injected content, not human input)
-            if len(content) > 2000:
-                continue
+    Reads backwards from the end of the transcript in fixed-size blocks and
+    stops at the first human task, so the cost is the size of the tail
+    rather than the (possibly hundreds of MB) whole file.
+    """
+    if not transcript_path or not Path(transcript_path).exists():
+        return ""
+
+    try:
+        from empirica.utils.transcript_reader import TranscriptReader
 
-            return content[:max_chars]
+        found = TranscriptReader(transcript_path).last('user', predicate=_is_human_task)
+        if found:
+            return found[0]['message']['content'].strip()[:max_chars]
     except Exception:
         pass
 
@@ -40,6 +40,12 @@ _lib_path = Path(__file__).parent.parent / 'lib'
 if str(_lib_path) not in sys.path:
     sys.path.insert(0, str(_lib_path))
 
+# Opt-in warm path: when `empirica hook-daemon` is running it executes this
+# script in a warm interpreter and we exit here; otherwise continue in-process.
+if __name__ == '__main__':
+    from hook_daemon_client import forward_to_daemon
+    forward_to_daemon(__file__)
+
 from project_resolver import detect_environment, get_active_project_path, get_instance_id  # noqa: E402, I001 — after sys.path setup
 
 # Noetic tools - read/investigate/search - always allowed (whitelist)
@@ -305,8 +311,8 @@ def _get_dynamic_thresholds(db) -> tuple:
     Only the noetic phase thresholds are used for the sentinel gate (investigation → action).
     """
     try:
-        from empirica.core.post_test.dynamic_thresholds import compute_dynamic_thresholds
-        dt_result = compute_dynamic_thresholds(ai_id="claude-code", db=db)
+        from empirica.core.post_test.dynamic_thresholds import cached_dynamic_thresholds
+        dt_result = cached_dynamic_thresholds(ai_id="claude-code", db=db)
         if dt_result.get("source") == "dynamic":
             noetic = dt_result.get("noetic", {})
             if noetic.get("brier_score") is not None:
@@ -321,17 +327,46 @@ def _get_domain_scaled_thresholds(
     domain: str | None,
     criticality: str | None,
     project_path: str | None = None,
+    db=None,
 ) -> float:
     """Scale uncertainty threshold based on domain criticality (B1 Wave 2).
 
     Higher criticality = stricter threshold (lower uncertainty required).
     Uses coverage_min from the domain checklist as the scaling signal.
+    With a db, the result is cached alongside the dynamic thresholds and
+    reused until calibration data or a domain file changes.
 
     Returns the adjusted uncertainty threshold.
     """
     if not domain and not criticality:
         return base_unc
 
+    if db is not None:
+        try:
+            from empirica.core.post_test.dynamic_thresholds import (
+                cached_threshold,
+                domain_config_signature,
+            )
+            key_parts = [
+                "domain_scaled_uncertainty", base_unc, domain, criticality, project_path,
+                domain_config_signature(project_path),
+            ]
+            return cached_threshold(
+                db, key_parts,
+                lambda: _scale_uncertainty_for_domain(base_unc, domain, criticality, project_path),
+            )
+        except (ImportError, OSError):
+            pass
+    return _scale_uncertainty_for_domain(base_unc, domain, criticality, project_path)
+
+
+def _scale_uncertainty_for_domain(
+    base_unc: float,
+    domain: str | None,
+    criticality: str | None,
+    project_path: str | None,
+) -> float:
+    """Resolve the domain checklist and scale base_unc by its coverage_min."""
     try:
         from pathlib import Path
 
@@ -2705,6 +2740,7 @@ def _check_auto_proceed(raw_know: float, raw_unc: float, db, tx_file,
         _current_domain,
         _current_criticality,
         project_path=str(Path(tx_file).parent.parent) if tx_file else None,
+        db=db,
     )
     if raw_know >= _dyn_know and raw_unc <= _domain_unc:
         _domain_info = ""
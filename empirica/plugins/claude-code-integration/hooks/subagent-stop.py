@@ -63,6 +63,32 @@ def mark_session_completed(session_file: str, summary: dict):
         pass
 
 
+def _assistant_records(transcript_path: str):
+    """Yield the transcript's assistant records lazily.
+
+    Reads through the transcript's offset index: the first pass over a
+    transcript builds (or extends) the sidecar, later passes seek straight to
+    the assistant records. Falls back to a line-by-line read when the
+    empirica package isn't importable from the hook.
+    """
+    try:
+        from empirica.utils.transcript_reader import TranscriptReader
+    except ImportError:
+        try:
+            with open(transcript_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(entry, dict) and entry.get("type") == "assistant":
+                        yield entry
+        except (OSError, UnicodeDecodeError):
+            pass
+        return
+    yield from TranscriptReader(transcript_path).records_of_type("assistant")
+
+
 def count_transcript_tool_calls(transcript_path: str) -> int:
     """Count tool use invocations in a subagent's transcript.
 
@@ -73,24 +99,16 @@ def count_transcript_tool_calls(transcript_path: str) -> int:
         return 0
 
     count = 0
-    try:
-        content = Path(transcript_path).read_text()
-        for line in content.strip().split('\n'):
-            try:
-                entry = json.loads(line)
-                msg = entry.get("message", {})
-                if msg.get("role") != "assistant":
-                    continue
-                # Count tool_use blocks in content
-                content_blocks = msg.get("content", [])
-                if isinstance(content_blocks, list):
-                    for block in content_blocks:
-                        if isinstance(block, dict) and block.get("type") == "tool_use":
-                            count += 1
-            except json.JSONDecodeError:
-                continue
-    except (OSError, UnicodeDecodeError):
-        pass
+    for entry in _assistant_records(transcript_path):
+        msg = entry.get("message", {})
+        if not isinstance(msg, dict) or msg.get("role") != "assistant":
+            continue
+        # Count tool_use blocks in content
+        content_blocks = msg.get("content", [])
+        if isinstance(content_blocks, list):
+            for block in content_blocks:
+                if isinstance(block, dict) and block.get("type") == "tool_use":
+                    count += 1
 
     return count
 
@@ -209,34 +227,24 @@ def extract_findings_from_transcript(transcript_path: str) -> dict:
     finding_patterns = ["Found:", "Discovered:", "Key insight:", "Result:"]
     unknown_patterns = ["Unknown:", "Unclear:", "Need to investigate:", "TODO:"]
 
-    try:
-        content = Path(transcript_path).read_text()
-        for line in content.strip().split('\n'):
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            msg = entry.get("message", {})
-            if msg.get("role") != "assistant":
-                continue
-
-            text_content = _extract_text_from_message(msg)
-            if not text_content:
-                continue
+    for entry in _assistant_records(transcript_path):
+        msg = entry.get("message", {})
+        if not isinstance(msg, dict) or msg.get("role") != "assistant":
+            continue
 
-            for pattern in finding_patterns:
-                match = _extract_matching_sentence(text_content, pattern)
-                if match:
-                    findings.append(match)
+        text_content = _extract_text_from_message(msg)
+        if not text_content:
+            continue
 
-            for pattern in unknown_patterns:
-                match = _extract_matching_sentence(text_content, pattern)
-                if match:
-                    unknowns.append(match)
+        for pattern in finding_patterns:
+            match = _extract_matching_sentence(text_content, pattern)
+            if match:
+                findings.append(match)
 
-    except (OSError, UnicodeDecodeError):
-        pass
+        for pattern in unknown_patterns:
+            match = _extract_matching_sentence(text_content, pattern)
+            if match:
+                unknowns.append(match)
 
     return {
         "findings": findings[:5],  # Cap at 5 per type
@@ -328,6 +336,29 @@ def rollup_to_parent(parent_session_id: str, agent_name: str, extracted: dict,
     return logged
 
 
+def _project_near_duplicates(db, project_id, raw_findings, known):
+    """Closest earlier project finding to each raw finding, via the MinHash bands.
+
+    Lets novelty scoring see the whole project's history through index probes
+    instead of only the parent session's recent findings.
+    """
+    if not project_id or not hasattr(db, "find_similar_findings"):
+        return []
+    seen = set(known)
+    closest = []
+    for item in raw_findings:
+        text = item.get("finding", "") if isinstance(item, dict) else str(item)
+        try:
+            matches = db.find_similar_findings(project_id, text, threshold=0.0, limit=1)
+        except Exception:
+            return closest
+        for match in matches:
+            if match["finding"] not in seen:
+                seen.add(match["finding"])
+                closest.append(match["finding"])
+    return closest
+
+
 def _gated_rollup(parent_session_id, project_id, agent_name, raw_findings, db,
                   subagent_data=None):
     """Run findings through EpistemicRollupGate. Returns None if gate unavailable."""
@@ -360,6 +391,7 @@ def _gated_rollup(parent_session_id, project_id, agent_name, raw_findings, db,
             existing = [row[0] for row in cursor.fetchall()]
         except Exception:
             pass
+        existing += _project_near_duplicates(db, project_id, raw_findings, existing)
 
         # Load budget if one exists for this session
         budget_id = None
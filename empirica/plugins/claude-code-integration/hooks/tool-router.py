@@ -23,6 +23,16 @@ import sys
 import time
 from pathlib import Path
 
+_lib_path = Path(__file__).parent.parent / 'lib'
+if str(_lib_path) not in sys.path:
+    sys.path.insert(0, str(_lib_path))
+
+# Opt-in warm path: when `empirica hook-daemon` is running it executes this
+# script in a warm interpreter and we exit here; otherwise continue in-process.
+if __name__ == '__main__':
+    from hook_daemon_client import forward_to_daemon
+    forward_to_daemon(__file__)
+
 # ============================================================================
 # Agent domain registry — keyword → agent mapping
 # ============================================================================
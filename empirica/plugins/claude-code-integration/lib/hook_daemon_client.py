@@ -0,0 +1,138 @@
+"""
+Hook Daemon Client - Forward a hook invocation to the warm hook daemon
+
+Hook scripts call forward_to_daemon(__file__) before their heavy imports.
+If `empirica hook-daemon start` is running, the hook's argv/stdin/env/cwd
+are sent over ~/.empirica/hookd.sock, the daemon runs the same script in a
+warm interpreter, and this process prints the result and exits with the
+script's exit code — skipping the cold start entirely.
+
+If the daemon is not running (no socket, connect refused, timeout, bad
+reply) the call returns and the hook continues in-process exactly as before.
+
+IMPORTANT: This module uses ONLY stdlib imports. It runs before anything
+else in the hook, so it must stay cheap to import.
+
+Environment:
+    EMPIRICA_HOOKD_SOCKET   Override socket path
+    EMPIRICA_HOOKD_DISABLE  Set to 1/true to always run in-process
+    EMPIRICA_HOOKD_INPROC   Set by the daemon itself (prevents re-forwarding)
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+INPROC_ENV = 'EMPIRICA_HOOKD_INPROC'
+SOCKET_ENV = 'EMPIRICA_HOOKD_SOCKET'
+DISABLE_ENV = 'EMPIRICA_HOOKD_DISABLE'
+
+CONNECT_TIMEOUT = 0.2
+RESPONSE_TIMEOUT = 15.0
+
+
+def _socket_path() -> Path:
+    """Socket path: $EMPIRICA_HOOKD_SOCKET or ~/.empirica/hookd.sock."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / '.empirica' / 'hookd.sock'
+
+
+def _read_stdin(stdin_wait: float | None) -> str:
+    """Read all of stdin. With stdin_wait, give up if nothing arrives in time."""
+    try:
+        if sys.stdin is None or sys.stdin.isatty():
+            return ''
+        if stdin_wait is not None:
+            import select
+            ready, _, _ = select.select([sys.stdin], [], [], stdin_wait)
+            if not ready:
+                return ''
+        return sys.stdin.read()
+    except Exception:
+        return ''
+
+
+def _restore_stdin(data: str) -> None:
+    """Put consumed stdin back for the in-process fallback.
+
+    Uses a real temp file rather than StringIO so hooks that select() on
+    stdin (statusline) keep working.
+    """
+    buf = tempfile.TemporaryFile('w+', encoding='utf-8')  # noqa: SIM115 — becomes sys.stdin; must outlive this call
+    buf.write(data)
+    buf.seek(0)
+    sys.stdin = buf
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    """Read the daemon reply until it closes the connection."""
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def forward_to_daemon(script_path: str, stdin_wait: float | None = None) -> None:
+    """Run this hook through the daemon if it is up; otherwise return.
+
+    On success this never returns: it writes the daemon's stdout/stderr and
+    exits with the hook's exit code.
+
+    Args:
+        script_path: The calling hook's __file__
+        stdin_wait: Seconds to wait for stdin data (None = block until EOF,
+                    as hooks do; statusline passes a short wait)
+    """
+    if os.environ.get(INPROC_ENV):
+        return
+    if os.environ.get(DISABLE_ENV, '').strip().lower() in {'1', 'true', 'yes'}:
+        return
+    sock_path = _socket_path()
+    if not sock_path.exists():
+        return
+
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(sock_path))
+    except OSError:
+        return
+
+    stdin_data = _read_stdin(stdin_wait)
+    try:
+        with sock:
+            request = {
+                'op': 'run',
+                'script': str(Path(script_path).resolve()),
+                'stdin': stdin_data,
+                'env': dict(os.environ),
+                'cwd': os.getcwd(),
+                'argv': sys.argv[1:],
+            }
+            sock.settimeout(RESPONSE_TIMEOUT)
+            sock.sendall(json.dumps(request).encode('utf-8'))
+            sock.shutdown(socket.SHUT_WR)
+            reply = json.loads(_recv_all(sock).decode('utf-8'))
+    except (OSError, ValueError):
+        _restore_stdin(stdin_data)
+        return
+
+    if not isinstance(reply, dict) or not reply.get('ok'):
+        _restore_stdin(stdin_data)
+        return
+
+    if reply.get('stdout'):
+        sys.stdout.write(reply['stdout'])
+        sys.stdout.flush()
+    if reply.get('stderr'):
+        sys.stderr.write(reply['stderr'])
+        sys.stderr.flush()
+    sys.exit(int(reply.get('exit_code', 0)))
@@ -28,6 +28,15 @@ from pathlib import Path
 # Add empirica to path
 EMPIRICA_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(EMPIRICA_ROOT))
+_lib_path = EMPIRICA_ROOT / 'lib'
+if str(_lib_path) not in sys.path:
+    sys.path.insert(0, str(_lib_path))
+
+# Opt-in warm path: when `empirica hook-daemon` is running it executes this
+# script in a warm interpreter and we exit here; otherwise continue in-process.
+if __name__ == '__main__':
+    from hook_daemon_client import forward_to_daemon
+    forward_to_daemon(__file__, stdin_wait=0.1)
 
 from empirica.core.signaling import format_vectors_compact  # noqa: E402 — after sys.path setup
 from empirica.data.session_database import SessionDatabase  # noqa: E402 — after sys.path setup
@@ -73,6 +82,22 @@ def get_open_counts(db: SessionDatabase, session_id: str, project_id: str | None
             'completion': float,         # Latest completion vector (0.0-1.0)
         }
     """
+    from empirica.data.project_counters import read_project_counters
+
+    # Trigger-maintained counters (migration 057): one primary-key read
+    counters = read_project_counters(db.conn, project_id)
+    if counters is not None:
+        if counters['latest_completion_session'] == session_id:
+            completion = counters['latest_completion']
+        else:
+            completion = _latest_session_completion(db.conn.cursor(), session_id)
+        return {
+            'open_goals': counters['open_goals'],
+            'open_unknowns': counters['open_unknowns'],
+            'goal_linked_unknowns': counters['goal_linked_unknowns'],
+            'completion': completion if completion is not None else 0.0,
+        }
+
     cursor = db.conn.cursor()
 
     # Count open goals for THIS PROJECT (project-scoped, not session-scoped)
@@ -122,7 +147,18 @@ def get_open_counts(db: SessionDatabase, session_id: str, project_id: str | None
         """)
     goal_linked_unknowns = cursor.fetchone()[0] or 0
 
-    # Get completion from latest vector state
+    completion = _latest_session_completion(cursor, session_id)
+
+    return {
+        'open_goals': open_goals,
+        'open_unknowns': open_unknowns,
+        'goal_linked_unknowns': goal_linked_unknowns,
+        'completion': completion if completion is not None else 0.0,
+    }
+
+
+def _latest_session_completion(cursor, session_id: str) -> float | None:
+    """Completion vector from the session's latest reflex, if any."""
     cursor.execute("""
         SELECT completion
         FROM reflexes
@@ -131,14 +167,7 @@ def get_open_counts(db: SessionDatabase, session_id: str, project_id: str | None
         LIMIT 1
     """, (session_id,))
     reflex_row = cursor.fetchone()
-    completion = reflex_row[0] if reflex_row and reflex_row[0] is not None else 0.0
-
-    return {
-        'open_goals': open_goals,
-        'open_unknowns': open_unknowns,
-        'goal_linked_unknowns': goal_linked_unknowns,
-        'completion': completion,
-    }
+    return reflex_row[0] if reflex_row else None
 
 
 def get_active_goal(db: SessionDatabase, session_id: str) -> dict | None:
@@ -374,8 +403,8 @@ def get_dynamic_threshold(db) -> tuple:
       Red = significant inflation (unreliable self-assessment)
     """
     try:
-        from empirica.core.post_test.dynamic_thresholds import compute_dynamic_thresholds
-        dt = compute_dynamic_thresholds(ai_id="claude-code", db=db)
+        from empirica.core.post_test.dynamic_thresholds import cached_dynamic_thresholds
+        dt = cached_dynamic_thresholds(ai_id="claude-code", db=db)
         if dt.get("source") == "dynamic":
             noetic = dt.get("noetic", {})
             if noetic.get("brier_score") is not None:
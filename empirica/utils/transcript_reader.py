@@ -0,0 +1,299 @@
+"""
+Transcript Reader — Streaming, seekable access to .jsonl session transcripts.
+
+Long Claude Code sessions produce transcripts of hundreds of MB. Everything
+that reads them goes through TranscriptReader instead of loading the file:
+
+- records(): lazy forward iteration, optionally resuming from a byte offset
+- reverse_records() / last(): read backwards from EOF in fixed-size blocks,
+  so "the last user message" costs the size of the tail, not the file
+- update_index() / records_of_type(): a sidecar offset index
+  (record type → byte offsets of its records, in file order) for random
+  access by per-type record number, extended incrementally as the
+  transcript grows
+
+Sidecar layout ({transcript}.offsets.json):
+    {"version": 1, "first_line_sha1": str, "size": int,
+     "by_type": {"user": [offset, ...], "assistant": [...], ...}}
+
+`size` is the byte length covered (always ends on a newline), so an update
+only scans what was appended since. A transcript whose first line changed
+or that shrank is re-indexed from scratch. If the sidecar can't be written
+(read-only transcript dir) the index lives only on the reader instance.
+
+Lines that aren't valid JSON objects are skipped everywhere, matching
+TranscriptParser.
+
+Architecture:
+    .jsonl file ──> TranscriptReader
+                         ├── records() ──> TranscriptParser.iter_session()
+                         ├── last() ──> pre-compact _extract_last_task()
+                         └── update_index() ──> records_of_type() ──> subagent-stop tool-call
+                                                                        count / finding extraction
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+BLOCK_SIZE = 64 * 1024
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".offsets.json"
+
+
+def _decode(line: bytes) -> dict[str, Any] | None:
+    """Parse one transcript line, or None for blank/malformed/non-object lines."""
+    if not line.strip():
+        return None
+    try:
+        record = json.loads(line)
+    except ValueError:  # JSONDecodeError and UnicodeDecodeError
+        return None
+    return record if isinstance(record, dict) else None
+
+
+@dataclass
+class TranscriptIndex:
+    """Byte offsets of each record, bucketed by record type, in file order."""
+    first_line_sha1: str = ""
+    size: int = 0
+    by_type: dict[str, list[int]] = field(default_factory=dict)
+
+    @property
+    def record_count(self) -> int:
+        return sum(len(offsets) for offsets in self.by_type.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "first_line_sha1": self.first_line_sha1,
+            "size": self.size,
+            "by_type": self.by_type,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TranscriptIndex | None:
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return None
+        by_type = data.get("by_type")
+        size = data.get("size")
+        if not isinstance(by_type, dict) or not isinstance(size, int):
+            return None
+        return cls(
+            first_line_sha1=str(data.get("first_line_sha1", "")),
+            size=size,
+            by_type={str(k): list(v) for k, v in by_type.items()},
+        )
+
+
+class TranscriptReader:
+    """Streaming reader over one .jsonl transcript."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        index_path: str | Path | None = None,
+        block_size: int = BLOCK_SIZE,
+    ):
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path else self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self.block_size = block_size
+        self._index: TranscriptIndex | None = None
+
+    def exists(self) -> bool:
+        return self.path.is_file()
+
+    # --- Forward ---
+
+    def records_with_offsets(self, start_offset: int = 0) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield (byte offset, record) in file order, starting at `start_offset`
+        (which must be the start of a line, e.g. from a previous read)."""
+        try:
+            f = open(self.path, 'rb')  # noqa: SIM115 - generator owns the handle
+        except OSError:
+            return
+        with f:
+            f.seek(start_offset)
+            offset = start_offset
+            for line in f:
+                record = _decode(line)
+                if record is not None:
+                    yield offset, record
+                offset += len(line)
+
+    def records(self, start_offset: int = 0) -> Iterator[dict[str, Any]]:
+        """Yield records lazily in file order."""
+        for _, record in self.records_with_offsets(start_offset):
+            yield record
+
+    def read_at(self, offset: int) -> dict[str, Any] | None:
+        """The record whose line starts at `offset`."""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                return _decode(f.readline())
+        except OSError:
+            return None
+
+    # --- Backward ---
+
+    def reverse_records(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield (byte offset, record) newest first, reading fixed-size blocks
+        back from EOF. A line longer than a block is stitched from its pieces
+        without re-scanning them."""
+        try:
+            f = open(self.path, 'rb')  # noqa: SIM115 - generator owns the handle
+        except OSError:
+            return
+        with f:
+            pos = f.seek(0, os.SEEK_END)
+            # Pieces of the line currently being assembled, newest piece first.
+            pending: list[bytes] = []
+            while pos > 0:
+                size = min(self.block_size, pos)
+                pos -= size
+                f.seek(pos)
+                block = f.read(size)
+
+                end = len(block)
+                newline = block.rfind(b'\n', 0, end)
+                while newline != -1:
+                    line = block[newline + 1:end]
+                    if pending:
+                        line += b''.join(reversed(pending))
+                        pending = []
+                    record = _decode(line)
+                    if record is not None:
+                        yield pos + newline + 1, record
+                    end = newline
+                    newline = block.rfind(b'\n', 0, end)
+                pending.append(block[:end])
+
+            record = _decode(b''.join(reversed(pending)))
+            if record is not None:
+                yield 0, record
+
+    def last(
+        self,
+        record_type: str | None = None,
+        n: int = 1,
+        predicate: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[dict[str, Any]]:
+        """The last `n` records (newest first) of `record_type`, optionally
+        filtered by `predicate`. Stops reading as soon as `n` are found."""
+        found: list[dict[str, Any]] = []
+        if n <= 0:
+            return found
+        for _, record in self.reverse_records():
+            if record_type is not None and record.get("type") != record_type:
+                continue
+            if predicate is not None and not predicate(record):
+                continue
+            found.append(record)
+            if len(found) >= n:
+                break
+        return found
+
+    # --- Offset index ---
+
+    def _first_line_sha1(self) -> str:
+        try:
+            with open(self.path, 'rb') as f:
+                first = f.readline()
+        except OSError:
+            return ""
+        if not first.endswith(b'\n'):
+            return ""
+        return hashlib.sha1(first, usedforsecurity=False).hexdigest()
+
+    def _load_index(self) -> TranscriptIndex | None:
+        if self._index is not None:
+            return self._index
+        try:
+            data = json.loads(self.index_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return TranscriptIndex.from_dict(data)
+
+    def _save_index(self, index: TranscriptIndex) -> None:
+        tmp = self.index_path.with_name(self.index_path.name + f".{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(index.to_dict(), separators=(',', ':')), encoding='utf-8')
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            logger.debug(f"Transcript index not persisted for {self.path.name}: {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def update_index(self) -> TranscriptIndex:
+        """Bring the offset index up to date with the transcript, scanning only
+        bytes appended since it was last extended, and persist it."""
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            self._index = TranscriptIndex()
+            return self._index
+
+        index = self._load_index()
+        first_line = self._first_line_sha1()
+        if index is None or index.size > size or (index.size and index.first_line_sha1 != first_line):
+            index = TranscriptIndex()
+        if size == index.size:
+            self._index = index
+            return index
+
+        covered = index.size
+        with open(self.path, 'rb') as f:
+            f.seek(covered)
+            offset = covered
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # still being written; picked up by the next update
+                record = _decode(line)
+                if record is not None:
+                    index.by_type.setdefault(str(record.get("type", "unknown")), []).append(offset)
+                offset += len(line)
+                covered = offset
+
+        if covered != index.size:
+            index.size = covered
+            index.first_line_sha1 = first_line
+            self._save_index(index)
+        self._index = index
+        return index
+
+    def records_of_type(
+        self, record_type: str, start: int = 0, stop: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Records of one type by per-type record number (slice semantics,
+        negative indices allowed), via the offset index."""
+        offsets = self.update_index().by_type.get(record_type, [])[start:stop]
+        if not offsets:
+            return
+        try:
+            f = open(self.path, 'rb')  # noqa: SIM115 - generator owns the handle
+        except OSError:
+            return
+        with f:
+            for offset in offsets:
+                f.seek(offset)
+                record = _decode(f.readline())
+                if record is not None:
+                    yield record
+
+
+__all__ = [
+    'TranscriptIndex',
+    'TranscriptReader',
+]
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark SessionDatabase open latency with and without the schema fast path.
+
+Builds a throwaway sessions.db seeded with N reflexes, then times
+SessionDatabase() construction in two modes:
+
+  full  — PRAGMA user_version reset to 0 before each open, forcing the
+          complete CREATE TABLE / migration / CREATE INDEX pass (the
+          pre-fingerprint behaviour)
+  fast  — fingerprint left in place, so the open is a single PRAGMA read
+
+Usage:
+    python scripts/bench_session_db_open.py [--reflexes 10000] [--runs 30]
+"""
+import argparse
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from empirica.data.session_database import SessionDatabase
+
+
+def seed(db_path: Path, n_reflexes: int) -> None:
+    """Create the schema and insert n_reflexes rows."""
+    SessionDatabase(db_path=str(db_path)).close()
+    conn = sqlite3.connect(str(db_path))
+    session_id = str(uuid.uuid4())
+    now = time.time()
+    conn.executemany(
+        "INSERT INTO reflexes (session_id, phase, round, timestamp, know, uncertainty) "
+        "VALUES (?, ?, 1, ?, 0.7, 0.3)",
+        [(session_id, ("PREFLIGHT", "CHECK", "POSTFLIGHT")[i % 3], now + i) for i in range(n_reflexes)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def time_opens(db_path: Path, runs: int, force_full: bool) -> list[float]:
+    """Return per-open latencies in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        if force_full:
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("PRAGMA user_version = 0")
+            conn.commit()
+            conn.close()
+        start = time.perf_counter()
+        db = SessionDatabase(db_path=str(db_path))
+        samples.append((time.perf_counter() - start) * 1000)
+        db.close()
+    return samples
+
+
+def summarize(label: str, samples: list[float]) -> str:
+    """Format p50/p95/mean for a set of samples."""
+    ordered = sorted(samples)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    return f"{label:<6} p50={statistics.median(ordered):7.2f} ms  p95={p95:7.2f} ms  mean={statistics.mean(ordered):7.2f} ms"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reflexes", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "sessions.db"
+        seed(db_path, args.reflexes)
+        # Warm imports so both modes measure DB work, not module loading
+        time_opens(db_path, 1, force_full=True)
+
+        full = time_opens(db_path, args.runs, force_full=True)
+        fast = time_opens(db_path, args.runs, force_full=False)
+
+    print(f"SessionDatabase open latency ({args.reflexes} reflexes, {args.runs} runs)")
+    print(summarize("full", full))
+    print(summarize("fast", fast))
+    print(f"speedup (p50): {statistics.median(full) / statistics.median(fast):.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
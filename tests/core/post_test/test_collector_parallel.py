@@ -0,0 +1,138 @@
+"""Tests for concurrent evidence collection in PostTestCollector.collect_all.
+
+Parallel sources run on worker threads with their own read-only SQLite
+connection and a per-source time budget; outcomes merge into the bundle in
+declaration order and every source records its duration.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from empirica.core.post_test.collector import (
+    EvidenceItem,
+    EvidenceProfile,
+    EvidenceQuality,
+    PostTestCollector,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    from empirica.data.session_database import SessionDatabase
+
+    database = SessionDatabase(db_path=str(tmp_path / "sessions.db"))
+    yield database
+    database.close()
+
+
+def _collector(db, monkeypatch):
+    collector = PostTestCollector(session_id="s1", db=db, phase="praxic")
+    monkeypatch.setattr(collector, "_resolve_profile", lambda: EvidenceProfile.CODE)
+    monkeypatch.setattr(collector, "_resolve_project_root", lambda: None)
+    return collector
+
+
+def _item(name: str) -> EvidenceItem:
+    return EvidenceItem(
+        source=name, metric_name=name, value=1.0, raw_value=1,
+        quality=EvidenceQuality.OBJECTIVE, supports_vectors=["do"],
+    )
+
+
+_METHODS = {
+    "artifacts": "_collect_artifact_metrics",
+    "goals": "_collect_goal_metrics",
+    "issues": "_collect_issue_metrics",
+    "triage": "_collect_triage_metrics",
+    "codebase_model": "_collect_codebase_model_metrics",
+    "non_git_files": "_collect_non_git_file_metrics",
+    "pytest": "_collect_test_results",
+    "git": "_collect_git_metrics",
+    "code_quality": "_collect_code_quality_metrics",
+}
+
+
+def test_sources_run_concurrently_and_merge_in_declaration_order(db, monkeypatch):
+    collector = _collector(db, monkeypatch)
+    threads = {}
+
+    def make(name, delay):
+        def _collect():
+            threads[name] = threading.current_thread().name
+            # Each worker sees its own read-only connection, not the shared one
+            assert collector._get_db() is not db
+            collector._get_db().conn.execute("SELECT 1").fetchone()
+            time.sleep(delay)
+            return [_item(name)]
+        return _collect
+
+    # Later-declared sources finish first
+    for i, (name, method) in enumerate(_METHODS.items()):
+        monkeypatch.setattr(collector, method, make(name, 0.3 - i * 0.03))
+
+    start = time.perf_counter()
+    bundle = collector.collect_all()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.5  # sequential would take ~1.6s
+    assert bundle.sources_available == list(_METHODS)
+    assert [item.metric_name for item in bundle.items] == list(_METHODS)
+    assert set(bundle.source_durations_ms) == set(_METHODS)
+    assert all(name.startswith("evidence") for name in threads.values())
+
+
+def test_overrunning_source_is_failed_with_budget_error(db, monkeypatch):
+    collector = _collector(db, monkeypatch)
+    for name, method in _METHODS.items():
+        monkeypatch.setattr(collector, method, lambda name=name: [_item(name)])
+    monkeypatch.setattr(collector, "_collect_git_metrics", lambda: time.sleep(1.0) or [_item("git")])
+    monkeypatch.setitem(PostTestCollector.SOURCE_TIME_BUDGETS, "git", 0.1)
+
+    bundle = collector.collect_all()
+
+    assert "git" in bundle.sources_failed
+    assert bundle.source_errors["git"].startswith("TimeoutError: exceeded 0.1s")
+    assert bundle.source_durations_ms["git"] == 100
+    assert "code_quality" in bundle.sources_available
+
+
+def test_overrunning_source_does_not_delay_process_exit(tmp_path):
+    script = textwrap.dedent(f"""
+        import time
+        from empirica.core.post_test.collector import EvidenceProfile, PostTestCollector
+        from empirica.data.session_database import SessionDatabase
+
+        collector = PostTestCollector(session_id="s1", db=SessionDatabase(db_path={str(tmp_path / "sessions.db")!r}),
+                                      phase="praxic")
+        collector._resolve_profile = lambda: EvidenceProfile.CODE
+        collector._resolve_project_root = lambda: None
+        for method in {sorted(_METHODS.values())!r}:
+            setattr(collector, method, lambda: [])
+        collector._collect_git_metrics = lambda: time.sleep(60) or []
+        PostTestCollector.SOURCE_TIME_BUDGETS["git"] = 0.1
+        assert "git" in collector.collect_all().sources_failed
+    """)
+
+    # The hung collector sleeps 60s; exit must not wait for it
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=30, cwd=tmp_path)
+
+
+def test_sequential_when_disabled_or_uncommitted_writes(db, monkeypatch):
+    collector = _collector(db, monkeypatch)
+    monkeypatch.setenv("EMPIRICA_EVIDENCE_PARALLEL", "0")
+    assert collector._parallel_db_path() is None
+
+    monkeypatch.delenv("EMPIRICA_EVIDENCE_PARALLEL")
+    assert collector._parallel_db_path() == str(db.db_path)
+    db.conn.execute("CREATE TABLE scratch (x)")
+    db.conn.commit()
+    db.conn.execute("INSERT INTO scratch VALUES (1)")
+    assert collector._parallel_db_path() is None
+    db.conn.rollback()
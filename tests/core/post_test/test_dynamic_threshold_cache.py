@@ -0,0 +1,107 @@
+"""Tests for the generation-keyed dynamic threshold cache (migration 056).
+
+Thresholds are recomputed only when calibration_trajectory changes (which
+bumps calibration_generation) or when a non-database input — overrides,
+cascade_styles.yaml, domain files — changes the cache key.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from empirica.core.post_test import dynamic_thresholds
+from empirica.core.post_test.dynamic_thresholds import (
+    cached_dynamic_thresholds,
+    cached_threshold,
+    compute_dynamic_thresholds,
+    domain_config_signature,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    from empirica.data.session_database import SessionDatabase
+
+    database = SessionDatabase(db_path=str(tmp_path / "sessions.db"))
+    yield database
+    database.close()
+
+
+def _record(db, count, self_assessed=0.9, grounded=0.5, phase="noetic"):
+    for i in range(count):
+        db.conn.execute(
+            "INSERT INTO calibration_trajectory (point_id, session_id, ai_id, vector_name, "
+            "self_assessed, grounded, gap, timestamp, phase) VALUES (?, 's', 'claude-code', 'know', ?, ?, ?, ?, ?)",
+            (str(uuid.uuid4()), self_assessed, grounded, self_assessed - grounded, float(i), phase),
+        )
+    db.conn.commit()
+
+
+def _no_recompute(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("thresholds recomputed")
+    monkeypatch.setattr(dynamic_thresholds, "compute_dynamic_thresholds", fail)
+
+
+class TestCachedDynamicThresholds:
+    def test_reused_until_calibration_data_lands(self, db, monkeypatch):
+        _record(db, 6)
+        first = cached_dynamic_thresholds("claude-code", db)
+        assert first == compute_dynamic_thresholds("claude-code", db)
+        assert first["source"] == "dynamic"
+
+        with monkeypatch.context() as m:
+            _no_recompute(m)
+            assert cached_dynamic_thresholds("claude-code", db) == first
+
+        _record(db, 10, self_assessed=0.5)
+        refreshed = cached_dynamic_thresholds("claude-code", db)
+        assert refreshed["noetic"]["transactions_analyzed"] == 16
+        assert refreshed != first
+
+    def test_overrides_are_part_of_the_key(self, db, monkeypatch):
+        _record(db, 6)
+        default = cached_dynamic_thresholds("claude-code", db)
+        strict = cached_dynamic_thresholds(
+            "claude-code", db, base_thresholds={"ready_know_threshold": 0.8},
+        )
+
+        assert strict["noetic"]["ready_know_threshold"] > default["noetic"]["ready_know_threshold"]
+        assert cached_dynamic_thresholds("claude-code", db, min_transactions=50)["source"] == "static"
+
+    def test_live_loader_overrides_invalidate(self, db):
+        from empirica.config.threshold_loader import ThresholdLoader
+
+        _record(db, 6)
+        ThresholdLoader.reset_instance()
+        try:
+            before = cached_dynamic_thresholds("claude-code", db)
+            ThresholdLoader.get_instance().override("calibration.max_inflation", 0.0)
+            after = cached_dynamic_thresholds("claude-code", db)
+        finally:
+            ThresholdLoader.reset_instance()
+
+        assert before["noetic"]["threshold_inflation"] > 0
+        assert after["noetic"]["threshold_inflation"] == 0
+
+
+class TestCachedThreshold:
+    def test_without_cache_tables_computes_directly(self):
+        bare = SimpleNamespace(conn=sqlite3.connect(":memory:"))
+        calls = []
+
+        assert cached_threshold(bare, ["k"], lambda: calls.append(1) or 0.3) == 0.3
+        assert cached_threshold(bare, ["k"], lambda: calls.append(1) or 0.3) == 0.3
+        assert len(calls) == 2
+
+    def test_domain_file_change_changes_signature(self, tmp_path):
+        before = domain_config_signature(str(tmp_path))
+        (tmp_path / ".empirica").mkdir()
+        (tmp_path / ".empirica" / "domains.yaml").write_text("domains: []\n")
+
+        assert domain_config_signature(str(tmp_path)) != before
+        assert domain_config_signature(None) == before
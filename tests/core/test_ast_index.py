@@ -0,0 +1,163 @@
+"""Tests for the shared incremental AST index (empirica.core.ast_index).
+
+Files are re-parsed only when their content changes; the index persists
+under .empirica/cache/ for project roots only; and the consumers that used
+to parse on their own (coupling, docs, code_embeddings) read from it.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from empirica.core import ast_index
+from empirica.core.ast_index import AstIndex, extract_facts
+
+SOURCE = b'''"""Module doc."""
+import os, json.decoder
+from .sibling import thing
+from pkg.core import api
+
+__all__ = ["Public", "_leaked"]
+
+
+class Public(ABC):
+    """Documented."""
+
+    def method(self, x: int = 1) -> int:
+        return x
+
+
+class _Private(abc.ABCMeta):
+    pass
+
+
+async def fetch(url):
+    """Fetch."""
+
+
+if __name__ == "__main__":
+    fetch("x")
+'''
+
+
+@pytest.fixture(autouse=True)
+def _fresh_instances(monkeypatch):
+    monkeypatch.setattr(AstIndex, "_instances", {})
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Record every file the index actually parses."""
+    seen = []
+    real = ast_index.extract_facts
+
+    def spy(source, filename="<unknown>"):
+        seen.append(os.path.basename(filename))
+        return real(source, filename)
+
+    monkeypatch.setattr(ast_index, "extract_facts", spy)
+    return seen
+
+
+def _tree(root, count=3):
+    pkg = root / "pkg"
+    pkg.mkdir(exist_ok=True)
+    for i in range(count):
+        (pkg / f"mod{i}.py").write_text(f"import os\n\ndef api_{i}():\n    pass\n")
+    return sorted(pkg.glob("*.py"))
+
+
+class TestExtractFacts:
+    def test_collects_every_consumer_fact(self):
+        facts = extract_facts(SOURCE)
+
+        assert facts.parsed and facts.module_docstring == "Module doc."
+        assert facts.imports == ["os", "json.decoder"]
+        assert facts.from_imports == [("sibling", 1), ("pkg.core", 0)]
+        assert facts.all_names == ["Public", "_leaked"]
+        assert facts.entry_point
+        assert [(d["kind"], d["name"], d["documented"]) for d in facts.definitions] == [
+            ("class", "Public", True), ("class", "_Private", False),
+            ("async def", "fetch", True), ("def", "method", False),
+        ]
+        assert facts.definitions[1]["bases"] == ["abc.ABCMeta"]
+        assert [c["name"] for c in facts.classes] == ["Public"]
+        assert facts.classes[0]["methods"][0]["params"][1] == {"name": "x", "type": "int", "default": "1"}
+        assert [f["name"] for f in facts.functions] == ["fetch"]
+
+    def test_syntax_error_is_recorded(self):
+        facts = extract_facts(b"def broken(:\n")
+        assert not facts.parsed and facts.error.startswith("SyntaxError")
+
+
+class TestIncremental:
+    def test_only_changed_files_are_reparsed(self, tmp_path, parses):
+        files = _tree(tmp_path)
+        index = AstIndex.for_root(tmp_path)
+
+        index.update(files, workers=1)
+        assert sorted(parses) == ["mod0.py", "mod1.py", "mod2.py"]
+
+        parses.clear()
+        st = files[0].stat()
+        os.utime(files[0], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # touched, same bytes
+        files[1].write_text("def renamed():\n    pass\n")
+        facts = index.update(files, workers=1)
+
+        assert parses == ["mod1.py"]
+        assert facts[1].functions[0]["name"] == "renamed"
+        assert index.update([tmp_path / "pkg" / "missing.py"]) == [None]
+
+    def test_persisted_for_project_roots_only(self, tmp_path, parses, monkeypatch):
+        plain = tmp_path / "plain"
+        plain.mkdir()
+        AstIndex.for_root(plain).update(_tree(plain), workers=1)
+        assert not (plain / ".empirica").exists()
+
+        project = tmp_path / "project"
+        (project / ".empirica").mkdir(parents=True)
+        (project / ".empirica" / "project.yaml").write_text("name: p\n")
+        files = _tree(project)
+        AstIndex.for_root(project).update(files, workers=1)
+        assert (project / ".empirica" / "cache" / "ast_index.json").exists()
+
+        # A new process (fresh memo) loads the sidecar instead of parsing
+        monkeypatch.setattr(AstIndex, "_instances", {})
+        parses.clear()
+        facts = AstIndex.for_root(project).update(files, workers=1)
+        assert parses == []
+        assert facts[2].functions[0]["name"] == "api_2"
+
+    def test_parallel_matches_in_process(self, tmp_path):
+        files = _tree(tmp_path, count=4)
+        parallel = AstIndex(tmp_path).update(files, workers=2, parallel_min=2)
+        sequential = AstIndex(tmp_path).update(files, workers=1)
+        assert parallel == sequential
+
+
+class TestConsumers:
+    def test_coupling_analyzer_reads_index(self, tmp_path):
+        from empirica.core.architecture_assessment import CouplingAnalyzer
+
+        (tmp_path / "mod.py").write_bytes(SOURCE)
+        metrics = CouplingAnalyzer(str(tmp_path)).analyze("mod.py")
+
+        assert metrics.leaked_internals == ["_leaked"]
+        assert (metrics.public_functions, metrics.private_functions) == (3, 1)
+        assert metrics.abstractness == 1.0
+
+    def test_docs_agent_reads_index(self, tmp_path):
+        from empirica.cli.command_handlers.docs_commands import EpistemicDocsAgent
+
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "service.py").write_bytes(SOURCE)
+        agent = EpistemicDocsAgent(project_root=tmp_path)
+        agent.config.package_dirs = ["pkg"]
+
+        docstrings = agent.check_docstrings()
+        assert docstrings["classes_missing"] == ["pkg/service.py:_Private"]
+        assert docstrings["functions_missing"] == ["pkg/service.py:method"]
+        modules, categories = agent._extract_core_modules()
+        assert modules == ["Public"] and categories == {"Service": ["Public"]}
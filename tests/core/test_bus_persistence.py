@@ -0,0 +1,105 @@
+"""
+Tests for the write-behind SqliteBusObserver: events are queued on the
+publishing thread and written in batched transactions by one connection.
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from empirica.core import bus_persistence
+from empirica.core.bus_persistence import SqliteBusObserver, flush_sqlite_observers
+from empirica.core.epistemic_bus import EpistemicEvent
+
+
+def _event(i=0, data=None):
+    return EpistemicEvent(
+        event_type="test_event", agent_id="agent", session_id="s1",
+        data=data if data is not None else {"i": i},
+    )
+
+
+def _count(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM epistemic_events").fetchone()[0]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "sessions.db")
+
+
+@pytest.fixture
+def observer(db_path):
+    obs = SqliteBusObserver("s1", db_path=db_path, batch_size=10, flush_interval=60)
+    yield obs
+    obs.close()
+
+
+class TestWriteBehind:
+    def test_publish_queues_without_writing(self, observer, db_path):
+        for i in range(5):
+            observer.handle_event(_event(i))
+
+        assert _count(db_path) == 0
+        assert observer.stats()["pending"] == 5
+        assert observer.flush() == 5
+        assert _count(db_path) == 5
+        assert observer.stats() == {
+            "queued": 5, "flushed": 5, "dropped": 0, "batches": 1, "pending": 0,
+        }
+
+    def test_batch_size_triggers_background_flush(self, observer, db_path):
+        for i in range(10):
+            observer.handle_event(_event(i))
+
+        deadline = time.monotonic() + 5
+        while observer.stats()["flushed"] < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _count(db_path) == 10
+        assert observer.stats()["batches"] == 1
+
+    def test_time_threshold_flushes_partial_batch(self, db_path):
+        obs = SqliteBusObserver("s1", db_path=db_path, batch_size=100, flush_interval=0.05)
+        try:
+            obs.handle_event(_event())
+            deadline = time.monotonic() + 5
+            while obs.stats()["flushed"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert _count(db_path) == 1
+        finally:
+            obs.close()
+
+    def test_full_queue_drops_instead_of_blocking(self, db_path):
+        obs = SqliteBusObserver("s1", db_path=db_path, batch_size=100, flush_interval=60, max_queue=3)
+        try:
+            for i in range(5):
+                obs.handle_event(_event(i))
+            obs.handle_event(_event(data={"bad": object()}))  # not JSON-serializable
+            stats = obs.stats()
+            assert stats["queued"] == 3
+            assert stats["dropped"] == 3
+        finally:
+            obs.close()
+
+
+class TestFlushOnExitAndQuery:
+    def test_close_and_module_flush_persist_pending(self, db_path):
+        obs = SqliteBusObserver("s1", db_path=db_path, batch_size=100, flush_interval=60)
+        obs.handle_event(_event(1))
+        assert flush_sqlite_observers() >= 1
+        obs.handle_event(_event(2))
+        obs.close()
+        assert _count(db_path) == 2
+        assert obs not in bus_persistence._sqlite_observers
+
+    def test_failed_write_is_requeued(self, observer, db_path):
+        observer.handle_event(_event())
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DROP TABLE epistemic_events")
+        assert observer.flush() == 0
+        assert observer.stats()["pending"] == 1
+
+        observer._ensure_table()
+        assert observer.flush() == 1
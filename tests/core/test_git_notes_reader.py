@@ -0,0 +1,130 @@
+"""
+Tests for GitNotesReader — batched git-notes reads over one
+`git cat-file --batch` process, shared by the empirica_git stores.
+"""
+
+import json
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from empirica.core.canonical.empirica_git import notes_reader
+from empirica.core.canonical.empirica_git.finding_store import GitFindingStore
+from empirica.core.canonical.empirica_git.notes_reader import GitNotesReader, get_notes_reader
+
+
+def _git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _commit(cwd, name):
+    (Path(cwd) / name).write_text(name)
+    _git(cwd, 'add', '.')
+    _git(cwd, 'commit', '-q', '-m', name)
+    return _git(cwd, 'rev-parse', 'HEAD')
+
+
+@pytest.fixture
+def git_repo():
+    """Create a temporary git repo with one commit."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _git(tmpdir, 'init', '-q')
+        _git(tmpdir, 'config', 'user.email', 'test@test.com')
+        _git(tmpdir, 'config', 'user.name', 'Test')
+        _commit(tmpdir, 'README.md')
+        yield tmpdir
+
+
+@pytest.fixture
+def reader(git_repo):
+    with GitNotesReader(git_repo) as r:
+        yield r
+
+
+def _add_note(repo, ref, payload, commit='HEAD'):
+    _git(repo, 'notes', f'--ref={ref}', 'add', '-f', '-m', json.dumps(payload), commit)
+
+
+class TestReadNote:
+    def test_reads_per_artifact_ref(self, git_repo, reader):
+        _add_note(git_repo, 'empirica/findings/f1', {'finding_id': 'f1'})
+        head = _git(git_repo, 'rev-parse', 'HEAD')
+
+        entry = reader.read_note('empirica/findings/f1')
+        assert entry.ref == 'refs/notes/empirica/findings/f1'
+        assert entry.annotated == head
+        assert reader.read_note_json('refs/notes/empirica/findings/f1') == {'finding_id': 'f1'}
+        assert reader.annotated_object('empirica/findings/f1') == head
+
+    def test_missing_ref_and_invalid_json(self, git_repo, reader):
+        assert reader.read_note('empirica/findings/nope') is None
+        _git(git_repo, 'notes', '--ref=empirica/findings/bad', 'add', '-m', 'not json', 'HEAD')
+        assert reader.read_note_json('empirica/findings/bad') is None
+        assert reader.read_note('empirica/findings/bad').text.startswith('not json')
+
+    def test_sees_updates_made_after_pipe_started(self, git_repo, reader):
+        _add_note(git_repo, 'empirica/messages/ch/m1', {'status': 'unread'})
+        assert reader.read_note_json('empirica/messages/ch/m1')['status'] == 'unread'
+        _add_note(git_repo, 'empirica/messages/ch/m1', {'status': 'read'})
+        assert reader.read_note_json('empirica/messages/ch/m1')['status'] == 'read'
+
+    def test_show_note_and_note_map_on_shared_ref(self, git_repo, reader):
+        first = _git(git_repo, 'rev-parse', 'HEAD')
+        second = _commit(git_repo, 'b.txt')
+        _add_note(git_repo, 'empirica/checkpoints', {'n': 1}, first)
+        _add_note(git_repo, 'empirica/checkpoints', {'n': 2}, second)
+
+        assert set(reader.note_map('empirica/checkpoints')) == {first, second}
+        assert json.loads(reader.show_note('empirica/checkpoints', second)) == {'n': 2}
+        assert reader.show_note('empirica/checkpoints', '0' * 40) is None
+
+
+class TestListNotes:
+    def test_enumerates_prefix_with_constant_process_count(self, git_repo, reader, monkeypatch):
+        for i in range(20):
+            _add_note(git_repo, f'empirica/findings/f{i:02d}', {'i': i})
+        _add_note(git_repo, 'empirica/goals/g1', {'goal': True})
+
+        spawned = []
+        real_popen = subprocess.Popen
+
+        def counting_popen(*args, **kwargs):
+            spawned.append(args[0])
+            return real_popen(*args, **kwargs)
+
+        monkeypatch.setattr(notes_reader.subprocess, 'Popen', counting_popen)
+        notes = list(reader.list_notes_json('refs/notes/empirica/findings/'))
+
+        assert [payload['i'] for _, payload in notes] == list(range(20))
+        assert len(spawned) <= 2  # for-each-ref + the cat-file pipe
+
+    def test_not_a_repo_yields_nothing(self, tmp_path):
+        with GitNotesReader(tmp_path) as r:
+            assert list(r.list_notes('refs/notes/empirica/')) == []
+            assert r.read_note('empirica/findings/x') is None
+
+
+class TestSharedReaders:
+    def test_one_reader_per_repo(self, git_repo):
+        assert get_notes_reader(git_repo) is get_notes_reader(Path(git_repo))
+
+    def test_least_recently_used_reader_is_evicted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(notes_reader, '_MAX_READERS', 2)
+        dirs = [tmp_path / name for name in ('a', 'b', 'c')]
+        for d in dirs:
+            d.mkdir()
+        first = get_notes_reader(dirs[0])
+        get_notes_reader(dirs[1])
+        get_notes_reader(dirs[2])
+        assert get_notes_reader(dirs[0]) is not first
+
+    def test_finding_store_discovers_through_reader(self, git_repo):
+        store = GitFindingStore(workspace_root=git_repo)
+        for i, impact in enumerate((0.2, 0.9)):
+            assert store.store_finding(f'id-{i}', 'proj', 'sess', 'ai', f'finding {i}', impact=impact)
+
+        found = store.discover_findings(project_id='proj')
+        assert [f['finding'] for f in found] == ['finding 1', 'finding 0']
+        assert store.load_finding('id-0')['impact'] == 0.2
@@ -0,0 +1,102 @@
+"""Tests for workflow pattern mining (detect_patterns).
+
+Patterns are contiguous tool subsequences (length 3-10) seen in at least
+min_frequency distinct transactions; a pattern is dropped when a one-step
+longer extension appears in the same transactions.
+"""
+
+from empirica.core.workflow_patterns import MAX_SEQ_LEN, detect_patterns
+
+
+def _trace(spec: str, target: str = "") -> list[list[str]]:
+    """'Read Grep Edit:p' → [["Read", target, "n"], ["Grep", target, "n"], ["Edit", target, "p"]]."""
+    trace = []
+    for item in spec.split():
+        tool, _, phase = item.partition(":")
+        trace.append([tool, target, phase or "n"])
+    return trace
+
+
+def _signatures(patterns):
+    return {(p.signature, p.frequency) for p in patterns}
+
+
+def test_shared_run_reported_once_as_longest():
+    traces = {
+        "tx1": _trace("Glob Read Grep Edit:p Bash:p Write:p"),
+        "tx2": _trace("Read Grep Edit:p Bash:p Task"),
+    }
+
+    patterns = detect_patterns(traces)
+
+    assert _signatures(patterns) == {("Read(n) → Grep(n) → Edit(p) → Bash(p)", 2)}
+    assert patterns[0].transaction_ids == ["tx1", "tx2"]
+
+
+def test_shorter_pattern_kept_when_more_frequent():
+    traces = {
+        "tx1": _trace("Read Grep Edit:p Bash:p"),
+        "tx2": _trace("Read Grep Edit:p Bash:p"),
+        "tx3": _trace("Read Grep Edit:p Write:p"),
+    }
+
+    assert _signatures(detect_patterns(traces)) == {
+        ("Read(n) → Grep(n) → Edit(p) → Bash(p)", 2),
+        ("Read(n) → Grep(n) → Edit(p)", 3),
+    }
+
+
+def test_tool_name_suffix_does_not_hide_pattern():
+    # "Edit(p) Bash(p) Read(n)" is a substring of "MultiEdit(p) Bash(p) Read(n)"
+    # as text but not as a tool sequence
+    traces = {
+        "tx1": _trace("MultiEdit:p Bash:p Read Grep"),
+        "tx2": _trace("MultiEdit:p Bash:p Read Grep"),
+        "tx3": _trace("Edit:p Bash:p Read"),
+        "tx4": _trace("Edit:p Bash:p Read"),
+    }
+
+    assert ("Edit(p) → Bash(p) → Read(n)", 2) in _signatures(detect_patterns(traces))
+
+
+def test_support_counts_transactions_not_occurrences():
+    traces = {
+        "tx1": _trace("Read Grep Edit:p Read Grep Edit:p Read Grep Edit:p"),
+        "tx2": _trace("Bash:p Read Grep Edit:p"),
+    }
+
+    (pattern,) = detect_patterns(traces)
+
+    assert pattern.signature == "Read(n) → Grep(n) → Edit(p)"
+    assert pattern.frequency == 2
+
+
+def test_patterns_capped_at_max_length():
+    steps = " ".join(f"T{i}" for i in range(MAX_SEQ_LEN + 5))
+    traces = {"tx1": _trace(steps), "tx2": _trace(steps)}
+
+    patterns = detect_patterns(traces)
+
+    assert {len(p.sequence) for p in patterns} == {MAX_SEQ_LEN}
+    assert len(patterns) == 6
+
+
+def test_position_and_targets_from_first_occurrence():
+    traces = {
+        "tx1": [["Glob", "*.py", "n"]] * 4 + _trace("Read Grep Edit:p", target="app.py"),
+        "tx2": _trace("Read Grep Edit:p Bash:p", target="lib.py"),
+    }
+
+    (pattern,) = detect_patterns(traces)
+
+    assert pattern.avg_position == (4 / 6 + 0) / 2
+    assert pattern.example_targets == ["Read:app.py", "Grep:app.py", "Edit:app.py"]
+
+
+def test_short_or_too_few_traces_yield_nothing():
+    assert detect_patterns({"tx1": _trace("Read Grep Edit:p")}) == []
+    assert detect_patterns({"tx1": _trace("Read Grep"), "tx2": _trace("Read Grep")}) == []
+    assert detect_patterns({
+        "tx1": _trace("Read Grep Edit:p"),
+        "tx2": _trace("Read Grep Edit:p"),
+    }, min_frequency=3) == []
@@ -0,0 +1,81 @@
+"""
+Command Registry Integrity Tests
+
+cli_core dispatches through command_registry instead of importing every
+parser and handler module up front. These tests keep the static tables in
+sync with what the parser modules actually register:
+- PARSER_GROUPS lists exactly the commands each add_*_parsers() registers
+- Every COMMAND_HANDLERS entry resolves to a callable
+- Dispatching one command does not import unrelated handler modules
+"""
+
+import argparse
+import subprocess
+import sys
+
+import pytest
+
+from empirica.cli.command_registry import (
+    COMMAND_HANDLERS,
+    PARSER_GROUPS,
+    add_parser_group,
+    load_handler,
+    parser_group_for,
+)
+
+# Parsers registered but intentionally without a handler ("Unknown command")
+_UNHANDLED = {'tx-adopt', 'goal-analysis'}
+
+
+def _subcommands(parser):
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return list(action.choices)
+    return []
+
+
+@pytest.mark.parametrize('group', list(PARSER_GROUPS))
+def test_parser_group_matches_registry(group):
+    parser = argparse.ArgumentParser()
+    add_parser_group(parser.add_subparsers(dest='command'), group)
+    assert tuple(_subcommands(parser)) == PARSER_GROUPS[group]
+
+
+def test_full_parser_covers_every_group():
+    from empirica.cli.cli_core import create_argument_parser
+
+    registered = set(_subcommands(create_argument_parser())) - {'help'}
+    listed = {cmd for cmds in PARSER_GROUPS.values() for cmd in cmds}
+    assert registered == listed
+
+
+def test_every_command_has_handler_or_is_known_unhandled():
+    listed = {cmd for cmds in PARSER_GROUPS.values() for cmd in cmds}
+    assert listed - set(COMMAND_HANDLERS) == _UNHANDLED
+    assert set(COMMAND_HANDLERS) <= listed
+
+
+@pytest.mark.parametrize('command', sorted(COMMAND_HANDLERS))
+def test_handler_resolves(command):
+    assert parser_group_for(command) is not None
+    assert callable(load_handler(command))
+
+
+def test_dispatch_imports_only_invoked_handler():
+    code = (
+        "import sys\n"
+        "from empirica.cli.cli_core import main\n"
+        "try:\n"
+        "    main(['finding-log', '--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = sorted(m for m in sys.modules\n"
+        "                if m.startswith(('empirica.cli.command_handlers.', 'empirica.cli.parsers.')))\n"
+        "print('\\n'.join(loaded), file=sys.stderr)\n"
+    )
+    proc = subprocess.run([sys.executable, '-c', code], check=False, capture_output=True, text=True, timeout=60)
+    loaded = set(proc.stderr.split())
+    assert 'empirica.cli.command_handlers.cockpit_commands' not in loaded
+    assert 'empirica.cli.command_handlers.chat_commands' not in loaded
+    assert 'empirica.cli.parsers.cockpit_parsers' not in loaded
+    assert [m for m in loaded if m.startswith('empirica.cli.parsers.')] == ['empirica.cli.parsers.checkpoint_parsers']
@@ -220,3 +220,48 @@ class TestDedupEdgeCases:
         id2 = repo.log_finding(PROJECT_ID, SESSION_ID, "line one line two")
 
         assert id1 == id2, "Tabs/newlines should normalize to spaces for dedup"
+
+
+# ── Persisted content_hash ───────────────────────────────────────────────────
+
+class TestPersistedContentHash:
+    def test_hash_stored_on_insert(self, fresh_db):
+        """Every artifact type persists the normalized content hash."""
+        from empirica.data.content_hash import content_hash
+
+        repo = fresh_db.breadcrumbs
+        finding_id = repo.log_finding(PROJECT_ID, SESSION_ID, "  Stored  Hash ")
+        mistake_id = repo.log_mistake(SESSION_ID, "Bad call", "Wrong reason", project_id=PROJECT_ID)
+
+        row = fresh_db.conn.execute(
+            "SELECT content_hash FROM project_findings WHERE id = ?", (finding_id,)
+        ).fetchone()
+        assert row[0] == content_hash("stored hash")
+        row = fresh_db.conn.execute(
+            "SELECT content_hash FROM mistakes_made WHERE id = ?", (mistake_id,)
+        ).fetchone()
+        assert row[0] == content_hash("bad call", "wrong reason")
+
+    def test_rows_without_hash_are_backfilled_on_lookup(self, fresh_db):
+        """Rows inserted by other writers (NULL hash) still dedup."""
+        repo = fresh_db.breadcrumbs
+        fresh_db.conn.execute("""
+            INSERT INTO project_findings (
+                id, project_id, session_id, finding, created_timestamp, finding_data
+            ) VALUES ('legacy', ?, ?, 'Legacy Finding', 0, '{}')
+        """, (PROJECT_ID, SESSION_ID))
+        fresh_db.conn.commit()
+
+        assert repo.log_finding(PROJECT_ID, SESSION_ID, "legacy finding") == "legacy"
+        row = fresh_db.conn.execute(
+            "SELECT content_hash FROM project_findings WHERE id = 'legacy'"
+        ).fetchone()
+        assert row[0] is not None
+
+    def test_lookup_uses_index(self, fresh_db):
+        """Duplicate detection is an indexed (project_id, content_hash) lookup."""
+        plan = fresh_db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM project_findings "
+            "WHERE project_id = ? AND content_hash = ?", (PROJECT_ID, "x")
+        ).fetchall()
+        assert any("idx_project_findings_content_hash" in str(tuple(r)) for r in plan)
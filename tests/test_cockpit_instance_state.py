@@ -302,3 +302,105 @@ def test_discover_when_tmux_unavailable(env, monkeypatch):
     _bind_instance(home, project, 'tmux_5')
     monkeypatch.setattr(ist, '_live_tmux_panes', lambda: None)
     assert ist.discover_instances() == ['tmux_5']
+
+
+# ─── incremental aggregation (AggregationCache) ──────────────────────────
+
+
+def _stable(payload: dict) -> list[dict]:
+    """Instance rows minus the fields that move with the clock."""
+    clocked = {'last_activity_seconds'}
+    rows = []
+    for inst in payload['instances']:
+        row = {k: v for k, v in inst.items() if k not in clocked}
+        if row['transaction']:
+            row['transaction'] = {
+                k: v for k, v in row['transaction'].items() if k != 'age_seconds'
+            }
+        rows.append(row)
+    return rows
+
+
+def test_cached_aggregate_matches_fresh_read(env):
+    from empirica.core.cockpit.aggregation_cache import AggregationCache
+
+    home, project = env
+    _bind_instance(home, project, 'tmux_5')
+    _write_transaction(project, 'tmux_5', status='open', praxic_calls=2)
+    lr.LoopRegistry('tmux_5').register(name='poll', kind='monitor')
+    cache = AggregationCache()
+
+    fresh = ist.aggregate_all(include_dead=True)
+    assert _stable(ist.aggregate_all(include_dead=True, cache=cache)) == _stable(fresh)
+    assert _stable(ist.aggregate_all(include_dead=True, cache=cache)) == _stable(fresh)
+
+
+def test_cached_aggregate_rereads_only_changed_files(env, monkeypatch):
+    from empirica.core.cockpit.aggregation_cache import AggregationCache
+
+    home, project = env
+    _bind_instance(home, project, 'tmux_5')
+    _write_transaction(project, 'tmux_5', status='open')
+    cache = AggregationCache()
+    first = ist.aggregate_instance_state('tmux_5', cache=cache)
+
+    real_load = ist._load_transaction_snapshot
+    loads = []
+    monkeypatch.setattr(
+        ist, '_load_transaction_snapshot',
+        lambda *a: loads.append(a) or real_load(*a),
+    )
+    again = ist.aggregate_instance_state('tmux_5', cache=cache)
+    assert loads == []
+    assert again['phase'] == first['phase'] == 'noetic'
+    # Ages are still derived from the clock, not frozen in the cache.
+    assert again['transaction']['age_seconds'] >= first['transaction']['age_seconds']
+
+    counters = project / '.empirica' / 'hook_counters_tmux_5.json'
+    counters.write_text(json.dumps({'praxic_tool_calls': 1}))
+    assert ist.aggregate_instance_state('tmux_5', cache=cache)['phase'] == 'praxic'
+    assert len(loads) == 1
+
+    reg = lr.LoopRegistry('tmux_5')
+    reg.register(name='poll', kind='monitor')
+    assert ist.aggregate_instance_state('tmux_5', cache=cache)['loops']['poll']['paused'] is False
+    # Pause sidecars are existence checks, evaluated every tick.
+    lr.set_loop_paused('tmux_5', 'poll', True)
+    assert ist.aggregate_instance_state('tmux_5', cache=cache)['loops']['poll']['paused'] is True
+
+
+def test_cached_discovery_sees_new_instances(env):
+    from empirica.core.cockpit.aggregation_cache import AggregationCache
+
+    home, project = env
+    cache = AggregationCache()
+    _bind_instance(home, project, 'tmux_5')
+    assert ist.aggregate_all(include_dead=True, cache=cache)['summary']['instances'] == 1
+
+    _bind_instance(home, project, 'tmux_7')
+    payload = ist.aggregate_all(include_dead=True, cache=cache)
+    assert [i['instance_id'] for i in payload['instances']] == ['tmux_5', 'tmux_7']
+
+
+def test_event_log_tail_reads_appends_incrementally(tmp_path):
+    from empirica.core.cockpit.aggregation_cache import AggregationCache
+
+    log = tmp_path / 'loop_fires.log'
+    cache = AggregationCache()
+    assert cache.recent_events(log, 'tmux_5', 5) == []
+
+    with open(log, 'w', encoding='utf-8') as f:
+        f.writelines(json.dumps({'instance_id': 'tmux_5', 'n': n}) + '\n' for n in range(8))
+        f.write(json.dumps({'instance_id': 'tmux_7', 'n': 99}) + '\n')
+        f.write('not json\n')
+        f.write('{"instance_id": "tmux_5", "n": 8')  # half-written line
+    assert [e['n'] for e in cache.recent_events(log, 'tmux_5', 5)] == [7, 6, 5, 4, 3]
+
+    with open(log, 'a', encoding='utf-8') as f:
+        f.write('}\n')
+    assert [e['n'] for e in cache.recent_events(log, 'tmux_5', 2)] == [8, 7]
+    assert [e['n'] for e in cache.recent_events(log, 'tmux_7', 5)] == [99]
+
+    # Truncation (log rotated in place) restarts from the top.
+    log.write_text(json.dumps({'instance_id': 'tmux_5', 'n': 0}) + '\n')
+    assert [e['n'] for e in cache.recent_events(log, 'tmux_5', 5)] == [0]
@@ -0,0 +1,114 @@
+"""Tests for the materialized current-belief tables (migration 055).
+
+bayesian_beliefs and grounded_beliefs stay append-only; triggers keep
+*_current at the newest row per (ai_id, vector_name) and the calibration
+managers read only that table.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from empirica.core.bayesian_beliefs import BayesianBeliefManager
+from empirica.core.post_test.grounded_calibration import GroundedCalibrationManager
+from empirica.core.post_test.mapper import GroundedAssessment, GroundedVectorEstimate
+from empirica.data.migrations.migrations import migration_055_current_beliefs
+
+
+@pytest.fixture
+def db(tmp_path):
+    from empirica.data.session_database import SessionDatabase
+
+    database = SessionDatabase(db_path=str(tmp_path / "sessions.db"))
+    yield database
+    database.close()
+
+
+def _session(db, ai_id="agent"):
+    session_id = db.create_session(ai_id=ai_id)
+    cascade_id = db.create_cascade(session_id, "task", {})
+    return session_id, cascade_id
+
+
+def _assessment(session_id, value):
+    estimate = GroundedVectorEstimate(
+        vector_name="know", estimated_value=value, confidence=1.0,
+        evidence_count=1, primary_source="tests",
+    )
+    return GroundedAssessment(
+        session_id=session_id, self_assessed={"know": 0.8}, grounded={"know": estimate},
+        calibration_gaps={}, grounded_coverage=1.0, overall_calibration_score=1.0,
+    )
+
+
+def _count(db, table):
+    return db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestBayesianCurrent:
+    def test_updates_chain_through_current_row(self, db):
+        session_id, cascade_id = _session(db)
+        manager = BayesianBeliefManager(db)
+
+        first = manager.update_beliefs(cascade_id, session_id, {"know": 0.5}, {"know": 0.9})
+        second = manager.update_beliefs(cascade_id, session_id, {"know": 0.5}, {"know": 0.9})
+
+        assert second["know"]["prior_mean"] == first["know"]["posterior_mean"]
+        assert manager.get_beliefs("agent")["know"].evidence_count == 2
+        assert manager.get_beliefs("other")["know"].evidence_count == 0
+        assert _count(db, "bayesian_beliefs") == 2
+        assert _count(db, "bayesian_beliefs_current") == 1
+
+    def test_older_rows_do_not_displace_current(self, db):
+        _, cascade_id = _session(db)
+        now = datetime.now()
+        db.log_bayesian_belief(cascade_id, "know", 0.7, 0.1, 3, 0.5, 0.1)
+        db.conn.execute(
+            "INSERT INTO bayesian_beliefs (belief_id, cascade_id, vector_name, mean, variance, "
+            "evidence_count, prior_mean, prior_variance, last_updated) "
+            "VALUES ('old', ?, 'know', 0.1, 0.2, 1, 0.5, 0.1, ?)",
+            (cascade_id, now - timedelta(days=1)),
+        )
+        db.conn.commit()
+
+        assert BayesianBeliefManager(db).get_beliefs("agent")["know"].mean == 0.7
+
+
+class TestGroundedCurrent:
+    def test_latest_grounded_belief_is_read(self, db):
+        session_id, _ = _session(db)
+        manager = GroundedCalibrationManager(db)
+
+        manager.update_grounded_beliefs(session_id, _assessment(session_id, 0.9))
+        update = manager.update_grounded_beliefs(session_id, _assessment(session_id, 0.2))
+
+        belief = manager.get_grounded_beliefs("agent")["know"]
+        assert belief.mean == update["know"]["posterior_mean"]
+        assert belief.last_observation == 0.2
+        assert belief.evidence_count == 2
+        assert _count(db, "grounded_beliefs") == 2
+
+    def test_migration_backfills_existing_history(self, db):
+        session_id, cascade_id = _session(db)
+        GroundedCalibrationManager(db).update_grounded_beliefs(session_id, _assessment(session_id, 0.9))
+        BayesianBeliefManager(db).update_beliefs(cascade_id, session_id, {"do": 0.4}, {"do": 0.6})
+        expected = (
+            GroundedCalibrationManager(db).get_grounded_beliefs("agent")["know"],
+            BayesianBeliefManager(db).get_beliefs("agent")["do"],
+        )
+
+        db.conn.execute("DROP TABLE grounded_beliefs_current")
+        db.conn.execute("DROP TABLE bayesian_beliefs_current")
+        migration_055_current_beliefs(db.conn.cursor())
+        migration_055_current_beliefs(db.conn.cursor())  # idempotent
+        db.conn.commit()
+
+        assert GroundedCalibrationManager(db).get_grounded_beliefs("agent")["know"] == expected[0]
+        assert BayesianBeliefManager(db).get_beliefs("agent")["do"] == expected[1]
+
+    def test_lookup_uses_primary_key(self, db):
+        plan = db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM grounded_beliefs_current WHERE ai_id = ?", ("agent",)
+        ).fetchall()
+
+        assert any("USING INDEX" in str(row[-1]) for row in plan)
@@ -7,6 +7,8 @@ Covers:
 - LIKE search hits across all 6 artifact tables
 - Recency-ordered output, capped at limit
 - project_id scoping
+- All matching tests run against both the FTS5 mention index (migration
+  052) and the LIKE fallback for DBs without it
 - format_relevance_nudge produces a clean one-liner from results
 """
 
@@ -21,15 +23,19 @@ import pytest
 
 from empirica.core.file_relevance import (
     _build_needles,
+    _query_mention_index,
     _to_iso,
     format_relevance_nudge,
     get_file_relevant_artifacts,
 )
+from empirica.data.migrations.migrations import migration_052_artifact_mention_index
 
 
-@pytest.fixture
-def project_db(tmp_path: Path) -> Path:
-    """Bootstrap a project-shaped SQLite DB with the artifact tables we need."""
+def _make_project_db(tmp_path: Path, indexed: bool) -> Path:
+    """Bootstrap a project-shaped SQLite DB with the artifact tables we need.
+
+    indexed=True also runs migration 052 (FTS5 mention index).
+    """
     db_dir = tmp_path / ".empirica" / "sessions"
     db_dir.mkdir(parents=True)
     db_path = db_dir / "sessions.db"
@@ -46,11 +52,28 @@ def project_db(tmp_path: Path) -> Path:
     }
     for table, cols in schemas.items():
         conn.execute(f"CREATE TABLE {table} ({cols})")
+    if indexed:
+        migration_052_artifact_mention_index(conn.cursor())
     conn.commit()
     conn.close()
     return tmp_path
 
 
+@pytest.fixture(params=["like", "indexed"])
+def project_db(request, tmp_path: Path) -> Path:
+    """Artifact DB, once without and once with the mention index."""
+    return _make_project_db(tmp_path, indexed=request.param == "indexed")
+
+
+@pytest.fixture
+def indexed_db(tmp_path: Path) -> Path:
+    return _make_project_db(tmp_path, indexed=True)
+
+
+def _connect(project_root: Path) -> sqlite3.Connection:
+    return sqlite3.connect(project_root / ".empirica" / "sessions" / "sessions.db")
+
+
 # ── Guard rails ────────────────────────────────────────────────────────
 
 
@@ -214,6 +237,52 @@ def test_project_id_scopes_search(project_db: Path):
     assert {h["id"] for h in both} == {p1_id, p2_id}
 
 
+# ── FTS5 mention index ────────────────────────────────────────────────
+
+
+def test_index_answers_lookup_without_like_fallback(indexed_db: Path):
+    conn = _connect(indexed_db)
+    conn.execute(
+        "INSERT INTO project_findings (id, project_id, finding, created_timestamp) "
+        "VALUES ('f1', 'p1', 'See src/auth/auth.py.', 1.0)"
+    )
+    conn.commit()
+    hits = _query_mention_index(conn.cursor(), "p1", ["auth.py", "src/auth/auth.py"], 5, 3)
+    conn.close()
+    assert [h["id"] for h in hits] == ["f1"]
+
+
+def test_index_tracks_updates_and_deletes(indexed_db: Path):
+    conn = _connect(indexed_db)
+    conn.execute(
+        "INSERT INTO decisions (id, project_id, choice, rationale, created_timestamp) "
+        "VALUES ('d1', 'p1', 'Keep it', 'nothing to see', 1.0)"
+    )
+    conn.commit()
+    assert get_file_relevant_artifacts(indexed_db, "auth.py") == []
+
+    conn.execute("UPDATE decisions SET rationale = 'auth.py needs it' WHERE id = 'd1'")
+    conn.commit()
+    assert [h["id"] for h in get_file_relevant_artifacts(indexed_db, "auth.py")] == ["d1"]
+
+    conn.execute("DELETE FROM decisions WHERE id = 'd1'")
+    conn.commit()
+    conn.close()
+    assert get_file_relevant_artifacts(indexed_db, "auth.py") == []
+
+
+def test_index_migration_backfills_existing_rows(tmp_path: Path):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE project_findings (id TEXT PRIMARY KEY, project_id TEXT, finding TEXT, created_timestamp REAL)")
+    conn.execute("INSERT INTO project_findings VALUES ('old', 'p1', 'legacy note on auth.py', 1.0)")
+    migration_052_artifact_mention_index(conn.cursor())
+    migration_052_artifact_mention_index(conn.cursor())  # idempotent
+
+    hits = _query_mention_index(conn.cursor(), None, ["auth.py"], 5, 3)
+    assert [h["id"] for h in hits] == ["old"]
+    assert conn.execute("SELECT COUNT(*) FROM artifact_mentions").fetchone()[0] == 1
+
+
 # ── needle building ───────────────────────────────────────────────────
 
 
@@ -0,0 +1,156 @@
+"""Tests for the warm hook daemon and its stdlib-only client shim.
+
+Verifies:
+  - Scripts run in-process with the caller's stdin/env/argv; stdout, stderr
+    and exit code come back verbatim
+  - Only allowlisted script basenames are executed
+  - Process-global state (env, sys.path, log handlers) is restored per run
+  - A hook using the client shim forwards to the daemon when it is up and
+    falls back to in-process execution when it is not
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+from empirica.core.hook_daemon import HookDaemon, ping, request
+
+LIB_DIR = Path(__file__).resolve().parent.parent / 'empirica' / 'plugins' / 'claude-code-integration' / 'lib'
+
+ECHO_HOOK = textwrap.dedent("""
+    import json, logging, os, sys
+    sys.path.insert(0, {lib!r})
+    if __name__ == '__main__':
+        from hook_daemon_client import forward_to_daemon
+        forward_to_daemon(__file__)
+    logging.getLogger('echo-hook').addHandler(logging.NullHandler())
+    data = json.loads(sys.stdin.read() or '{{}}')
+    print(json.dumps({{
+        'tool': data.get('tool_name'),
+        'marker': os.environ.get('ECHO_MARKER'),
+        'inproc': os.environ.get('EMPIRICA_HOOKD_INPROC'),
+        'argv': sys.argv[1:],
+    }}))
+    sys.stderr.write('echo-stderr\\n')
+    sys.exit(3)
+""")
+
+
+@pytest.fixture
+def echo_hook(tmp_path):
+    script = tmp_path / 'echo-hook.py'
+    script.write_text(ECHO_HOOK.format(lib=str(LIB_DIR)))
+    return script
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    # AF_UNIX paths are length-limited; keep the socket name short
+    sock = Path(f'/tmp/hookd-test-{os.getpid()}-{id(tmp_path)}.sock')
+    d = HookDaemon(socket_path=sock, allowed_scripts={'echo-hook.py'})
+    thread = threading.Thread(target=d.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if ping(sock) is not None:
+            break
+        threading.Event().wait(0.01)
+    yield d
+    request({'op': 'shutdown'}, socket_path=sock)
+    thread.join(timeout=5)
+
+
+def test_run_hook_round_trip(daemon, echo_hook):
+    reply = request({
+        'op': 'run',
+        'script': str(echo_hook),
+        'stdin': json.dumps({'tool_name': 'Edit'}),
+        'env': {'ECHO_MARKER': 'abc', 'PATH': os.environ.get('PATH', '')},
+        'cwd': str(echo_hook.parent),
+        'argv': ['--flag'],
+    }, socket_path=daemon.socket_path)
+
+    assert reply['ok'] is True
+    assert reply['exit_code'] == 3
+    assert reply['stderr'] == 'echo-stderr\n'
+    out = json.loads(reply['stdout'])
+    assert out == {'tool': 'Edit', 'marker': 'abc', 'inproc': '1', 'argv': ['--flag']}
+
+
+def test_disallowed_script_is_rejected(daemon, tmp_path):
+    other = tmp_path / 'other.py'
+    other.write_text('print("nope")')
+    reply = request({'op': 'run', 'script': str(other)}, socket_path=daemon.socket_path)
+    assert reply['ok'] is False
+    assert 'not allowed' in reply['error']
+
+
+def test_global_state_restored_between_runs(daemon, echo_hook):
+    path_before = list(sys.path)
+    env_before = dict(os.environ)
+    for _ in range(3):
+        daemon.run_hook({'script': str(echo_hook), 'env': {'ECHO_MARKER': 'x'}})
+    assert sys.path == path_before
+    assert dict(os.environ) == env_before
+    assert logging.getLogger('echo-hook').handlers == []
+    assert daemon.stats()['scripts']['echo-hook.py']['count'] >= 3
+
+
+def test_client_shim_forwards_when_daemon_up(daemon, echo_hook):
+    env = {**os.environ, 'EMPIRICA_HOOKD_SOCKET': str(daemon.socket_path), 'ECHO_MARKER': 'fwd'}
+    proc = subprocess.run(
+        [sys.executable, str(echo_hook)],
+        input=json.dumps({'tool_name': 'Write'}), capture_output=True, text=True, env=env, timeout=30,
+    )
+    assert proc.returncode == 3
+    out = json.loads(proc.stdout)
+    assert out['inproc'] == '1'
+    assert out['marker'] == 'fwd'
+    assert out['tool'] == 'Write'
+
+
+def test_client_shim_falls_back_without_daemon(echo_hook, tmp_path):
+    env = {**os.environ, 'EMPIRICA_HOOKD_SOCKET': str(tmp_path / 'missing.sock'), 'ECHO_MARKER': 'local'}
+    env.pop('EMPIRICA_HOOKD_INPROC', None)
+    proc = subprocess.run(
+        [sys.executable, str(echo_hook)],
+        input=json.dumps({'tool_name': 'Bash'}), capture_output=True, text=True, env=env, timeout=30,
+    )
+    assert proc.returncode == 3
+    out = json.loads(proc.stdout)
+    assert out['inproc'] is None
+    assert out['tool'] == 'Bash'
+
+
+ROOT_HOOK = textwrap.dedent("""
+    from empirica.config.path_resolver import get_git_root
+    print(get_git_root())
+""")
+
+
+def test_each_run_resolves_its_own_project(tmp_path):
+    """One daemon serves every project: the cached git root must not leak."""
+    script = tmp_path / 'root-hook.py'
+    script.write_text(ROOT_HOOK)
+    repos = []
+    for name in ('project-a', 'project-b'):
+        repo = tmp_path / name
+        repo.mkdir()
+        subprocess.run(['git', 'init', '-q', str(repo)], check=True)
+        repos.append(repo)
+
+    d = HookDaemon(socket_path=tmp_path / 'unused.sock', allowed_scripts={'root-hook.py'})
+    env = {'PATH': os.environ.get('PATH', '')}
+    roots = [
+        d.run_hook({'script': str(script), 'env': env, 'cwd': str(repo)})['stdout'].strip()
+        for repo in (*repos, repos[0])
+    ]
+    assert roots == [str(repos[0].resolve()), str(repos[1].resolve()), str(repos[0].resolve())]
@@ -0,0 +1,133 @@
+"""Tests for the lesson hot-cache loader and its on-disk snapshot.
+
+LessonStorageManager used to issue one knowledge_graph query per lesson on
+every construction. It now loads with a fixed number of set-based queries
+and persists a snapshot keyed by lesson_cache_generation (migration 053),
+so a new process with an unchanged lesson graph skips SQLite entirely.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from empirica.core.lessons import hot_cache
+from empirica.core.lessons.storage import LessonStorageManager
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    from empirica.data.session_database import SessionDatabase
+
+    monkeypatch.setattr(hot_cache, "_hot_cache", None)
+    database = SessionDatabase(db_path=str(tmp_path / "sessions.db"))
+    yield database
+    database.close()
+
+
+def _add_lesson(conn, lesson_id, domain="testing", know=0.0, requires=(), prereqs=()):
+    now = time.time()
+    conn.execute(
+        """
+        INSERT INTO lessons (id, name, version, domain, source_confidence, teaching_quality,
+                             reproducibility, created_timestamp, updated_timestamp, lesson_data)
+        VALUES (?, ?, '1.0', ?, 0.8, 0.8, 0.8, ?, ?, '{}')
+        """,
+        (lesson_id, f"Lesson {lesson_id}", domain, now, now),
+    )
+    if know:
+        conn.execute(
+            "INSERT INTO lesson_epistemic_deltas VALUES (?, ?, 'know', ?)",
+            (f"{lesson_id}:know", lesson_id, know),
+        )
+    for target in requires:
+        conn.execute(
+            "INSERT INTO knowledge_graph (id, source_type, source_id, relation_type, target_type, "
+            "target_id, created_timestamp) VALUES (?, 'lesson', ?, 'requires', 'lesson', ?, ?)",
+            (f"{lesson_id}:requires:{target}", lesson_id, target, now),
+        )
+    for prereq in prereqs:
+        conn.execute(
+            "INSERT INTO lesson_prerequisites (id, lesson_id, prereq_type, prereq_id, prereq_name) "
+            "VALUES (?, ?, 'lesson', ?, ?)",
+            (f"{lesson_id}:pre:{prereq}", lesson_id, prereq, prereq),
+        )
+    conn.commit()
+
+
+def _manager(db, tmp_path):
+    return LessonStorageManager(db_conn=db.conn, cold_storage_path=tmp_path / "lessons")
+
+
+def _snapshot_path(tmp_path):
+    return tmp_path / "sessions.db.lesson-cache.json"
+
+
+def test_set_based_load_builds_indexes(db, tmp_path):
+    _add_lesson(db.conn, "a", know=0.2)
+    _add_lesson(db.conn, "b", know=0.5, requires=["a"], prereqs=["a"])
+
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    storage = _manager(db, tmp_path)
+    db.conn.set_trace_callback(None)
+
+    cache = storage._hot
+    assert cache.get_prerequisites("b") == {"a"}
+    assert cache.get_lesson("b").prereq_ids == {"a"}
+    assert cache.lessons_that_improve("know") == ["b", "a"]
+    assert cache.find_by_domain("testing") == {"a", "b"}
+    assert sum("knowledge_graph" in s for s in statements) == 1
+
+
+def test_snapshot_reused_until_lesson_tables_change(db, tmp_path, monkeypatch):
+    _add_lesson(db.conn, "a", know=0.2)
+    _manager(db, tmp_path)
+    snapshot = json.loads(_snapshot_path(tmp_path).read_text())
+    assert snapshot["key"][1] == 2  # lesson + delta inserts
+
+    # Unchanged generation: the warm loader is not consulted
+    def fail(self):
+        raise AssertionError("rebuilt from SQLite")
+    monkeypatch.setattr(LessonStorageManager, "get_all_hot_data", fail)
+    assert _manager(db, tmp_path)._hot.get_lesson("a").expected_delta == {"know": 0.2}
+
+    # Replay counters don't invalidate; graph changes do
+    db.conn.execute("UPDATE lessons SET replay_count = replay_count + 1")
+    db.conn.commit()
+    _manager(db, tmp_path)
+
+    monkeypatch.undo()
+    monkeypatch.setattr(hot_cache, "_hot_cache", None)
+    _add_lesson(db.conn, "b", requires=["a"])
+    storage = _manager(db, tmp_path)
+    assert storage._hot.get_prerequisites("b") == {"a"}
+    assert json.loads(_snapshot_path(tmp_path).read_text())["key"][1] == 4
+
+
+def test_corrupt_snapshot_falls_back_to_sqlite(db, tmp_path):
+    _add_lesson(db.conn, "a")
+    _snapshot_path(tmp_path).write_text("{not json")
+
+    storage = _manager(db, tmp_path)
+
+    assert storage._hot.get_lesson("a") is not None
+    assert json.loads(_snapshot_path(tmp_path).read_text())["cache"]["lessons"][0][0] == "a"
+
+
+def test_snapshot_round_trip_preserves_indexes():
+    cache = hot_cache.LessonHotCache()
+    cache.load_lesson({"id": "a", "name": "A", "expected_delta": {"uncertainty": -0.3}})
+    cache.load_lesson({"id": "b", "name": "B", "domain": "d", "requires": ["a"], "enables": ["c"]})
+
+    restored = hot_cache.LessonHotCache()
+    restored.load_snapshot(json.loads(json.dumps(cache.to_snapshot())))
+
+    assert restored.to_snapshot() == cache.to_snapshot()
+    assert restored.get_learning_path("b", set()) == ["a", "b"]
+    assert restored.lessons_that_improve("uncertainty") == ["a"]
+
+    with pytest.raises(ValueError, match="snapshot format"):
+        restored.load_snapshot({"format": -1})
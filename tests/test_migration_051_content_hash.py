@@ -0,0 +1,70 @@
+"""Tests for migration 051: persisted content_hash on artifact tables.
+
+Dedup used to re-hash every row of the project in Python on each insert;
+051 adds a content_hash column, backfills it and indexes
+(project_id, content_hash) so the check is one indexed lookup.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from empirica.data.content_hash import content_hash
+from empirica.data.migrations.migrations import migration_051_artifact_content_hash
+
+
+@pytest.fixture
+def legacy_db():
+    """Artifact tables from before 051 (no content_hash), with some rows."""
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.executescript("""
+        CREATE TABLE project_findings (
+            id TEXT PRIMARY KEY,
+            project_id TEXT,
+            finding TEXT NOT NULL,
+            created_timestamp REAL NOT NULL
+        );
+        CREATE TABLE project_dead_ends (
+            id TEXT PRIMARY KEY,
+            project_id TEXT,
+            approach TEXT NOT NULL,
+            why_failed TEXT,
+            created_timestamp REAL NOT NULL
+        );
+        INSERT INTO project_findings VALUES ('f1', 'p1', '  Rate Limit  is 100 ', 1.0);
+        INSERT INTO project_dead_ends VALUES ('d1', 'p1', 'Retry loop', NULL, 1.0);
+    """)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def test_migration_backfills_hashes(legacy_db):
+    cursor = legacy_db.cursor()
+    migration_051_artifact_content_hash(cursor)
+    legacy_db.commit()
+
+    cursor.execute("SELECT content_hash FROM project_findings WHERE id = 'f1'")
+    assert cursor.fetchone()[0] == content_hash("rate limit is 100")
+    cursor.execute("SELECT content_hash FROM project_dead_ends WHERE id = 'd1'")
+    assert cursor.fetchone()[0] == content_hash("retry loop", None)
+
+
+def test_migration_creates_index_and_skips_missing_tables(legacy_db):
+    cursor = legacy_db.cursor()
+    migration_051_artifact_content_hash(cursor)  # mistakes_made etc. absent
+
+    cursor.execute("PRAGMA index_list(project_findings)")
+    assert "idx_project_findings_content_hash" in {row[1] for row in cursor.fetchall()}
+
+
+def test_migration_is_idempotent(legacy_db):
+    cursor = legacy_db.cursor()
+    migration_051_artifact_content_hash(cursor)
+    migration_051_artifact_content_hash(cursor)
+
+    cursor.execute("SELECT COUNT(*) FROM project_findings WHERE content_hash IS NULL")
+    assert cursor.fetchone()[0] == 0
@@ -0,0 +1,183 @@
+"""
+Test MinHash/LSH near-duplicate detection for findings.
+
+Verifies that:
+1. NearDuplicateIndex finds near-duplicates via LSH and verifies exact Jaccard
+2. novelty_score over an index agrees with the exhaustive scan for similar text
+3. Rollup dedup drops near-duplicates of higher-scored findings
+4. Logged findings persist signatures + band buckets (migration 054) and
+   find_similar_findings looks them up without scanning the project
+5. The subagent-stop rollup scores novelty against the project's findings
+   through that index
+"""
+
+import importlib.util
+import random
+import uuid
+from pathlib import Path
+
+import pytest
+
+from empirica.core.epistemic_rollup import EpistemicRollupGate, ScoredFinding
+from empirica.core.information_gain import novelty_score
+from empirica.data.minhash import (
+    NearDuplicateIndex,
+    jaccard,
+    minhash_signature,
+    pack_signature,
+    text_tokens,
+    unpack_signature,
+)
+
+PROJECT_ID = str(uuid.uuid4())
+SESSION_ID = str(uuid.uuid4())
+
+BASE = "auth middleware caches session tokens in redis with fifteen minute expiry window"
+NEAR = "auth middleware caches session tokens in redis with thirty minute expiry window"
+
+
+def _random_texts(count, seed=0):
+    rng = random.Random(seed)  # noqa: S311 - reproducible fixture text
+    vocab = [f"word{i}" for i in range(2000)]
+    return [" ".join(rng.sample(vocab, 12)) for _ in range(count)]
+
+
+@pytest.fixture
+def fresh_db(tmp_path):
+    """Create a fresh SessionDatabase with temp SQLite file."""
+    from empirica.data.session_database import SessionDatabase
+
+    db = SessionDatabase(db_path=str(tmp_path / "test_minhash.db"))
+    yield db
+    db.close()
+
+
+class TestNearDuplicateIndex:
+    def test_signature_is_stable_and_round_trips(self):
+        signature = minhash_signature(text_tokens(BASE))
+        assert signature == minhash_signature(text_tokens(BASE.upper()))
+        assert unpack_signature(pack_signature(signature)) == signature
+        assert minhash_signature(text_tokens("the and of")) == ()
+
+    def test_query_finds_near_duplicate_among_noise(self):
+        index = NearDuplicateIndex(_random_texts(500))
+        index.add("target", BASE)
+
+        matches = index.query(NEAR, threshold=0.7)
+
+        assert [key for key, _ in matches] == ["target"]
+        assert matches[0][1] == jaccard(text_tokens(BASE), text_tokens(NEAR))
+        assert len(index.candidates(NEAR)) < 50
+
+    def test_empty_text_matches_novelty_semantics(self):
+        assert NearDuplicateIndex().max_similarity(BASE) == 0.0
+        assert NearDuplicateIndex([BASE]).max_similarity("the and") == 1.0
+        assert NearDuplicateIndex(["the and"]).max_similarity(BASE) == 0.0
+
+
+class TestNoveltyWithIndex:
+    def test_index_agrees_with_exhaustive_scan(self):
+        existing = _random_texts(200) + [BASE]
+        index = NearDuplicateIndex(existing)
+
+        assert novelty_score(NEAR, index) == pytest.approx(novelty_score(NEAR, existing))
+        assert novelty_score(BASE, index) == 0.0
+        assert novelty_score(BASE, NearDuplicateIndex()) == 1.0
+
+    def test_rollup_dedup_keeps_highest_scored(self):
+        gate = EpistemicRollupGate(jaccard_threshold=0.7)
+
+        def scored(text, score):
+            return ScoredFinding(
+                finding=text, score=score, agent_name="a", domain="d",
+                novelty=1.0, confidence=score, domain_relevance=1.0,
+            )
+
+        findings = [scored(NEAR, 0.4), scored(BASE, 0.9), scored("unrelated database migration note", 0.5)]
+        kept = gate.deduplicate(findings)
+
+        assert [f.finding for f in kept] == [BASE, "unrelated database migration note"]
+
+    def test_pipeline_scores_against_earlier_findings(self):
+        gate = EpistemicRollupGate(min_score=0.0)
+        result = gate.process(
+            raw_findings=[{"finding": BASE}, {"finding": NEAR}],
+            agent_name="a", domain="d", confidence=1.0,
+            existing_findings=[], budget_remaining=10,
+        )
+
+        assert [f.finding for f in result.accepted] == [BASE]
+
+
+class TestPersistedFindingSignatures:
+    def test_logged_finding_is_indexed_and_found(self, fresh_db):
+        repo = fresh_db.breadcrumbs
+        for text in _random_texts(30):
+            repo.log_finding(PROJECT_ID, SESSION_ID, text)
+        finding_id = repo.log_finding(PROJECT_ID, SESSION_ID, BASE)
+
+        matches = fresh_db.find_similar_findings(PROJECT_ID, NEAR)
+
+        assert [m["id"] for m in matches] == [finding_id]
+        assert matches[0]["similarity"] >= 0.7
+        assert fresh_db.find_similar_findings("other-project", NEAR) == []
+
+    def test_direct_inserts_are_indexed_with_next_logged_finding(self, fresh_db):
+        fresh_db.conn.execute(
+            "INSERT INTO project_findings (id, project_id, session_id, finding, created_timestamp, finding_data) "
+            "VALUES ('raw', ?, ?, ?, 1.0, '{}')",
+            (PROJECT_ID, SESSION_ID, BASE),
+        )
+        fresh_db.conn.commit()
+
+        # Lookups are read-only
+        assert fresh_db.find_similar_findings(PROJECT_ID, NEAR) == []
+        assert not fresh_db.conn.in_transaction
+
+        fresh_db.breadcrumbs.log_finding(PROJECT_ID, SESSION_ID, "unrelated database migration note")
+        assert [m["id"] for m in fresh_db.find_similar_findings(PROJECT_ID, NEAR)] == ["raw"]
+        row = fresh_db.conn.execute("SELECT minhash FROM project_findings WHERE id = 'raw'").fetchone()
+        assert unpack_signature(row[0]) == minhash_signature(text_tokens(BASE))
+
+    def test_edit_and_delete_maintain_bands(self, fresh_db):
+        repo = fresh_db.breadcrumbs
+        finding_id = repo.log_finding(PROJECT_ID, SESSION_ID, BASE)
+
+        fresh_db.conn.execute(
+            "UPDATE project_findings SET finding = 'unrelated database migration note' WHERE id = ?",
+            (finding_id,),
+        )
+        fresh_db.conn.commit()
+        repo.log_finding(PROJECT_ID, SESSION_ID, "fresh finding to trigger reindexing")
+        assert fresh_db.find_similar_findings(PROJECT_ID, NEAR) == []
+        assert fresh_db.find_similar_findings(PROJECT_ID, "database migration note unrelated")
+
+        fresh_db.conn.execute("DELETE FROM project_findings WHERE id = ?", (finding_id,))
+        fresh_db.conn.commit()
+        count = fresh_db.conn.execute(
+            "SELECT COUNT(*) FROM artifact_minhash_bands WHERE artifact_id = ?", (finding_id,)
+        ).fetchone()[0]
+        assert count == 0
+
+
+def _load_subagent_stop():
+    hooks = Path(__file__).parent.parent / "empirica" / "plugins" / "claude-code-integration" / "hooks"
+    spec = importlib.util.spec_from_file_location("subagent_stop", hooks / "subagent-stop.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class TestRollupAgainstProjectHistory:
+    def test_near_duplicate_from_another_session_is_rejected(self, fresh_db, monkeypatch):
+        hook = _load_subagent_stop()
+        monkeypatch.setattr("empirica.core.epistemic_rollup.log_rollup_decision", lambda *a, **kw: None)
+        for text in _random_texts(30):
+            fresh_db.breadcrumbs.log_finding(PROJECT_ID, SESSION_ID, text)
+        fresh_db.breadcrumbs.log_finding(PROJECT_ID, str(uuid.uuid4()), BASE)
+
+        assert hook._project_near_duplicates(fresh_db, PROJECT_ID, [{"finding": NEAR}], []) == [BASE]
+
+        result = hook._gated_rollup(SESSION_ID, PROJECT_ID, "agent", [{"finding": NEAR}], fresh_db)
+        assert result["accepted"] == []
+        assert result["rejected"][0]["finding"] == NEAR
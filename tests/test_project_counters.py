@@ -0,0 +1,151 @@
+"""Tests for the trigger-maintained project_counters table (migration 057).
+
+Every surface that used to COUNT goals/unknowns/sessions on render reads
+one project_counters row instead; the triggers must keep it equal to a
+live count through inserts, updates, deletes and INSERT OR REPLACE.
+"""
+
+import importlib.util
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+
+from empirica.data.migrations.migrations import migration_057_project_counters
+from empirica.data.project_counters import read_project_counters
+
+PROJECT_ID = str(uuid.uuid4())
+
+_STATUSLINE = (
+    Path(__file__).resolve().parents[1]
+    / "empirica/plugins/claude-code-integration/scripts/statusline_empirica.py"
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    from empirica.data.session_database import SessionDatabase
+
+    database = SessionDatabase(db_path=str(tmp_path / "sessions.db"))
+    yield database
+    database.close()
+
+
+def _live(db, project_id):
+    def count(sql):
+        return db.conn.execute(sql, (project_id,)).fetchone()[0]
+
+    return {
+        "sessions": count("SELECT COUNT(*) FROM sessions WHERE project_id = ?"),
+        "goals": count("SELECT COUNT(*) FROM goals WHERE project_id = ?"),
+        "open_goals": count("SELECT COUNT(*) FROM goals WHERE project_id = ? AND is_completed = 0"),
+        "findings": count("SELECT COUNT(*) FROM project_findings WHERE project_id = ?"),
+        "unknowns": count("SELECT COUNT(*) FROM project_unknowns WHERE project_id = ?"),
+        "open_unknowns": count(
+            "SELECT COUNT(*) FROM project_unknowns WHERE project_id = ? AND is_resolved = 0"
+        ),
+        "goal_linked_unknowns": count(
+            "SELECT COUNT(*) FROM project_unknowns "
+            "WHERE project_id = ? AND is_resolved = 0 AND goal_id IS NOT NULL"
+        ),
+    }
+
+
+def _populate(db):
+    session_id = db.create_session(ai_id="agent", project_id=PROJECT_ID)
+    db.link_session_to_project(session_id, PROJECT_ID)
+    goal_id = db.create_goal(session_id, "ship it")
+    done_goal = db.create_goal(session_id, "done already")
+    db.conn.execute("UPDATE goals SET is_completed = 1 WHERE id = ?", (done_goal,))
+    db.breadcrumbs.log_finding(PROJECT_ID, session_id, "cache misses dominate startup")
+    blocker = db.breadcrumbs.log_unknown(PROJECT_ID, session_id, "which lock?", goal_id=goal_id)
+    db.breadcrumbs.log_unknown(PROJECT_ID, session_id, "is it flaky?")
+    db.conn.commit()
+    return session_id, goal_id, blocker
+
+
+def _subset(counters, keys):
+    return {k: counters[k] for k in keys}
+
+
+class TestTriggers:
+    def test_counts_track_writes(self, db):
+        _, goal_id, blocker = _populate(db)
+        live = _live(db, PROJECT_ID)
+        assert live["goals"] == 2 and live["goal_linked_unknowns"] == 1
+        assert _subset(db.get_project_counters(PROJECT_ID), live) == live
+
+        db.breadcrumbs.resolve_unknown(blocker, "the session lock")
+        db.conn.execute("DELETE FROM goals WHERE id = ?", (goal_id,))
+        db.conn.commit()
+
+        live = _live(db, PROJECT_ID)
+        assert live["goal_linked_unknowns"] == 0 and live["goals"] == 1
+        assert _subset(db.get_project_counters(PROJECT_ID), live) == live
+
+    def test_insert_or_replace_and_project_moves_stay_exact(self, db):
+        session_id, goal_id, _ = _populate(db)
+        other = str(uuid.uuid4())
+        row = db.conn.execute("SELECT * FROM goals WHERE id = ?", (goal_id,)).fetchone()
+        columns = [d[0] for d in db.conn.execute("SELECT * FROM goals LIMIT 0").description]
+        db.conn.execute(
+            f"INSERT OR REPLACE INTO goals ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            tuple(row),
+        )
+        db.conn.execute("UPDATE sessions SET project_id = ? WHERE session_id = ?", (other, session_id))
+        db.conn.commit()
+
+        for project in (PROJECT_ID, other):
+            live = _live(db, project)
+            assert _subset(db.get_project_counters(project), live) == live
+
+    def test_latest_completion_follows_reflexes(self, db):
+        session_id, _, _ = _populate(db)
+        db.store_vectors(session_id, "PREFLIGHT", {"completion": 0.2})
+        db.store_vectors(session_id, "POSTFLIGHT", {"completion": 0.9})
+
+        counters = db.get_project_counters(PROJECT_ID)
+        assert counters["latest_completion"] == 0.9
+        assert counters["latest_completion_session"] == session_id
+
+        db.conn.execute(
+            "DELETE FROM reflexes WHERE id = (SELECT MAX(id) FROM reflexes)"
+        )
+        db.conn.commit()
+        assert db.get_project_counters(PROJECT_ID)["latest_completion"] == 0.2
+
+    def test_migration_rebuilds_from_source_tables(self, db):
+        _populate(db)
+        before = db.get_project_counters(PROJECT_ID)
+
+        db.conn.execute("DELETE FROM project_counters")
+        migration_057_project_counters(db.conn.cursor())
+        db.conn.commit()
+
+        assert db.get_project_counters(PROJECT_ID) == before
+
+
+class TestReaders:
+    def test_missing_table_and_unknown_project(self, db):
+        assert read_project_counters(sqlite3.connect(":memory:"), "p") is None
+        empty = db.get_project_counters("no-such-project")
+        assert empty["open_goals"] == 0 and empty["latest_completion"] is None
+
+    def test_statusline_open_counts_from_counters(self, db):
+        spec = importlib.util.spec_from_file_location("statusline_empirica", _STATUSLINE)
+        statusline = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(statusline)
+        session_id, _, _ = _populate(db)
+        db.store_vectors(session_id, "PREFLIGHT", {"completion": 0.4})
+
+        statements = []
+        db.conn.set_trace_callback(statements.append)
+        counts = statusline.get_open_counts(db, session_id, PROJECT_ID)
+        db.conn.set_trace_callback(None)
+
+        assert counts == {
+            "open_goals": 1, "open_unknowns": 2, "goal_linked_unknowns": 1, "completion": 0.4,
+        }
+        assert len(statements) == 1
+        assert statusline.get_open_counts(db, session_id)["open_unknowns"] == 2
@@ -156,14 +156,13 @@ def test_omitting_qdrant_url_is_byte_for_byte_legacy_behavior(monkeypatch):
     with patch.object(conn_mod, "_get_qdrant_imports",
                       return_value=(mock_cls, None, None, None)):
         legacy_call = conn_mod._get_qdrant_client()
-    mock_cls.reset_mock()
     with patch.object(conn_mod, "_get_qdrant_imports",
                       return_value=(mock_cls, None, None, None)):
         new_call_with_none = conn_mod._get_qdrant_client(qdrant_url=None)
-    # Same client object returned, same URL used
+    # Same (pooled) client object returned, built once against the env URL
     assert legacy_call is not None
-    assert new_call_with_none is not None
-    assert mock_cls.call_args[1]["url"] == "http://legacy:6333"
+    assert new_call_with_none is legacy_call
+    mock_cls.assert_called_once_with(url="http://legacy:6333")
 
 # ── embed_* / upsert_* / search threading (prop_t7s6whxwjncoploks5wwcdqssm) ──
 # The write-path gap cortex found: embed_single_memory_item / embed_assumption /
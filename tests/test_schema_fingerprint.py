@@ -0,0 +1,69 @@
+"""Tests for the SessionDatabase schema-fingerprint fast path.
+
+Verifies:
+  - A fresh DB gets the fingerprint written to PRAGMA user_version
+  - Reopening an up-to-date DB skips the DDL/migration pass entirely
+  - A stale or missing fingerprint triggers the full (idempotent) pass again
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from empirica.data.session_database import SessionDatabase, schema_fingerprint
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "sessions.db"
+    db = SessionDatabase(db_path=str(path))
+    db.close()
+    return path
+
+
+def _user_version(path) -> int:
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_fingerprint_is_stable_and_nonzero():
+    assert schema_fingerprint() == schema_fingerprint()
+    assert 0 < schema_fingerprint() < 2 ** 31
+
+
+def test_fresh_db_stores_fingerprint(db_path):
+    assert _user_version(db_path) == schema_fingerprint()
+
+
+def test_up_to_date_db_skips_migrations(db_path):
+    with patch("empirica.data.migrations.MigrationRunner.run_all") as run_all:
+        db = SessionDatabase(db_path=str(db_path))
+        db.close()
+    run_all.assert_not_called()
+
+
+def test_stale_fingerprint_runs_full_pass(db_path):
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA user_version = 1")
+    conn.execute("DROP INDEX idx_sessions_ai")
+    conn.commit()
+    conn.close()
+
+    db = SessionDatabase(db_path=str(db_path))
+    db.close()
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        row = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_sessions_ai'"
+        ).fetchone()
+    finally:
+        conn.close()
+    assert row is not None
+    assert _user_version(db_path) == schema_fingerprint()
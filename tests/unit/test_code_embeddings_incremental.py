@@ -0,0 +1,81 @@
+"""Incremental, batched code_api embedding (embed_project_code)."""
+
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import QdrantClient
+
+from empirica.core.qdrant import code_embeddings
+
+
+@pytest.fixture
+def qdrant(monkeypatch):
+    """In-memory Qdrant plus an embedder that records its batch calls."""
+    client = QdrantClient(":memory:")
+    batches = []
+
+    def fake_batch(texts):
+        batches.append(len(texts))
+        return [[float(len(t) % 7), 1.0, 0.5, 0.25] for t in texts]
+
+    monkeypatch.setattr(code_embeddings, "_check_qdrant_available", lambda: True)
+    monkeypatch.setattr(code_embeddings, "_get_qdrant_client", lambda: client)
+    monkeypatch.setattr("empirica.core.qdrant.connection._get_qdrant_client", lambda *a, **k: client)
+    monkeypatch.setattr("empirica.core.qdrant.connection._get_embeddings_batch", fake_batch)
+    monkeypatch.setenv("EMPIRICA_EMBED_BATCH_SIZE", "3")
+    yield client, batches
+    client.close()
+
+
+def _write_modules(root, count):
+    pkg = root / "pkg"
+    pkg.mkdir(exist_ok=True)
+    for i in range(count):
+        (pkg / f"mod{i}.py").write_text(f'def api_{i}(x: int) -> int:\n    """Doc {i}."""\n    return x\n')
+    (pkg / "private.py").write_text("def _hidden():\n    pass\n")
+
+
+def test_first_run_embeds_in_batches(tmp_path, qdrant):
+    client, batches = qdrant
+    _write_modules(tmp_path, 7)
+
+    result = code_embeddings.embed_project_code("proj", tmp_path)
+
+    assert result["files_scanned"] == 8
+    assert result["modules_embedded"] == 7
+    assert result["skipped"] == 1
+    assert result["unchanged"] == 0
+    assert result["errors"] == 0
+    assert "duration_ms" in result
+    assert batches == [3, 3, 1]
+    coll = code_embeddings._eidetic_collection("proj")
+    assert client.count(coll).count == 7
+
+
+def test_rerun_skips_unchanged_modules(tmp_path, qdrant):
+    _, batches = qdrant
+    _write_modules(tmp_path, 5)
+    code_embeddings.embed_project_code("proj", tmp_path)
+    batches.clear()
+
+    (tmp_path / "pkg" / "mod2.py").write_text("def renamed(y: str) -> str:\n    return y\n")
+    result = code_embeddings.embed_project_code("proj", tmp_path)
+
+    assert result["modules_embedded"] == 1
+    assert result["unchanged"] == 4
+    assert batches == [1]
+
+
+def test_parallel_extraction_matches_sequential(tmp_path, monkeypatch):
+    _write_modules(tmp_path, 6)
+    files = sorted((tmp_path / "pkg").glob("*.py"))
+
+    monkeypatch.setattr(code_embeddings, "_PARALLEL_MIN_FILES", 2)
+    monkeypatch.setenv("EMPIRICA_CODE_EMBED_WORKERS", "2")
+    parallel = code_embeddings._extract_modules(files, tmp_path)
+    monkeypatch.setenv("EMPIRICA_CODE_EMBED_WORKERS", "1")
+    sequential = code_embeddings._extract_modules(files, tmp_path)
+
+    assert parallel == sequential
+    assert [m.get("module_path") for m in parallel if m][:1] == ["pkg.mod0"]
@@ -0,0 +1,89 @@
+"""Embedded (in-process) Qdrant store selected through _get_qdrant_client.
+
+With EMPIRICA_QDRANT_EMBEDDED set and no server URL, the qdrant modules run
+against qdrant-client's local mode: no HTTP, persisted under ~/.empirica.
+"""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from empirica.core.qdrant import connection, embeddings
+from empirica.core.qdrant.memory import search, upsert_memory
+from empirica.core.qdrant.pattern_retrieval import retrieve_task_patterns
+
+pytest.importorskip("qdrant_client")
+
+ITEMS = [
+    {"id": "f1", "type": "finding", "text": "sqlite wal mode removes writer stalls", "timestamp": "2026-01-01T00:00:00"},
+    {"id": "f2", "type": "finding", "text": "embedding cache keyed by normalized text", "timestamp": "2026-01-02T00:00:00"},
+    {"id": "d1", "type": "dead_end", "text": "DEAD END: global lock Why failed: serialized every hook"},
+]
+
+
+@pytest.fixture
+def embedded(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("EMPIRICA_QDRANT_URL", raising=False)
+    monkeypatch.setenv("EMPIRICA_QDRANT_EMBEDDED", "vectors")
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_PROVIDER", "local")
+    monkeypatch.setattr(connection, "_qdrant_available", True)
+    monkeypatch.setattr(embeddings, "_provider_singleton", None)
+    connection._reset_client_pool()
+    yield tmp_path / ".empirica" / "vectors"
+    connection._reset_client_pool()
+
+
+def test_store_path_resolution(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("EMPIRICA_QDRANT_EMBEDDED", raising=False)
+    assert connection._local_store_path() is None
+    # The old, documented-but-unread variable must not enable it
+    monkeypatch.setenv("EMPIRICA_QDRANT_PATH", "./.qdrant_data")
+    assert connection._local_store_path() is None
+
+    monkeypatch.setenv("EMPIRICA_QDRANT_EMBEDDED", "on")
+    assert connection._local_store_path() == str(tmp_path / ".empirica" / "qdrant_local")
+    monkeypatch.setenv("EMPIRICA_QDRANT_EMBEDDED", str(tmp_path / "abs"))
+    assert connection._local_store_path() == str(tmp_path / "abs")
+
+
+def test_roundtrip_without_a_server(embedded):
+    client = connection._get_qdrant_client()
+    assert client is connection._get_qdrant_client()
+    assert upsert_memory("proj", ITEMS) == 3
+
+    hits = search("proj", "sqlite wal mode", kind="memory", limit=2)["memory"]
+    assert hits[0]["text"] == ITEMS[0]["text"]
+    assert embedded.is_dir()
+
+    # Persisted: a fresh client (new process) sees the same points
+    connection._reset_client_pool()
+    hits = search("proj", "embedding cache keyed by normalized text", kind="memory", limit=1)["memory"]
+    assert hits[0]["text"] == ITEMS[1]["text"]
+
+
+def test_pattern_retrieval_runs_on_embedded_store(embedded):
+    upsert_memory("proj", ITEMS)
+
+    result = retrieve_task_patterns("proj", "sqlite wal mode removes writer stalls", threshold=0.3)
+    assert result["relevant_findings"][0]["finding"] == ITEMS[0]["text"]
+
+
+def test_locked_store_warns_once_and_falls_back_to_localhost(embedded, caplog):
+    from qdrant_client import QdrantClient
+
+    holder = QdrantClient(path=str(embedded))  # stands in for another process
+    try:
+        with caplog.at_level(logging.WARNING, logger=connection.__name__), \
+             patch("urllib.request.urlopen", side_effect=OSError("refused")) as urlopen:
+            assert connection._get_qdrant_client() is None
+            assert connection._get_qdrant_client() is None
+        assert urlopen.call_count == 2
+        warnings = [r for r in caplog.records if "one process at a time" in r.getMessage()]
+        assert len(warnings) == 1
+    finally:
+        holder.close()
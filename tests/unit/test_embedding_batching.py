@@ -0,0 +1,182 @@
+"""Native batch requests, keep-alive and backoff for hosted embedding providers.
+
+A local HTTP stub stands in for the Jina/Voyage endpoint and records every
+request and the client connection it arrived on.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from empirica.core.qdrant import embeddings
+from empirica.core.qdrant.embeddings import EmbeddingsProvider
+
+
+class _Stub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        server.requests.append({"input": body["input"], "peer": self.client_address[1],
+                                "auth": self.headers.get("Authorization")})
+        if server.throttle or server.reject & set(body["input"]):
+            server.throttle = max(0, server.throttle - 1)
+            self._reply(429, {"detail": "slow down"}, {"Retry-After": "0"})
+            return
+        if server.invalid & set(body["input"]):
+            self._reply(400, {"detail": "input too long"})
+            return
+        # Reversed on purpose: clients must order by "index"
+        data = [{"index": i, "embedding": [float(len(text)), float(i)]} for i, text in enumerate(body["input"])]
+        self._reply(200, {"data": data[::-1]})
+
+    def _reply(self, status, payload, headers=None):
+        raw = json.dumps(payload).encode()
+        self.send_response(status)
+        for key, value in {"Content-Type": "application/json", "Content-Length": str(len(raw)), **(headers or {})}.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub(monkeypatch, tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    server.requests, server.throttle, server.reject, server.invalid = [], 0, set(), set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/embeddings"
+    monkeypatch.setattr(embeddings, "_HOSTED_ENDPOINTS", {"jina": (url, {"encoding_type": "float"}, 2)})
+    monkeypatch.setattr(embeddings, "_BACKOFF_SECONDS", 0)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_PROVIDER", "jina")
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_MODEL", "jina-embeddings-v3")
+    monkeypatch.setenv("JINA_API_KEY", "test-key")
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_CACHE", "off")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_batches_over_one_keep_alive_connection(stub, monkeypatch):
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_CONCURRENCY", "1")
+    provider = EmbeddingsProvider()
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    vectors = provider.batch_embed(texts)
+    provider.embed("ffffff")
+
+    assert [r["input"] for r in stub.requests] == [["a", "bb"], ["ccc", "dddd"], ["eeeee"], ["ffffff"]]
+    assert [v[0] for v in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert len({r["peer"] for r in stub.requests}) == 1
+    assert stub.requests[0]["auth"] == "Bearer test-key"
+
+
+def test_concurrent_chunks_keep_order(stub, monkeypatch):
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_CONCURRENCY", "3")
+    texts = [f"text {'x' * i}" for i in range(9)]
+
+    vectors = EmbeddingsProvider().batch_embed(texts)
+
+    assert len(stub.requests) == 5
+    assert [v[0] for v in vectors] == [float(len(t)) for t in texts]
+
+
+def test_throttling_is_retried_with_backoff(stub):
+    stub.throttle = 2
+    provider = EmbeddingsProvider()
+
+    assert provider.embed("retry me") == [8.0, 0.0]
+    assert len(stub.requests) == 3
+    assert provider._fallbacks == 0
+
+
+def test_exhausted_retries_fall_back_without_more_requests(stub):
+    stub.throttle = 100
+    provider = EmbeddingsProvider()
+
+    vectors = provider.batch_embed(["one", "two"])
+
+    assert len(stub.requests) == embeddings._RETRIES  # one chunk, no per-text re-sends
+    assert provider._fallbacks == 1
+    assert all(len(v) == provider._vector_size for v in vectors)  # local-hash stand-ins
+
+
+def test_only_fallback_vectors_skip_the_cache(stub, monkeypatch, tmp_path):
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_CACHE", str(tmp_path / "embeddings.db"))
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_CONCURRENCY", "1")
+    stub.reject = {"ccc"}
+    provider = EmbeddingsProvider()
+
+    first = provider.batch_embed(["a", "bb", "ccc", "dddd"])
+    assert first[:2] == [[1.0, 0.0], [2.0, 1.0]]
+    assert provider._fallbacks == 1
+
+    stub.reject = set()
+    stub.requests.clear()
+    second = provider.batch_embed(["a", "bb", "ccc", "dddd"])
+
+    assert [r["input"] for r in stub.requests] == [["ccc", "dddd"]]
+    assert second == [[1.0, 0.0], [2.0, 1.0], [3.0, 0.0], [4.0, 1.0]]
+
+
+def test_rejected_input_only_degrades_itself(stub, monkeypatch):
+    url, extra, _ = embeddings._HOSTED_ENDPOINTS["jina"]
+    monkeypatch.setitem(embeddings._HOSTED_ENDPOINTS, "jina", (url, extra, 4))
+    stub.invalid = {"bad"}
+    provider = EmbeddingsProvider()
+
+    vectors = provider.batch_embed(["a", "bb", "bad", "dddd"])
+
+    assert [r["input"] for r in stub.requests] == [
+        ["a", "bb", "bad", "dddd"], ["a", "bb"], ["bad", "dddd"], ["bad"], ["dddd"]]
+    assert vectors[0] == [1.0, 0.0] and vectors[1] == [2.0, 1.0] and vectors[3] == [4.0, 0.0]
+    assert vectors[2] == provider._embed_local_hash("bad")
+    assert provider._fallbacks == 1
+
+
+def _openai(monkeypatch, create):
+    class _Embeddings:
+        def create(self, model, input):
+            return create(list(input))
+
+    monkeypatch.setattr(embeddings, "OpenAI", lambda: SimpleNamespace(embeddings=_Embeddings()))
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_PROVIDER", "openai")
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_CACHE", "off")
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_CONCURRENCY", "1")
+
+
+def test_openai_errors_propagate(monkeypatch):
+    def create(texts):
+        raise RuntimeError("invalid input")
+
+    _openai(monkeypatch, create)
+    with pytest.raises(RuntimeError, match="invalid input"):
+        EmbeddingsProvider().batch_embed(["a", "bb"])
+
+
+def test_openai_uses_list_input(monkeypatch):
+    calls = []
+
+    def create(texts):
+        calls.append(texts)
+        data = [SimpleNamespace(index=i, embedding=[float(len(t))]) for i, t in enumerate(texts)]
+        return SimpleNamespace(data=data[::-1])
+
+    _openai(monkeypatch, create)
+    monkeypatch.setattr(embeddings, "_OPENAI_BATCH", 3)
+
+    vectors = EmbeddingsProvider().batch_embed(["a", "bb", "ccc", "dddd"])
+
+    assert calls == [["a", "bb", "ccc"], ["dddd"]]
+    assert vectors == [[1.0], [2.0], [3.0], [4.0]]
@@ -0,0 +1,122 @@
+"""Persistent embedding cache shared by EmbeddingsProvider.embed and batch_embed."""
+
+import itertools
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from empirica.core.qdrant import embedding_cache
+from empirica.core.qdrant.embedding_cache import EmbeddingCache, cache_key
+from empirica.core.qdrant.embeddings import EmbeddingsProvider
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = EmbeddingCache(tmp_path / "embeddings.db")
+    yield store
+    store.close()
+
+
+class TestEmbeddingCache:
+    def test_roundtrip_and_counters(self, cache):
+        key = cache_key("ollama", "all-minilm", "hello  world")
+        assert cache.get(key) is None
+
+        cache.put(key, [0.5, -0.25, 1.0])
+        assert cache.get(cache_key("ollama", "all-minilm", " hello\nworld ")) == [0.5, -0.25, 1.0]
+        assert cache.get(cache_key("ollama", "bge-m3", "hello world")) is None
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+        assert stats["bytes"] == 12  # float32
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path, monkeypatch):
+        ticks = itertools.count()
+        monkeypatch.setattr(embedding_cache, "time", SimpleNamespace(time=lambda: next(ticks)))
+        store = EmbeddingCache(tmp_path / "lru.db", max_bytes=4 * 4 * 10)  # ten 4-d vectors
+        keys = [cache_key("p", "m", f"text {i}") for i in range(10)]
+        store.put_many({k: [float(i)] * 4 for i, k in enumerate(keys)})
+        store.get(keys[0])  # refresh the oldest entry
+
+        store._puts_since_check = 10**6  # force the size check on this put
+        store.put_many({cache_key("p", "m", f"more {i}"): [1.0] * 4 for i in range(5)})
+
+        stats = store.stats()
+        assert stats["bytes"] <= store.max_bytes
+        assert store.get(keys[0]) == [0.0] * 4
+        assert sum(store.get(k) is not None for k in keys[1:]) == 2
+        store.close()
+
+    def test_unusable_path_degrades_to_miss(self, tmp_path):
+        (tmp_path / "blocked").write_text("not a directory")
+        store = EmbeddingCache(tmp_path / "blocked" / "embeddings.db")
+        key = cache_key("p", "m", "x")
+
+        store.put(key, [1.0])
+        assert store.get(key) is None
+        assert store.stats()["misses"] == 1
+
+
+class _Response:
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._data
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_PROVIDER", "ollama")
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_MODEL", "all-minilm")
+    monkeypatch.setenv("EMPIRICA_EMBEDDINGS_CACHE", str(tmp_path / "cache.db"))
+    instance = EmbeddingsProvider()
+    yield instance
+    instance._cache.close()
+
+
+class TestProviderCaching:
+    def test_embed_and_batch_share_entries(self, provider):
+        sent = []
+
+        def fake_post(url, json, timeout):
+            if url.endswith("/api/embeddings"):
+                sent.append([json["prompt"]])
+                return _Response({"embedding": [0.5] * 384})
+            sent.append(list(json["input"]))
+            return _Response({"embeddings": [[float(len(t))] * 384 for t in json["input"]]})
+
+        with patch("requests.post", side_effect=fake_post):
+            first = provider.embed("alpha")
+            assert provider.embed(" alpha ") == first
+            batch = provider.batch_embed(["alpha", "beta", "beta", "gamma"])
+            assert provider.batch_embed(["gamma", "beta"]) == [batch[3], batch[1]]
+
+        assert sent == [["alpha"], ["beta", "gamma"]]
+        assert batch[0] == first
+        assert provider.cache_stats()["hits"] == 4
+
+    def test_fallback_vectors_are_not_cached(self, provider):
+        import requests
+
+        with patch("requests.post", side_effect=requests.exceptions.ConnectionError()):
+            provider.embed("offline text")
+        assert provider.cache_stats()["entries"] == 0
+
+        with patch("requests.post", return_value=_Response({"embedding": [0.25] * 384})) as post:
+            assert provider.embed("offline text") == [0.25] * 384
+            assert provider.embed("offline text") == [0.25] * 384
+        assert post.call_count == 1
+
+    def test_local_provider_and_opt_out_skip_cache(self, monkeypatch, provider):
+        monkeypatch.setenv("EMPIRICA_EMBEDDINGS_PROVIDER", "local")
+        assert EmbeddingsProvider().cache_stats() is None
+
+        monkeypatch.setenv("EMPIRICA_EMBEDDINGS_PROVIDER", "ollama")
+        monkeypatch.setenv("EMPIRICA_EMBEDDINGS_CACHE", "off")
+        assert EmbeddingsProvider().cache_stats() is None
@@ -0,0 +1,90 @@
+"""Batched memory-type retrieval for PREFLIGHT (retrieve_task_patterns).
+
+Lessons, dead ends and findings are fetched with one batched embed and one
+query_batch_points request, then split back per type.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from empirica.core.qdrant import vector_store
+from empirica.core.qdrant.pattern_retrieval import (
+    _search_memory_by_type,
+    _search_memory_types,
+    retrieve_task_patterns,
+)
+
+
+def _point(score, **payload):
+    return SimpleNamespace(score=score, payload=payload)
+
+
+@pytest.fixture
+def qdrant(monkeypatch):
+    """A fake memory collection answering query_batch_points per type filter."""
+    stored = {
+        "lesson": [_point(0.9, text="LESSON: pin deps - lock versions Domain: build")],
+        "dead_end": [_point(0.8, text="DEAD END: global cache Why failed: stale reads")],
+        "finding": [_point(0.7, text="parser is O(n^2)", impact=0.6), _point(0.2, text="noise")],
+    }
+    client = MagicMock()
+
+    def query_batch_points(collection_name, requests):
+        return [
+            SimpleNamespace(points=stored[r.filter.must[0].match.value][: r.limit])
+            for r in requests
+        ]
+
+    client.query_batch_points.side_effect = query_batch_points
+    embed = MagicMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+
+    monkeypatch.setenv("EMPIRICA_QDRANT_URL", "http://qdrant:6333")
+    monkeypatch.setattr(vector_store, "_check_qdrant_available", lambda *a, **kw: True)
+    monkeypatch.setattr(vector_store, "_get_qdrant_client", lambda *a, **kw: client)
+    monkeypatch.setattr(vector_store, "_collection_exists", lambda c, name: True)
+    monkeypatch.setattr(vector_store, "_get_embeddings_batch", embed)
+    return SimpleNamespace(client=client, embed=embed)
+
+
+def test_one_embed_and_one_search_for_all_types(qdrant):
+    hits = _search_memory_types("proj", {
+        "lesson": ("How to: x", 3),
+        "dead_end": ("Approach for: x", 3),
+        "finding": ("x", 3),
+    }, min_score=0.5)
+
+    qdrant.embed.assert_called_once_with(["How to: x", "Approach for: x", "x"])
+    assert qdrant.client.query_batch_points.call_count == 1
+    assert [h["text"] for h in hits["finding"]] == ["parser is O(n^2)"]
+    assert hits["lesson"][0]["score"] == 0.9
+    assert _search_memory_by_type("proj", "x", "dead_end", 1, 0.5)[0]["text"].startswith("DEAD END")
+
+
+def test_failed_embedding_skips_only_that_type(qdrant):
+    qdrant.embed.side_effect = lambda texts: [None if t.startswith("How") else [1.0] for t in texts]
+    hits = _search_memory_types("proj", {"lesson": ("How to: x", 3), "finding": ("x", 3)}, 0.5)
+
+    assert hits["lesson"] == []
+    assert len(hits["finding"]) == 1
+    (call,) = qdrant.client.query_batch_points.call_args_list
+    assert len(call.kwargs["requests"]) == 1
+
+
+def test_search_error_degrades_to_empty(qdrant):
+    qdrant.client.query_batch_points.side_effect = RuntimeError("down")
+    assert _search_memory_types("proj", {"lesson": ("q", 3), "finding": ("q", 3)}) == {
+        "lesson": [], "finding": []}
+
+
+def test_retrieve_task_patterns_splits_batched_results(qdrant, monkeypatch):
+    monkeypatch.setattr(vector_store, "search_global_dead_ends", lambda *a, **kw: [])
+    result = retrieve_task_patterns("proj", "speed up parsing", threshold=0.5)
+
+    assert qdrant.client.query_batch_points.call_count == 1
+    assert result["lessons"][0]["name"] == "pin deps"
+    assert result["dead_ends"][0]["why_failed"] == "stale reads"
+    assert [f["finding"] for f in result["relevant_findings"]] == ["parser is O(n^2)"]
@@ -0,0 +1,116 @@
+"""Process-wide Qdrant client pool and the collection metadata cache.
+
+_get_qdrant_client() hands out one client per (class, url) for the life of
+the process; _collection_exists / _get_collection_vector_size answer from a
+per-client TTL cache that creates and deletes keep current.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from empirica.core.qdrant import connection as conn_mod
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    conn_mod._reset_client_pool()
+    yield
+    conn_mod._reset_client_pool()
+
+
+def _client(existing=()):
+    """A client stub whose collection calls mutate a set of names."""
+    names = set(existing)
+    client = MagicMock()
+    client.collection_exists.side_effect = lambda name: name in names
+    client.create_collection.side_effect = lambda name, **kw: names.add(name) or True
+    client.delete_collection.side_effect = lambda name: names.discard(name) or True
+    return client, names
+
+
+class TestClientPool:
+    def test_one_client_per_url(self, monkeypatch):
+        monkeypatch.setenv("EMPIRICA_QDRANT_URL", "http://env:6333")
+        mock_cls = MagicMock(side_effect=lambda url: MagicMock(url=url))
+        with patch.object(conn_mod, "_get_qdrant_imports", return_value=(mock_cls, None, None, None)):
+            first = conn_mod._get_qdrant_client()
+            assert conn_mod._get_qdrant_client() is first
+            other = conn_mod._get_qdrant_client(qdrant_url="http://org:7333")
+            assert conn_mod._get_qdrant_client(qdrant_url="http://org:7333") is other
+
+        assert other is not first
+        assert [c.kwargs["url"] for c in mock_cls.call_args_list] == ["http://env:6333", "http://org:7333"]
+
+    def test_localhost_probe_reused_while_fresh(self, monkeypatch):
+        monkeypatch.delenv("EMPIRICA_QDRANT_URL", raising=False)
+        mock_cls = MagicMock()
+        resp = MagicMock(status=200)
+        resp.__enter__ = lambda self: self
+        resp.__exit__ = lambda self, *a: None
+        with patch.object(conn_mod, "_get_qdrant_imports", return_value=(mock_cls, None, None, None)), \
+             patch("urllib.request.urlopen", return_value=resp) as urlopen:
+            first = conn_mod._get_qdrant_client()
+            assert conn_mod._get_qdrant_client() is first
+            assert urlopen.call_count == 1
+
+            monkeypatch.setattr(conn_mod, "_localhost_verified_at", 0.0)
+            assert conn_mod._get_qdrant_client() is first
+            assert urlopen.call_count == 2
+        mock_cls.assert_called_once_with(url="http://localhost:6333")
+
+
+class TestCollectionMetadata:
+    def test_exists_is_cached_per_client(self):
+        client, _ = _client({"docs"})
+        assert conn_mod._collection_exists(client, "docs")
+        assert conn_mod._collection_exists(client, "docs")
+        assert not conn_mod._collection_exists(client, "memory")
+        assert client.collection_exists.call_count == 2
+
+        other, _ = _client()
+        assert not conn_mod._collection_exists(other, "docs")
+
+    def test_create_and_delete_update_cache(self):
+        client, names = _client()
+        assert not conn_mod._collection_exists(client, "goals")
+
+        conn_mod._create_collection(client, "goals", vectors_config=None)
+        assert conn_mod._collection_exists(client, "goals")
+        conn_mod._delete_collection(client, "goals")
+        assert not conn_mod._collection_exists(client, "goals")
+        assert names == set()
+        assert client.collection_exists.call_count == 2
+
+    def test_create_race_is_benign(self):
+        client, names = _client()
+        assert not conn_mod._collection_exists(client, "eidetic")
+        names.add("eidetic")  # another process created it meanwhile
+        client.create_collection.side_effect = RuntimeError("already exists")
+
+        assert conn_mod._create_collection(client, "eidetic") is False
+        assert conn_mod._collection_exists(client, "eidetic")
+        with pytest.raises(RuntimeError):  # a genuine failure still surfaces
+            conn_mod._create_collection(client, "never-created")
+
+    def test_ttl_expiry(self, monkeypatch):
+        client, names = _client()
+        monkeypatch.setenv("EMPIRICA_QDRANT_META_TTL", "0")
+        assert not conn_mod._collection_exists(client, "docs")
+        names.add("docs")
+        assert conn_mod._collection_exists(client, "docs")
+        assert client.collection_exists.call_count == 2
+
+    def test_vector_size_is_cached(self):
+        client, _ = _client({"docs"})
+        client.get_collection.return_value = SimpleNamespace(
+            config=SimpleNamespace(params=SimpleNamespace(vectors=SimpleNamespace(size=384))))
+
+        assert conn_mod._get_collection_vector_size(client, "docs") == 384
+        assert conn_mod._get_collection_vector_size(client, "docs") == 384
+        assert conn_mod._collection_exists(client, "docs")
+        assert client.get_collection.call_count == 1
+        assert client.collection_exists.call_count == 0
@@ -0,0 +1,89 @@
+"""Payload-only staleness pass (apply_staleness_signal) against local Qdrant.
+
+The pass scrolls payloads without vectors, writes staleness_factor with
+grouped set_payload operations, and records a per-collection high-water mark
+so a collection isn't decayed twice within the pass interval.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from empirica.core.qdrant import connection, decay
+
+qdrant_client = pytest.importorskip("qdrant_client")
+from qdrant_client.models import Distance, PointStruct, VectorParams  # noqa: E402
+
+DAY = 86400
+
+
+def _iso(days_ago: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).isoformat()
+
+
+@pytest.fixture
+def memory(tmp_path, monkeypatch):
+    """An in-memory collection of points aged 0-179 days, wired into decay."""
+    client = qdrant_client.QdrantClient(":memory:")
+    coll = "project_proj_memory"
+    client.create_collection(coll, vectors_config=VectorParams(size=4, distance=Distance.COSINE))
+    client.upsert(coll, points=[
+        PointStruct(id=i, vector=[1.0, 0.0, 0.0, float(i)], payload={"type": "finding", "timestamp": _iso(i * 10)})
+        for i in range(18)
+    ] + [PointStruct(id=99, vector=[0.0, 1.0, 0.0, 0.0], payload={"type": "note"})])
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(decay, "_check_qdrant_available", lambda *a, **kw: True)
+    monkeypatch.setattr(decay, "_get_qdrant_client", lambda *a, **kw: client)
+    monkeypatch.setattr(decay, "update_assumption_urgency", lambda project_id: 0)
+    connection._invalidate_collection_meta(client)
+    return client, coll
+
+
+def _staleness(client, coll):
+    points, _ = client.scroll(coll, limit=100, with_payload=True)
+    return {p.id: p.payload.get("staleness_factor") for p in points}
+
+
+def test_payload_only_pass_and_high_water_mark(memory, monkeypatch):
+    client, coll = memory
+    scrolls = []
+    real_scroll = client.scroll
+
+    def spy(*args, **kwargs):
+        scrolls.append(kwargs)
+        return real_scroll(*args, **kwargs)
+
+    vectors_before = {p.id: p.vector for p in client.scroll(coll, limit=100, with_vectors=True)[0]}
+    monkeypatch.setattr(client, "scroll", spy)
+
+    # Points 3..17 are past the 30-day period and more than 0.05 stale
+    assert decay.apply_staleness_signal("proj") == 15
+    assert all(not kw["with_vectors"] for kw in scrolls)
+    staleness = _staleness(client, coll)
+    assert staleness[0] is None and staleness[2] is None and staleness[99] is None
+    assert staleness[9] == pytest.approx(0.5, abs=0.001)
+    points, _ = real_scroll(coll, limit=100, with_vectors=True)
+    assert {p.id: p.vector for p in points} == vectors_before
+
+    # Same day: the high-water mark skips the collection entirely
+    scrolls.clear()
+    assert decay.apply_staleness_signal("proj") == 0
+    assert scrolls == []
+
+
+def test_recently_decayed_points_are_not_scanned(memory):
+    client, coll = memory
+    decay.apply_staleness_signal("proj")
+
+    later = time.time() + 2 * DAY
+    points = decay._scroll_all_points(
+        client, coll, scroll_filter=decay._staleness_candidates_filter(later, 180),
+        payload_fields=["timestamp", "staleness_factor"],
+    )
+    # Only never-decayed points remain candidates two days on
+    assert sorted(p.id for p in points) == [0, 1, 2, 99]
+    assert set(points[0].payload) <= {"timestamp", "staleness_factor"}
@@ -0,0 +1,177 @@
+"""
+Tests for TranscriptReader — streaming, reverse and indexed transcript access.
+
+Tests:
+1. Forward iteration with byte offsets and resume
+2. Reverse reading across block boundaries (lines longer than a block)
+3. last() with type and predicate filters
+4. Incremental offset index: appends, partial lines, truncation, rewrites
+5. Parser streaming via iter_session()
+6. subagent-stop reading assistant records through the index
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+from empirica.core.canonical.transcript_parser import TranscriptParser
+from empirica.utils.transcript_reader import TranscriptReader
+
+
+def _record(kind: str, text: str, n: int) -> dict:
+    return {"type": kind, "uuid": f"{kind}-{n}", "timestamp": f"2026-03-24T10:00:{n:02d}Z",
+            "message": {"role": kind, "content": text}}
+
+
+def _write(path: Path, records: list, trailing: str = "") -> None:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records) + trailing)
+
+
+def _append(path: Path, text: str) -> None:
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def _transcript(tmp_path: Path, count: int = 6) -> Path:
+    path = tmp_path / "session.jsonl"
+    records = [_record("user" if i % 2 == 0 else "assistant", f"message {i}", i) for i in range(count)]
+    _write(path, records)
+    return path
+
+
+# --- Forward ---
+
+
+class TestForward:
+    def test_offsets_resume_reading(self, tmp_path):
+        path = _transcript(tmp_path)
+        reader = TranscriptReader(path)
+
+        pairs = list(reader.records_with_offsets())
+        assert [r["uuid"] for _, r in pairs][:2] == ["user-0", "assistant-1"]
+
+        offset, record = pairs[3]
+        assert reader.read_at(offset) == record
+        resumed = list(reader.records(start_offset=offset))
+        assert [r["uuid"] for r in resumed] == [r["uuid"] for _, r in pairs[3:]]
+
+    def test_malformed_and_missing(self, tmp_path):
+        path = tmp_path / "bad.jsonl"
+        path.write_text('{"type": "user"}\nnot json\n[1, 2]\n\n{"type": "assistant"}\n')
+        assert [r["type"] for r in TranscriptReader(path).records()] == ["user", "assistant"]
+        assert list(TranscriptReader(tmp_path / "missing.jsonl").records()) == []
+
+
+# --- Backward ---
+
+
+class TestReverse:
+    def test_matches_forward_with_long_lines(self, tmp_path):
+        path = tmp_path / "long.jsonl"
+        records = [_record("user", "x" * (i * 37), i) for i in range(12)]
+        _write(path, records)
+
+        forward = list(TranscriptReader(path).records_with_offsets())
+        backward = list(TranscriptReader(path, block_size=16).reverse_records())
+        assert backward == forward[::-1]
+
+    def test_unterminated_last_line(self, tmp_path):
+        path = tmp_path / "open.jsonl"
+        _write(path, [_record("user", "first", 0)], trailing=json.dumps(_record("user", "tail", 1)))
+        newest = next(TranscriptReader(path, block_size=8).reverse_records())[1]
+        assert newest["message"]["content"] == "tail"
+
+    def test_last_filters(self, tmp_path):
+        path = _transcript(tmp_path, count=8)
+        reader = TranscriptReader(path, block_size=32)
+
+        assert [r["uuid"] for r in reader.last("user", n=2)] == ["user-6", "user-4"]
+        picked = reader.last("user", predicate=lambda r: r["message"]["content"].endswith("2"))
+        assert picked[0]["uuid"] == "user-2"
+        assert reader.last("summary") == []
+        assert reader.last() == [reader.read_at(list(reader.records_with_offsets())[-1][0])]
+
+
+# --- Offset index ---
+
+
+class TestIndex:
+    def test_index_extends_incrementally(self, tmp_path):
+        path = _transcript(tmp_path)
+        reader = TranscriptReader(path)
+        assert [r["uuid"] for r in reader.records_of_type("user", -2)] == ["user-2", "user-4"]
+        assert reader.index_path.exists()
+
+        # A half-written record isn't indexed until its newline lands
+        _append(path, json.dumps(_record("user", "late", 6))[:20])
+        assert reader.update_index().record_count == 6
+        _append(path, json.dumps(_record("user", "late", 6))[20:] + "\n")
+
+        fresh = TranscriptReader(path)  # reloads the persisted sidecar
+        assert fresh.update_index().record_count == 7
+        assert [r["uuid"] for r in fresh.records_of_type("user", -1)] == ["user-6"]
+        assert [r["uuid"] for r in fresh.records_of_type("assistant", 1, 2)] == ["assistant-3"]
+
+    def test_rebuilds_after_truncation_or_rewrite(self, tmp_path):
+        path = _transcript(tmp_path)
+        TranscriptReader(path).update_index()
+
+        _write(path, [_record("assistant", "only", 0)])
+        index = TranscriptReader(path).update_index()
+        assert index.by_type == {"assistant": [0]}
+
+        # Same size, different content: the first-line fingerprint catches it
+        _write(path, [_record("summaries", "only", 0)])
+        assert TranscriptReader(path).update_index().by_type == {"summaries": [0]}
+
+    def test_unwritable_sidecar_is_tolerated(self, tmp_path):
+        path = _transcript(tmp_path)
+        reader = TranscriptReader(path, index_path=tmp_path / "missing-dir" / "idx.json")
+        assert len(list(reader.records_of_type("user"))) == 3
+
+
+# --- Parser integration ---
+
+
+class TestParserStreaming:
+    def test_iter_session_resumes_from_offset(self, tmp_path):
+        path = _transcript(tmp_path)
+        parser = TranscriptParser()
+        offset = list(TranscriptReader(path).records_with_offsets())[4][0]
+
+        assert len(parser.parse_session(path)) == 6
+        assert [r.uuid for r in parser.iter_session(path, start_offset=offset)] == ["user-4", "assistant-5"]
+
+
+# --- Hook integration ---
+
+
+def _load_subagent_stop():
+    hooks = Path(__file__).parents[2] / "empirica" / "plugins" / "claude-code-integration" / "hooks"
+    spec = importlib.util.spec_from_file_location("subagent_stop", hooks / "subagent-stop.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class TestSubagentStop:
+    def test_reads_assistant_records_through_the_index(self, tmp_path):
+        hook = _load_subagent_stop()
+        tool_use = {"type": "tool_use", "name": "Read", "input": {}}
+        records = [
+            {"type": "user", "message": {"role": "user", "content": "Found: not from the agent."}},
+            {"type": "assistant", "message": {"role": "assistant", "content": [tool_use, tool_use]}},
+            {"type": "assistant", "message": {"role": "assistant", "content": [
+                {"type": "text", "text": "Found: the cache key ignores the model name. Done"}, tool_use]}},
+        ]
+        path = tmp_path / "agent.jsonl"
+        _write(path, records)
+
+        assert hook.count_transcript_tool_calls(str(path)) == 3
+        reader = TranscriptReader(path)
+        assert reader.index_path.exists()
+        assert reader.update_index().by_type == {"user": [0], "assistant": [
+            len(json.dumps(records[0])) + 1, len(json.dumps(records[0])) + len(json.dumps(records[1])) + 2]}
+
+        extracted = hook.extract_findings_from_transcript(str(path))
+        assert extracted["findings"] == ["Found: the cache key ignores the model name"]